@@ -0,0 +1,9 @@
+@echo off
+echo GumusDil kutuphanesi derleniyor (bin\gumus.dll)...
+if not exist bin mkdir bin
+g++ -std=c++17 -shared -O2 -I src/compiler -o bin/gumus.dll src/compiler/gumus_api.cpp src/compiler/lexer/*.cpp src/compiler/parser/*.cpp src/compiler/semantic/*.cpp src/compiler/interpreter/*.cpp src/compiler/stability/error_recovery.cpp src/compiler/security/*.cpp src/compiler/hardware/*.cpp -lwininet -lws2_32 -static -static-libgcc -static-libstdc++
+if %errorlevel% neq 0 (
+    echo Derleme HATALI!
+    exit /b %errorlevel%
+)
+echo Derleme BASARILI: bin\gumus.dll
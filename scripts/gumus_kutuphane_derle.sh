@@ -0,0 +1,18 @@
+#!/bin/bash
+# GümüşDil paylaşımlı kütüphanesi (bin/libgumus.so)
+# IDE programları ctypes ile süreç içinde çalıştırır (bkz. src/compiler/gumus_api.h)
+
+set -e
+
+mkdir -p bin
+echo "🔨 libgumus.so derleniyor..."
+g++ -std=c++17 -shared -fPIC -fvisibility=hidden -O2 -I src/compiler -o bin/libgumus.so \
+    src/compiler/gumus_api.cpp \
+    src/compiler/lexer/*.cpp \
+    src/compiler/parser/*.cpp \
+    src/compiler/semantic/*.cpp \
+    src/compiler/interpreter/*.cpp \
+    src/compiler/stability/error_recovery.cpp \
+    src/compiler/security/*.cpp \
+    src/compiler/hardware/*.cpp
+echo "✅ Derleme BAŞARILI: bin/libgumus.so"
@@ -4,4 +4,12 @@
 inline bool gumus_debug = false;
 inline bool gumus_memory_dump = false;
 
+// Caller-owned cancel flag of the running gumus_run() (gumus_api.h); when it
+// becomes non-zero the interpreter stops at the next statement
+inline const volatile int* gumus_cancel_flag = nullptr;
+
+// Thrown when a run is cancelled; deliberately not a std::exception so that
+// the language's own try/catch cannot swallow it
+struct GumusCancelled {};
+
 #endif
@@ -0,0 +1,271 @@
+#include "gumus_api.h"
+#include <algorithm>
+#include <cstring>
+#include <iostream>
+#include <mutex>
+#include <sstream>
+#include <streambuf>
+#include <string>
+#include <vector>
+#include "lexer/tokenizer.h"
+#include "parser/parser.h"
+#include "semantic/resolver.h"
+#include "interpreter/interpreter.h"
+#include "parser/ast_serializer.h"
+#include "json_hata.h"
+#include "debug.h"
+
+namespace {
+
+std::mutex g_apiMutex;
+std::string g_lastMemory = "null";
+
+// Line-buffered std::streambuf that forwards output to a gumus_output_fn
+class CallbackOutputBuf : public std::streambuf {
+public:
+    CallbackOutputBuf(gumus_output_fn output, void* user, int stream)
+        : output(output), user(user), stream(stream) {}
+
+protected:
+    int_type overflow(int_type ch) override {
+        if (ch != traits_type::eof()) {
+            buffer.push_back(traits_type::to_char_type(ch));
+            if (ch == '\n') deliver();
+        }
+        return ch;
+    }
+
+    std::streamsize xsputn(const char* data, std::streamsize count) override {
+        buffer.append(data, static_cast<size_t>(count));
+        if (std::memchr(data, '\n', static_cast<size_t>(count)) != nullptr) deliver();
+        return count;
+    }
+
+    int sync() override {
+        deliver();
+        return 0;
+    }
+
+private:
+    void deliver() {
+        if (!buffer.empty() && output != nullptr) {
+            output(user, stream, buffer.data(), buffer.size());
+        }
+        buffer.clear();
+    }
+
+    gumus_output_fn output;
+    void* user;
+    int stream;
+    std::string buffer;
+};
+
+// std::streambuf that pulls program input from a gumus_input_fn
+class CallbackInputBuf : public std::streambuf {
+public:
+    CallbackInputBuf(gumus_input_fn input, void* user) : input(input), user(user) {}
+
+protected:
+    int_type underflow() override {
+        if (gptr() < egptr()) return traits_type::to_int_type(*gptr());
+        if (input == nullptr) return traits_type::eof();
+        size_t count = input(user, data, sizeof(data));
+        if (count == 0) return traits_type::eof();
+        setg(data, data, data + std::min(count, sizeof(data)));
+        return traits_type::to_int_type(*gptr());
+    }
+
+private:
+    gumus_input_fn input;
+    void* user;
+    char data[4096];
+};
+
+// Swaps the standard streams for the duration of an API call
+class StreamRedirect {
+public:
+    StreamRedirect(std::streambuf* out, std::streambuf* err, std::streambuf* in)
+        : oldOut(std::cout.rdbuf(out)), oldErr(std::cerr.rdbuf(err)),
+          oldIn(in != nullptr ? std::cin.rdbuf(in) : nullptr) {}
+
+    ~StreamRedirect() {
+        std::cout.flush();
+        std::cerr.flush();
+        std::cout.rdbuf(oldOut);
+        std::cerr.rdbuf(oldErr);
+        if (oldIn != nullptr) {
+            std::cin.rdbuf(oldIn);
+            std::cin.clear();  // girdi() may have hit EOF
+        }
+    }
+
+private:
+    std::streambuf* oldOut;
+    std::streambuf* oldErr;
+    std::streambuf* oldIn;
+};
+
+int copyOut(const std::string& text, char* buffer, size_t capacity, size_t* required) {
+    if (required != nullptr) *required = text.size() + 1;
+    if (buffer == nullptr || capacity < text.size() + 1) return GUMUS_BUFFER_TOO_SMALL;
+    std::memcpy(buffer, text.data(), text.size());
+    buffer[text.size()] = '\0';
+    return GUMUS_OK;
+}
+
+std::string memorySnapshot(const Interpreter& interpreter) {
+    std::string json = "{ \"line\": " + std::to_string(interpreter.currentLine) + ", \"stack\": [], \"env\": ";
+    json += interpreter.globals != nullptr ? interpreter.globals->toJson() : "null";
+    return json + " }";
+}
+
+void reportRuntimeError(const LoxRuntimeException& error, const std::string& filename) {
+    std::string message = error.what();
+    if (!error.callstack.empty()) {
+        message += "\n\nHata Izi (Traceback):\n";
+        for (auto it = error.callstack.rbegin(); it != error.callstack.rend(); ++it) {
+            message += "  -> " + *it + " icinde\n";
+        }
+    }
+    JsonHata("runtime_error", message, error.line, filename, error.suggestion);
+}
+
+} // namespace
+
+extern "C" {
+
+int gumus_api_version(void) {
+    return GUMUS_API_VERSION;
+}
+
+int gumus_compile(const char* source, char* diagnostics, size_t capacity, size_t* required) {
+    std::unique_lock<std::mutex> lock(g_apiMutex, std::try_to_lock);
+    if (!lock.owns_lock()) return GUMUS_BUSY;
+
+    std::stringstream errorStream;
+    {
+        std::stringstream ignored;
+        StreamRedirect redirect(ignored.rdbuf(), errorStream.rdbuf(), nullptr);
+        try {
+            Interpreter interpreter;
+            Tokenizer tokenizer(source != nullptr ? source : "");
+            std::vector<Token> tokens = tokenizer.tokenize();
+            Parser parser(tokens, interpreter.astArena);
+            std::vector<Stmt*> statements = parser.parse();
+            Resolver resolver(interpreter);
+            resolver.resolve(statements);
+        } catch (const GumusException& error) {
+            JsonHata(error.type, error.what(), error.line);
+        } catch (const std::exception& error) {
+            JsonHata("system_error", error.what(), 0);
+        }
+    }
+
+    // JsonHata writes one JSON object per line
+    std::string json = "[";
+    std::string line;
+    bool first = true;
+    while (std::getline(errorStream, line)) {
+        if (line.empty() || line[0] != '{') continue;
+        if (!first) json += ",";
+        json += line;
+        first = false;
+    }
+    json += "]";
+
+    int status = copyOut(json, diagnostics, capacity, required);
+    if (status != GUMUS_OK) return status;
+    return first ? GUMUS_OK : GUMUS_ERROR;
+}
+
+int gumus_dump_ast(const char* source, char* buffer, size_t capacity, size_t* required) {
+    std::unique_lock<std::mutex> lock(g_apiMutex, std::try_to_lock);
+    if (!lock.owns_lock()) return GUMUS_BUSY;
+
+    std::string json;
+    int status = GUMUS_OK;
+    {
+        std::stringstream ignored;
+        StreamRedirect redirect(ignored.rdbuf(), ignored.rdbuf(), nullptr);
+        try {
+            Interpreter interpreter;
+            Tokenizer tokenizer(source != nullptr ? source : "");
+            std::vector<Token> tokens = tokenizer.tokenize();
+            Parser parser(tokens, interpreter.astArena);
+            std::vector<Stmt*> statements = parser.parse();
+            AstJsonSerializer serializer;
+            json = serializer.serialize(statements);
+        } catch (...) {
+            status = GUMUS_ERROR;
+        }
+    }
+    if (status != GUMUS_OK) {
+        if (required != nullptr) *required = 0;
+        return status;
+    }
+    return copyOut(json, buffer, capacity, required);
+}
+
+int gumus_run(const char* source, const char* filename, int flags,
+              gumus_output_fn output, gumus_input_fn input, void* user,
+              const volatile int* cancel) {
+    std::unique_lock<std::mutex> lock(g_apiMutex, std::try_to_lock);
+    if (!lock.owns_lock()) return GUMUS_BUSY;
+
+    const std::string file = filename != nullptr ? filename : "<gomulu>";
+    gumus_cancel_flag = cancel;
+    bool oldMemoryDump = gumus_memory_dump;
+    gumus_memory_dump = (flags & GUMUS_RUN_DUMP_MEMORY) != 0;
+    g_lastMemory = "null";
+
+    int status = GUMUS_OK;
+    CallbackOutputBuf out(output, user, GUMUS_STDOUT);
+    CallbackOutputBuf err(output, user, GUMUS_STDERR);
+    CallbackInputBuf in(input, user);
+    {
+        StreamRedirect redirect(&out, &err, &in);
+        try {
+            Interpreter interpreter;
+            Tokenizer tokenizer(source != nullptr ? source : "");
+            std::vector<Token> tokens = tokenizer.tokenize();
+            Parser parser(tokens, interpreter.astArena);
+            std::vector<Stmt*> statements = parser.parse();
+            if (parser.hasError()) {
+                status = GUMUS_ERROR;
+            } else {
+                Resolver resolver(interpreter);
+                resolver.resolve(statements);
+                try {
+                    interpreter.interpret(statements);
+                } catch (...) {
+                    g_lastMemory = memorySnapshot(interpreter);
+                    throw;
+                }
+                g_lastMemory = memorySnapshot(interpreter);
+            }
+        } catch (const GumusCancelled&) {
+            status = GUMUS_CANCELLED;
+        } catch (const GumusException& error) {
+            JsonHata(error.type, error.what(), error.line);
+            status = GUMUS_ERROR;
+        } catch (const LoxRuntimeException& error) {
+            reportRuntimeError(error, file);
+            status = GUMUS_ERROR;
+        } catch (const std::exception& error) {
+            JsonHata("system_error", error.what(), 0);
+            status = GUMUS_ERROR;
+        }
+    }
+
+    gumus_memory_dump = oldMemoryDump;
+    gumus_cancel_flag = nullptr;
+    return status;
+}
+
+int gumus_dump_memory(char* buffer, size_t capacity, size_t* required) {
+    std::unique_lock<std::mutex> lock(g_apiMutex, std::try_to_lock);
+    if (!lock.owns_lock()) return GUMUS_BUSY;
+    return copyOut(g_lastMemory, buffer, capacity, required);
+}
+
+} // extern "C"
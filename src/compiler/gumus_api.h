@@ -0,0 +1,82 @@
+#ifndef GUMUS_API_H
+#define GUMUS_API_H
+
+/*
+ * GümüşDil embedding API (C ABI)
+ *
+ * The compiler sources (everything except main.cpp) also build as a shared
+ * library (bin/libgumus.so, bin/gumus.dll) so that the IDE can run programs
+ * in-process through ctypes instead of launching bin/gumus for each run.
+ * See scripts/gumus_kutuphane_derle.sh and src/ide/core/native_vm.py.
+ *
+ * Text results are written to caller-provided buffers as NUL-terminated
+ * UTF-8. *required always receives the needed size (including the NUL); if
+ * capacity is smaller, nothing is written and GUMUS_BUFFER_TOO_SMALL is
+ * returned so the caller can retry with a larger buffer.
+ *
+ * The interpreter uses process-wide state (std::cout/std::cin redirection,
+ * the memory-dump flag), so only one call runs at a time; a call made while
+ * another is in progress returns GUMUS_BUSY.
+ */
+
+#include <stddef.h>
+
+#ifdef _WIN32
+#define GUMUS_API __declspec(dllexport)
+#else
+#define GUMUS_API __attribute__((visibility("default")))
+#endif
+
+#define GUMUS_API_VERSION 1
+
+/* Status codes */
+#define GUMUS_OK               0
+#define GUMUS_ERROR            1  /* Compile or runtime error (diagnostics / stderr) */
+#define GUMUS_BUFFER_TOO_SMALL 2
+#define GUMUS_BUSY             3
+#define GUMUS_CANCELLED        4
+
+/* Output streams passed to gumus_output_fn */
+#define GUMUS_STDOUT 1
+#define GUMUS_STDERR 2
+
+/* gumus_run flags */
+#define GUMUS_RUN_DUMP_MEMORY 1  /* Same __MEMORY_JSON_START__ blocks as --dump-memory */
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Receives program output, one or more complete lines per call (the last
+   chunk of a run may lack a trailing newline). */
+typedef void (*gumus_output_fn)(void* user, int stream, const char* data, size_t length);
+
+/* Fills `buffer` with up to `capacity` bytes of program input; 0 means EOF. */
+typedef size_t (*gumus_input_fn)(void* user, char* buffer, size_t capacity);
+
+GUMUS_API int gumus_api_version(void);
+
+/* Parses and resolves `source`; diagnostics is a JSON array of the error
+   objects the compiler prints to stderr. GUMUS_ERROR if there are any. */
+GUMUS_API int gumus_compile(const char* source, char* diagnostics, size_t capacity, size_t* required);
+
+/* Same JSON as `gumus --dump-ast`. */
+GUMUS_API int gumus_dump_ast(const char* source, char* buffer, size_t capacity, size_t* required);
+
+/* Runs `source` on the interpreter; `filename` is used in error messages.
+   Output goes to `output`, girdi() reads from `input` (either may be NULL).
+   Setting `*cancel` to non-zero from another thread stops the run at the
+   next statement with GUMUS_CANCELLED (`cancel` may be NULL). */
+GUMUS_API int gumus_run(const char* source, const char* filename, int flags,
+                        gumus_output_fn output, gumus_input_fn input, void* user,
+                        const volatile int* cancel);
+
+/* Global variables at the end of the last gumus_run, in the memory-dump
+   format: {"line": N, "stack": [], "env": {...}}. */
+GUMUS_API int gumus_dump_memory(char* buffer, size_t capacity, size_t* required);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
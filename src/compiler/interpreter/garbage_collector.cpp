@@ -98,8 +98,8 @@ void GarbageCollector::sweep() {
 // -----------------------------------------------------------------
 
 void GumusList::mark(GarbageCollector* gc) {
-    for (auto& el : elements) {
-        gc->markValue(el);
+    for (std::size_t i = head; i < elements.size(); ++i) {
+        gc->markValue(elements[i]);
     }
 }
 
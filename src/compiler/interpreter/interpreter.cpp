@@ -111,6 +111,7 @@ void Interpreter::interpret(const std::vector<Stmt*>& statements) {
 
 void Interpreter::execute(Stmt* stmt) {
     if (stmt == nullptr) return;
+    if (gumus_cancel_flag != nullptr && *gumus_cancel_flag) throw GumusCancelled();
     currentLine = stmt->line;
     
     try {
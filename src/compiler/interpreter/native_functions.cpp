@@ -176,7 +176,7 @@ void registerNativeFunctions(Interpreter& interpreter) {
     // uzunluk(deger)
     auto uzunluk = std::make_shared<NativeFunction>("uzunluk", 1, [](Interpreter&, const std::vector<Value>& args) {
         if (args[0].type == ValueType::STRING) return Value((int)args[0].getString().length());
-        if (args[0].type == ValueType::LIST) return Value((int)args[0].getList().size());
+        if (args[0].type == ValueType::LIST) return Value((int)AS_LIST(args[0])->size());
         return Value(0);
     });
     interpreter.functions["uzunluk"] = uzunluk;
@@ -201,6 +201,19 @@ void registerNativeFunctions(Interpreter& interpreter) {
     });
     interpreter.functions["sayiYap"] = sayiYap;
 
+    // tamsayi(deger) -> sıfıra doğru kesilmiş tamsayı (ör. orta = tamsayı((alt + ust) / 2))
+    auto tamsayi = std::make_shared<NativeFunction>("tamsayı", 1, [](Interpreter&, const std::vector<Value>& args) {
+        if (args[0].type == ValueType::INTEGER) return args[0];
+        if (args[0].type == ValueType::FLOAT) return Value(static_cast<int>(args[0].as.floatVal));
+        if (args[0].type == ValueType::STRING) {
+            try { return Value(static_cast<int>(std::stod(args[0].getString()))); } catch(...) { return Value(0); }
+        }
+        if (args[0].type == ValueType::BOOLEAN) return Value(args[0].as.boolVal ? 1 : 0);
+        return Value(0);
+    });
+    interpreter.functions["tamsayi"] = tamsayi;
+    interpreter.functions["tamsayı"] = tamsayi;
+
     // metin(deger)
     auto metin = std::make_shared<NativeFunction>("metin", 1, [](Interpreter& interpreter, const std::vector<Value>& args) {
         return Value(interpreter.garbageCollector->allocateObject<GumusString>(args[0].toString()), ValueType::STRING);
@@ -231,7 +244,7 @@ void registerNativeFunctions(Interpreter& interpreter) {
     // ekle(liste, eleman)
     auto ekle = std::make_shared<NativeFunction>("ekle", 2, [](Interpreter&, const std::vector<Value>& args) {
         if (args[0].type != ValueType::LIST) return Value(0);
-        args[0].getList().push_back(args[1]);
+        AS_LIST(args[0])->elements.push_back(args[1]);  // Sona ekleme tüketilmiş öneki etkilemez
         return args[0];
     });
     interpreter.functions["ekle"] = ekle;
@@ -262,6 +275,101 @@ void registerNativeFunctions(Interpreter& interpreter) {
     });
     interpreter.functions["sirala"] = sirala;
 
+    // 2b. KOLEKSİYON İŞLEMLERİ (lib/veri_yapilari.tr bunlara dayanır)
+    // ----------------------------------------------------------------
+    // Python çalışma zamanındaki yerleşiklerle aynı adlar (ASCII yazımları da
+    // kayıtlıdır). Kuyruk ayrı bir tür değildir, listedir; baştan çıkarma
+    // GumusList::head ile tüketilmiş öneki ilerletir (amortize O(1)).
+
+    // cikar(liste) -> sondaki elemanı çıkarıp döner
+    auto cikar = std::make_shared<NativeFunction>("çıkar", 1, [](Interpreter&, const std::vector<Value>& args) {
+        if (args[0].type != ValueType::LIST || args[0].getList().empty()) return Value();
+        Value last = args[0].getList().back();
+        args[0].getList().pop_back();
+        return last;
+    });
+    interpreter.functions["cikar"] = cikar;
+    interpreter.functions["çıkar"] = cikar;
+
+    // araya_ekle(liste, indeks, eleman)
+    auto araya_ekle = std::make_shared<NativeFunction>("araya_ekle", 3, [](Interpreter&, const std::vector<Value>& args) {
+        if (args[0].type != ValueType::LIST || args[1].type != ValueType::INTEGER) return args[0];
+        auto& list = args[0].getList();
+        long long idx = args[1].as.intVal;
+        if (idx < 0) idx = std::max(0LL, idx + (long long)list.size());
+        if (idx > (long long)list.size()) idx = (long long)list.size();
+        list.insert(list.begin() + idx, args[2]);
+        return args[0];
+    });
+    interpreter.functions["araya_ekle"] = araya_ekle;
+
+    // kuyruk_yap() -> boş kuyruk
+    auto kuyruk_yap = std::make_shared<NativeFunction>("kuyruk_yap", 0, [](Interpreter& interpreter, const std::vector<Value>& args) {
+        return Value(interpreter.garbageCollector->allocateObject<GumusList>(), ValueType::LIST);
+    });
+    interpreter.functions["kuyruk_yap"] = kuyruk_yap;
+
+    // basa_ekle(kuyruk, eleman)
+    auto basa_ekle = std::make_shared<NativeFunction>("başa_ekle", 2, [](Interpreter&, const std::vector<Value>& args) {
+        if (args[0].type != ValueType::LIST) return args[0];
+        GumusList* list = AS_LIST(args[0]);
+        if (list->head > 0) list->elements[--list->head] = args[1];  // Tüketilmiş yuva yeniden kullanılır
+        else list->elements.insert(list->elements.begin(), args[1]);
+        return args[0];
+    });
+    interpreter.functions["basa_ekle"] = basa_ekle;
+    interpreter.functions["başa_ekle"] = basa_ekle;
+
+    // bastan_cikar(kuyruk) -> baştaki elemanı çıkarıp döner
+    auto bastan_cikar = std::make_shared<NativeFunction>("baştan_çıkar", 1, [](Interpreter&, const std::vector<Value>& args) {
+        if (args[0].type != ValueType::LIST || AS_LIST(args[0])->size() == 0) return Value();
+        GumusList* list = AS_LIST(args[0]);
+        Value first = list->elements[list->head];
+        list->elements[list->head++] = Value();  // GC tüketilen elemanı tutmasın
+        // Önek yarıyı geçince silinir: her eleman en fazla bir kez kaydırılır
+        if (list->head * 2 >= list->elements.size()) list->compact();
+        return first;
+    });
+    interpreter.functions["bastan_cikar"] = bastan_cikar;
+    interpreter.functions["baştan_çıkar"] = bastan_cikar;
+
+    // sozluk_al(sozluk, anahtar) -> değer veya yok
+    auto sozluk_al = std::make_shared<NativeFunction>("sözlük_al", 2, [](Interpreter&, const std::vector<Value>& args) {
+        if (args[0].type != ValueType::MAP) return Value();
+        auto it = args[0].getMap().find(args[1].toString());
+        return it != args[0].getMap().end() ? it->second : Value();
+    });
+    interpreter.functions["sozluk_al"] = sozluk_al;
+    interpreter.functions["sözlük_al"] = sozluk_al;
+
+    // sozluk_koy(sozluk, anahtar, deger)
+    auto sozluk_koy = std::make_shared<NativeFunction>("sözlük_koy", 3, [](Interpreter&, const std::vector<Value>& args) {
+        if (args[0].type == ValueType::MAP) args[0].getMap()[args[1].toString()] = args[2];
+        return args[0];
+    });
+    interpreter.functions["sozluk_koy"] = sozluk_koy;
+    interpreter.functions["sözlük_koy"] = sozluk_koy;
+
+    // sozluk_sil(sozluk, anahtar) -> silinen değer veya yok
+    auto sozluk_sil = std::make_shared<NativeFunction>("sözlük_sil", 2, [](Interpreter&, const std::vector<Value>& args) {
+        if (args[0].type != ValueType::MAP) return Value();
+        auto& map = args[0].getMap();
+        auto it = map.find(args[1].toString());
+        if (it == map.end()) return Value();
+        Value removed = it->second;
+        map.erase(it);
+        return removed;
+    });
+    interpreter.functions["sozluk_sil"] = sozluk_sil;
+    interpreter.functions["sözlük_sil"] = sozluk_sil;
+
+    // anahtar_var(sozluk, anahtar)
+    auto anahtar_var = std::make_shared<NativeFunction>("anahtar_var", 2, [](Interpreter&, const std::vector<Value>& args) {
+        if (args[0].type != ValueType::MAP) return Value(false);
+        return Value(args[0].getMap().count(args[1].toString()) > 0);
+    });
+    interpreter.functions["anahtar_var"] = anahtar_var;
+
     // 3. MATEMATİK
     // ------------
     
@@ -60,8 +60,13 @@ struct GumusString : public GumusObject {
 
 struct GumusList : public GumusObject {
     ValueList elements;
+    // baştan_çıkar ile tüketilmiş önek: elements[0, head) artık listede değildir.
+    // Kuyruk işlemleri O(1) kalır; indeksle erişen yollar getList() ile önce sıkıştırır.
+    std::size_t head = 0;
     GumusList() : GumusObject(ObjectType::OBJ_LIST) {}
     void mark(GarbageCollector* gc) override;
+    void compact();
+    std::size_t size() const;
 };
 
 struct GumusMap : public GumusObject {
@@ -110,7 +115,7 @@ struct Value {
 
     // Yardimci Erisim Metotlari
     std::string& getString() const { return AS_STRING(*this)->str; }
-    ValueList& getList() const { return AS_LIST(*this)->elements; }
+    ValueList& getList() const { AS_LIST(*this)->compact(); return AS_LIST(*this)->elements; }
     std::map<std::string, Value>& getMap() const { return AS_MAP(*this)->items; }
 
     // 📊 Bellek Analizi ve Optimizasyon
@@ -296,6 +301,15 @@ struct Value {
     }
 };
 
+// GumusList üyeleri Value tamamlandıktan sonra tanımlanır
+inline void GumusList::compact() {
+    if (head == 0) return;
+    elements.erase(elements.begin(), elements.begin() + head);
+    head = 0;
+}
+
+inline std::size_t GumusList::size() const { return elements.size() - head; }
+
 // 🔧 Utility functions
 std::string valueTypeName(ValueType type);
 
@@ -9,6 +9,7 @@
 #include "parser/parser.h"
 #include "semantic/resolver.h"
 #include "interpreter/interpreter.h"
+#include "parser/ast_serializer.h"
 #include "json_hata.h"
 
 #ifdef _WIN32
@@ -23,7 +24,7 @@ void LSPServer::run() {
 #endif
 
     std::string line;
-    while (std::getline(std::cin, line)) {
+    while (running && std::getline(std::cin, line)) {
         if (line.substr(0, 16) == "Content-Length: ") {
             int length = std::stoi(line.substr(16));
             std::getline(std::cin, line); // Read empty line \r\n
@@ -75,41 +76,77 @@ void LSPServer::handleRequest(const std::string& method, const std::string& para
         sendResponse(id, result);
     } else if (method == "shutdown") {
         sendResponse(id, "null");
+    } else if (method == "gumus/ast") {
+        // The document must have been sent with didOpen/didChange first
+        std::string uri = extractJsonString(params, "uri");
+        auto doc = documents.find(uri);
+        if (doc == documents.end()) {
+            sendError(id, -32602, "Unknown document: " + uri);
+        } else {
+            sendResponse(id, serializeAst(doc->second));
+        }
+    } else {
+        sendError(id, -32601, "Method not found: " + method);
     }
 }
 
-void LSPServer::handleNotification(const std::string& method, const std::string& params) {
-    if (method == "textDocument/didOpen" || method == "textDocument/didChange" || method == "textDocument/didSave") {
-        // Extract URI and context
-        size_t uriPos = params.find("\"uri\":\"");
-        if (uriPos == std::string::npos) return;
-        size_t start = uriPos + 7;
-        size_t end = params.find("\"", start);
-        std::string uri = params.substr(start, end - start);
-
-        // For didChange, it's more complex, but let's assume we get the full text for simplicity
-        // in a basic implementation or if we use textDocumentSync: 1 (Full)
-        size_t textPos = params.find("\"text\":\"");
-        if (textPos != std::string::npos) {
-            size_t tStart = textPos + 8;
-            size_t tEnd = params.find("\"", tStart);
-            std::string content = params.substr(tStart, tEnd - tStart);
-            
-            // Unescape simple JSON escapes (demonstration)
-            std::string unescaped = "";
-            for (size_t i = 0; i < content.length(); ++i) {
-                if (content[i] == '\\' && i + 1 < content.length()) {
-                    if (content[i+1] == 'n') { unescaped += '\n'; i++; }
-                    else if (content[i+1] == '"') { unescaped += '"'; i++; }
-                    else if (content[i+1] == '\\') { unescaped += '\\'; i++; }
-                    else unescaped += content[i];
-                } else {
-                    unescaped += content[i];
-                }
+std::string extractJsonString(const std::string& body, const std::string& key, bool* found) {
+    std::string pattern = "\"" + key + "\":\"";
+    size_t pos = body.find(pattern);
+    if (found) *found = pos != std::string::npos;
+    if (pos == std::string::npos) return "";
+
+    std::string value;
+    for (size_t i = pos + pattern.length(); i < body.length(); ++i) {
+        char c = body[i];
+        if (c == '"') break;
+        if (c != '\\' || i + 1 >= body.length()) {
+            value += c;
+            continue;
+        }
+        char e = body[++i];
+        if (e == 'n') value += '\n';
+        else if (e == 't') value += '\t';
+        else if (e == 'r') value += '\r';
+        else if (e == 'b') value += '\b';
+        else if (e == 'f') value += '\f';
+        else if (e == 'u' && i + 4 < body.length()) {
+            // Encode the BMP code point as UTF-8
+            unsigned int cp = std::stoul(body.substr(i + 1, 4), nullptr, 16);
+            i += 4;
+            if (cp < 0x80) {
+                value += static_cast<char>(cp);
+            } else if (cp < 0x800) {
+                value += static_cast<char>(0xC0 | (cp >> 6));
+                value += static_cast<char>(0x80 | (cp & 0x3F));
+            } else {
+                value += static_cast<char>(0xE0 | (cp >> 12));
+                value += static_cast<char>(0x80 | ((cp >> 6) & 0x3F));
+                value += static_cast<char>(0x80 | (cp & 0x3F));
             }
+        }
+        else value += e; // \" \\ \/
+    }
+    return value;
+}
 
-            publishDiagnostics(uri, unescaped);
+void LSPServer::handleNotification(const std::string& method, const std::string& params) {
+    if (method == "textDocument/didOpen" || method == "textDocument/didChange" || method == "textDocument/didSave") {
+        bool hasUri = false;
+        std::string uri = extractJsonString(params, "uri", &hasUri);
+        if (!hasUri) return;
+
+        // textDocumentSync: 1 (Full) - every change carries the whole text
+        bool hasText = false;
+        std::string content = extractJsonString(params, "text", &hasText);
+        if (hasText) {
+            documents[uri] = content;
+            publishDiagnostics(uri, content);
         }
+    } else if (method == "textDocument/didClose") {
+        documents.erase(extractJsonString(params, "uri"));
+    } else if (method == "exit") {
+        running = false;
     }
 }
 
@@ -118,6 +155,36 @@ void LSPServer::sendResponse(const std::string& id, const std::string& result) {
     std::cout << "Content-Length: " << body.length() << "\r\n\r\n" << body << std::flush;
 }
 
+void LSPServer::sendError(const std::string& id, int code, const std::string& message) {
+    std::string escaped;
+    for (char c : message) {
+        if (c == '"' || c == '\\') escaped += '\\';
+        escaped += c;
+    }
+    std::string body = "{\"jsonrpc\":\"2.0\",\"id\":" + id + ",\"error\":{\"code\":" +
+                       std::to_string(code) + ",\"message\":\"" + escaped + "\"}}";
+    std::cout << "Content-Length: " << body.length() << "\r\n\r\n" << body << std::flush;
+}
+
+std::string LSPServer::serializeAst(const std::string& content) {
+    // Parser/resolver errors go to the diagnostics channel, not the JSON-RPC stream
+    std::stringstream errorStream;
+    std::streambuf* oldCerr = std::cerr.rdbuf(errorStream.rdbuf());
+    std::string json = "[]";
+    try {
+        Interpreter interpreter;
+        Tokenizer tokenizer(content);
+        std::vector<Token> tokens = tokenizer.tokenize();
+        Parser parser(tokens, interpreter.astArena);
+        std::vector<Stmt*> statements = parser.parse();
+        AstJsonSerializer serializer;
+        json = serializer.serialize(statements);
+    } catch (...) {
+    }
+    std::cerr.rdbuf(oldCerr);
+    return json;
+}
+
 void LSPServer::sendNotification(const std::string& method, const std::string& params) {
     std::string body = "{\"jsonrpc\":\"2.0\",\"method\":\"" + method + "\",\"params\":" + params + "}";
     std::cout << "Content-Length: " << body.length() << "\r\n\r\n" << body << std::flush;
@@ -1,6 +1,7 @@
 #ifndef LSP_SERVER_H
 #define LSP_SERVER_H
 
+#include <map>
 #include <string>
 
 class LSPServer {
@@ -11,10 +12,19 @@ private:
     void handleRequest(const std::string& method, const std::string& params, const std::string& id);
     void handleNotification(const std::string& method, const std::string& params);
     void sendResponse(const std::string& id, const std::string& result);
+    void sendError(const std::string& id, int code, const std::string& message);
     void sendNotification(const std::string& method, const std::string& params);
     
     // Core LSP logic
     void publishDiagnostics(const std::string& uri, const std::string& content);
+    std::string serializeAst(const std::string& content);
+
+    // Open documents (uri -> full text), kept for gumus/ast requests
+    std::map<std::string, std::string> documents;
+    bool running = true;
 };
 
+// Reads the JSON string value of `key` (first occurrence), decoding escapes
+std::string extractJsonString(const std::string& body, const std::string& key, bool* found = nullptr);
+
 #endif
@@ -54,6 +54,7 @@ struct CompilerConfig {
     bool dumpMemory = false;
     bool enableDebug = false;
     bool enableProfiling = false;
+    bool lspMode = false;
     std::string outputFile;
     SecurityContext::TrustLevel securityLevel = SecurityContext::TrustLevel::MEDIUM;
 };
@@ -74,6 +75,7 @@ void printUsage(const char* programName) {
     std::cout << "  --dump-memory       Dump memory state\n";
     std::cout << "  --debug             Enable debug mode\n";
     std::cout << "  --profile           Enable profiling\n";
+    std::cout << "  --lsp               Run as a language server (JSON-RPC over stdio)\n";
     std::cout << "  --security <level>  Security level (low|medium|high|system)\n";
     std::cout << "  --output <file>     Output file (for code generation)\n";
     std::cout << "  --help              Show this help message\n\n";
@@ -127,6 +129,8 @@ bool parseArguments(int argc, char* argv[]) {
             gumus_debug = true;
         } else if (arg == "--profile") {
             config.enableProfiling = true;
+        } else if (arg == "--lsp") {
+            config.lspMode = true;
         } else if (arg == "--security" && i + 1 < argc) {
             std::string level = argv[++i];
             if (level == "low") config.securityLevel = SecurityContext::TrustLevel::LOW;
@@ -445,6 +449,13 @@ int main(int argc, char* argv[]) {
     
     // Update security context with parsed security level
     g_securityContext.setTrustLevel(config.securityLevel);
+
+    // Persistent daemon for the IDE: diagnostics and AST requests over stdio
+    if (config.lspMode) {
+        LSPServer server;
+        server.run();
+        return 0;
+    }
     
     // Find input file
     std::string inputFile;
@@ -20,8 +20,10 @@ else:
 # PLATFORM KONTROLÜ
 if sys.platform == 'win32':
     COMPILER_PATH = PROJECT_ROOT / "bin" / "gumus.exe"
+    NATIVE_LIBRARY_PATH = PROJECT_ROOT / "bin" / "gumus.dll"
 else:
     COMPILER_PATH = PROJECT_ROOT / "bin" / "gumus"
+    NATIVE_LIBRARY_PATH = PROJECT_ROOT / "bin" / "libgumus.so"
 
 EXAMPLES_DIR = PROJECT_ROOT / "ornekler"
 LIB_DIR = PROJECT_ROOT / "lib"
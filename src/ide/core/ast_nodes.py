@@ -1,17 +1,31 @@
 # -*- coding: utf-8 -*-
+"""
+GümüşDil AST Düğümleri
+Düğümler __slots__ kullanır (örnek başına __dict__ yok) ve her sınıf bir tamsayı
+`kind` etiketi taşır. NodeVisitor bu etiketle tablodan tek adımda doğru
+visit_* metoduna atlar; isinstance zincirlerine gerek kalmaz.
+"""
 
 class ASTNode:
+    __slots__ = ()
+    kind = -1 # NODE_TYPES içindeki sıra; modül sonunda atanır
+
     def to_json(self):
         raise NotImplementedError
 
 class Program(ASTNode):
-    def __init__(self, statements):
+    __slots__ = ('statements', 'diagnostics')
+
+    def __init__(self, statements, diagnostics=None):
         self.statements = statements
+        self.diagnostics = diagnostics if diagnostics is not None else [] # Sözdizimi hataları
     
     def to_json(self):
         return [s.to_json() for s in self.statements]
 
 class VarStmt(ASTNode):
+    __slots__ = ('name', 'initializer')
+
     def __init__(self, name, initializer):
         self.name = name
         self.initializer = initializer
@@ -21,6 +35,8 @@ class VarStmt(ASTNode):
         return { "type": "VarStmt", "value": self.name.value, "children": children }
 
 class FunctionStmt(ASTNode):
+    __slots__ = ('name', 'params', 'body')
+
     def __init__(self, name, params, body):
         self.name = name
         self.params = params # List of Token
@@ -36,7 +52,23 @@ class FunctionStmt(ASTNode):
             "children": [body_json]
         }
 
+class ClassStmt(ASTNode):
+    __slots__ = ('name', 'superclass', 'methods')
+
+    def __init__(self, name, superclass, methods):
+        self.name = name
+        self.superclass = superclass # Variable veya None
+        self.methods = methods # List of FunctionStmt
+
+    def to_json(self):
+        result = { "type": "ClassStmt", "value": self.name.value, "children": [m.to_json() for m in self.methods] }
+        if self.superclass:
+            result["superclass"] = self.superclass.name.value
+        return result
+
 class BlockStmt(ASTNode):
+    __slots__ = ('statements',)
+
     def __init__(self, statements):
         self.statements = statements
         
@@ -45,6 +77,8 @@ class BlockStmt(ASTNode):
         return { "type": "BlockStmt", "children": children }
 
 class IfStmt(ASTNode):
+    __slots__ = ('condition', 'then_branch', 'else_branch')
+
     def __init__(self, condition, then_branch, else_branch=None):
         self.condition = condition
         self.then_branch = then_branch
@@ -57,6 +91,8 @@ class IfStmt(ASTNode):
         return { "type": "IfStmt", "children": children }
 
 class WhileStmt(ASTNode):
+    __slots__ = ('condition', 'body')
+
     def __init__(self, condition, body):
         self.condition = condition
         self.body = body
@@ -64,22 +100,43 @@ class WhileStmt(ASTNode):
     def to_json(self):
         return { "type": "WhileStmt", "children": [self.condition.to_json(), self.body.to_json()] }
 
+class ForStmt(ASTNode):
+    __slots__ = ('initializer', 'condition', 'increment', 'body')
+
+    def __init__(self, initializer, condition, increment, body):
+        self.initializer = initializer # VarStmt, ExprStmt veya None
+        self.condition = condition
+        self.increment = increment
+        self.body = body
+
+    def to_json(self):
+        children = [part.to_json() if part else None for part in (self.initializer, self.condition, self.increment)]
+        return { "type": "ForStmt", "children": children + [self.body.to_json()] }
+
 class PrintStmt(ASTNode):
-    def __init__(self, expressions):
+    __slots__ = ('expressions', 'keyword')
+
+    def __init__(self, expressions, keyword=None):
         self.expressions = expressions
+        self.keyword = keyword # 'yazdır' token'ı (satır bilgisi için)
         
     def to_json(self):
         return { "type": "PrintStmt", "children": [e.to_json() for e in self.expressions] }
 
 class ReturnStmt(ASTNode):
-    def __init__(self, value):
+    __slots__ = ('value', 'keyword')
+
+    def __init__(self, value, keyword=None):
         self.value = value
+        self.keyword = keyword
         
     def to_json(self):
         children = [self.value.to_json()] if self.value else []
         return { "type": "ReturnStmt", "children": children }
 
 class ExprStmt(ASTNode):
+    __slots__ = ('expression',)
+
     def __init__(self, expression):
         self.expression = expression
         
@@ -87,24 +144,45 @@ class ExprStmt(ASTNode):
         return { "type": "ExprStmt", "children": [self.expression.to_json()] }
 
 class BreakStmt(ASTNode):
+    __slots__ = ('keyword',)
+
+    def __init__(self, keyword=None):
+        self.keyword = keyword
+
     def to_json(self): return { "type": "BreakStmt" }
 
 class ContinueStmt(ASTNode):
+    __slots__ = ('keyword',)
+
+    def __init__(self, keyword=None):
+        self.keyword = keyword
+
     def to_json(self): return { "type": "ContinueStmt" }
 
 class IncludeStmt(ASTNode):
-    def __init__(self, module):
+    __slots__ = ('module', 'alias')
+
+    def __init__(self, module, alias=None):
         self.module = module
+        self.alias = alias
     def to_json(self): return { "type": "IncludeStmt", "value": self.module }
 
 class TryStmt(ASTNode):
-    def __init__(self, try_block, catch_body):
+    __slots__ = ('try_block', 'catch_body', 'catch_name')
+
+    def __init__(self, try_block, catch_body, catch_name=None):
         self.try_block = try_block
         self.catch_body = catch_body
+        self.catch_name = catch_name # yakala(hata) -> Token, yoksa None
     def to_json(self):
-        return { "type": "TryStmt", "children": [self.try_block.to_json(), self.catch_body.to_json()] }
+        result = { "type": "TryStmt", "children": [self.try_block.to_json(), self.catch_body.to_json()] }
+        if self.catch_name:
+            result["value"] = self.catch_name.value
+        return result
 
 class UnaryExpr(ASTNode):
+    __slots__ = ('operator', 'right')
+
     def __init__(self, operator, right):
         self.operator = operator
         self.right = right
@@ -113,6 +191,8 @@ class UnaryExpr(ASTNode):
         return { "type": "UnaryExpr", "value": self.operator.value, "children": [self.right.to_json()] }
 
 class BinaryExpr(ASTNode):
+    __slots__ = ('left', 'operator', 'right')
+
     def __init__(self, left, operator, right):
         self.left = left
         self.operator = operator
@@ -122,6 +202,8 @@ class BinaryExpr(ASTNode):
         return { "type": "BinaryExpr", "value": self.operator.value, "children": [self.left.to_json(), self.right.to_json()] }
 
 class Literal(ASTNode):
+    __slots__ = ('value',)
+
     def __init__(self, value):
         self.value = value
         
@@ -129,6 +211,8 @@ class Literal(ASTNode):
         return { "type": "Literal", "value": str(self.value) }
 
 class Variable(ASTNode):
+    __slots__ = ('name',)
+
     def __init__(self, name):
         self.name = name
         
@@ -136,6 +220,8 @@ class Variable(ASTNode):
         return { "type": "Variable", "value": self.name.value }
 
 class CallExpr(ASTNode):
+    __slots__ = ('callee', 'args')
+
     def __init__(self, callee, args):
         self.callee = callee
         self.args = args
@@ -143,3 +229,148 @@ class CallExpr(ASTNode):
     def to_json(self):
         children = [self.callee.to_json()] + [arg.to_json() for arg in self.args]
         return { "type": "CallExpr", "children": children }
+
+class AssignExpr(ASTNode):
+    __slots__ = ('name', 'value')
+
+    def __init__(self, name, value):
+        self.name = name
+        self.value = value
+
+    def to_json(self):
+        return { "type": "AssignExpr", "value": self.name.value, "children": [self.value.to_json()] }
+
+class LogicalExpr(ASTNode):
+    __slots__ = ('left', 'operator', 'right')
+
+    def __init__(self, left, operator, right):
+        self.left = left
+        self.operator = operator
+        self.right = right
+
+    def to_json(self):
+        return { "type": "LogicalExpr", "value": self.operator.value, "children": [self.left.to_json(), self.right.to_json()] }
+
+class GetExpr(ASTNode):
+    __slots__ = ('object', 'name')
+
+    def __init__(self, object, name):
+        self.object = object
+        self.name = name
+
+    def to_json(self):
+        return { "type": "GetExpr", "value": self.name.value, "children": [self.object.to_json()] }
+
+class SetExpr(ASTNode):
+    __slots__ = ('object', 'name', 'value')
+
+    def __init__(self, object, name, value):
+        self.object = object
+        self.name = name
+        self.value = value
+
+    def to_json(self):
+        return { "type": "SetExpr", "value": self.name.value, "children": [self.object.to_json(), self.value.to_json()] }
+
+class IndexExpr(ASTNode):
+    __slots__ = ('object', 'index')
+
+    def __init__(self, object, index):
+        self.object = object
+        self.index = index
+
+    def to_json(self):
+        return { "type": "IndexExpr", "children": [self.object.to_json(), self.index.to_json()] }
+
+class IndexSetExpr(ASTNode):
+    __slots__ = ('object', 'index', 'value')
+
+    def __init__(self, object, index, value):
+        self.object = object
+        self.index = index
+        self.value = value
+
+    def to_json(self):
+        return { "type": "IndexSetExpr", "children": [self.object.to_json(), self.index.to_json(), self.value.to_json()] }
+
+class ListExpr(ASTNode):
+    __slots__ = ('elements',)
+
+    def __init__(self, elements):
+        self.elements = elements
+
+    def to_json(self):
+        return { "type": "ListExpr", "children": [e.to_json() for e in self.elements] }
+
+class ThisExpr(ASTNode):
+    __slots__ = ('keyword',)
+
+    def __init__(self, keyword):
+        self.keyword = keyword
+
+    def to_json(self):
+        return { "type": "ThisExpr", "value": self.keyword.value }
+
+class SuperExpr(ASTNode):
+    __slots__ = ('keyword', 'method')
+
+    def __init__(self, keyword, method):
+        self.keyword = keyword
+        self.method = method
+
+    def to_json(self):
+        return { "type": "SuperExpr", "value": self.method.value }
+
+class NewExpr(ASTNode):
+    __slots__ = ('callee', 'args')
+
+    def __init__(self, callee, args):
+        self.callee = callee
+        self.args = args
+
+    def to_json(self):
+        children = [self.callee.to_json()] + [arg.to_json() for arg in self.args]
+        return { "type": "NewExpr", "children": children }
+
+class DictExpr(ASTNode):
+    __slots__ = ('keys', 'values')
+
+    def __init__(self, keys, values):
+        self.keys = keys # List of Literal
+        self.values = values
+
+    def to_json(self):
+        children = [{ "type": "Pair", "value": str(k.value), "children": [v.to_json()] } for k, v in zip(self.keys, self.values)]
+        return { "type": "DictExpr", "children": children }
+
+
+# Düğüm türü tablosu: `kind` bu listedeki sıradır. Yeni düğüm sona eklenmeli;
+# sıra değişirse ayrıştırma önbelleği için PARSER_VERSION artırılmalıdır.
+NODE_TYPES = [
+    Program, VarStmt, FunctionStmt, ClassStmt, BlockStmt, IfStmt, WhileStmt, ForStmt,
+    PrintStmt, ReturnStmt, ExprStmt, BreakStmt, ContinueStmt, IncludeStmt, TryStmt,
+    UnaryExpr, BinaryExpr, Literal, Variable, CallExpr, AssignExpr, LogicalExpr,
+    GetExpr, SetExpr, IndexExpr, IndexSetExpr, ListExpr, ThisExpr, SuperExpr, NewExpr, DictExpr,
+]
+
+for _kind, _node_type in enumerate(NODE_TYPES):
+    _node_type.kind = _kind
+del _kind, _node_type
+
+
+class NodeVisitor:
+    """
+    Tablo güdümlü ziyaretçi tabanı. Alt sınıf visit_<Düğüm> metotları tanımlar;
+    kurulumda bunlar `kind` sırasına göre bir listeye bağlanır, tanımlanmayanlar
+    generic_visit'e düşer.
+    """
+
+    def __init__(self):
+        fallback = self.generic_visit
+        self._dispatch = [getattr(self, f"visit_{node_type.__name__}", fallback) for node_type in NODE_TYPES]
+
+    def visit(self, node):
+        return self._dispatch[node.kind](node)
+
+    def generic_visit(self, node):
+        raise NotImplementedError(f"{type(self).__name__}: {type(node).__name__} için ziyaretçi yok")
@@ -6,6 +6,10 @@ import time
 from pathlib import Path
 from ..config import COMPILER_PATH, PROJECT_ROOT
 from .secure_subprocess import SecureSubprocessManager, SecurityLevel, SecurityError
+from .compiler_probe import get_compiler_probe
+from .worker_pool import get_worker_pool
+from .lsp_client import get_lsp_client, LspError
+from .native_vm import get_native_vm, NativeError
 
 class CompilerRunner:
     DLL_NOT_FOUND_ERROR = 3221225781 # 0xC0000135
@@ -19,6 +23,8 @@ class CompilerRunner:
         self.secure_manager.add_safe_command(str(COMPILER_PATH.name))
         # Set timeout for compiler operations with retry logic
         self.secure_manager.set_timeout(45)  # Increased to 45 seconds for stability
+        # Kontrolden çıkan öğrenci programları IDE'nin belleğini ve işlemciyi tüketmesin
+        self.secure_manager.set_resource_limits(memory_mb=1024)
         
         # Enhanced error tracking
         self.error_count = 0
@@ -26,38 +32,45 @@ class CompilerRunner:
         self.max_consecutive_errors = 3
         self.fallback_mode = False
 
-    def is_compiler_viable(self):
-        """Derleyicinin çalışabilir durumda olup olmadığını kontrol eder (DLL kontrolü)"""
-        if not COMPILER_PATH.exists():
-            return False
+    def is_compiler_viable(self, refresh=False):
+        """
+        Derleyicinin çalışabilir durumda olup olmadığını döner (DLL kontrolü).
+        Sonuç ikilinin parmak iziyle önbelleğe alınır (bkz. compiler_probe.py);
+        ikili değişmedikçe süreç başlatılmaz. `refresh` yeniden yoklar.
+        """
         try:
-            # Use secure subprocess for compiler check with retry logic
-            for attempt in range(3):  # 3 attempts for stability
-                result = self.secure_manager.execute_safe(
-                    str(COMPILER_PATH), 
-                    ["--help"],
-                    cwd=str(PROJECT_ROOT)
-                )
-                if result['success'] and result['returncode'] == 0:
-                    self.error_count = 0  # Reset error count on success
-                    self.fallback_mode = False
-                    return True
-                
-                if attempt < 2:  # Don't sleep on last attempt
-                    time.sleep(1)  # Wait 1 second between attempts
-                    
-            self._handle_compiler_error("Compiler viability check failed after 3 attempts")
-            return False
+            result = get_compiler_probe().result(refresh)
         except Exception as e:
             self._handle_compiler_error(f"Exception during compiler check: {e}")
             return False
+        if result.viable and refresh:
+            self.error_count = 0
+            self.fallback_mode = False
+        return result.viable
+
+    def supports(self, flag):
+        """Derleyici çalışıyor ve `--help` çıktısında bu seçenek var mı"""
+        return get_compiler_probe().result().supports(flag)
 
     def start_interactive(self, source_file):
-        """İnteraktif bir process başlatır ve Popen nesnesini döner"""
+        """
+        İnteraktif bir process başlatır ve Popen nesnesini döner. Yerel
+        kütüphane (bin/libgumus.so) varsa program süreç içinde çalışır
+        (NativeRun); simülatör kullanılıyorsa süreç havuzdaki hazır işçidir
+        (WorkerRun). İkisi de Popen gibi kullanılır ve süren önceki
+        çalıştırmayı iptal eder.
+        """
         # Validate source file path
         if not self.secure_manager.validate_working_directory(str(Path(source_file).parent))[0]:
             raise SecurityError(f"Güvensiz kaynak dosya yolu: {source_file}")
 
+        native = get_native_vm()
+        if native.available():
+            try:
+                return native.start(source_file)
+            except (NativeError, OSError, UnicodeDecodeError):
+                pass  # Meşgul veya okunamayan kaynak: süreç tabanlı yol denenir
+
         # FALLBACK: Simülatör (Dosya yoksa VEYA çalışmıyorsa)
         if not self.is_compiler_viable():
             simulator_script = PROJECT_ROOT / "src" / "ide" / "core" / "run_simulator.py"
@@ -66,18 +79,15 @@ class CompilerRunner:
             if not simulator_script.exists():
                 raise FileNotFoundError(f"Simülatör bulunamadı: {simulator_script}")
 
-            # Use secure subprocess for simulator
-            return self.secure_manager.execute_interactive(
-                sys.executable,
-                [str(simulator_script), str(source_file)],
-                cwd=str(PROJECT_ROOT)
-            )
+            # Modülleri yüklü hazır bir işçide çalıştır (bkz. worker_pool.py)
+            return get_worker_pool().start(source_file)
 
         # Use secure subprocess for compiler
         return self.secure_manager.execute_interactive(
             str(COMPILER_PATH),
             [str(source_file)],
-            cwd=str(PROJECT_ROOT)
+            cwd=str(PROJECT_ROOT),
+            limit_resources=True
         )
 
 
@@ -87,25 +97,29 @@ class CompilerRunner:
         if not self.secure_manager.validate_working_directory(str(Path(source_file).parent))[0]:
             raise SecurityError(f"Güvensiz kaynak dosya yolu: {source_file}")
 
-        # FALLBACK: Simülatör
-        if not self.is_compiler_viable():
+        native = get_native_vm()
+        if native.available():
+            try:
+                return native.start(source_file, dump_memory=True)
+            except (NativeError, OSError, UnicodeDecodeError):
+                pass  # Meşgul veya okunamayan kaynak: süreç tabanlı yol denenir
+
+        # FALLBACK: Simülatör (derleyici yoksa veya bellek dökümünü desteklemiyorsa)
+        if not self.supports("--dump-memory"):
             simulator_script = PROJECT_ROOT / "src" / "ide" / "core" / "run_simulator.py"
             
             if not simulator_script.exists():
                 raise FileNotFoundError(f"Simülatör bulunamadı: {simulator_script}")
                 
-            # Use secure subprocess for simulator with trace
-            return self.secure_manager.execute_interactive(
-                sys.executable,
-                [str(simulator_script), "--trace", str(source_file)],
-                cwd=str(PROJECT_ROOT)
-            )
+            # Hazır işçide izleme ile çalıştır
+            return get_worker_pool().start(source_file, ["--trace"])
 
         # Use secure subprocess for compiler with memory dump
         return self.secure_manager.execute_interactive(
             str(COMPILER_PATH),
             ["--dump-memory", str(source_file)],
-            cwd=str(PROJECT_ROOT)
+            cwd=str(PROJECT_ROOT),
+            limit_resources=True
         )
 
     def run(self, source_file):
@@ -113,6 +127,16 @@ class CompilerRunner:
         # Validate source file path
         if not self.secure_manager.validate_working_directory(str(Path(source_file).parent))[0]:
             return None, f"Güvenlik Hatası: Güvensiz kaynak dosya yolu: {source_file}", -1
+
+        native = get_native_vm()
+        if native.available():
+            try:
+                return native.run(source_file, timeout=self.secure_manager.timeout)
+            except subprocess.TimeoutExpired:
+                # Süreç yolundaki execute_safe zaman aşımıyla aynı sonuç
+                return None, f"Yerel Çalıştırma Hatası: Komut timeout ({self.secure_manager.timeout}s) aşıldı", -1
+            except (NativeError, OSError, UnicodeDecodeError) as e:
+                self._handle_compiler_error(f"Native run failed: {e}")
             
         # Check if we should use fallback mode
         if self.fallback_mode or not self.is_compiler_viable():
@@ -188,20 +212,31 @@ class CompilerRunner:
         if not self.secure_manager.validate_working_directory(str(Path(source_file).parent))[0]:
             return None, f"Güvenlik Hatası: Güvensiz kaynak dosya yolu: {source_file}", -1
             
-        if not self.is_compiler_viable():
+        native = get_native_vm()
+        if native.available():
+            # Süreç içi: derleyici başlatılmaz (meşgulse aşağıdaki yollara düşülür)
+            try:
+                return native.dump_ast(Path(source_file).read_text(encoding='utf-8')), "", 0
+            except (NativeError, OSError, UnicodeDecodeError):
+                pass
+
+        if self.supports("--lsp"):
+            # Kalıcı dil sunucusu: her istekte derleyici süreci başlatılmaz
+            try:
+                import json
+
+                source = Path(source_file).read_text(encoding='utf-8')
+                return json.dumps(get_lsp_client().ast(source), indent=2, ensure_ascii=False), "", 0
+            except (LspError, OSError, UnicodeDecodeError):
+                pass  # Sunucu kullanılamıyor; tek seferlik süreçle devam edilir
+
+        if not self.supports("--dump-ast"):
             # FALLBACK: Python tabanlı parser'ı kullan
             try:
-                from .tokenizer import GumusTokenizer
-                from .parser import GumusParser
+                from .parse_cache import get_parse_cache
                 import json
                 
-                with open(source_file, 'r', encoding='utf-8') as f:
-                    code = f.read()
-                
-                tokenizer = GumusTokenizer(code)
-                tokens = tokenizer.tokenize()
-                parser = GumusParser(tokens)
-                ast = parser.parse()
+                ast = get_parse_cache().parse_file(source_file)
                 
                 return json.dumps(ast.to_json(), indent=2, ensure_ascii=False), "", 0
             except Exception as e:
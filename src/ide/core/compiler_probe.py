@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""
+Derleyici Yetenek Yoklaması
+CompilerRunner her çalıştırma ve AST isteğinde derleyicinin çalışıp
+çalışmadığını `gumus --help` ile (üç denemeye kadar, aralarında 1 sn bekleyerek)
+sınıyordu. Yoklama artık IDE açılışında arka planda bir kez yapılır ve sonucu,
+ikilinin parmak iziyle (yol, değişiklik zamanı, boyut) birlikte
+USER_DATA_DIR/cache/compiler_probe.json dosyasına yazılır:
+
+    {"version": 2, "fingerprint": ["/.../bin/gumus", 1700000000000000000, 123456],
+     "viable": true, "features": ["--debug", "--dump-ast", "--dump-memory", "--lsp"]}
+
+Sonraki istekler yalnızca os.stat ile parmak izini karşılaştırır; ikili
+değişmedikçe süreç başlatılmaz. Yoklama sürerken gelen istekler yeni yoklama
+başlatmaz, süren yoklamanın sonucunu bekler.
+"""
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from ..config import COMPILER_PATH, PROJECT_ROOT
+from .secure_subprocess import SecureSubprocessManager, SecurityLevel
+
+# Kayıt biçimi değişirse artırılmalıdır (eski kayıtlar yok sayılır)
+PROBE_VERSION = 2
+
+# `--help` çıktısında aranan, IDE'nin kullandığı seçenekler
+FEATURE_FLAGS = ("--dump-ast", "--dump-memory", "--debug", "--lsp")
+
+
+class ProbeResult:
+    """Tek bir derleyici ikilisi için yoklama sonucu"""
+    __slots__ = ('fingerprint', 'viable', 'features')
+
+    def __init__(self, fingerprint, viable, features=()):
+        self.fingerprint = fingerprint  # [yol, mtime_ns, boyut]; ikili yoksa None
+        self.viable = viable
+        self.features = frozenset(features)
+
+    def supports(self, flag):
+        return self.viable and flag in self.features
+
+    def to_json(self):
+        return {
+            "version": PROBE_VERSION,
+            "fingerprint": self.fingerprint,
+            "viable": self.viable,
+            "features": sorted(self.features),
+        }
+
+    @classmethod
+    def from_json(cls, data):
+        if not isinstance(data, dict) or data.get("version") != PROBE_VERSION:
+            return None
+        return cls(data.get("fingerprint"), bool(data.get("viable")), data.get("features") or ())
+
+
+class CompilerProbe:
+    """Derleyici yoklamasını bellekte ve diskte önbelleğe alan servis"""
+
+    def __init__(self, compiler_path=COMPILER_PATH, cache_file=None, manager=None,
+                 attempts=3, retry_delay=1.0):
+        if cache_file is None:
+            from ..config import USER_DATA_DIR
+            cache_file = USER_DATA_DIR / "cache" / "compiler_probe.json"
+        self.compiler_path = Path(compiler_path)
+        self.cache_file = Path(cache_file) if cache_file else None
+        if manager is None:
+            manager = SecureSubprocessManager(SecurityLevel.MEDIUM)
+            manager.add_safe_command(self.compiler_path.name)
+        self.manager = manager
+        self.attempts = max(1, attempts)
+        self.retry_delay = retry_delay
+        self.launches = 0  # Başlatılan yoklama süreci sayısı
+        self._result = None
+        self._lock = threading.Lock()
+
+    def fingerprint(self):
+        """İkilinin [yol, mtime_ns, boyut] parmak izi; ikili yoksa None"""
+        try:
+            stat = os.stat(self.compiler_path)
+        except OSError:
+            return None
+        return [str(self.compiler_path.resolve()), stat.st_mtime_ns, stat.st_size]
+
+    def start(self):
+        """Yoklamayı arka planda başlatır (IDE açılışı)"""
+        thread = threading.Thread(target=self.result, daemon=True)
+        thread.start()
+        return thread
+
+    def result(self, refresh=False):
+        """
+        Güncel yoklama sonucu. Parmak izi bellekteki veya diskteki kayıtla
+        aynıysa süreç başlatılmaz; `refresh` yeniden yoklamayı zorlar.
+        """
+        fingerprint = self.fingerprint()
+        if fingerprint is None:
+            return ProbeResult(None, False)
+        with self._lock:
+            if not refresh:
+                cached = self._result
+                if cached is not None and cached.fingerprint == fingerprint:
+                    return cached
+                stored = self._load()
+                if stored is not None and stored.fingerprint == fingerprint:
+                    self._result = stored
+                    return stored
+            result = self._probe(fingerprint)
+            self._result = result
+            self._store(result)
+            return result
+
+    def _probe(self, fingerprint):
+        for attempt in range(self.attempts):
+            self.launches += 1
+            run = self.manager.execute_safe(str(self.compiler_path), ["--help"], cwd=str(PROJECT_ROOT))
+            text = (run['stdout'] or '') + (run['stderr'] or '')
+            # Derleyici kullanım metnini yazıp 1 ile çıkar; DLL eksikliğinde hiç çıktı olmaz
+            if run['returncode'] == 0 or "Usage:" in text:
+                return ProbeResult(fingerprint, True, [flag for flag in FEATURE_FLAGS if flag in text])
+            if attempt < self.attempts - 1:
+                time.sleep(self.retry_delay)
+        return ProbeResult(fingerprint, False)
+
+    def _load(self):
+        if self.cache_file is None:
+            return None
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                return ProbeResult.from_json(json.load(f))
+        except (OSError, ValueError):
+            return None
+
+    def _store(self, result):
+        if self.cache_file is None:
+            return
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # Yarım yazılmış kayıt okunmasın diye önce geçici dosyaya yazılır
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_file.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(result.to_json(), f)
+                os.replace(tmp_path, self.cache_file)
+            except OSError:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            # Kayıt isteğe bağlıdır; yazılamazsa sonuç yalnızca bu oturumda kalır
+            pass
+
+
+_shared_probe = None
+
+
+def get_compiler_probe():
+    """CompilerRunner örneklerinin paylaştığı yoklama servisi"""
+    global _shared_probe
+    if _shared_probe is None:
+        _shared_probe = CompilerProbe()
+    return _shared_probe
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 import json
 
+from .ast_nodes import NodeVisitor, BlockStmt, CallExpr
+
 class FlowNode:
     def __init__(self, id, type, label, children=None):
         self.id = id
@@ -9,10 +11,13 @@ class FlowNode:
         self.next = [] # List of IDs it points to
         self.children = children or [] # For nested blocks (if/while)
 
-class FlowchartGenerator:
+class FlowchartGenerator(NodeVisitor):
     def __init__(self):
+        super().__init__()
         self.node_count = 0
         self.nodes = []
+        self._nodes_by_id = {}
+        self._current_id = None
 
     def _next_id(self):
         self.node_count += 1
@@ -20,15 +25,14 @@ class FlowchartGenerator:
 
     def generate(self, ast):
         self.nodes = []
+        self._nodes_by_id = {}
         self.node_count = 0
         
-        start_node = FlowNode(self._next_id(), "start", "BAŞLA")
-        self.nodes.append(start_node)
+        start_node = self._add_node("start", "BAŞLA")
         
         last_node_id = self._process_statements(ast.statements, start_node.id)
         
-        end_node = FlowNode(self._next_id(), "end", "BİTİR")
-        self.nodes.append(end_node)
+        end_node = self._add_node("end", "BİTİR")
         
         if last_node_id:
             self._get_node(last_node_id).next.append(end_node.id)
@@ -38,85 +42,58 @@ class FlowchartGenerator:
         return self.nodes
 
     def _get_node(self, id):
-        for n in self.nodes:
-            if n.id == id: return n
-        return None
+        return self._nodes_by_id.get(id)
+
+    def _add_node(self, type, label):
+        node = FlowNode(self._next_id(), type, label)
+        self.nodes.append(node)
+        self._nodes_by_id[node.id] = node
+        return node
+
+    def _link(self, type, label):
+        # Yeni düğümü geçerli düğümün ardına bağlar ve geçerli düğüm yapar
+        node = self._add_node(type, label)
+        self._nodes_by_id[self._current_id].next.append(node.id)
+        self._current_id = node.id
+        return node.id
 
     def _process_statements(self, statements, last_id):
-        current_id = last_id
+        self._current_id = last_id
+        visit = self.visit
         for stmt in statements:
-            if not stmt: continue
-            
-            stmt_json = stmt.to_json()
-            type = stmt_json.get("type")
-            
-            if type == "VarStmt":
-                new_id = self._next_id()
-                label = f"Tanımla: {stmt_json['value']}"
-                node = FlowNode(new_id, "process", label)
-                self.nodes.append(node)
-                self._get_node(current_id).next.append(new_id)
-                current_id = new_id
-                
-            elif type == "PrintStmt":
-                new_id = self._next_id()
-                node = FlowNode(new_id, "process", "Yazdır")
-                self.nodes.append(node)
-                self._get_node(current_id).next.append(new_id)
-                current_id = new_id
-                
-            elif type == "IfStmt":
-                decision_id = self._next_id()
-                node = FlowNode(decision_id, "decision", "Eğer?")
-                self.nodes.append(node)
-                self._get_node(current_id).next.append(decision_id)
-                
-                # Logic for If: Draw then branch
-                # For a simple vertical flowchart, we just process then branch then join back
-                # This is a simplification but better than nothing
-                if hasattr(stmt, 'then_branch'):
-                    # If it's a BlockStmt, process its statements
-                    if hasattr(stmt.then_branch, 'statements'):
-                        branch_last = self._process_statements(stmt.then_branch.statements, decision_id)
-                    else:
-                        branch_last = self._process_statements([stmt.then_branch], decision_id)
-                    
-                    current_id = branch_last
-                else:
-                    current_id = decision_id
-                
-            elif type == "WhileStmt":
-                loop_id = self._next_id()
-                node = FlowNode(loop_id, "loop", "Döngü")
-                self.nodes.append(node)
-                self._get_node(current_id).next.append(loop_id)
-                
-                if hasattr(stmt, 'body'):
-                    if hasattr(stmt.body, 'statements'):
-                        self._process_statements(stmt.body.statements, loop_id)
-                    else:
-                        self._process_statements([stmt.body], loop_id)
-                
-                current_id = loop_id
-                
-            elif type == "FunctionStmt":
-                new_id = self._next_id()
-                node = FlowNode(new_id, "call", f"Fonksiyon: {stmt_json['value']}")
-                self.nodes.append(node)
-                self._get_node(current_id).next.append(new_id)
-                current_id = new_id
-                
-            elif type == "ExprStmt":
-                # Check if it's a CallExpr
-                label = "İşlem"
-                inner = stmt_json.get("children", [{}])[0]
-                if inner.get("type") == "CallExpr":
-                    label = "Çağır"
-                
-                new_id = self._next_id()
-                node = FlowNode(new_id, "process", label)
-                self.nodes.append(node)
-                self._get_node(current_id).next.append(new_id)
-                current_id = new_id
-                
-        return current_id
+            if stmt:
+                visit(stmt)
+        return self._current_id
+
+    def _branch_statements(self, branch):
+        # Dal bir BlockStmt ise içindeki ifadeler, değilse kendisi işlenir
+        return branch.statements if branch.kind == BlockStmt.kind else [branch]
+
+    def generic_visit(self, node):
+        # Akışta karşılığı olmayan ifadeler (dön, kır, dahil et...) atlanır
+        pass
+
+    def visit_VarStmt(self, node):
+        self._link("process", f"Tanımla: {node.name.value}")
+
+    def visit_PrintStmt(self, node):
+        self._link("process", "Yazdır")
+
+    def visit_IfStmt(self, node):
+        # Basit dikey akış: karar düğümünden sonra 'ise' dalı işlenir ve oradan devam edilir
+        decision_id = self._link("decision", "Eğer?")
+        self._process_statements(self._branch_statements(node.then_branch), decision_id)
+
+    def visit_WhileStmt(self, node):
+        loop_id = self._link("loop", "Döngü")
+        self._process_statements(self._branch_statements(node.body), loop_id)
+        self._current_id = loop_id
+
+    visit_ForStmt = visit_WhileStmt
+
+    def visit_FunctionStmt(self, node):
+        self._link("call", f"Fonksiyon: {node.name.value}")
+
+    def visit_ExprStmt(self, node):
+        label = "Çağır" if node.expression.kind == CallExpr.kind else "İşlem"
+        self._link("process", label)
@@ -1,12 +1,13 @@
 # -*- coding: utf-8 -*-
-from .tokenizer import TokenizerRunner, TokenType
-from .parser import GumusParser, Program, VarStmt, FunctionStmt, BlockStmt, IfStmt, WhileStmt, PrintStmt, ReturnStmt, ExprStmt, BinaryExpr, UnaryExpr, Literal, Variable, CallExpr, IncludeStmt, BreakStmt, ContinueStmt, TryStmt
+from .ast_nodes import NodeVisitor, VarStmt, ExprStmt
+from .parse_cache import parse_source
 from .library_bridge import LibraryBridge
 
-class GumusToCppTranspiler:
+class GumusToCppTranspiler(NodeVisitor):
     """GümüşDil kodunu C++'a çevirir."""
     
     def __init__(self):
+        super().__init__()
         self.indent_level = 0
         self.output_lines = []
         self.includes = {"iostream", "string"}
@@ -26,18 +27,15 @@ class GumusToCppTranspiler:
             "temizle": "system",
         }
 
-    def transpile(self, source_code):
+    def transpile(self, source_code, ast=None):
         self.output_lines = []
         self.indent_level = 0
         self.includes = {"iostream", "string"}
         
         try:
-            # 1. Tokenize
-            tokens = TokenizerRunner.get_tokens(source_code)
-            
-            # 2. Parse
-            parser = GumusParser(tokens)
-            ast = parser.parse()
+            # 1-2. Tokenize + Parse (hazır AST verilmediyse paylaşılan önbellek üzerinden)
+            if ast is None:
+                ast = parse_source(source_code)
             
             if not ast or not hasattr(ast, 'statements') or not ast.statements:
                 return "// Boş program veya parse hatası."
@@ -47,7 +45,7 @@ class GumusToCppTranspiler:
             self.current_output = temp_lines
             
             for stmt in ast.statements:
-                self.visit_stmt(stmt)
+                self.visit(stmt)
             
             # 4. Final Assembler
             header = []
@@ -79,29 +77,16 @@ class GumusToCppTranspiler:
         indent = "    " * self.indent_level
         self.output_lines.append(f"{indent}{text}")
 
-    # --- Statement Visitors ---
+    def generic_visit(self, node):
+        return f"/* Unknown Node: {type(node).__name__} */"
 
-    def visit_stmt(self, node):
-        if isinstance(node, VarStmt): self.visit_VarStmt(node)
-        elif isinstance(node, FunctionStmt): self.visit_FunctionStmt(node)
-        elif isinstance(node, BlockStmt): self.visit_BlockStmt(node)
-        elif isinstance(node, IfStmt): self.visit_IfStmt(node)
-        elif isinstance(node, WhileStmt): self.visit_WhileStmt(node)
-        elif isinstance(node, PrintStmt): self.visit_PrintStmt(node)
-        elif isinstance(node, ReturnStmt): self.visit_ReturnStmt(node)
-        elif isinstance(node, IncludeStmt): self.visit_IncludeStmt(node)
-        elif isinstance(node, BreakStmt): self.visit_BreakStmt(node)
-        elif isinstance(node, ContinueStmt): self.visit_ContinueStmt(node)
-        elif isinstance(node, TryStmt): self.visit_TryStmt(node)
-        elif isinstance(node, ExprStmt): self.visit_ExprStmt(node)
-        else:
-            self.emit(f"// Unknown Statement: {type(node).__name__}")
+    # --- Statement Visitors ---
 
     def visit_VarStmt(self, node):
         name = node.name.value
         init = "nullptr"
         if node.initializer:
-            init = self.visit_expr(node.initializer)
+            init = self.visit(node.initializer)
         # C++'da auto ile tip çıkarımı yapabiliriz
         self.emit(f"auto {name} = {init};")
 
@@ -120,45 +105,64 @@ class GumusToCppTranspiler:
 
     def visit_BlockStmt(self, node):
         for stmt in node.statements:
-            self.visit_stmt(stmt)
+            self.visit(stmt)
 
     def visit_IfStmt(self, node):
-        cond = self.visit_expr(node.condition)
+        cond = self.visit(node.condition)
         self.emit(f"if ({cond}) {{")
         self.indent_level += 1
-        self.visit_stmt(node.then_branch)
+        self.visit(node.then_branch)
         self.indent_level -= 1
         self.emit("}")
         
         if node.else_branch:
             self.emit("else {")
             self.indent_level += 1
-            self.visit_stmt(node.else_branch)
+            self.visit(node.else_branch)
             self.indent_level -= 1
             self.emit("}")
 
     def visit_WhileStmt(self, node):
-        cond = self.visit_expr(node.condition)
+        cond = self.visit(node.condition)
         self.emit(f"while ({cond}) {{")
         self.indent_level += 1
-        self.visit_stmt(node.body)
+        self.visit(node.body)
         self.indent_level -= 1
         self.emit("}")
 
+    def visit_ForStmt(self, node):
+        init = ""
+        if isinstance(node.initializer, VarStmt):
+            value = self.visit(node.initializer.initializer) if node.initializer.initializer else "0"
+            init = f"auto {node.initializer.name.value} = {value}"
+        elif isinstance(node.initializer, ExprStmt):
+            init = self.visit(node.initializer.expression)
+        cond = self.visit(node.condition) if node.condition else ""
+        incr = self.visit(node.increment) if node.increment else ""
+        self.emit(f"for ({init}; {cond}; {incr}) {{")
+        self.indent_level += 1
+        self.visit(node.body)
+        self.indent_level -= 1
+        self.emit("}")
+
+    def visit_ClassStmt(self, node):
+        # Sınıflar main içine gömülü lambda modeline uymuyor; şimdilik işaretlenir
+        self.emit(f"// sınıf {node.name.value}: C++ dönüşümü henüz desteklenmiyor")
+
     def visit_PrintStmt(self, node):
-        val = self.visit_expr(node.expression)
+        val = " << \" \" << ".join(self.visit(expr) for expr in node.expressions) or '""'
         # std::endl ile yeni satır
         self.emit(f"std::cout << {val} << std::endl;")
 
     def visit_ReturnStmt(self, node):
         if node.value:
-            val = self.visit_expr(node.value)
+            val = self.visit(node.value)
             self.emit(f"return {val};")
         else:
             self.emit("return;")
 
     def visit_ExprStmt(self, node):
-        val = self.visit_expr(node.expression)
+        val = self.visit(node.expression)
         self.emit(f"{val};")
 
     def visit_IncludeStmt(self, node):
@@ -177,28 +181,22 @@ class GumusToCppTranspiler:
     def visit_TryStmt(self, node):
         self.emit("try {")
         self.indent_level += 1
-        self.visit_stmt(node.try_block)
+        self.visit(node.try_block)
         self.indent_level -= 1
-        self.emit("} catch (...) {")
+        if node.catch_name:
+            self.emit(f"}} catch (const std::exception& {node.catch_name.value}) {{")
+        else:
+            self.emit("} catch (...) {")
         self.indent_level += 1
-        self.visit_stmt(node.catch_body)
+        self.visit(node.catch_body)
         self.indent_level -= 1
         self.emit("}")
 
     # --- Expression Visitors ---
 
-    def visit_expr(self, node):
-        if isinstance(node, BinaryExpr): return self.visit_BinaryExpr(node)
-        elif isinstance(node, UnaryExpr): return self.visit_UnaryExpr(node)
-        elif isinstance(node, Literal): return self.visit_Literal(node)
-        elif isinstance(node, Variable): return self.visit_Variable(node)
-        elif isinstance(node, CallExpr): return self.visit_CallExpr(node)
-        else:
-            return f"/* Unknown Expr: {type(node).__name__} */"
-
     def visit_BinaryExpr(self, node):
-        left = self.visit_expr(node.left)
-        right = self.visit_expr(node.right)
+        left = self.visit(node.left)
+        right = self.visit(node.right)
         op = node.operator.value
         
         op_map = {
@@ -209,7 +207,7 @@ class GumusToCppTranspiler:
 
     def visit_UnaryExpr(self, node):
         op = node.operator.value
-        right = self.visit_expr(node.right)
+        right = self.visit(node.right)
         if op == "değil": return f"!({right})"
         return f"{op}{right}"
 
@@ -225,8 +223,8 @@ class GumusToCppTranspiler:
         return node.name.value
 
     def visit_CallExpr(self, node):
-        callee_name = self.visit_expr(node.callee)
-        args_str = [self.visit_expr(arg) for arg in node.args]
+        callee_name = self.visit(node.callee)
+        args_str = [self.visit(arg) for arg in node.args]
         
         if callee_name == "uzunluk" and len(args_str) == 1:
             return f"{args_str[0]}.size()"
@@ -265,3 +263,40 @@ class GumusToCppTranspiler:
             
         return f"{callee_name}({', '.join(args_str)})"
 
+    def visit_AssignExpr(self, node):
+        return f"{node.name.value} = {self.visit(node.value)}"
+
+    def visit_LogicalExpr(self, node):
+        op = "&&" if node.operator.value == "ve" else "||"
+        return f"({self.visit(node.left)} {op} {self.visit(node.right)})"
+
+    def visit_GetExpr(self, node):
+        return f"{self.visit(node.object)}.{node.name.value}"
+
+    def visit_SetExpr(self, node):
+        return f"{self.visit(node.object)}.{node.name.value} = {self.visit(node.value)}"
+
+    def visit_IndexExpr(self, node):
+        return f"{self.visit(node.object)}[{self.visit(node.index)}]"
+
+    def visit_IndexSetExpr(self, node):
+        return f"{self.visit(node.object)}[{self.visit(node.index)}] = {self.visit(node.value)}"
+
+    def visit_ListExpr(self, node):
+        self.includes.add("vector")
+        return f"std::vector{{{', '.join(self.visit(e) for e in node.elements)}}}"
+
+    def visit_DictExpr(self, node):
+        self.includes.add("map")
+        pairs = [f"std::pair{{{self.visit(k)}, {self.visit(v)}}}" for k, v in zip(node.keys, node.values)]
+        return f"std::map{{{', '.join(pairs)}}}"
+
+    def visit_ThisExpr(self, node):
+        return "(*this)"
+
+    def visit_SuperExpr(self, node):
+        return f"/* ata.{node.method.value} */"
+
+    def visit_NewExpr(self, node):
+        args_str = [self.visit(arg) for arg in node.args]
+        return f"{self.visit(node.callee)}({', '.join(args_str)})"
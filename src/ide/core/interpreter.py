@@ -0,0 +1,1454 @@
+# -*- coding: utf-8 -*-
+"""
+GümüşDil Kapanış Derleyen Yorumlayıcı
+GumusParser'ın ürettiği AST'yi bir kez iç içe Python kapanışlarına (closure)
+derler, sonra bu kapanışları çalıştırır. Satır satır regex eşleyen eski
+simülatörün aksine döngü gövdeleri ve fonksiyonlar her turda yeniden
+ayrıştırılmaz ve eval() kullanılmaz.
+
+Değişkenler önce resolver.py ile (derinlik, yuva) çiftlerine çözülür: yerel
+kapsamlar [üst çerçeve, yuva 1, ...] biçiminde listelerdir ve doğrudan
+indekslenir; yalnızca genel kapsam isimle (sözlükte) tutulur.
+
+Anlambilim yerel yorumlayıcıyı (src/compiler/interpreter) izler: tamsayı
+bölmesi sıfıra doğru keser, yalnızca yanlış/yok/0 yanlış sayılır, ve/veya
+işlenen değerini döner. Çıktı ve hata sözleşmesi GumusSimulator ile aynıdır.
+"""
+import json
+import math
+from collections import deque
+import random
+import sys
+import time
+from functools import partial
+from pathlib import Path
+
+from ..config import PROJECT_ROOT
+from .ast_nodes import (
+    NodeVisitor, BlockStmt, GetExpr, Literal,
+    BinaryExpr, UnaryExpr, LogicalExpr, ExprStmt, SetExpr, ThisExpr,
+)
+from .optimizer import OptimizationStats, optimize
+from .parse_cache import parse_source
+from .project_index import INCLUDE_SEARCH_DIRS
+from .resolver import resolve
+from .tiering import HOT_THRESHOLD, HotSpot, promotable
+from .tokenizer import Token, decode_escapes
+
+# Bir GümüşDil çağrısı birkaç Python çerçevesi kullanır; özyinelemeli
+# programlar için çalıştırma süresince sınır bu değere yükseltilir
+RECURSION_LIMIT = 20000
+
+
+class GumusRuntimeError(Exception):
+    """Çalışma zamanı hatası; yakala(hata) bloğuna `message` bağlanır"""
+
+    def __init__(self, message, line=None):
+        super().__init__(message)
+        self.message = message
+        self.line = line
+
+
+class _Halt(BaseException):
+    """stop() çağrıldı; kullanıcının dene/yakala bloğu bunu yakalayamaz"""
+
+
+class _Signal:
+    """Deyim kapanışlarının döndürdüğü akış sinyali (kır, devam et, dön)"""
+    __slots__ = ('value',)
+
+    def __init__(self, value=None):
+        self.value = value
+
+
+BREAK = _Signal()
+CONTINUE = _Signal()
+_MISSING = object()
+
+
+class Environment:
+    """Sözlük tabanlı kapsam (genel değişkenler ve yerleşikler)"""
+    __slots__ = ('values', 'parent')
+
+    def __init__(self, parent=None, values=None):
+        self.parent = parent
+        self.values = {} if values is None else values
+
+
+class GumusFunction:
+    """Kullanıcı fonksiyonu: derlenmiş gövde + tanımlandığı çerçeve"""
+    __slots__ = ('name', 'params', 'body', 'closure', 'pad', 'tier')
+
+    def __init__(self, name, params, body, closure, pad=(), tier=None):
+        self.name = name
+        self.params = params
+        self.body = body
+        self.closure = closure
+        self.pad = pad  # Parametrelerden sonraki yerel yuvaların başlangıç değerleri
+        self.tier = tier  # Python'a yükseltilebilen fonksiyonların sayacı (tiering.HotSpot)
+
+    def invoke(self, args, instance=_MISSING):
+        params = self.params
+        if len(args) != len(params):
+            raise GumusRuntimeError(
+                f"Fonksiyon '{self.name}': Beklenen parametre {len(params)} ama alınan {len(args)}.")
+        tier = self.tier
+        if tier is not None:
+            code = tier.code
+            if code is None and not tier.failed:
+                tier.count += 1
+                if tier.count >= HOT_THRESHOLD:
+                    code = tier.promote()
+            if code is not None:
+                try:
+                    return code(*args)
+                except RecursionError:
+                    raise
+                except Exception as error:
+                    if error.__class__ is GumusRuntimeError and error.line is not None:
+                        raise  # İç çağrıda yorumlayıcının konumlandırdığı gerçek hata
+                    # Python anlambilimi ayrıldı: saf çağrı yorumlayıcıda baştan çalıştırılır
+                    tier.demote()
+        # Çerçeve: [tanım çerçevesi, (öz), parametreler..., yereller...]
+        if instance is _MISSING:
+            frame = [self.closure, *args, *self.pad]
+        else:
+            frame = [self.closure, instance, *args, *self.pad]
+        signal = self.body(frame)
+        if signal.__class__ is _Signal:
+            return signal.value
+        return None
+
+    def __call__(self, *args):
+        return self.invoke(args)
+
+
+class BoundMethod:
+    """Nesneye bağlanmış metot (öz.metot ifadesinin değeri)"""
+    __slots__ = ('function', 'instance')
+
+    def __init__(self, function, instance):
+        self.function = function
+        self.instance = instance
+
+    def __call__(self, *args):
+        return self.function.invoke(args, self.instance)
+
+
+class Shape:
+    """
+    Gizli sınıf (hidden class): nesne alanlarının `values` listesindeki yerleri.
+    Alanları aynı sırayla eklenen nesneler aynı Shape'i paylaşır; her alan
+    eklemesi önbelleklenmiş bir geçişle bir sonraki Shape'e götürür.
+    """
+    __slots__ = ('names', 'transitions')
+
+    def __init__(self, names=None):
+        self.names = {} if names is None else names  # alan -> indeks
+        self.transitions = {}
+
+    def add(self, name):
+        shape = self.transitions.get(name)
+        if shape is None:
+            names = dict(self.names)
+            names[name] = len(names)
+            shape = self.transitions[name] = Shape(names)
+        return shape
+
+
+class GumusClass:
+    """
+    Sınıf; metot tablosu tanım anında üst sınıfınkiyle birleştirilir. `fields`
+    kurucunun öz'e atadığı alanlardır: nesneler bu yerleşimle (layout) doğar.
+    Her sınıfın kendi kök Shape'i vardır; böylece Shape sınıfı da belirler.
+    """
+    __slots__ = ('name', 'superclass', 'methods', 'layout', 'shape')
+
+    def __init__(self, name, superclass, methods, fields=()):
+        self.name = name
+        self.superclass = superclass
+        self.methods = methods
+        layout = list(superclass.layout) if superclass is not None else []
+        layout += [field for field in fields if field not in layout]
+        self.layout = tuple(layout)
+        shape = Shape()
+        for field in layout:
+            shape = shape.add(field)
+        self.shape = shape
+
+    def instantiate(self, args):
+        instance = GumusInstance(self)
+        init = self.methods.get('kurucu')
+        if init is not None:
+            init.invoke(args, instance)
+        elif args:
+            raise GumusRuntimeError(f"Sınıf '{self.name}': kurucu yok ama {len(args)} parametre verildi.")
+        return instance
+
+    def __call__(self, *args):
+        return self.instantiate(args)
+
+
+class GumusInstance:
+    """Sınıf nesnesi: alan değerleri Shape'in belirlediği sırayla bir listede durur"""
+    __slots__ = ('klass', 'shape', 'values')
+
+    def __init__(self, klass):
+        self.klass = klass
+        self.shape = klass.shape
+        self.values = [_MISSING] * len(klass.layout)  # Kurucu henüz atamadı
+
+    def get(self, name, default=None):
+        index = self.shape.names.get(name)
+        if index is not None:
+            value = self.values[index]
+            if value is not _MISSING:
+                return value
+        return default
+
+    def set(self, name, value):
+        index = self.shape.names.get(name)
+        if index is None:
+            self.shape = self.shape.add(name)
+            self.values.append(value)
+        else:
+            self.values[index] = value
+
+    @property
+    def fields(self):
+        """Atanmış alanlar (isim -> değer); hata ayıklama ve araçlar için"""
+        values = self.values
+        return {name: values[i] for name, i in self.shape.names.items() if values[i] is not _MISSING}
+
+
+# --- Değer yardımcıları ---
+
+def truthy(value):
+    """Yerel yorumlayıcıdaki gibi yalnızca yanlış, yok ve tamsayı 0 yanlıştır"""
+    return not (value is False or value is None or (value.__class__ is int and value == 0))
+
+
+def to_text(value):
+    """Değerin yazdır/metin() karşılığı"""
+    cls = value.__class__
+    if cls is str:
+        return value
+    if cls is bool:
+        return "doğru" if value else "yanlış"
+    if cls is int:
+        return str(value)
+    if cls is float:
+        return "%g" % value
+    if value is None:
+        return "yok"
+    if cls is list or cls is deque:
+        return "[" + ", ".join(to_text(item) for item in value) + "]"
+    if cls is dict:
+        return "{" + ", ".join(f'"{to_text(k)}": {to_text(v)}' for k, v in value.items()) + "}"
+    if cls is GumusInstance:
+        return f"<{value.klass.name} nesnesi>"
+    if cls is GumusClass:
+        return f"<sınıf {value.name}>"
+    if cls is GumusFunction:
+        return f"<fonksiyon {value.name}>"
+    if cls is BoundMethod:
+        return f"<metot {value.function.name}>"
+    return "<fonksiyon>" if callable(value) else str(value)
+
+
+_TYPE_NAMES = {
+    int: "Tamsayı", float: "Ondalıklı", str: "Metin", bool: "Mantıksal", list: "Liste", deque: "Kuyruk",
+    dict: "Sözlük", GumusClass: "Sınıf", GumusInstance: "Nesne", type(None): "Boş",
+}
+
+
+def type_name(value):
+    return _TYPE_NAMES.get(value.__class__, "Fonksiyon")
+
+
+def _divide(a, b):
+    if a.__class__ is int and b.__class__ is int:
+        # C++ gibi sıfıra doğru kesen tamsayı bölmesi
+        quotient = a // b
+        if quotient < 0 and quotient * b != a:
+            quotient += 1
+        return quotient
+    return a / b
+
+
+def _modulo(a, b):
+    if a.__class__ is int and b.__class__ is int:
+        remainder = a % b
+        if remainder and (a < 0) != (b < 0):
+            remainder -= b
+        return remainder
+    return math.fmod(a, b)
+
+
+def _to_number(value):
+    if value.__class__ in (int, float):
+        return value
+    if value.__class__ is bool:
+        return int(value)
+    try:
+        number = float(str(value).strip())
+    except ValueError:
+        return 0
+    return int(number) if number.is_integer() else number
+
+
+def _to_integer(value):
+    # C++ tamsayı dönüşümü gibi sıfıra doğru keser
+    return int(_to_number(value))
+
+
+def _turkish_upper(text):
+    return text.replace('i', 'İ').replace('ı', 'I').upper()
+
+
+def _turkish_lower(text):
+    return text.replace('I', 'ı').replace('İ', 'i').lower()
+
+
+def _string_to_int(text):
+    try:
+        return int(text.strip())
+    except ValueError:
+        return 0
+
+
+def _list_remove(items, index):
+    if index.__class__ is int and 0 <= index < len(items):
+        del items[index]
+    return items
+
+
+def _list_find(items, value):
+    for index, item in enumerate(items):
+        if item.__class__ is value.__class__ and item == value:
+            return index
+    return -1
+
+
+def _split(text, delimiter=" "):
+    if delimiter.__class__ is not str:
+        delimiter = " "
+    return text.split(delimiter) if delimiter else [text]
+
+
+def _sort(items):
+    if items.__class__ is list:
+        order = {int: 0, float: 0, str: 1}
+        items.sort(key=lambda item: (order.get(item.__class__, 2), item if item.__class__ in order else 0))
+    return items
+
+
+def _length(value):
+    return len(value) if value.__class__ in (str, list, dict, deque) else 0
+
+
+def _append(items, value):
+    if items.__class__ is list or items.__class__ is deque:
+        items.append(value)
+    return items
+
+
+# --- Yerel koleksiyon işlemleri ---
+# Kütüphane yapıları (lib/veri_yapilari.tr) bunların üzerine kuruludur; listeyi
+# kopyalamadan yerinde çalışırlar, ekleme/çıkarma amortize O(1)'dir.
+# Karşılık gelen Python şablonları LibraryBridge.COLLECTION_BUILTINS'tedir.
+
+def _collection(value, name, types=(list, deque)):
+    if value.__class__ not in types:
+        raise GumusRuntimeError(f"{name}: {type_name(value)} yerine liste bekleniyor.")
+    return value
+
+
+def _pop(items, index=None):
+    """Sondaki (veya verilen indeksteki) elemanı çıkarıp döner; boş listede indeks hatası"""
+    if index is None:
+        return _collection(items, "çıkar").pop()
+    return _collection(items, "çıkar", (list,)).pop(index)
+
+
+def _insert(items, index, value):
+    _collection(items, "araya_ekle", (list,)).insert(index, value)
+    return items
+
+
+def _prepend(items, value):
+    _collection(items, "başa_ekle", (deque,)).appendleft(value)
+    return items
+
+
+def _pop_front(items):
+    return _collection(items, "baştan_çıkar", (deque,)).popleft()
+
+
+def _slice(items, start=0, end=None):
+    if items.__class__ is deque:
+        items = list(items)
+    elif items.__class__ not in (list, str):
+        raise GumusRuntimeError(f"dilim: {type_name(items)} dilimlenemez.")
+    return items[start:end]
+
+
+def _dict_get(mapping, key, default=None):
+    return _collection(mapping, "sözlük_al", (dict,)).get(key, default)
+
+
+def _dict_set(mapping, key, value):
+    _collection(mapping, "sözlük_koy", (dict,))[key] = value
+    return mapping
+
+
+def _dict_delete(mapping, key):
+    return _collection(mapping, "sözlük_sil", (dict,)).pop(key, None)
+
+
+def _read_file(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except (OSError, UnicodeDecodeError):
+        return ""
+
+
+def _write_file(path, content, mode='w'):
+    try:
+        with open(path, mode, encoding='utf-8') as f:
+            f.write(to_text(content))
+        return True
+    except OSError:
+        return False
+
+
+# Liste/metin/sözlük metotları (yerel PropertyHandlers ile aynı isimler)
+TYPE_METHODS = {
+    list: {
+        'uzunluk': len,
+        'ekle': _append,
+        'sil': _list_remove,
+        'bul': _list_find,
+        'cikar': _pop, 'çıkar': _pop,
+        'araya_ekle': _insert,
+        'dilim': _slice,
+        'metin': lambda items, delimiter="": to_text(delimiter).join(to_text(i) for i in items),
+    },
+    str: {
+        'uzunluk': len,
+        'buyuk': _turkish_upper, 'büyük': _turkish_upper,
+        'kucuk': _turkish_lower, 'küçük': _turkish_lower,
+        'parcala': _split, 'parçala': _split,
+        'sayi': _string_to_int, 'sayı': _string_to_int,
+        'icerir': lambda text, part: part.__class__ is str and part in text,
+        'içerir': lambda text, part: part.__class__ is str and part in text,
+    },
+    dict: {
+        'uzunluk': len,
+        'anahtarlar': lambda mapping: list(mapping),
+        'degerler': lambda mapping: list(mapping.values()),
+        'değerler': lambda mapping: list(mapping.values()),
+        'sil': lambda mapping, key: mapping.pop(key, None) and None,
+        'temizle': lambda mapping: mapping.clear(),
+        'al': _dict_get,
+        'koy': _dict_set,
+        'icerir': lambda mapping, key: key in mapping, 'içerir': lambda mapping, key: key in mapping,
+    },
+    deque: {
+        'uzunluk': len,
+        'ekle': _append,
+        'cikar': _pop, 'çıkar': _pop,
+        'basa_ekle': _prepend, 'başa_ekle': _prepend,
+        'bastan_cikar': _pop_front, 'baştan_çıkar': _pop_front,
+        'temizle': lambda items: items.clear(),
+    },
+}
+
+
+def make_builtins():
+    """Yerleşik fonksiyonlar (eski simülatörünkiler + yerel yorumlayıcınınkiler)"""
+    def girdi(prompt=""):
+        try:
+            return input(to_text(prompt))
+        except EOFError:
+            return ""  # Girdi akışı kapalı (ör. IDE dışı çalıştırma): yerel getline gibi boş metin
+
+    def rastgele(low=None, high=None):
+        # rastgele() -> [0, 1) ondalık; rastgele(a, b) -> a..b arası tamsayı
+        if low is None:
+            return random.random()
+        if high is None:
+            low, high = 0, low
+        return random.randint(int(low), int(high))
+
+    def bekle(ms):
+        if ms.__class__ in (int, float) and ms > 0:
+            time.sleep(ms / 1000)
+
+    builtins = {
+        'metin': to_text,
+        'sayı': _to_number, 'sayi': _to_number, 'sayiYap': _to_number,
+        'tamsayı': _to_integer, 'tamsayi': _to_integer,
+        'karekök': math.sqrt, 'karekok': math.sqrt,
+        'rastgele': rastgele,
+        'zaman': time.time,
+        'girdi': girdi,
+        'bekle': bekle,
+        'uzunluk': _length,
+        'ekle': _append,
+        'sil': _list_remove,
+        'cikar': _pop, 'çıkar': _pop,
+        'araya_ekle': _insert,
+        'dilim': _slice,
+        'kuyruk_yap': lambda items=(): deque(items),
+        'basa_ekle': _prepend, 'başa_ekle': _prepend,
+        'bastan_cikar': _pop_front, 'baştan_çıkar': _pop_front,
+        'sozluk_al': _dict_get, 'sözlük_al': _dict_get,
+        'sozluk_koy': _dict_set, 'sözlük_koy': _dict_set,
+        'sozluk_sil': _dict_delete, 'sözlük_sil': _dict_delete,
+        'anahtar_var': lambda mapping, key: key in _collection(mapping, "anahtar_var", (dict,)),
+        'sırala': _sort, 'sirala': _sort,
+        'oku': _read_file, 'dosya_oku': _read_file,
+        'yaz': _write_file, 'dosya_yaz': _write_file,
+        'dosya_ekle': lambda path, content: _write_file(path, content, 'a'),
+    }
+    return builtins
+
+
+def read_source(path):
+    """Kaynak dosyayı okur; UTF-8 olmayan eski kütüphane dosyaları için cp1254 denenir"""
+    data = Path(path).read_bytes()
+    try:
+        return data.decode('utf-8-sig')
+    except UnicodeDecodeError:
+        return data.decode('cp1254', errors='replace')
+
+
+def find_module(module, base_dir, search_root):
+    """dahil_et modülünü önce dosyanın klasöründe, sonra kökün ., lib, std_lib klasörlerinde arar"""
+    name = module if module.endswith(".tr") else f"{module}.tr"
+    folders = [Path(base_dir)] + [Path(search_root) / d for d in INCLUDE_SEARCH_DIRS]
+    for folder in folders:
+        candidate = (folder / name).resolve()
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def report_line(log, line, variables, delay):
+    """İzleme sinyalleri: __TRACE__, görünen temel değişkenler için __VARS__, ara sıra __PROFILE__"""
+    log(f"__TRACE__:{line}")
+    clean_vars = {k: v for k, v in variables.items() if isinstance(v, (int, float, str, bool, list, dict))}
+    if clean_vars:
+        log(f"__VARS__:{json.dumps(clean_vars, default=to_text, ensure_ascii=False)}")
+
+    if line % 10 == 0: # Her 10 satırda bir raporla (Performans için)
+        try:
+            import psutil
+            cpu = psutil.cpu_percent()
+            mem = psutil.Process().memory_info().rss / (1024 * 1024)
+            log(f"__PROFILE__:{{\"cpu\": {cpu}, \"mem\": {mem:.1f}, \"line\": {line}}}")
+        except Exception:
+            pass # psutil yüklü değilse profiler sessiz kalsın
+
+    if delay > 0:
+        time.sleep(delay)
+
+
+def _node_line(node):
+    """Düğümdeki en küçük token satırı (token yoksa None)"""
+    best = None
+    stack = [node]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, Token):
+            if item.line and (best is None or item.line < best):
+                best = item.line
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+        elif item is not None and hasattr(item, '__slots__') and not isinstance(item, (str, int, float)):
+            for cls in type(item).__mro__:
+                for name in getattr(cls, '__slots__', ()):
+                    stack.append(getattr(item, name, None))
+    return best
+
+
+def _translate(error):
+    """Python istisnasını öğrenciye gösterilecek mesaja çevirir"""
+    if isinstance(error, GumusRuntimeError):
+        return error.message
+    if isinstance(error, ZeroDivisionError):
+        return "Sıfıra bölme hatası: Matematik kurallarına aykırı yeğenim."
+    if isinstance(error, RecursionError):
+        return "Çok derin özyineleme: Fonksiyon kendini durmadan çağırıyor olabilir."
+    if isinstance(error, IndexError):
+        return "Liste indeks hatası (sınır dışı)."
+    if isinstance(error, KeyError):
+        return f"Sözlükte böyle bir anahtar yok: {to_text(error.args[0]) if error.args else ''}"
+    if isinstance(error, TypeError):
+        return f"Geçersiz işlem veya çağrı: {error}"
+    return str(error)
+
+
+def locate(error, line):
+    """İstisnayı satır bilgisi taşıyan GumusRuntimeError'a dönüştürür"""
+    if isinstance(error, GumusRuntimeError):
+        if error.line is None:
+            error.line = line
+        return error
+    located = GumusRuntimeError(_translate(error), line)
+    located.__cause__ = error
+    return located
+
+
+# İşleç kapanışları: her işleç için işlemi satır içinde yapan bir fabrika
+# üretilir (operator.lt gibi bir çağrı eksilir). `{right}` sağ işlenenin ifadesidir;
+# sabit sürümde kapanışa gömülü sayının kendisidir.
+_OPERATOR_EXPRESSIONS = {
+    '+': 'a + b', '-': 'a - b', '*': 'a * b', '/': '_divide(a, b)', '%': '_modulo(a, b)',
+    '==': 'a == b', '!=': 'a != b', '<': 'a < b', '<=': 'a <= b', '>': 'a > b', '>=': 'a >= b',
+}
+_COMPARISONS = frozenset(('==', '!=', '<', '<=', '>', '>='))
+
+_FACTORY_TEMPLATE = """
+def make(left, right, fail):
+    def binary(env):
+        a = left(env)
+        b = {right}
+        try:
+            return {expression}
+        except TypeError:
+            return fail(a, b)
+    return binary
+"""
+
+
+def _counted(test, hotspot):
+    """Döngü koşulunu her turu (geri dönüş kenarını) sayacak biçimde sarar"""
+    def counted(env):
+        hotspot.count += 1
+        return test(env)
+    return counted
+
+
+def _build_factories(right):
+    factories = {}
+    for symbol, expression in _OPERATOR_EXPRESSIONS.items():
+        namespace = {'_divide': _divide, '_modulo': _modulo}
+        exec(_FACTORY_TEMPLATE.format(right=right, expression=expression), namespace)
+        factories[symbol] = namespace['make']
+    return factories
+
+
+_BINARY_FACTORIES = _build_factories("right(env)")
+_CONSTANT_FACTORIES = _build_factories("right")  # right: sayı sabiti
+
+
+class ClosureCompiler(NodeVisitor):
+    """
+    AST düğümlerini `fn(env)` imzalı kapanışlara çevirir; `env` içinde
+    bulunulan yerel çerçevedir (genel kapsamda None). İfade kapanışları değer,
+    deyim kapanışları ise akış sinyali (_Signal) veya önemsiz bir değer döner.
+    """
+
+    def __init__(self, interpreter, base_dir, resolution, trace=False):
+        super().__init__()
+        self.interpreter = interpreter
+        self.base_dir = base_dir
+        self.resolution = resolution
+        self.trace = trace
+        self.global_values = interpreter.globals.values
+        self.builtin_values = interpreter.builtins.values
+        self._scope = None  # Derlenen kodun içinde bulunduğu Scope (izleme için)
+        self._line = 0  # Token'ı olmayan deyimler bir öncekinin satırını alır
+        self._hotspot = None  # Derlenen fonksiyon gövdesinin sayacı (döngü turları da sayılır)
+        # Kademeli çalıştırma izleme kapalıyken yapılır; yükseltilen kod satır sinyali üretmez
+        self.tiering = interpreter.tiering and not trace
+        self.runtime = {
+            'globals': self.global_values, 'builtins': self.builtin_values,
+            'interpreter': interpreter, 'function_type': GumusFunction, 'halt': _Halt,
+            'truthy': truthy, 'divide': _divide, 'modulo': _modulo,
+        }
+
+    def generic_visit(self, node):
+        raise GumusRuntimeError(f"Desteklenmeyen yapı: {type(node).__name__}")
+
+    # --- Deyimler ---
+
+    def statements(self, nodes):
+        compiled, lines = [], []
+        for node in nodes:
+            self._line = _node_line(node) or self._line
+            line = self._line
+            fn = self.visit(node)
+            if self.trace:
+                fn = self._traced(fn, line)
+            compiled.append(fn)
+            lines.append(line)
+        return compiled, lines
+
+    def _traced(self, fn, line):
+        trace = self.interpreter.trace_line
+        scope = self._scope
+
+        def traced(env):
+            trace(line, env, scope)
+            return fn(env)
+        return traced
+
+    def _enter(self, scope):
+        """Derlemeyi `scope` içine taşır; dönen değerle _leave çağrılır"""
+        outer = self._scope
+        if scope is not None:
+            self._scope = scope
+        return outer
+
+    def _leave(self, outer):
+        self._scope = outer
+
+    def block(self, nodes, scope=None):
+        """Deyim listesini tek kapanışa çevirir; `scope` verilirse her girişte yeni çerçeve açılır"""
+        outer = self._enter(scope)
+        compiled, lines = self.statements(nodes)
+        self._leave(outer)
+        line_of = dict(zip(compiled, lines))
+        statements = tuple(compiled)
+        pad = (_MISSING,) * scope.size if scope is not None else None
+
+        def run_block(env):
+            if pad is not None:
+                env = [env, *pad]
+            stmt = None
+            try:
+                for stmt in statements:
+                    signal = stmt(env)
+                    if signal.__class__ is _Signal:
+                        return signal
+            except Exception as error:
+                raise locate(error, line_of.get(stmt))
+            return None
+        return run_block
+
+    def body(self, node):
+        """Dal/döngü gövdesi: BlockStmt ise ancak bildirim içeriyorsa (çözümleyicide kapsamı varsa) yeni çerçeve açar"""
+        return self.block(*self._body_parts(node))
+
+    def _body_parts(self, node):
+        if node.kind == BlockStmt.kind:
+            return node.statements, self.resolution.scopes.get(node)
+        return [node], None
+
+    def loop(self, test, step, body_node, line):
+        """
+        Koşul doğru oldukça gövdeyi çalıştıran kapanış. Gövde deyimleri ara bir
+        blok kapanışı olmadan doğrudan döngüye açılır (tur başına bir çağrı eksik).
+        """
+        nodes, scope = self._body_parts(body_node)
+        outer = self._enter(scope)
+        compiled, lines = self.statements(nodes)
+        self._leave(outer)
+        line_of = dict(zip(compiled, lines))
+        statements = tuple(compiled)
+        interpreter = self.interpreter
+        pad = (_MISSING,) * scope.size if scope is not None else None
+        if self._hotspot is not None:
+            test = _counted(test, self._hotspot)
+
+        def run_loop(env):
+            stmt = None
+            try:
+                while test(env):
+                    scope = [env, *pad] if pad is not None else env
+                    for stmt in statements:
+                        signal = stmt(scope)
+                        if signal.__class__ is _Signal:
+                            if signal is CONTINUE:
+                                break
+                            if signal is BREAK:
+                                return None
+                            return signal
+                    stmt = None
+                    if not interpreter.running:
+                        raise _Halt()
+                    if step is not None:
+                        step(env)
+            except Exception as error:
+                raise locate(error, line_of.get(stmt, line))
+            return None
+        return run_loop
+
+    def condition(self, node):
+        """Koşul ifadesini doğrudan bool döndüren kapanışa çevirir"""
+        fn = self.visit(node)
+        if self._is_boolean(node):
+            return fn
+        return lambda env: truthy(fn(env))
+
+    def _is_boolean(self, node):
+        kind = node.kind
+        if kind == BinaryExpr.kind:
+            return node.operator.value in _COMPARISONS
+        if kind == UnaryExpr.kind:
+            return node.operator.value == '!'
+        if kind == LogicalExpr.kind:
+            return self._is_boolean(node.left) and self._is_boolean(node.right)
+        return kind == Literal.kind and node.value.__class__ is bool
+
+    def _declarer(self, node):
+        """Bildirimin değeri yazan fonksiyonu: store(env, value)"""
+        slot = self.resolution.slots[node]
+        if slot is None:
+            values, name = self.global_values, node.name.value
+
+            def store(env, value):
+                values[name] = value
+        else:
+            def store(env, value):
+                env[slot] = value
+        return store
+
+    def visit_VarStmt(self, node):
+        init = self.visit(node.initializer) if node.initializer is not None else None
+        store = self._declarer(node)
+        if init is None:
+            return lambda env: store(env, None)
+        return lambda env: store(env, init(env))
+
+    def visit_FunctionStmt(self, node):
+        hotspot = None
+        if self.tiering and promotable(node, self.resolution, self.builtin_values):
+            hotspot = HotSpot(node, self.resolution, self.runtime)
+        name, params, body, pad = self._function_parts(node, hotspot=hotspot)
+        store = self._declarer(node)
+
+        def define(env):
+            store(env, GumusFunction(name, params, body, env, pad, hotspot))
+        return define
+
+    def _function_parts(self, node, method=False, hotspot=None):
+        outer_line = self._line
+        scope = self.resolution.scopes[node]
+        params = tuple(p.value for p in node.params)
+        outer = self._enter(scope)
+        outer_hotspot, self._hotspot = self._hotspot, hotspot
+        body = self.block(node.body.statements)  # Çerçeveyi çağrı açar
+        self._hotspot = outer_hotspot
+        self._leave(outer)
+        self._line = outer_line
+        pad = (_MISSING,) * (scope.size - len(params) - method)
+        return node.name.value, params, body, pad
+
+    @staticmethod
+    def _constructor_fields(node):
+        """Kurucunun gövdesinde doğrudan öz.alan = ... ile atanan alanlar (yazılış sırasıyla)"""
+        fields = []
+        for method in node.methods:
+            if method.name.value != 'kurucu':
+                continue
+            for stmt in method.body.statements:
+                if stmt.kind == ExprStmt.kind and stmt.expression.kind == SetExpr.kind:
+                    target = stmt.expression
+                    if target.object.kind == ThisExpr.kind and target.name.value not in fields:
+                        fields.append(target.name.value)
+        return tuple(fields)
+
+    def visit_ClassStmt(self, node):
+        name = node.name.value
+        line = self._line
+        fields = self._constructor_fields(node)
+        superclass = self.visit(node.superclass) if node.superclass is not None else None
+        outer = self._enter(self.resolution.scopes.get(node))  # Üst sınıf varsa `ata` kapsamı
+        methods = [self._function_parts(method, True) for method in node.methods]
+        self._leave(outer)
+        store = self._declarer(node)
+
+        def define(env):
+            parent = None
+            closure = env
+            inherited = {}
+            if superclass is not None:
+                parent = superclass(env)
+                if parent.__class__ is not GumusClass:
+                    raise GumusRuntimeError("Üst sınıf bir sınıf olmalıdır.", line)
+                closure = [env, parent]
+                inherited = dict(parent.methods)
+            for method_name, params, body, pad in methods:
+                inherited[method_name] = GumusFunction(method_name, params, body, closure, pad)
+            store(env, GumusClass(name, parent, inherited, fields))
+        return define
+
+    def visit_BlockStmt(self, node):
+        return self.body(node)
+
+    def visit_IfStmt(self, node):
+        test = self.condition(node.condition)
+        then_branch = self.body(node.then_branch)
+        else_branch = self.body(node.else_branch) if node.else_branch is not None else None
+
+        def if_stmt(env):
+            if test(env):
+                return then_branch(env)
+            if else_branch is not None:
+                return else_branch(env)
+            return None
+        return if_stmt
+
+    def visit_WhileStmt(self, node):
+        line = self._line
+        return self.loop(self.condition(node.condition), None, node.body, line)
+
+    def visit_ForStmt(self, node):
+        line = self._line
+        scope = self.resolution.scopes.get(node)  # için (değişken ...) döngü çerçevesi
+        outer = self._enter(scope)
+        init = self.visit(node.initializer) if node.initializer is not None else None
+        test = self.condition(node.condition) if node.condition is not None else (lambda env: True)
+        step = self.visit(node.increment) if node.increment is not None else None
+        run_loop = self.loop(test, step, node.body, line)
+        self._leave(outer)
+        if init is None:
+            return run_loop
+        pad = (_MISSING,) * scope.size if scope is not None else None
+
+        def for_stmt(env):
+            if pad is not None:
+                env = [env, *pad]
+            init(env)
+            return run_loop(env)
+        return for_stmt
+
+    def visit_PrintStmt(self, node):
+        parts = [self.visit(expr) for expr in node.expressions]
+        log = self.interpreter.log
+
+        if len(parts) == 1:
+            part = parts[0]
+
+            def print_stmt(env):
+                log(to_text(part(env)))
+        else:
+            def print_stmt(env):
+                log(" ".join([to_text(part(env)) for part in parts]))
+        return print_stmt
+
+    def visit_ReturnStmt(self, node):
+        if node.value is None:
+            return lambda env: _Signal()
+        value = self.visit(node.value)
+        return lambda env: _Signal(value(env))
+
+    def visit_ExprStmt(self, node):
+        # İfadenin değeri _Signal olamayacağı için ek sarmalayıcıya gerek yok
+        return self.visit(node.expression)
+
+    def visit_BreakStmt(self, node):
+        return lambda env: BREAK
+
+    def visit_ContinueStmt(self, node):
+        return lambda env: CONTINUE
+
+    def visit_IncludeStmt(self, node):
+        module, base_dir, line = node.module, self.base_dir, self._line
+        include = self.interpreter.include
+
+        def include_stmt(env):
+            include(module, base_dir, line)
+        return include_stmt
+
+    def visit_TryStmt(self, node):
+        line = self._line
+        attempt = self.body(node.try_block)
+        catch = node.catch_body
+        scope = self.resolution.scopes.get(node)  # yakala(hata) çerçevesi: ilk yuva hata mesajı
+        outer = self._enter(scope)
+        handler = self.block(catch.statements if catch.kind == BlockStmt.kind else [catch])
+        self._leave(outer)
+        named = node.catch_name is not None
+        pad = (_MISSING,) * (scope.size - named) if scope is not None else None
+
+        def try_stmt(env):
+            try:
+                return attempt(env)
+            except Exception as error:
+                message = locate(error, line).message
+                if pad is None:
+                    return handler(env)
+                return handler([env, message, *pad] if named else [env, *pad])
+        return try_stmt
+
+    # --- İfadeler ---
+
+    def visit_Literal(self, node):
+        value = node.value
+        if value.__class__ is str:
+            value = decode_escapes(value)
+        return lambda env: value
+
+    def _global_loader(self, name, line):
+        values, builtins = self.global_values, self.builtin_values
+
+        def load_global(env):
+            value = values.get(name, _MISSING)
+            if value is _MISSING:
+                value = builtins.get(name, _MISSING)
+                if value is _MISSING:
+                    raise GumusRuntimeError(f"Tanımsız değişken veya fonksiyon: '{name}'", line)
+            return value
+        return load_global
+
+    def _loader(self, location, name, line):
+        """Çözümlenmiş konumdan okuyan kapanış (konum yoksa genel kapsamdan isimle)"""
+        if location is None:
+            return self._global_loader(name, line)
+        depth, slot, checked = location
+        if checked:
+            # Fonksiyon sınırını aşan başvuru: yuva henüz atanmadıysa genel kapsama düşülür
+            fallback = self._global_loader(name, line)
+
+            def load_checked(env):
+                for _ in range(depth):
+                    env = env[0]
+                value = env[slot]
+                return fallback(None) if value is _MISSING else value
+            return load_checked
+        if depth == 0:
+            return lambda env: env[slot]
+        if depth == 1:
+            return lambda env: env[0][slot]
+
+        def load(env):
+            for _ in range(depth):
+                env = env[0]
+            return env[slot]
+        return load
+
+    def visit_Variable(self, node):
+        return self._loader(self.resolution.locals.get(node), node.name.value, node.name.line)
+
+    def visit_ThisExpr(self, node):
+        return self._loader(self.resolution.locals.get(node), 'öz', node.keyword.line)
+
+    def visit_SuperExpr(self, node):
+        line = node.keyword.line
+        super_location, this_location = self.resolution.locals[node]
+        load_super = self._loader(super_location, 'ata', line)
+        load_this = self._loader(this_location, 'öz', line)
+        name = node.method.value
+
+        def super_method(env):
+            method = load_super(env).methods.get(name)
+            if method is None:
+                raise GumusRuntimeError(f"Üst sınıfta '{name}' metodu bulunamadı.", line)
+            return BoundMethod(method, load_this(env))
+        return super_method
+
+    def visit_AssignExpr(self, node):
+        value_fn = self.visit(node.value)
+        location = self.resolution.locals.get(node)
+        if location is None:
+            # Genel değişken; bildirilmemiş isme atama da eski simülatördeki gibi genel değişken olur
+            values, name = self.global_values, node.name.value
+
+            def assign_global(env):
+                value = values[name] = value_fn(env)
+                return value
+            return assign_global
+
+        depth, slot, _ = location
+        if depth == 0:
+            def assign_local(env):
+                value = env[slot] = value_fn(env)
+                return value
+            return assign_local
+
+        def assign(env):
+            value = value_fn(env)
+            frame = env
+            for _ in range(depth):
+                frame = frame[0]
+            frame[slot] = value
+            return value
+        return assign
+
+    def visit_UnaryExpr(self, node):
+        right = self.visit(node.right)
+        line = node.operator.line
+        if node.operator.value == '!':
+            return lambda env: not truthy(right(env))
+
+        def negate(env):
+            value = right(env)
+            try:
+                return -value
+            except TypeError:
+                raise GumusRuntimeError(f"'-' işlemi {type_name(value)} ile yapılamaz.", line) from None
+        return negate
+
+    def visit_BinaryExpr(self, node):
+        symbol = node.operator.value
+        line = node.operator.line
+        left = self.visit(node.left)
+        if node.right.kind == Literal.kind and node.right.value.__class__ in (int, float):
+            # Sağ işlenen sayı sabiti (i + 1, i < 10): bir kapanış çağrısı eksilir
+            right, factories = node.right.value, _CONSTANT_FACTORIES
+        else:
+            right, factories = self.visit(node.right), _BINARY_FACTORIES
+
+        def fail(a, b):
+            # Yalnızca TypeError yolunda çağrılır; metin birleştirme burada yapılır
+            if symbol == '+' and (a.__class__ is str or b.__class__ is str):
+                return to_text(a) + to_text(b)
+            raise GumusRuntimeError(f"'{symbol}' işlemi {type_name(a)} ve {type_name(b)} ile yapılamaz.", line)
+        return factories[symbol](left, right, fail)
+
+    def visit_LogicalExpr(self, node):
+        left = self.visit(node.left)
+        right = self.visit(node.right)
+        if node.operator.value == 'veya':
+            def logical_or(env):
+                value = left(env)
+                return value if truthy(value) else right(env)
+            return logical_or
+
+        def logical_and(env):
+            value = left(env)
+            return right(env) if truthy(value) else value
+        return logical_and
+
+    def _arguments(self, nodes):
+        """Argüman kapanışlarını tek kapanışa toplar (sık görülen sayılar açılır)"""
+        fns = [self.visit(arg) for arg in nodes]
+        if not fns:
+            return lambda env: ()
+        if len(fns) == 1:
+            a, = fns
+            return lambda env: (a(env),)
+        if len(fns) == 2:
+            a, b = fns
+            return lambda env: (a(env), b(env))
+        return lambda env: tuple([fn(env) for fn in fns])
+
+    def visit_CallExpr(self, node):
+        if node.callee.kind == GetExpr.kind:
+            return self._method_call(node.callee, node.args)
+        callee = self.visit(node.callee)
+        arguments = self._arguments(node.args)
+        line = self._line
+
+        def call(env):
+            function = callee(env)
+            args = arguments(env)
+            cls = function.__class__
+            if cls is GumusFunction:
+                return function.invoke(args)
+            if cls is GumusClass:
+                return function.instantiate(args)
+            if not callable(function):
+                raise GumusRuntimeError(
+                    f"Sadece fonksiyonlar ve sınıflar çağrılabilir ({type_name(function)} değil).", line)
+            return function(*args)
+        return call
+
+    def _method_call(self, get, arg_nodes):
+        target = self.visit(get.object)
+        name = get.name.value
+        line = get.name.line
+        arguments = self._arguments(arg_nodes)
+        # Satır içi önbellek: bu çağrı noktasında son görülen Shape ve çözülen metot.
+        # Shape sınıfı belirlediği ve bu isimde alan içermediği için metot değişmez.
+        cached_shape = None
+        cached_method = None
+
+        def method_call(env):
+            nonlocal cached_shape, cached_method
+            obj = target(env)
+            args = arguments(env)
+            cls = obj.__class__
+            if cls is GumusInstance:
+                shape = obj.shape
+                if shape is cached_shape:
+                    return cached_method.invoke(args, obj)
+                index = shape.names.get(name)
+                if index is not None:
+                    field = obj.values[index]
+                    if field is not _MISSING:
+                        if not callable(field):
+                            raise GumusRuntimeError(f"'{name}' bir fonksiyon değil.", line)
+                        return field(*args)
+                method = obj.klass.methods.get(name)
+                if method is None:
+                    raise GumusRuntimeError(f"'{obj.klass.name}' nesnesinde '{name}' metodu yok.", line)
+                if index is None:
+                    cached_shape, cached_method = shape, method
+                return method.invoke(args, obj)
+            handler = TYPE_METHODS.get(cls, {}).get(name)
+            if handler is None:
+                raise GumusRuntimeError(f"{type_name(obj)} değerinin '{name}' metodu yok.", line)
+            return handler(obj, *args)
+        return method_call
+
+    def visit_NewExpr(self, node):
+        callee = self.visit(node.callee)
+        arguments = self._arguments(node.args)
+        line = self._line
+
+        def new(env):
+            klass = callee(env)
+            if klass.__class__ is not GumusClass:
+                raise GumusRuntimeError("'yeni' sadece sınıflarla kullanılabilir.", line)
+            return klass.instantiate(arguments(env))
+        return new
+
+    def visit_GetExpr(self, node):
+        target = self.visit(node.object)
+        name = node.name.value
+        line = node.name.line
+        cached_shape = None  # Satır içi önbellek: Shape -> alanın indeksi
+        cached_index = 0
+
+        def get(env):
+            nonlocal cached_shape, cached_index
+            obj = target(env)
+            if obj.__class__ is GumusInstance:
+                shape = obj.shape
+                if shape is cached_shape:
+                    value = obj.values[cached_index]
+                    if value is not _MISSING:
+                        return value
+                else:
+                    index = shape.names.get(name)
+                    if index is not None:
+                        cached_shape, cached_index = shape, index
+                        value = obj.values[index]
+                        if value is not _MISSING:
+                            return value
+                method = obj.klass.methods.get(name)
+                if method is not None:
+                    return BoundMethod(method, obj)
+                raise GumusRuntimeError(f"'{obj.klass.name}' nesnesinde '{name}' özelliği yok.", line)
+            handler = TYPE_METHODS.get(obj.__class__, {}).get(name)
+            if handler is None:
+                raise GumusRuntimeError(f"{type_name(obj)} değerinin '{name}' özelliği yok.", line)
+            return partial(handler, obj)
+        return get
+
+    def visit_SetExpr(self, node):
+        target = self.visit(node.object)
+        value_fn = self.visit(node.value)
+        name = node.name.value
+        line = node.name.line
+        # Satır içi önbellek: Shape -> (alanın indeksi, alan ekleniyorsa geçilecek Shape)
+        cached_shape = None
+        cached_index = 0
+        cached_next = None
+
+        def set_field(env):
+            nonlocal cached_shape, cached_index, cached_next
+            obj = target(env)
+            value = value_fn(env)
+            if obj.__class__ is not GumusInstance:
+                raise GumusRuntimeError(
+                    f"Sadece nesnelerin özellikleri atanabilir ({type_name(obj)} değil).", line)
+            shape = obj.shape
+            if shape is not cached_shape:
+                index = shape.names.get(name)
+                if index is None:
+                    cached_shape, cached_next = shape, shape.add(name)
+                else:
+                    cached_shape, cached_index, cached_next = shape, index, None
+            if cached_next is None:
+                obj.values[cached_index] = value
+            else:
+                obj.shape = cached_next
+                obj.values.append(value)
+            return value
+        return set_field
+
+    def visit_IndexExpr(self, node):
+        target = self.visit(node.object)
+        index = self.visit(node.index)
+        line = self._line
+
+        def get_item(env):
+            obj = target(env)
+            key = index(env)
+            try:
+                return obj[key]
+            except (IndexError, KeyError, TypeError) as error:
+                if obj.__class__ not in (list, str, dict):
+                    raise GumusRuntimeError("Sadece listeler, metinler ve sözlükler indekslenebilir.", line) from None
+                raise locate(error, line) from None
+        return get_item
+
+    def visit_IndexSetExpr(self, node):
+        target = self.visit(node.object)
+        index = self.visit(node.index)
+        value_fn = self.visit(node.value)
+        line = self._line
+
+        def set_item(env):
+            obj = target(env)
+            key = index(env)
+            value = value_fn(env)
+            if obj.__class__ not in (list, dict):
+                raise GumusRuntimeError("Sadece listelere ve sözlüklere indeks ile atama yapılabilir.", line)
+            try:
+                obj[key] = value
+            except (IndexError, TypeError) as error:
+                raise locate(error, line) from None
+            return value
+        return set_item
+
+    def visit_ListExpr(self, node):
+        elements = [self.visit(e) for e in node.elements]
+        return lambda env: [fn(env) for fn in elements]
+
+    def visit_DictExpr(self, node):
+        pairs = [(decode_escapes(key.value), self.visit(value)) for key, value in zip(node.keys, node.values)]
+        return lambda env: {key: fn(env) for key, fn in pairs}
+
+
+class GumusInterpreter:
+    """
+    GumusSimulator ile aynı sözleşme: çıktı `output_callback`'e metin olarak
+    gider, hatalar "Simülasyon Hatası: ..." biçiminde loglanır, trace_enabled
+    açıksa her deyimden önce __TRACE__/__VARS__/__PROFILE__ sinyalleri gönderilir.
+    """
+
+    def __init__(self, output_callback=None, search_root=None):
+        self.output_callback = output_callback if output_callback else print
+        self.search_root = Path(search_root) if search_root else PROJECT_ROOT
+        self.running = True
+        self.trace_enabled = False  # Görsel hata ayıklama için izleme (IDE tarafından açılır)
+        self.execution_delay = 0.05 # Adım adım izleme için gecikme (sn)
+        self.builtins = Environment(None, make_builtins())
+        self.globals = Environment(self.builtins)
+        self.tiering = True  # Sıcak saf fonksiyonları Python'a yükselt (bkz. tiering.py)
+        self.optimize = False  # Sabit katlama / ölü kod aşaması (bkz. optimizer.py)
+        self.optimization_stats = OptimizationStats()
+        self._included = set()
+        self._trace = False
+
+    @property
+    def variables(self):
+        """Genel değişkenler (GumusSimulator.variables karşılığı)"""
+        return self.globals.values
+
+    def log(self, message):
+        if self.output_callback:
+            self.output_callback(str(message))
+
+    def stop(self):
+        self.running = False
+
+    def reset(self):
+        self.globals = Environment(self.builtins)
+        self._included = set()
+
+    def compile(self, program, base_dir=None):
+        """Program düğümünü çözümleyip çalıştırılabilir tek kapanışa derler (çerçevesi None)"""
+        base_dir = str(base_dir) if base_dir else str(Path.cwd())
+        if self.optimize and not self._trace:  # İzlemede her deyim satırıyla adımlanmalı
+            program, _ = optimize(program, self.optimization_stats)
+        compiler = ClosureCompiler(self, base_dir, resolve(program), trace=self._trace)
+        return compiler.block(program.statements)
+
+    def check(self, program, base_dir=None):
+        """
+        Çalıştırmadan önce statik denetim: hiçbir kapsamda, yerleşiklerde veya
+        (dolaylı) dahil edilen modüllerde tanımlanmayan isimler [(isim, satır), ...].
+        Bulunamayan modüllerin tanımları bilinemediği için bu durumda da bildirilir.
+        """
+        base_dir = Path(base_dir) if base_dir else Path.cwd()
+        resolution = resolve(program)
+        known = set(self.builtins.values) | set(self.globals.values)
+        missing = []
+        pending, seen = [(resolution.includes, base_dir)], set(self._included)
+        while pending:
+            modules, folder = pending.pop()
+            for module in modules:
+                path = find_module(module, folder, self.search_root)
+                if path is None:
+                    missing.append(module)
+                    continue
+                if str(path) in seen:
+                    continue
+                seen.add(str(path))
+                try:
+                    included = resolve(parse_source(read_source(path)))
+                except OSError:
+                    continue
+                known |= included.global_defs
+                pending.append((included.includes, path.parent))
+        unresolved = resolution.unresolved(known)
+        return unresolved + [(f"dahil_et: {module}", None) for module in missing]
+
+    def run(self, code, base_dir=None):
+        """Kaynağı çalıştırır; başarılıysa True döner"""
+        program = parse_source(code)
+        if program.diagnostics:
+            for diag in program.diagnostics:
+                self.log(f"Sözdizimi Hatası (Satır {diag.line}): {diag.message}")
+            return False
+        return self.run_program(program, base_dir)
+
+    def run_file(self, path):
+        path = Path(path).resolve()
+        self._included.add(str(path))
+        return self.run(read_source(path), path.parent)
+
+    def run_program(self, program, base_dir=None):
+        self.running = True
+        self._trace = self.trace_enabled
+        self.optimization_stats = OptimizationStats()
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(max(limit, RECURSION_LIMIT))
+        try:
+            self.compile(program, base_dir)(None)
+            return True
+        except _Halt:
+            self.log("Simülasyon durduruldu.")
+        except Exception as error:
+            error = locate(error, None)
+            where = f" (Satır {error.line})" if error.line else ""
+            self.log(f"Simülasyon Hatası{where}: {error.message}")
+        finally:
+            sys.setrecursionlimit(limit)
+        return False
+
+    def include(self, module, base_dir, line=None):
+        """dahil_et: modülü bir kez yükleyip genel kapsamda çalıştırır"""
+        candidate = find_module(module, base_dir, self.search_root)
+        if candidate is None:
+            raise GumusRuntimeError(f"Modül bulunamadı: {module}", line)
+
+        key = str(candidate)
+        if key in self._included:
+            return
+        self._included.add(key)
+        program = parse_source(read_source(candidate))
+        if program.diagnostics:
+            first = program.diagnostics[0]
+            raise GumusRuntimeError(
+                f"Modül ayrıştırılamadı: {module} (Satır {first.line}: {first.message})", line)
+        try:
+            self.compile(program, candidate.parent)(None)
+        except GumusRuntimeError as error:
+            error.message = f"{module}: {error.message}"
+            raise
+
+    def trace_line(self, line, env, scope=None):
+        """İzleme açıkken her deyimden önce çağrılır; `scope` env çerçevesinin isimleridir"""
+        if not self.running:
+            raise _Halt()
+        visible = {}
+        while env is not None and scope is not None:
+            for key, slot in scope.names.items():
+                value = env[slot]
+                if value is not _MISSING:
+                    visible.setdefault(key, value)
+            env, scope = env[0], scope.parent
+        for key, value in self.globals.values.items():
+            visible.setdefault(key, value)
+        report_line(self.log, line, visible, self.execution_delay)
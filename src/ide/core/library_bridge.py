@@ -175,8 +175,42 @@ class LibraryBridge:
         }
     }
 
+    # Yerel koleksiyon yerleşikleri: GümüşDil ismi -> {argüman sayısı: Python ifadesi şablonu}
+    # Çalışma zamanı karşılıkları interpreter.make_builtins() içindedir; listeyi kopyalamadan
+    # yerinde çalışırlar (ekleme/çıkarma amortize O(1)).
+    COLLECTION_BUILTINS = {
+        "ekle": {2: "{0}.append({1})"},
+        "çıkar": {1: "{0}.pop()", 2: "{0}.pop({1})"},
+        "araya_ekle": {3: "{0}.insert({1}, {2})"},
+        "dilim": {2: "{0}[{1}:]", 3: "{0}[{1}:{2}]"},
+        "kuyruk_yap": {0: "deque()", 1: "deque({0})"},
+        "başa_ekle": {2: "{0}.appendleft({1})"},
+        "baştan_çıkar": {1: "{0}.popleft()"},
+        "sözlük_al": {2: "{0}.get({1})", 3: "{0}.get({1}, {2})"},
+        "sözlük_koy": {3: "{0}.__setitem__({1}, {2})"},
+        "sözlük_sil": {2: "{0}.pop({1}, None)"},
+        "anahtar_var": {2: "({1} in {0})"},
+    }
+    COLLECTION_ALIASES = {
+        "cikar": "çıkar", "basa_ekle": "başa_ekle", "bastan_cikar": "baştan_çıkar",
+        "sozluk_al": "sözlük_al", "sozluk_koy": "sözlük_koy", "sozluk_sil": "sözlük_sil",
+    }
+    COLLECTION_IMPORTS = {"kuyruk_yap": "from collections import deque"}
+
+    @staticmethod
+    def get_collection_builtin(name, argc):
+        """Koleksiyon yerleşiğinin Python şablonu ve gerektirdiği import (yoksa None)"""
+        name = LibraryBridge.COLLECTION_ALIASES.get(name, name)
+        template = LibraryBridge.COLLECTION_BUILTINS.get(name, {}).get(argc)
+        if template is None:
+            return None
+        return template, LibraryBridge.COLLECTION_IMPORTS.get(name)
+
     @staticmethod
     def get_python_import(gumus_module):
+        # dahil_et "std_lib/matematik.tr" -> matematik
+        if "/" in gumus_module or gumus_module.endswith(".tr"):
+            gumus_module = gumus_module.replace("\\", "/").rsplit("/", 1)[-1].rsplit(".", 1)[0]
         info = LibraryBridge.LIBRARY_MAP.get(gumus_module)
         if info:
             py = info["py"]
@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+"""
+GümüşDil Döngü Kalıpları
+Python transpiler'ının sayaçlı döngüleri `for i in range(...)` olarak üretmesi
+için gereken çözümleme. Öğrenci kodundaki iki biçim tanınır:
+
+    değişken i = 0                        için (değişken i = 0; i < n; i = i + 1) {
+    döngü (i < n) { ...  i = i + 1 }          ...
+                                          }
+
+Dönüşüm yalnızca anlambilimi değiştirmediği kanıtlanabildiğinde yapılır:
+  - Koşul sayaç ile bir sınır arasında <, <=, > veya >= karşılaştırmasıdır ve
+    adım (i = i ± k) koşulun yönüyle uyumlu, sıfırdan farklı bir tamsayıdır.
+  - Başlangıç tamsayıdır; sınır tamsayı değilse math.ceil/floor ile yuvarlanır.
+  - Gövde sayaca atama yapmaz, fonksiyon/sınıf (sayacı yakalayan kapanış) bildirmez.
+  - Sınır döngü boyunca değişmez: içindeki değişkenlere gövdede atama yapılmaz,
+    uzunluk(...) içeriyorsa gövde hiçbir koleksiyonu değiştiremez.
+  - `döngü` biçiminde artış gövdenin son deyimidir, gövdede bu döngüye ait
+    `devam` yoktur (artışı atlardı) ve sayaç döngüden sonra okunmaz (range
+    bittiğinde sayaç son değerde kalır, while'da bir adım ileridedir).
+
+Dönüştürülemeyen döngülerin koşulundaki değişmez uzunluk(...) çağrıları da
+döngüden önce bir kez hesaplanacak biçimde dışarı alınabilir (hoistable_lengths).
+"""
+from .ast_nodes import (
+    ASTNode, VarStmt, FunctionStmt, ClassStmt, BlockStmt, WhileStmt, ForStmt, ExprStmt,
+    ContinueStmt, UnaryExpr, BinaryExpr, Literal, Variable, CallExpr, AssignExpr, LogicalExpr,
+    SetExpr, IndexSetExpr, NewExpr,
+)
+
+# Hiçbir koleksiyonu değiştirmeyen yerleşikler (saf olmaları gerekmez: rastgele de olur)
+NON_MUTATING_CALLS = frozenset((
+    'uzunluk', 'metin', 'sayı', 'sayi', 'sayiYap', 'tamsayı', 'tamsayi', 'karekök', 'karekok', 'mutlak',
+    'rastgele', 'rastgele_sayı', 'rastgele_ondalık', 'zaman', 'dilim',
+    'sözlük_al', 'sozluk_al', 'anahtar_var',
+))
+
+_INCREASING = {'<': False, '<=': True}   # operatör -> sınır dahil mi
+_DECREASING = {'>': False, '>=': True}
+_MIRRORED = {'<': '>', '<=': '>=', '>': '<', '>=': '<='}
+_LOOPS = (WhileStmt.kind, ForStmt.kind)
+_CLOSURES = (FunctionStmt.kind, ClassStmt.kind)
+_MUTATIONS = (SetExpr.kind, IndexSetExpr.kind, NewExpr.kind)
+
+
+class CountedLoop:
+    """Tanınan sayaçlı döngü: `for name in range(start, bound ± 1, step)` için gerekenler"""
+    __slots__ = ('name', 'start', 'bound', 'inclusive', 'step', 'body')
+
+    def __init__(self, name, start, bound, inclusive, step, body):
+        self.name = name            # Sayaç adı
+        self.start = start          # Başlangıç ifadesi (tamsayı)
+        self.bound = bound          # Sınır ifadesi (döngü boyunca değişmez)
+        self.inclusive = inclusive  # <= / >= (sınır dahil)
+        self.step = step            # Sıfırdan farklı tamsayı adım
+        self.body = body            # Üretilecek gövde deyimleri
+
+
+class LoopEffects:
+    """Bir döngü gövdesinin (ve artışının) sayaç/sınır çözümlemesi için özeti"""
+    __slots__ = ('assigned', 'mutates', 'closures', 'continues')
+
+    def __init__(self, nodes):
+        self.assigned = set()    # Atanan veya bildirilen isimler
+        self.mutates = False     # Bir koleksiyonu/nesneyi değiştirebilir mi
+        self.closures = False    # Fonksiyon veya sınıf bildirimi var mı
+        self.continues = False   # Bu döngüye ait (iç döngüde olmayan) devam var mı
+        for node in nodes:
+            self._scan(node, False)
+
+    def _scan(self, node, nested):
+        kind = node.kind
+        if kind == AssignExpr.kind or kind == VarStmt.kind:
+            self.assigned.add(node.name.value)
+        elif kind in _CLOSURES:
+            self.closures = True
+            self.assigned.add(node.name.value)
+        elif kind in _MUTATIONS:
+            self.mutates = True
+        elif kind == CallExpr.kind:
+            callee = node.callee
+            if callee.kind != Variable.kind or callee.name.value not in NON_MUTATING_CALLS:
+                self.mutates = True
+        elif kind == ContinueStmt.kind and not nested:
+            self.continues = True
+        nested = nested or kind in _LOOPS
+        for child in children(node):
+            self._scan(child, nested)
+
+
+def children(node):
+    """Düğümün doğrudan alt düğümleri (__slots__ üzerinden; Token'lar atlanır)"""
+    for name in node.__slots__:
+        value = getattr(node, name, None)
+        if isinstance(value, ASTNode):
+            yield value
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, ASTNode):
+                    yield item
+
+
+def references(nodes, name):
+    """Deyimlerden biri `name` değişkenini okuyor veya ona atıyor mu"""
+    pending = list(nodes)
+    while pending:
+        node = pending.pop()
+        if node.kind in (Variable.kind, AssignExpr.kind, VarStmt.kind) and node.name.value == name:
+            return True
+        pending.extend(children(node))
+    return False
+
+
+def is_integral(node, integers=()):
+    """İfade her zaman tamsayı mı üretir (range argümanı olarak doğrudan kullanılabilir mi)"""
+    kind = node.kind
+    if kind == Literal.kind:
+        return node.value.__class__ is int
+    if kind == Variable.kind:
+        return node.name.value in integers
+    if kind == UnaryExpr.kind:
+        return node.operator.value == '-' and is_integral(node.right, integers)
+    if kind == BinaryExpr.kind:
+        return (node.operator.value in ('+', '-', '*')
+                and is_integral(node.left, integers) and is_integral(node.right, integers))
+    if kind == CallExpr.kind:
+        return _length_call(node) is not None
+    return False
+
+
+def _length_call(node):
+    """uzunluk(değişken) çağrısıysa değişken adı"""
+    if (node.kind == CallExpr.kind and node.callee.kind == Variable.kind
+            and node.callee.name.value == 'uzunluk' and len(node.args) == 1
+            and node.args[0].kind == Variable.kind):
+        return node.args[0].name.value
+    return None
+
+
+def _invariant(node, effects):
+    """Sınır ifadesi gövde boyunca aynı değeri verir mi"""
+    kind = node.kind
+    if kind == Literal.kind:
+        return True
+    if kind == Variable.kind:
+        return node.name.value not in effects.assigned
+    if kind == UnaryExpr.kind:
+        return node.operator.value == '-' and _invariant(node.right, effects)
+    if kind == BinaryExpr.kind:
+        return (node.operator.value in ('+', '-', '*', '/')
+                and _invariant(node.left, effects) and _invariant(node.right, effects))
+    name = _length_call(node)
+    return name is not None and name not in effects.assigned and not effects.mutates
+
+
+def _step(increment, name):
+    """`name = name ± k` (veya k + name) artışının işaretli adımı; değilse None"""
+    if increment.kind != AssignExpr.kind or increment.name.value != name:
+        return None
+    value = increment.value
+    if value.kind != BinaryExpr.kind or value.operator.value not in ('+', '-'):
+        return None
+    left, right = value.left, value.right
+    if value.operator.value == '+' and right.kind == Variable.kind and right.name.value == name:
+        left, right = right, left
+    if (left.kind != Variable.kind or left.name.value != name or right.kind != Literal.kind
+            or right.value.__class__ is not int or right.value == 0):
+        return None
+    return right.value if value.operator.value == '+' else -right.value
+
+
+def _comparison(condition, name):
+    """Koşul `name <op> sınır` (veya ayna biçimi) ise (op, sınır)"""
+    if condition is None or condition.kind != BinaryExpr.kind:
+        return None
+    operator = condition.operator.value
+    if operator not in _MIRRORED:
+        return None
+    left, right = condition.left, condition.right
+    if right.kind == Variable.kind and right.name.value == name:
+        left, right, operator = right, left, _MIRRORED[operator]
+    if left.kind != Variable.kind or left.name.value != name:
+        return None
+    return operator, right
+
+
+def _counted(name, start, condition, step, body, effects, integers):
+    if step is None or not is_integral(start, integers):
+        return None
+    comparison = _comparison(condition, name)
+    if comparison is None:
+        return None
+    operator, bound = comparison
+    direction = _INCREASING if step > 0 else _DECREASING
+    if operator not in direction or references([bound], name):
+        return None
+    if name in effects.assigned or effects.closures or not _invariant(bound, effects):
+        return None
+    return CountedLoop(name, start, bound, direction[operator], step, body)
+
+
+def counted_for(node, integers=()):
+    """`için (değişken i = a; i < n; i = i + k)` döngüsünü tanır; değilse None"""
+    initializer = node.initializer
+    if initializer is None or initializer.kind != VarStmt.kind or initializer.initializer is None:
+        return None
+    if node.increment is None:
+        return None
+    name = initializer.name.value
+    body = node.body.statements if node.body.kind == BlockStmt.kind else [node.body]
+    effects = LoopEffects(body)
+    return _counted(name, initializer.initializer, node.condition, _step(node.increment, name),
+                    body, effects, integers)
+
+
+def counted_while(declaration, node, following, integers=()):
+    """
+    `değişken i = a` ardından gelen `döngü (i < n) { ... i = i + k }` çiftini tanır.
+    `following` aynı bloktaki sonraki deyimlerdir; sayaç onlarda geçiyorsa None.
+    """
+    if (declaration.kind != VarStmt.kind or declaration.initializer is None
+            or node.kind != WhileStmt.kind or node.body.kind != BlockStmt.kind):
+        return None
+    statements = node.body.statements
+    if not statements or statements[-1].kind != ExprStmt.kind:
+        return None
+    name = declaration.name.value
+    body = statements[:-1]
+    effects = LoopEffects(body)
+    if effects.continues or references(following, name):
+        return None
+    return _counted(name, declaration.initializer, node.condition,
+                    _step(statements[-1].expression, name), body, effects, integers)
+
+
+def hoistable_lengths(condition, body):
+    """
+    Koşulda her turda koşulsuz değerlendirilen ve gövdede değişmeyen
+    uzunluk(değişken) çağrıları; döngüden önce bir kez hesaplanabilirler.
+    """
+    if condition is None:
+        return []
+    effects = None
+    found = []
+    pending = [condition]
+    while pending:
+        node = pending.pop()
+        if node.kind == LogicalExpr.kind:
+            pending.append(node.left)  # Sağ taraf kısa devreyle hiç değerlendirilmeyebilir
+            continue
+        name = _length_call(node)
+        if name is not None:
+            if effects is None:
+                effects = LoopEffects(body)
+            if name not in effects.assigned and not effects.mutates:
+                found.append(node)
+            continue
+        pending.extend(children(node))
+    return found
@@ -0,0 +1,342 @@
+# -*- coding: utf-8 -*-
+"""
+Derleyici Dil Sunucusu İstemcisi
+AST görüntüleyici her istekte yeni bir `gumus --dump-ast` süreci başlatıyordu.
+LspClient derleyiciyi bir kez `gumus --lsp` kipinde (src/compiler/lsp_server.cpp)
+başlatır ve stdio üzerinden Content-Length çerçeveli JSON-RPC 2.0 konuşur:
+
+  - İstekler sıralı beklenmeden art arda gönderilir (pipelining); her biri bir
+    concurrent.futures.Future döner, yanıtlar `id` ile eşlenir.
+  - `cancel` isteği $/cancelRequest ile bildirir ve Future'ı hemen
+    REQUEST_CANCELLED hatasıyla sonlandırır; geç gelen yanıt yok sayılır.
+  - Sunucu çökerse bekleyen istekler LspError ile biter, sunucu yeniden
+    başlatılır ve açık belgeler yeniden gönderilir. Kısa sürede çok sayıda
+    çökme olursa (restart_window içinde max_restarts) istemci vazgeçer.
+
+Sunucunun kendi istekleri:
+  gumus/ast  {"textDocument": {"uri": ...}} -> AST JSON listesi (--dump-ast biçimi)
+Sunucu didOpen/didChange sonrası textDocument/publishDiagnostics yayınlar.
+
+IDE şimdilik yalnızca AST görüntüleyicide sunucuyu kullanır. Editör tanıları
+ve anahat, her tuş vuruşunda süreç içindeki artımlı ayrıştırıcı / proje
+indeksinden gelir: gidiş-dönüş gerektirmez, derleyici kurulu olmadan da çalışır
+ve sunucuda belge sembolleri isteği yoktur.
+"""
+import atexit
+import io
+import json
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from pathlib import Path
+
+from ..config import COMPILER_PATH, PROJECT_ROOT
+from .secure_subprocess import SecureSubprocessManager, SecurityLevel, SecurityError
+
+# JSON-RPC / LSP hata kodları
+METHOD_NOT_FOUND = -32601
+REQUEST_CANCELLED = -32800
+
+AST_URI = "gumus://ast"  # ast() çağrılarının kullandığı sanal belge
+
+
+class LspError(Exception):
+    """Dil sunucusu isteği başarısız oldu (hata yanıtı, iptal, çökme veya zaman aşımı)"""
+
+    def __init__(self, message, code=None):
+        super().__init__(message)
+        self.code = code
+
+
+class LspClient:
+    """Tek bir dil sunucusu sürecini yöneten, iş parçacığı güvenli JSON-RPC istemcisi"""
+
+    def __init__(self, command=None, cwd=None, manager=None, timeout=10.0,
+                 max_restarts=3, restart_window=60.0):
+        if command is None:
+            command = [str(COMPILER_PATH), "--lsp"]
+        self.command = list(command)
+        self.cwd = str(cwd or PROJECT_ROOT)
+        if manager is None:
+            manager = SecureSubprocessManager(SecurityLevel.MEDIUM)
+            manager.add_safe_command(Path(self.command[0]).name)
+        self.manager = manager
+        self.timeout = timeout
+        self.max_restarts = max_restarts
+        self.restart_window = restart_window
+        self.capabilities = None
+        self.restarts = 0
+        self.on_diagnostics = []  # callback(uri, diagnostics)
+
+        self._process = None
+        self._stdout = None
+        self._next_id = 0
+        self._pending = {}        # id -> Future
+        self._documents = {}      # uri -> [sürüm, metin]
+        self._diagnostics = {}    # uri -> son yayınlanan tanılar
+        self._crashes = []        # Son çökme zamanları
+        self._closing = False
+        self._failed = None       # Vazgeçildiyse nedeni
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self._ast_lock = threading.Lock()  # AST_URI güncellemesi ile gumus/ast isteği bölünmez
+
+    # --- Süreç yaşam döngüsü ---
+
+    @property
+    def running(self):
+        return self._process is not None and self._process.poll() is None
+
+    def start(self):
+        """Sunucuyu (gerekirse) başlatır ve initialize el sıkışmasını yapar"""
+        with self._lock:
+            if self._failed:
+                raise LspError(self._failed)
+            if self.running:
+                return
+            self._closing = False
+            try:
+                process = self.manager.execute_interactive(self.command[0], self.command[1:],
+                                                           cwd=self.cwd, text=False)
+            except SecurityError as e:
+                raise LspError(f"Dil sunucusu başlatılamadı: {e}")
+            self._process = process
+            self._stdout = io.BufferedReader(process.stdout)
+            threading.Thread(target=self._read_loop, args=(process, self._stdout), daemon=True).start()
+            threading.Thread(target=self._drain, args=(process.stderr,), daemon=True).start()
+            initialize = self._send_request("initialize", {
+                "processId": None, "rootUri": None, "capabilities": {},
+            })
+            for uri, (version, text) in self._documents.items():
+                self._send("textDocument/didOpen", {"textDocument": {
+                    "uri": uri, "languageId": "gumusdil", "version": version, "text": text,
+                }})
+        self.capabilities = self._wait(initialize, self.timeout).get("capabilities", {})
+        self._send("initialized", {})
+
+    def shutdown(self):
+        """shutdown/exit ile kapatır; yanıt gelmezse süreç öldürülür"""
+        with self._lock:
+            self._closing = True
+            process = self._process
+            if process is None:
+                return
+            future = self._send_request("shutdown", None) if process.poll() is None else None
+        # Yanıtı okuma döngüsü işler; kilit tutulurken beklenmemelidir
+        if future is not None:
+            try:
+                future.result(2.0)
+                self._send("exit", None)
+                process.wait(timeout=2.0)
+            except Exception:
+                pass
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        with self._lock:
+            if self._process is process:
+                self._process = None
+
+    def _on_exit(self, process):
+        """Okuma döngüsü dosya sonunu gördü: bekleyenleri bitir, gerekirse yeniden başlat"""
+        with self._lock:
+            if process is not self._process:
+                return
+            self._process = None
+            pending, self._pending = self._pending, {}
+            restart = not self._closing
+            if restart:
+                now = time.monotonic()
+                self._crashes = [t for t in self._crashes if now - t < self.restart_window] + [now]
+                if len(self._crashes) > self.max_restarts:
+                    self._failed = "Dil sunucusu tekrar tekrar çöktü"
+                    restart = False
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(LspError("Dil sunucusu beklenmedik şekilde kapandı"))
+        if restart:
+            threading.Thread(target=self._restart, daemon=True).start()
+
+    def _restart(self):
+        try:
+            self.start()
+            self.restarts += 1
+        except LspError:
+            pass
+
+    # --- İstekler ---
+
+    def request(self, method, params=None):
+        """İsteği gönderir ve yanıtı beklemeden Future döner"""
+        self.start()
+        with self._lock:
+            return self._send_request(method, params)
+
+    def call(self, method, params=None, timeout=None):
+        """İsteği gönderip sonucunu bekler; zaman aşımında istek iptal edilir"""
+        return self._wait(self.request(method, params), self.timeout if timeout is None else timeout)
+
+    def notify(self, method, params=None):
+        self.start()
+        with self._lock:
+            self._send(method, params)
+
+    def cancel(self, future):
+        """Süren isteği iptal eder ($/cancelRequest); Future REQUEST_CANCELLED ile biter"""
+        with self._lock:
+            request_id = getattr(future, "request_id", None)
+            if self._pending.pop(request_id, None) is None:
+                return False
+            if self.running:
+                self._send("$/cancelRequest", {"id": request_id})
+        future.set_exception(LspError("İstek iptal edildi", REQUEST_CANCELLED))
+        return True
+
+    def _wait(self, future, timeout):
+        try:
+            return future.result(timeout)
+        except FutureTimeout:
+            self.cancel(future)
+            raise LspError(f"Dil sunucusu {timeout} sn içinde yanıt vermedi")
+
+    def _send_request(self, method, params):
+        self._next_id += 1
+        future = Future()
+        future.request_id = self._next_id
+        self._pending[self._next_id] = future
+        message = {"jsonrpc": "2.0", "id": self._next_id, "method": method}
+        if params is not None:
+            message["params"] = params
+        self._write(message)
+        return future
+
+    def _send(self, method, params):
+        message = {"jsonrpc": "2.0", "method": method}
+        if params is not None:
+            message["params"] = params
+        self._write(message)
+
+    def _write(self, message):
+        # Sunucu ayrıştırıcısı boşluksuz JSON bekler ("method":"...")
+        body = json.dumps(message, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        header = f"Content-Length: {len(body)}\r\n\r\n".encode('ascii')
+        try:
+            with self._write_lock:
+                self._process.stdin.write(header + body)
+                self._process.stdin.flush()
+        except (OSError, ValueError, AttributeError):
+            pass  # Süreç kapanıyor; okuma döngüsü çökmeyi işler
+
+    # --- Okuma ---
+
+    def _read_loop(self, process, stream):
+        try:
+            while True:
+                message = self._read_message(stream)
+                if message is None:
+                    break
+                self._dispatch(message)
+        finally:
+            self._on_exit(process)
+
+    @staticmethod
+    def _read_message(stream):
+        length = None
+        while True:
+            line = stream.readline()
+            if not line:
+                return None
+            line = line.strip()
+            if not line:
+                if length is not None:
+                    break
+                continue
+            name, _, value = line.partition(b":")
+            if name.strip().lower() == b"content-length":
+                length = int(value.strip())
+        body = stream.read(length)
+        if len(body) < length:
+            return None
+        try:
+            return json.loads(body.decode('utf-8', 'replace'))
+        except ValueError:
+            return {}
+
+    def _dispatch(self, message):
+        if "id" in message and ("result" in message or "error" in message):
+            with self._lock:
+                future = self._pending.pop(message["id"], None)
+            if future is None or future.done():
+                return  # İptal edilmiş isteğin geç yanıtı
+            error = message.get("error")
+            if error:
+                future.set_exception(LspError(error.get("message", "Bilinmeyen hata"), error.get("code")))
+            else:
+                future.set_result(message.get("result"))
+        elif message.get("method") == "textDocument/publishDiagnostics":
+            params = message.get("params") or {}
+            uri = params.get("uri")
+            diagnostics = params.get("diagnostics") or []
+            self._diagnostics[uri] = diagnostics
+            for callback in list(self.on_diagnostics):
+                try:
+                    callback(uri, diagnostics)
+                except Exception:
+                    pass
+
+    @staticmethod
+    def _drain(stream):
+        try:
+            while stream.read(4096):
+                pass
+        except (OSError, ValueError):
+            pass
+
+    # --- Belgeler ---
+
+    def open_document(self, uri, text):
+        """Belgeyi açar veya tam metinle günceller (textDocumentSync: Full)"""
+        self.start()
+        with self._lock:
+            document = self._documents.get(uri)
+            if document is None:
+                self._documents[uri] = [1, text]
+                self._send("textDocument/didOpen", {"textDocument": {
+                    "uri": uri, "languageId": "gumusdil", "version": 1, "text": text,
+                }})
+            elif document[1] != text:
+                document[0] += 1
+                document[1] = text
+                self._send("textDocument/didChange", {
+                    "textDocument": {"uri": uri, "version": document[0]},
+                    "contentChanges": [{"text": text}],
+                })
+
+    def close_document(self, uri):
+        with self._lock:
+            if self._documents.pop(uri, None) is not None and self.running:
+                self._send("textDocument/didClose", {"textDocument": {"uri": uri}})
+            self._diagnostics.pop(uri, None)
+
+    def diagnostics(self, uri):
+        """Belge için sunucunun yayınladığı son tanılar"""
+        return list(self._diagnostics.get(uri, ()))
+
+    def ast(self, source, timeout=None):
+        """Kaynağın AST'si (--dump-ast ile aynı JSON listesi)"""
+        # Eşzamanlı çağıranlar sanal belgeyi birbirinin kaynağıyla ezmesin
+        with self._ast_lock:
+            self.open_document(AST_URI, source)
+            return self.call("gumus/ast", {"textDocument": {"uri": AST_URI}}, timeout)
+
+
+_shared_client = None
+
+
+def get_lsp_client():
+    """IDE genelinde paylaşılan derleyici dil sunucusu istemcisi"""
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = LspClient()
+        atexit.register(_shared_client.shutdown)
+    return _shared_client
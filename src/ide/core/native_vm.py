@@ -0,0 +1,338 @@
+# -*- coding: utf-8 -*-
+"""
+Süreç İçi Yerel Yorumlayıcı (ctypes)
+Her çalıştırma, AST ve bellek isteği bir `bin/gumus` süreci başlatıp çıktısını
+metin olarak geri ayrıştırıyordu. Derleyici kaynakları ayrıca paylaşımlı
+kütüphane olarak derlenebilir (scripts/gumus_kutuphane_derle.sh ->
+bin/libgumus.so, Windows'ta bin/gumus.dll); C arayüzü
+src/compiler/gumus_api.h dosyasındadır. NativeVM kütüphaneyi ctypes ile yükler:
+
+  - `start` programı bir iş parçacığında süreç içinde çalıştırır ve
+    subprocess.Popen gibi kullanılan bir NativeRun döner. Çıktı kütüphaneden
+    satır satır geri çağırımla gelir; girdi() stdin'e yazılanları okur.
+  - `dump_ast`, `compile` ve `dump_memory` sonuçlarını çağıranın tamponuna
+    yazdırır; tampon küçükse kütüphanenin bildirdiği boyutla yeniden denenir.
+
+Yorumlayıcı süreç genelinde durum kullandığından kütüphane aynı anda tek
+çağrı kabul eder; meşgulken gelen çağrılar NativeError(BUSY) ile döner ve
+CompilerRunner süreç tabanlı yollara düşer.
+"""
+import codecs
+import ctypes
+import json
+import os
+import queue
+import subprocess
+import threading
+from pathlib import Path
+
+from ..config import NATIVE_LIBRARY_PATH
+
+API_VERSION = 1
+
+# gumus_api.h durum kodları
+OK = 0
+ERROR = 1
+BUFFER_TOO_SMALL = 2
+BUSY = 3
+CANCELLED = 4
+
+STDOUT = 1
+STDERR = 2
+RUN_DUMP_MEMORY = 1
+
+# Çalıştırma durumlarının Popen çıkış kodu karşılıkları
+RETURN_CODES = {OK: 0, ERROR: 1, CANCELLED: -1}
+
+OUTPUT_FN = ctypes.CFUNCTYPE(None, ctypes.c_void_p, ctypes.c_int, ctypes.POINTER(ctypes.c_char), ctypes.c_size_t)
+INPUT_FN = ctypes.CFUNCTYPE(ctypes.c_size_t, ctypes.c_void_p, ctypes.POINTER(ctypes.c_char), ctypes.c_size_t)
+
+# Sonuç tamponunun ilk boyutu (bayt)
+INITIAL_BUFFER = 64 * 1024
+
+# Yeni çalıştırmadan önce iptal edilen çalıştırmanın bitmesi için beklenen süre (sn)
+CANCEL_TIMEOUT = 5
+
+
+class NativeError(Exception):
+    """Kütüphane yüklenemedi veya çağrı başarısız oldu"""
+
+    def __init__(self, message, status=ERROR):
+        super().__init__(message)
+        self.status = status
+
+
+class _NativeStream:
+    """Geri çağırımla dolan, Popen akışı gibi satır satır okunan metin akışı"""
+
+    def __init__(self):
+        self._buffer = ''
+        self._closed = False
+        self._decoder = codecs.getincrementaldecoder('utf-8')('replace')
+        self._condition = threading.Condition()
+
+    def _feed(self, data):
+        with self._condition:
+            self._buffer += self._decoder.decode(data)
+            self._condition.notify_all()
+
+    def _finish(self):
+        with self._condition:
+            self._buffer += self._decoder.decode(b'', final=True)
+            self._closed = True
+            self._condition.notify_all()
+
+    def readline(self):
+        with self._condition:
+            while '\n' not in self._buffer and not self._closed:
+                self._condition.wait()
+            index = self._buffer.find('\n') + 1 or len(self._buffer)
+            line, self._buffer = self._buffer[:index], self._buffer[index:]
+            return line
+
+    def __iter__(self):
+        return iter(self.readline, '')
+
+    def read(self):
+        with self._condition:
+            while not self._closed:
+                self._condition.wait()
+            text, self._buffer = self._buffer, ''
+            return text
+
+    def close(self):
+        pass
+
+
+class _NativeInput:
+    """Çalıştırmanın stdin'i; yazılanlar girdi() çağrılarına aktarılır"""
+
+    def __init__(self, run):
+        self._run = run
+
+    def write(self, text):
+        if self._run.returncode is not None:
+            return 0
+        self._run._input.put(text.encode('utf-8'))
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self._run._input.put(None)  # Programa dosya sonu
+
+
+class NativeRun:
+    """Kütüphanede süren tek çalıştırma; subprocess.Popen ile aynı kullanım"""
+
+    def __init__(self, library, source, filename, flags=0, on_output=None):
+        self.args = [filename]
+        self.pid = os.getpid()
+        self.returncode = None
+        self.on_output = on_output  # callback(metin, hata_mı)
+        self.stdin = _NativeInput(self)
+        self.stdout = _NativeStream()
+        self.stderr = _NativeStream()
+        self._library = library
+        self._source = source.encode('utf-8')
+        self._filename = str(filename).encode('utf-8')
+        self._flags = flags
+        self._cancel = ctypes.c_int(0)
+        self._input = queue.Queue()
+        self._pending_input = b''
+        self._done = threading.Event()
+        # Geri çağırım nesneleri çalıştırma boyunca yaşamalıdır
+        self._output_fn = OUTPUT_FN(self._on_output)
+        self._input_fn = INPUT_FN(self._on_input)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        try:
+            status = self._library.gumus_run(self._source, self._filename, self._flags,
+                                             self._output_fn, self._input_fn, None,
+                                             ctypes.byref(self._cancel))
+        except Exception as e:
+            self.stderr._feed(f"Yerel çalıştırma hatası: {e}\n".encode('utf-8'))
+            status = ERROR
+        if status == BUSY:
+            self.stderr._feed("Yerel yorumlayıcı başka bir programı çalıştırıyor\n".encode('utf-8'))
+        self.returncode = RETURN_CODES.get(status, 1)
+        self.stdout._finish()
+        self.stderr._finish()
+        self._done.set()
+
+    def _on_output(self, user, stream, data, length):
+        chunk = ctypes.string_at(data, length)
+        is_error = stream == STDERR
+        (self.stderr if is_error else self.stdout)._feed(chunk)
+        if self.on_output is not None:
+            try:
+                self.on_output(chunk.decode('utf-8', 'replace'), is_error)
+            except Exception:
+                pass  # Geri çağırım hatası yerel koda taşınmamalı
+
+    def _on_input(self, user, buffer, capacity):
+        if not self._pending_input:
+            data = self._input.get()
+            if data is None:
+                self._input.put(None)  # Sonraki okumalar da dosya sonu görsün
+                return 0
+            self._pending_input = data
+        chunk, self._pending_input = self._pending_input[:capacity], self._pending_input[capacity:]
+        ctypes.memmove(buffer, chunk, len(chunk))
+        return len(chunk)
+
+    def poll(self):
+        return self.returncode
+
+    def wait(self, timeout=None):
+        if not self._done.wait(timeout):
+            raise subprocess.TimeoutExpired(self.args, timeout)
+        return self.returncode
+
+    def cancel(self):
+        """Çalıştırmayı bir sonraki deyimde durdurur; girdi bekleyen program dosya sonu görür"""
+        if self._done.is_set():
+            return
+        self._cancel.value = 1
+        self._input.put(None)
+
+    terminate = kill = cancel
+
+
+class NativeVM:
+    """Paylaşımlı kütüphaneyi (ilk kullanımda) yükleyen süreç içi yorumlayıcı"""
+
+    def __init__(self, library_path=NATIVE_LIBRARY_PATH):
+        self.library_path = Path(library_path)
+        self._library = None
+        self._load_error = None
+        self._active = None
+        self._lock = threading.Lock()
+
+    def available(self):
+        """Kütüphane var, yüklenebiliyor ve API sürümü uyuyor mu"""
+        try:
+            self._load()
+            return True
+        except NativeError:
+            return False
+
+    def _load(self):
+        with self._lock:
+            if self._library is None:
+                if self._load_error is None:
+                    try:
+                        self._library = self._open()
+                    except NativeError as e:
+                        self._load_error = str(e)  # Her çağrıda yeniden denenmez
+                if self._load_error is not None:
+                    raise NativeError(self._load_error)
+            return self._library
+
+    def _open(self):
+        """Kütüphaneyi açıp imzaları tanımlar"""
+        if not self.library_path.exists():
+            raise NativeError(f"Kütüphane bulunamadı: {self.library_path}")
+        try:
+            library = ctypes.CDLL(str(self.library_path))
+            library.gumus_api_version.restype = ctypes.c_int
+            version = library.gumus_api_version()
+        except (OSError, AttributeError) as e:
+            raise NativeError(f"Kütüphane yüklenemedi: {e}")
+        if version != API_VERSION:
+            raise NativeError(f"Kütüphane API sürümü uyumsuz: {version} (beklenen {API_VERSION})")
+        buffer_call = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_size_t, ctypes.POINTER(ctypes.c_size_t)]
+        for name in ("gumus_compile", "gumus_dump_ast"):
+            getattr(library, name).argtypes = buffer_call
+            getattr(library, name).restype = ctypes.c_int
+        library.gumus_dump_memory.argtypes = buffer_call[1:]
+        library.gumus_dump_memory.restype = ctypes.c_int
+        library.gumus_run.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int, OUTPUT_FN,
+                                      INPUT_FN, ctypes.c_void_p, ctypes.POINTER(ctypes.c_int)]
+        library.gumus_run.restype = ctypes.c_int
+        return library
+
+    def _call(self, function, *args):
+        """Tampona yazan çağrı; (durum, metin) döner, meşgulse NativeError"""
+        size = INITIAL_BUFFER
+        while True:
+            buffer = ctypes.create_string_buffer(size)
+            required = ctypes.c_size_t(0)
+            status = function(*args, buffer, size, ctypes.byref(required))
+            if status == BUFFER_TOO_SMALL and required.value > size:
+                size = required.value
+                continue
+            if status == BUSY:
+                raise NativeError("Yerel yorumlayıcı meşgul", BUSY)
+            return status, buffer.value.decode('utf-8', 'replace')
+
+    def compile(self, source):
+        """Kaynağı ayrıştırıp çözümler; (başarılı mı, hata nesneleri listesi)"""
+        status, text = self._call(self._load().gumus_compile, source.encode('utf-8'))
+        return status == OK, json.loads(text or '[]')
+
+    def dump_ast(self, source):
+        """`gumus --dump-ast` ile aynı JSON metni"""
+        status, text = self._call(self._load().gumus_dump_ast, source.encode('utf-8'))
+        if status != OK:
+            raise NativeError("AST üretilemedi", status)
+        return text
+
+    def dump_memory(self):
+        """Son çalıştırmanın sonundaki global değişkenler (bellek dökümü biçimi)"""
+        status, text = self._call(self._load().gumus_dump_memory)
+        return json.loads(text) if status == OK else None
+
+    def start(self, source_file, dump_memory=False, on_output=None):
+        """
+        Programı süreç içinde başlatır ve NativeRun döner. Süren önceki
+        çalıştırma iptal edilir ve bitmesi beklenir; iptale yanıt vermezse
+        NativeError(BUSY) yükselir ve çağıran süreç tabanlı yola düşer.
+        """
+        library = self._load()
+        source = Path(source_file).read_text(encoding='utf-8')
+        previous = self._active
+        if previous is not None:
+            previous.cancel()
+            try:
+                previous.wait(timeout=CANCEL_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                raise NativeError("Önceki yerel çalıştırma iptal edilemedi", BUSY)
+        run = NativeRun(library, source, source_file, RUN_DUMP_MEMORY if dump_memory else 0, on_output)
+        self._active = run
+        return run
+
+    def run(self, source_file, input_text='', timeout=None):
+        """
+        Programı sonuna kadar çalıştırır; (stdout, stderr, çıkış kodu). timeout
+        saniyede bitmezse çalıştırma iptal edilir ve subprocess.TimeoutExpired
+        yükselir. Süreç içinde çalıştığından RLIMIT bellek sınırı uygulanmaz.
+        """
+        run = self.start(source_file)
+        if input_text:
+            run.stdin.write(input_text)
+        run.stdin.close()
+        try:
+            code = run.wait(timeout)
+        except subprocess.TimeoutExpired:
+            run.cancel()
+            try:
+                run.wait(CANCEL_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                pass  # İptali dinlemiyor; sonraki start BUSY ile süreç yoluna düşer
+            raise
+        return run.stdout.read(), run.stderr.read(), code
+
+
+_shared_vm = None
+
+
+def get_native_vm():
+    """CompilerRunner örneklerinin paylaştığı yerel yorumlayıcı"""
+    global _shared_vm
+    if _shared_vm is None:
+        _shared_vm = NativeVM()
+    return _shared_vm
@@ -0,0 +1,341 @@
+# -*- coding: utf-8 -*-
+"""
+GümüşDil AST İyileştiricisi
+src/compiler/optimizer/constant_folding.cpp ve dead_code_elimination.cpp'nin
+GumusParser AST'si üzerindeki karşılığı. Yorumlayıcı, VM ve transpiler'dan
+önce isteğe bağlı bir aşama olarak çalışır:
+
+  - Sabit katlama: sabitler arası aritmetik, karşılaştırma, metin birleştirme,
+    tekli işleçler ve sol tarafı sabit olan ve/veya.
+  - Ölü kod: koşulu sabit olan eğer/döngü/için dalları ile dön, kır ve devam'dan
+    sonra bir blokta kalan deyimler atılır.
+  - Çift olumsuzlama: koşullardaki !!x, x'e indirgenir (doğruluk değeri aynıdır).
+
+Katlama çalışma zamanıyla aynı anlambilimi kullanır (tamsayı bölmesi sıfıra
+doğru keser, "n=" + 5 metne çevirir); hata verecek işlemler (sıfıra bölme,
+uyumsuz türler) katlanmaz, hata çalışma anında satırıyla birlikte oluşur.
+
+parse_cache'in AST'si paylaşıldığı için ağaç yerinde değiştirilmez: değişen
+düğümler yeniden oluşturulur, değişmeyen alt ağaçlar paylaşılır.
+"""
+import operator
+
+from .ast_nodes import (
+    NodeVisitor, Program, VarStmt, FunctionStmt, ClassStmt, BlockStmt, IfStmt, WhileStmt,
+    ForStmt, PrintStmt, ReturnStmt, ExprStmt, BreakStmt, ContinueStmt, TryStmt,
+    UnaryExpr, BinaryExpr, Literal, CallExpr, AssignExpr, LogicalExpr, GetExpr, SetExpr,
+    IndexExpr, IndexSetExpr, ListExpr, NewExpr, DictExpr,
+)
+
+# Katlama sonucu bundan uzun metinler üretilmez ("a" * 100000 kaynağı şişirmesin)
+MAX_FOLDED_TEXT = 1024
+
+_TERMINATORS = (ReturnStmt.kind, BreakStmt.kind, ContinueStmt.kind)
+_DECLARATIONS = (VarStmt.kind, FunctionStmt.kind, ClassStmt.kind)
+_CONSTANT_TYPES = (int, float, str, bool, type(None))
+_UNFOLDABLE = object()
+# Çalışma zamanında da doğrudan Python işleciyle hesaplananlar
+_PYTHON_OPERATORS = {
+    '-': operator.sub, '*': operator.mul,
+    '==': operator.eq, '!=': operator.ne, '<': operator.lt, '<=': operator.le,
+    '>': operator.gt, '>=': operator.ge,
+}
+
+
+class OptimizationStats:
+    """Bir iyileştirme çalışmasında yapılan dönüşümlerin sayaçları"""
+    __slots__ = ('folded', 'pruned_branches', 'unreachable', 'negations')
+
+    def __init__(self):
+        self.folded = 0           # Sabite indirgenen ifadeler
+        self.pruned_branches = 0  # Koşulu sabit olduğu için atılan dallar/döngüler
+        self.unreachable = 0      # dön/kır/devam sonrasında atılan deyimler
+        self.negations = 0        # Kaldırılan çift olumsuzlamalar
+
+    @property
+    def total(self):
+        return self.folded + self.pruned_branches + self.unreachable + self.negations
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __str__(self):
+        return (f"{self.folded} ifade katlandı, {self.pruned_branches} dal atıldı, "
+                f"{self.unreachable} erişilemeyen deyim silindi, {self.negations} çift olumsuzlama kaldırıldı")
+
+
+def _repeat_length(a, b):
+    """metin * tamsayı (her iki sırada) sonucunun uzunluğu; tekrar değilse 0"""
+    if a.__class__ is str and isinstance(b, int):
+        return len(a) * b
+    if b.__class__ is str and isinstance(a, int):
+        return len(b) * a
+    return 0
+
+
+def _is_constant(node):
+    # Kaçış dizisi içeren metinler ham tutulur (çözme sabit kurulurken yapılır); katlanmaz
+    return (node.kind == Literal.kind and node.value.__class__ in _CONSTANT_TYPES
+            and not (node.value.__class__ is str and '\\' in node.value))
+
+
+class AstOptimizer(NodeVisitor):
+    """
+    Her visit_* düğümün iyileştirilmiş karşılığını döner (değişiklik yoksa düğümün
+    kendisini). Deyim listeleri `statements` ile işlenir; atılan deyimler listeden çıkar.
+    """
+
+    def __init__(self, stats=None):
+        super().__init__()
+        # Değer kuralları çalışma zamanından alınır; transpiler bu modülü içe aktardığı
+        # için (interpreter -> tiering -> transpiler) içe aktarma burada yapılır
+        from .interpreter import truthy, to_text, _divide, _modulo
+        self.truthy, self.to_text, self.divide, self.modulo = truthy, to_text, _divide, _modulo
+        self.stats = stats if stats is not None else OptimizationStats()
+
+    def optimize(self, program):
+        statements = self.statements(program.statements)
+        if statements is program.statements:
+            return program
+        return Program(statements, program.diagnostics)
+
+    def generic_visit(self, node):
+        return node
+
+    def _all(self, nodes):
+        """Düğüm listesini ziyaret eder; hiçbiri değişmediyse aynı listeyi döner"""
+        result = [self.visit(node) for node in nodes]
+        if all(new is old for new, old in zip(result, nodes)):
+            return nodes
+        return result
+
+    # --- Deyimler ---
+
+    def statements(self, nodes):
+        result, changed = [], False
+        for index, node in enumerate(nodes):
+            new = self.visit(node)  # Atılan deyim için None
+            if new is not node:
+                changed = True
+            if new is None:
+                continue
+            result.append(new)
+            if new.kind in _TERMINATORS and index + 1 < len(nodes):
+                self.stats.unreachable += len(nodes) - index - 1
+                return result
+        return result if changed else nodes
+
+    def _branch(self, node):
+        """Koşulu sabit eğer'in yerine geçen dal; blok kendi kapsamıyla kalır"""
+        if node is None:
+            return None
+        node = self.visit(node)
+        if node.kind == BlockStmt.kind and not node.statements:
+            return None
+        return node
+
+    def _body(self, node):
+        return self.visit(node) if node is not None else None
+
+    def _nested(self, node):
+        """Dal/döngü gövdesi: tek deyimlik gövde atılırsa boş blok kalır"""
+        new = self.visit(node)
+        return BlockStmt([]) if new is None else new
+
+    def visit_BlockStmt(self, node):
+        statements = self.statements(node.statements)
+        return node if statements is node.statements else BlockStmt(statements)
+
+    def visit_VarStmt(self, node):
+        if node.initializer is None:
+            return node
+        initializer = self.visit(node.initializer)
+        return node if initializer is node.initializer else VarStmt(node.name, initializer)
+
+    def visit_FunctionStmt(self, node):
+        body = self.visit(node.body)
+        return node if body is node.body else FunctionStmt(node.name, node.params, body)
+
+    def visit_ClassStmt(self, node):
+        methods = self._all(node.methods)
+        return node if methods is node.methods else ClassStmt(node.name, node.superclass, methods)
+
+    def visit_IfStmt(self, node):
+        condition = self.condition(node.condition)
+        if _is_constant(condition):
+            chosen = node.then_branch if self.truthy(condition.value) else node.else_branch
+            # Dalsız tek bildirim (eğer (doğru) değişken x = 1) bulunduğu kapsama aittir;
+            # yukarı taşınırsa bloğun kapsamı değişeceğinden dokunulmaz
+            if chosen is None or chosen.kind not in _DECLARATIONS:
+                self.stats.pruned_branches += 1
+                return self._branch(chosen)
+        then_branch = self._nested(node.then_branch)
+        else_branch = self._body(node.else_branch)
+        if (condition is node.condition and then_branch is node.then_branch
+                and else_branch is node.else_branch):
+            return node
+        return IfStmt(condition, then_branch, else_branch)
+
+    def visit_WhileStmt(self, node):
+        condition = self.condition(node.condition)
+        if _is_constant(condition) and not self.truthy(condition.value):
+            self.stats.pruned_branches += 1
+            return None
+        body = self._nested(node.body)
+        if condition is node.condition and body is node.body:
+            return node
+        return WhileStmt(condition, body)
+
+    def visit_ForStmt(self, node):
+        initializer = self._body(node.initializer)
+        condition = self.condition(node.condition) if node.condition is not None else None
+        increment = self._body(node.increment)
+        if condition is not None and _is_constant(condition) and not self.truthy(condition.value):
+            # Gövde hiç çalışmaz; başlangıç ifadesinin yan etkisi döngü çerçevesinde kalır
+            self.stats.pruned_branches += 1
+            if initializer is None:
+                return None
+            return BlockStmt([initializer])
+        body = self._nested(node.body)
+        if (initializer is node.initializer and condition is node.condition
+                and increment is node.increment and body is node.body):
+            return node
+        return ForStmt(initializer, condition, increment, body)
+
+    def visit_PrintStmt(self, node):
+        expressions = self._all(node.expressions)
+        return node if expressions is node.expressions else PrintStmt(expressions, node.keyword)
+
+    def visit_ReturnStmt(self, node):
+        if node.value is None:
+            return node
+        value = self.visit(node.value)
+        return node if value is node.value else ReturnStmt(value, node.keyword)
+
+    def visit_ExprStmt(self, node):
+        expression = self.visit(node.expression)
+        return node if expression is node.expression else ExprStmt(expression)
+
+    def visit_TryStmt(self, node):
+        try_block = self.visit(node.try_block)
+        catch_body = self.visit(node.catch_body)
+        if try_block is node.try_block and catch_body is node.catch_body:
+            return node
+        return TryStmt(try_block, catch_body, node.catch_name)
+
+    # --- İfadeler ---
+
+    def condition(self, node):
+        """Koşul bağlamı: yalnızca doğruluk değeri önemli olduğundan !!x -> x"""
+        node = self.visit(node)
+        while (node.kind == UnaryExpr.kind and node.operator.value == '!'
+               and node.right.kind == UnaryExpr.kind and node.right.operator.value == '!'):
+            self.stats.negations += 1
+            node = node.right.right
+        return node
+
+    def _folded(self, value):
+        self.stats.folded += 1
+        return Literal(value)
+
+    def visit_UnaryExpr(self, node):
+        symbol = node.operator.value
+        right = self.condition(node.right) if symbol == '!' else self.visit(node.right)
+        if _is_constant(right):
+            if symbol == '!':
+                return self._folded(not self.truthy(right.value))
+            if right.value.__class__ in (int, float):
+                return self._folded(-right.value)
+        return node if right is node.right else UnaryExpr(node.operator, right)
+
+    def visit_BinaryExpr(self, node):
+        left, right = self.visit(node.left), self.visit(node.right)
+        if _is_constant(left) and _is_constant(right):
+            value = self._fold(node.operator.value, left.value, right.value)
+            if value is not _UNFOLDABLE:
+                return self._folded(value)
+        if left is node.left and right is node.right:
+            return node
+        return BinaryExpr(left, node.operator, right)
+
+    def visit_LogicalExpr(self, node):
+        left, right = self.visit(node.left), self.visit(node.right)
+        if _is_constant(left):
+            # ve/veya işlenen değerini döner: sonuç ya sol sabit ya da sağ ifadedir
+            self.stats.folded += 1
+            if node.operator.value == 'veya':
+                return left if self.truthy(left.value) else right
+            return right if self.truthy(left.value) else left
+        if left is node.left and right is node.right:
+            return node
+        return LogicalExpr(left, node.operator, right)
+
+    def visit_CallExpr(self, node):
+        callee, args = self.visit(node.callee), self._all(node.args)
+        return node if callee is node.callee and args is node.args else CallExpr(callee, args)
+
+    def visit_NewExpr(self, node):
+        callee, args = self.visit(node.callee), self._all(node.args)
+        return node if callee is node.callee and args is node.args else NewExpr(callee, args)
+
+    def visit_AssignExpr(self, node):
+        value = self.visit(node.value)
+        return node if value is node.value else AssignExpr(node.name, value)
+
+    def visit_GetExpr(self, node):
+        obj = self.visit(node.object)
+        return node if obj is node.object else GetExpr(obj, node.name)
+
+    def visit_SetExpr(self, node):
+        obj, value = self.visit(node.object), self.visit(node.value)
+        return node if obj is node.object and value is node.value else SetExpr(obj, node.name, value)
+
+    def visit_IndexExpr(self, node):
+        obj, index = self.visit(node.object), self.visit(node.index)
+        return node if obj is node.object and index is node.index else IndexExpr(obj, index)
+
+    def visit_IndexSetExpr(self, node):
+        obj, index, value = self.visit(node.object), self.visit(node.index), self.visit(node.value)
+        if obj is node.object and index is node.index and value is node.value:
+            return node
+        return IndexSetExpr(obj, index, value)
+
+    def visit_ListExpr(self, node):
+        elements = self._all(node.elements)
+        return node if elements is node.elements else ListExpr(elements)
+
+    def visit_DictExpr(self, node):
+        values = self._all(node.values)
+        return node if values is node.values else DictExpr(node.keys, values)
+
+    def _fold(self, symbol, a, b):
+        """Çalışma zamanının sonucunu verir; hata verecek veya şişecek işlemde _UNFOLDABLE"""
+        try:
+            if symbol == '+':
+                try:
+                    value = a + b
+                except TypeError:
+                    if a.__class__ is not str and b.__class__ is not str:
+                        return _UNFOLDABLE
+                    value = self.to_text(a) + self.to_text(b)
+            elif symbol in _PYTHON_OPERATORS:
+                if symbol == '*' and _repeat_length(a, b) > MAX_FOLDED_TEXT:
+                    return _UNFOLDABLE  # Sonuç hesaplanmadan reddedilir (bellek taşmasın)
+                value = _PYTHON_OPERATORS[symbol](a, b)
+            elif symbol == '/':
+                value = self.divide(a, b)
+            elif symbol == '%':
+                value = self.modulo(a, b)
+            else:
+                return _UNFOLDABLE
+        except (TypeError, ZeroDivisionError, ValueError, OverflowError):
+            return _UNFOLDABLE
+        if value.__class__ is str and len(value) > MAX_FOLDED_TEXT:
+            return _UNFOLDABLE
+        return value
+
+
+def optimize(program, stats=None):
+    """Programın iyileştirilmiş kopyasını ve sayaçları döner: (program, OptimizationStats)"""
+    optimizer = AstOptimizer(stats)
+    return optimizer.optimize(program), optimizer.stats
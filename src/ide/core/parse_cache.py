@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+İçerik Adresli Ayrıştırma Önbelleği
+Aynı kaynak metin transpiler'lar, AST görüntüleyici ve akış şeması tarafından
+tekrar tekrar taranıp ayrıştırılmasın diye AST'ler kaynak metnin özeti (hash) ve
+ayrıştırıcı sürümüyle anahtarlanarak saklanır:
+
+  1. Bellekte sınırlı boyutlu bir LRU (en son kullanılan) tablosu
+  2. Diskte USER_DATA_DIR/cache/ast altında pickle + zlib ile sıkıştırılmış kayıtlar
+
+Değişmeyen lib/*.tr modülleri böylece IDE oturumları arasında bile bir kez
+ayrıştırılır. Dönen AST paylaşılır; tüketiciler onu salt okunur kabul etmelidir.
+"""
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+
+from .tokenizer import TokenizerRunner
+from .parser import GumusParser, PARSER_VERSION
+
+
+class ParseCache:
+    """Kaynak metin -> Program eşlemesini bellek ve disk katmanlarında tutar"""
+
+    def __init__(self, cache_dir=None, max_entries=128, persist=True):
+        if cache_dir is None and persist:
+            from ..config import USER_DATA_DIR
+            cache_dir = USER_DATA_DIR / "cache" / "ast"
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.persist = persist and self.cache_dir is not None
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        # UI, kenar çubuğu/indeks yenileme ve panel iş parçacıkları aynı tabloyu kullanır;
+        # ayrıştırma kilit dışında yapılır, yalnızca tablo işlemleri kilitlenir
+        self._lock = threading.Lock()
+
+        # İstatistikler
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(source):
+        """Kaynak ve ayrıştırıcı sürümünden önbellek anahtarı üretir"""
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(f"gumus-ast:{PARSER_VERSION}\0".encode("ascii"))
+        digest.update(source.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def parse(self, source):
+        """Kaynağın AST'sini döner; gerekirse ayrıştırıp önbelleğe yazar"""
+        key = self.key(source)
+
+        with self._lock:
+            ast = self._entries.get(key)
+            if ast is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return ast
+
+        ast = self._load(key)
+        if ast is not None:
+            disk_hit = True
+        else:
+            disk_hit = False
+            ast = GumusParser(TokenizerRunner.get_tokens(source)).parse()
+            self._store(key, ast)
+
+        with self._lock:
+            if disk_hit:
+                self.disk_hits += 1
+            else:
+                self.misses += 1
+            # Aynı kaynağı eşzamanlı ayrıştıran iş parçacığı önce yazdıysa onun ağacı paylaşılır
+            ast = self._entries.get(key, ast)
+            self._remember(key, ast)
+        return ast
+
+    def parse_file(self, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return self.parse(f.read())
+
+    def clear(self, disk=False):
+        """Bellek katmanını (istenirse disk katmanını da) temizler"""
+        with self._lock:
+            self._entries.clear()
+        if disk and self.persist and self.cache_dir.exists():
+            for entry in self.cache_dir.glob("*/*.ast"):
+                try: entry.unlink()
+                except OSError: pass
+
+    def _remember(self, key, ast):
+        # Çağıran self._lock'u tutar
+        self._entries[key] = ast
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _path(self, key):
+        return self.cache_dir / key[:2] / f"{key}.ast"
+
+    def _load(self, key):
+        if not self.persist:
+            return None
+        try:
+            with open(self._path(key), 'rb') as f:
+                return pickle.loads(zlib.decompress(f.read()))
+        except Exception:
+            # Kayıt yok, bozuk veya eski biçimli: yeniden ayrıştırılacak
+            return None
+
+    def _store(self, key, ast):
+        if not self.persist:
+            return
+        path = self._path(key)
+        try:
+            payload = zlib.compress(pickle.dumps(ast, protocol=pickle.HIGHEST_PROTOCOL))
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Yarım yazılmış dosya okunmasın diye önce geçici dosyaya yazılır
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(payload)
+                os.replace(tmp_path, path)
+            except OSError:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, pickle.PicklingError, RecursionError):
+            # Disk katmanı isteğe bağlıdır; yazılamazsa yalnızca bellekte kalır
+            pass
+
+
+_shared_cache = None
+
+
+def get_parse_cache():
+    """Tüm AST tüketicilerinin paylaştığı önbellek örneği"""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = ParseCache()
+    return _shared_cache
+
+
+def parse_source(source):
+    return get_parse_cache().parse(source)
@@ -1,26 +1,116 @@
 # -*- coding: utf-8 -*-
-from .tokenizer import TokenType, Token
+from array import array
+from bisect import bisect_left
+from .tokenizer import GumusTokenizer, TokenType, Token, KIND_CODES
 from .ast_nodes import *
 
+_EOF_CODE = KIND_CODES[TokenType.EOF]
+
+# Dilbilgisi veya AST düğümleri değiştiğinde artırılmalı (ayrıştırma önbelleği anahtarı)
+PARSER_VERSION = 5
+
+# Hata sonrası toparlanmada yeni bir bildirimin başladığı kabul edilen token'lar
+_STATEMENT_STARTS = frozenset(KIND_CODES[t] for t in (
+    TokenType.FUNCTION, TokenType.VAR, TokenType.CLASS, TokenType.IF, TokenType.WHILE,
+    TokenType.FOR, TokenType.PRINT, TokenType.RETURN, TokenType.TRY, TokenType.INCLUDE,
+    TokenType.BREAK, TokenType.CONTINUE, TokenType.RBRACE,
+    # Bozuk bir başlığın ardından gelen gövde ayrı bir blok olarak ayrıştırılır;
+    # böylece kapanış parantezi sahipsiz kalıp ikinci bir hata doğurmaz
+    TokenType.LBRACE))
+_SEMICOLON_CODE = KIND_CODES[TokenType.SEMICOLON]
+
+# İfade ayrıştırıcısı için tür kodları
+_LPAREN_CODE = KIND_CODES[TokenType.LPAREN]
+_RPAREN_CODE = KIND_CODES[TokenType.RPAREN]
+_DOT_CODE = KIND_CODES[TokenType.DOT]
+_LBRACKET_CODE = KIND_CODES[TokenType.LBRACKET]
+_IDENTIFIER_CODE = KIND_CODES[TokenType.IDENTIFIER]
+_VALUE_CODES = frozenset((KIND_CODES[TokenType.NUMBER], KIND_CODES[TokenType.STRING]))
+_CONSTANTS = {KIND_CODES[TokenType.TRUE]: True, KIND_CODES[TokenType.FALSE]: False, KIND_CODES[TokenType.NULL]: None}
+_POSTFIX_CODES = frozenset((_LPAREN_CODE, _DOT_CODE, _LBRACKET_CODE))
+_PREFIX_CODES = frozenset((KIND_CODES[TokenType.BANG], KIND_CODES[TokenType.MINUS], _LPAREN_CODE))
+
+# Bağlama güçleri (büyük olan daha sıkı bağlar). Gruplama işareti 0 gücüyle
+# yığında durur ve kapanış parantezine kadar altındakilerin indirgenmesini engeller.
+_BP_ASSIGN = 1
+_BP_UNARY = 8
+_GROUP = (0, None, None)
+_INFIX = {KIND_CODES[t]: (bp, node_type) for bp, node_type, types in (
+    (_BP_ASSIGN, AssignExpr, (TokenType.EQ,)),
+    (2, LogicalExpr, (TokenType.OR,)),
+    (3, LogicalExpr, (TokenType.AND,)),
+    (4, BinaryExpr, (TokenType.BANGEQ, TokenType.EQEQ)),
+    (5, BinaryExpr, (TokenType.GT, TokenType.GTEQ, TokenType.LT, TokenType.LTEQ)),
+    (6, BinaryExpr, (TokenType.MINUS, TokenType.PLUS)),
+    (7, BinaryExpr, (TokenType.SLASH, TokenType.STAR, TokenType.PERCENT)),
+) for t in types}
+
+
+class ParseError(Exception):
+    """Ayrıştırıcının tek bir bildirimi terk etmesine yol açan sözdizimi hatası"""
+    def __init__(self, token, message, expected=None):
+        super().__init__(f"{message} Bulunan: {token}")
+        self.token = token
+        self.message = message
+        self.expected = expected
+
+
+class Diagnostic:
+    """Tek geçişte toplanan, konumlu sözdizimi hatası"""
+    def __init__(self, message, line, col, end_col, expected=None, found=None):
+        self.message = message
+        self.line = line
+        self.col = col
+        self.end_col = end_col
+        self.expected = expected  # Beklenen token türü (TokenType) veya açıklama
+        self.found = found        # Bulunan token
+
+    def to_json(self):
+        return {
+            "message": self.message,
+            "line": self.line,
+            "col": self.col,
+            "end_col": self.end_col,
+            "expected": self.expected,
+            "found": self.found.type if self.found is not None else None,
+            "found_value": self.found.value if self.found is not None else None,
+        }
+
+    def __repr__(self):
+        return f"Diagnostic({self.line}:{self.col}, '{self.message}')"
+
 class GumusParser:
-    def __init__(self, tokens):
+    def __init__(self, tokens, kinds=None):
         self.tokens = tokens
         self.current = 0
+        self.diagnostics = []
+        # Tür kodları: CompactTokenStream'de hazır dizi, Token listesinde bir kez çıkarılır.
+        # Böylece check/match token nesnesine (veya görünümüne) dokunmadan çalışır.
+        if kinds is None:
+            kinds = getattr(tokens, 'kinds', None)
+        self.kinds = kinds if kinds is not None else array('B', [KIND_CODES[t.type] for t in tokens])
         
     def parse(self):
-        statements = []
+        """Programı ayrıştırır; hatalı bildirimler atlanır, hatalar Program.diagnostics'e yazılır"""
+        statements = [stmt for stmt in self.iter_declarations() if stmt is not None]
+        return Program(statements, self.diagnostics)
+
+    def iter_declarations(self):
+        """Üst düzey bildirimleri tek tek üretir (akış halinde işleme için)"""
         while not self.is_at_end():
-            statements.append(self.declaration())
-        return Program(statements)
+            yield self.declaration()
         
     def declaration(self):
+        start = self.current
         try:
             if self.match(TokenType.VAR): return self.var_declaration()
             if self.match(TokenType.FUNCTION): return self.function_declaration()
+            if self.match(TokenType.CLASS): return self.class_declaration()
             if self.match(TokenType.INCLUDE): return self.include_declaration()
             return self.statement()
-        except Exception as e:
-            self.synchronize()
+        except ParseError as error:
+            self.report(error)
+            self.synchronize(start)
             return None
 
     def var_declaration(self):
@@ -28,11 +118,24 @@ class GumusParser:
         initializer = None
         if self.match(TokenType.EQ):
             initializer = self.expression()
+        self.end_statement()
         return VarStmt(name, initializer)
 
     def include_declaration(self):
-        module = self.consume(TokenType.IDENTIFIER, "Modül ismi bekleniyor.")
-        return IncludeStmt(module.value)
+        # dahil_et matematik | dahil_et "dosya.tr" | dahil_et("dosya.tr")
+        parenthesized = self.match(TokenType.LPAREN)
+        if self.match(TokenType.STRING):
+            module = self.previous()
+        else:
+            module = self.consume(TokenType.IDENTIFIER, "Modül ismi bekleniyor.")
+        if parenthesized:
+            self.consume(TokenType.RPAREN, "Modül ismi sonrası ) bekleniyor.")
+        alias = None
+        if self.check(TokenType.IDENTIFIER) and self.peek().value == "olarak":
+            self.advance()
+            alias = self.consume(TokenType.IDENTIFIER, "'olarak' sonrası takma ad bekleniyor.").value
+        self.end_statement()
+        return IncludeStmt(module.value, alias)
 
     def function_declaration(self):
         name = self.consume(TokenType.IDENTIFIER, "Fonksiyon ismi bekleniyor.")
@@ -48,12 +151,31 @@ class GumusParser:
         body = self.block()
         return FunctionStmt(name, params, body)
 
+    def class_declaration(self):
+        name = self.consume(TokenType.IDENTIFIER, "Sınıf ismi bekleniyor.")
+        superclass = None
+        if self.match(TokenType.LT):
+            superclass = Variable(self.consume(TokenType.IDENTIFIER, "Üst sınıf ismi bekleniyor."))
+        self.consume(TokenType.LBRACE, "Sınıf gövdesi için { bekleniyor.")
+        methods = []
+        while not self.check(TokenType.RBRACE) and not self.is_at_end():
+            # 'fonksiyon' yazmak isteğe bağlı: kurucu(...) { } de bir metottur
+            self.match(TokenType.FUNCTION)
+            if not self.check(TokenType.IDENTIFIER):
+                raise self.error(self.peek(), "Sınıf içinde sadece metotlar tanımlanabilir.", TokenType.FUNCTION)
+            methods.append(self.function_declaration())
+        self.consume(TokenType.RBRACE, "Sınıf gövdesi sonrası } bekleniyor.")
+        return ClassStmt(name, superclass, methods)
+
     def statement(self):
         if self.match(TokenType.IF): return self.if_statement()
         if self.match(TokenType.WHILE): return self.while_statement()
+        if self.match(TokenType.FOR): return self.for_statement()
         if self.match(TokenType.TRY): return self.try_statement()
-        if self.match(TokenType.BREAK): return BreakStmt()
-        if self.match(TokenType.CONTINUE): return ContinueStmt()
+        if self.match(TokenType.BREAK, TokenType.CONTINUE):
+            keyword = self.previous()  # end_statement ';' tüketirse previous() değişir
+            self.end_statement()
+            return BreakStmt(keyword) if keyword.type == TokenType.BREAK else ContinueStmt(keyword)
         if self.match(TokenType.LBRACE): return BlockStmt(self.block().statements)
         if self.match(TokenType.PRINT): return self.print_statement()
         if self.match(TokenType.RETURN): return self.return_statement()
@@ -71,87 +193,188 @@ class GumusParser:
 
     def while_statement(self):
         self.consume(TokenType.LPAREN, "Döngü koşulu için ( bekleniyor.")
+        if self.check(TokenType.VAR) or self.check(TokenType.SEMICOLON):
+            return self.for_clauses()
         condition = self.expression()
+        # döngü (i = 0; i < n; i = i + 1) biçimi: ilk ifade başlangıç atamasıdır
+        if self.match(TokenType.SEMICOLON):
+            return self.for_clauses(ExprStmt(condition))
         self.consume(TokenType.RPAREN, "Döngü koşulu sonrası ) bekleniyor.")
         body = self.statement()
         return WhileStmt(condition, body)
 
+    def for_statement(self):
+        self.consume(TokenType.LPAREN, "'için' sonrası ( bekleniyor.")
+        return self.for_clauses()
+
+    def for_clauses(self, initializer=None):
+        """için (başlangıç; koşul; artış) başlığının '(' sonrası kalanını ayrıştırır"""
+        if initializer is None and not self.match(TokenType.SEMICOLON):
+            if self.match(TokenType.VAR): initializer = self.var_declaration()
+            else: initializer = self.expression_statement()
+            if self.previous().type != TokenType.SEMICOLON:
+                self.consume(TokenType.SEMICOLON, "Döngü başlangıcı sonrası ; bekleniyor.")
+        condition = None
+        if not self.check(TokenType.SEMICOLON):
+            condition = self.expression()
+        self.consume(TokenType.SEMICOLON, "Döngü koşulu sonrası ; bekleniyor.")
+        increment = None
+        if not self.check(TokenType.RPAREN):
+            increment = self.expression()
+        self.consume(TokenType.RPAREN, "Döngü başlığı sonrası ) bekleniyor.")
+        body = self.statement()
+        return ForStmt(initializer, condition, increment, body)
+
     def try_statement(self):
         try_body = self.statement()
         self.consume(TokenType.CATCH, "Dene bloğu sonrası yakala bekleniyor.")
+        catch_name = None
+        if self.match(TokenType.LPAREN):
+            catch_name = self.consume(TokenType.IDENTIFIER, "Hata değişkeni ismi bekleniyor.")
+            self.consume(TokenType.RPAREN, "Hata değişkeni sonrası ) bekleniyor.")
         catch_body = self.statement()
-        return TryStmt(try_body, catch_body)
+        return TryStmt(try_body, catch_body, catch_name)
 
     def block(self):
+        opening = self.previous()
         statements = []
         while not self.check(TokenType.RBRACE) and not self.is_at_end():
-            statements.append(self.declaration())
+            stmt = self.declaration()
+            if stmt is not None:
+                statements.append(stmt)
+        if self.is_at_end():
+            # Dosya sonunda değil, açılan parantezin yerinde raporlanır
+            raise self.error(opening, "Kapatılmamış blok: '{'", TokenType.RBRACE)
         self.consume(TokenType.RBRACE, "Blok bitimi için } bekleniyor.")
         return BlockStmt(statements)
 
     def print_statement(self):
-        self.consume(TokenType.LPAREN, "Yazdır için parantez aç.")
+        keyword = self.previous()
+        if not self.check(TokenType.LPAREN):
+            # Parantezsiz kullanım: yazdır "merhaba"
+            expressions = [self.expression()]
+            self.end_statement()
+            return PrintStmt(expressions, keyword)
+        self.advance()
         expressions = []
         if not self.check(TokenType.RPAREN):
             while True:
                 expressions.append(self.expression())
                 if not self.match(TokenType.COMMA): break
         self.consume(TokenType.RPAREN, "Yazdır sonrası parantez kapat.")
-        return PrintStmt(expressions)
+        self.end_statement()
+        return PrintStmt(expressions, keyword)
 
     def return_statement(self):
+        keyword = self.previous()
         value = None
-        if not self.check(TokenType.SEMICOLON) and not self.check(TokenType.RBRACE):
+        # Aynı satırda değer yoksa (örn. '}' veya yeni satırdaki bildirim) çıplak dön
+        if not self.check(TokenType.SEMICOLON) and not self.check(TokenType.RBRACE) \
+                and not self.is_at_end() and self.peek().line == keyword.line:
              value = self.expression()
-        return ReturnStmt(value)
+        self.end_statement()
+        return ReturnStmt(value, keyword)
 
     def expression_statement(self):
         expr = self.expression()
+        self.end_statement()
         return ExprStmt(expr)
 
+    def end_statement(self):
+        """Bildirim sonundaki isteğe bağlı ';'"""
+        self.match(TokenType.SEMICOLON)
+
     def expression(self):
-        return self.equality()
-
-    def equality(self):
-        expr = self.comparison()
-        while self.match(TokenType.BANGEQ, TokenType.EQEQ):
-            operator = self.previous(); right = self.comparison()
-            expr = BinaryExpr(expr, operator, right)
-        return expr
-
-    def comparison(self):
-        expr = self.term()
-        while self.match(TokenType.GT, TokenType.GTEQ, TokenType.LT, TokenType.LTEQ):
-            operator = self.previous(); right = self.term()
-            expr = BinaryExpr(expr, operator, right)
-        return expr
-
-    def term(self):
-        expr = self.factor()
-        while self.match(TokenType.MINUS, TokenType.PLUS):
-            operator = self.previous(); right = self.factor()
-            expr = BinaryExpr(expr, operator, right)
-        return expr
-
-    def factor(self):
-        expr = self.unary()
-        while self.match(TokenType.SLASH, TokenType.STAR):
-            operator = self.previous(); right = self.unary()
-            expr = BinaryExpr(expr, operator, right)
-        return expr
-
-    def unary(self):
-        if self.match(TokenType.BANG, TokenType.MINUS):
-            operator = self.previous(); right = self.unary()
-            return UnaryExpr(operator, right)
-        return self.call()
+        """
+        Öncelik tırmanışlı (Pratt) ifade ayrıştırıcı. Her öncelik düzeyi için
+        ayrı bir metot çağırmak yerine _INFIX tablosundaki bağlama güçleriyle
+        açık bir operatör yığını kullanır; iç içe parantezler ve tekli operatör
+        zincirleri Python özyinelemesi gerektirmez.
+        """
+        kinds, tokens, infix = self.kinds, self.tokens, _INFIX
+        operands = []
+        operators = []  # (bağlama gücü, operatör token'ı, düğüm sınıfı) ya da _GROUP
+        while True:
+            # Önek: tekli operatörler ve gruplama parantezleri
+            kind = kinds[self.current]
+            while kind in _PREFIX_CODES:
+                operators.append(_GROUP if kind == _LPAREN_CODE else (_BP_UNARY, tokens[self.current], UnaryExpr))
+                self.current += 1
+                kind = kinds[self.current]
+            # İşlenen: en sık görülen isim/sayı/metin için doğrudan yol
+            if kind == _IDENTIFIER_CODE:
+                operand = Variable(tokens[self.current])
+                self.current += 1
+            elif kind in _VALUE_CODES:
+                operand = Literal(tokens[self.current].value)
+                self.current += 1
+            else:
+                operand = self.primary()
+            if kinds[self.current] in _POSTFIX_CODES:
+                operand = self.postfix(operand)
+            operands.append(operand)
+
+            while True:
+                kind = kinds[self.current]
+                entry = infix.get(kind)
+                if entry is not None:
+                    bp = entry[0]
+                    # Eşit güçtekiler önce indirgenir (sola birleşme); atama sağa birleşir
+                    floor = bp + 1 if bp == _BP_ASSIGN else bp
+                    while operators and operators[-1][0] >= floor:
+                        self.reduce(operators.pop(), operands)
+                    operators.append((bp, tokens[self.current], entry[1]))
+                    self.current += 1
+                    break
+
+                while operators and operators[-1][0] > 0:
+                    self.reduce(operators.pop(), operands)
+                if not operators:
+                    return operands.pop()
+                # Açık bir grup var: kapanmalı, ardından sonekler gruba uygulanır
+                if kind != _RPAREN_CODE:
+                    raise self.error(self.peek(), "Grup sonrası ) bekleniyor.", TokenType.RPAREN)
+                operators.pop()
+                self.current += 1
+                operands.append(self.postfix(operands.pop()))
+
+    def reduce(self, operator, operands):
+        """Yığının tepesindeki operatörü işlenenleriyle tek düğüme indirger"""
+        _, token, node_type = operator
+        right = operands.pop()
+        if node_type is UnaryExpr:
+            operands.append(UnaryExpr(token, right))
+            return
+        left = operands.pop()
+        if node_type is AssignExpr:
+            if isinstance(left, Variable): operands.append(AssignExpr(left.name, right))
+            elif isinstance(left, GetExpr): operands.append(SetExpr(left.object, left.name, right))
+            elif isinstance(left, IndexExpr): operands.append(IndexSetExpr(left.object, left.index, right))
+            else: raise self.error(token, "Geçersiz atama hedefi.", "atanabilir ifade")
+            return
+        operands.append(node_type(left, token, right))
 
     def call(self):
-        expr = self.primary()
+        return self.postfix(self.primary())
+
+    def postfix(self, expr):
+        kinds = self.kinds
         while True:
-            if self.match(TokenType.LPAREN): expr = self.finish_call(expr)
-            else: break
-        return expr
+            kind = kinds[self.current]
+            if kind == _LPAREN_CODE:
+                self.current += 1
+                expr = self.finish_call(expr)
+            elif kind == _DOT_CODE:
+                self.current += 1
+                name = self.consume(TokenType.IDENTIFIER, "'.' sonrası özellik ismi bekleniyor.")
+                expr = GetExpr(expr, name)
+            elif kind == _LBRACKET_CODE:
+                self.current += 1
+                index = self.expression()
+                self.consume(TokenType.RBRACKET, "İndeks sonrası ] bekleniyor.")
+                expr = IndexExpr(expr, index)
+            else:
+                return expr
 
     def finish_call(self, callee):
         args = []
@@ -163,39 +386,191 @@ class GumusParser:
         return CallExpr(callee, args)
 
     def primary(self):
-        if self.match(TokenType.FALSE): return Literal(False)
-        if self.match(TokenType.TRUE): return Literal(True)
-        if self.match(TokenType.NULL): return Literal(None)
-        if self.match(TokenType.NUMBER, TokenType.STRING): return Literal(self.previous().value)
-        if self.match(TokenType.IDENTIFIER): return Variable(self.previous())
+        kind = self.kinds[self.current]
+        if kind == _IDENTIFIER_CODE:
+            self.current += 1
+            return Variable(self.previous())
+        if kind in _VALUE_CODES:
+            self.current += 1
+            return Literal(self.previous().value)
+        if kind in _CONSTANTS:
+            self.current += 1
+            return Literal(_CONSTANTS[kind])
+        if self.match(TokenType.THIS): return ThisExpr(self.previous())
+        if self.match(TokenType.SUPER):
+            keyword = self.previous()
+            self.consume(TokenType.DOT, "'ata' sonrası '.' bekleniyor.")
+            return SuperExpr(keyword, self.consume(TokenType.IDENTIFIER, "Üst sınıf metot ismi bekleniyor."))
+        if self.match(TokenType.NEW):
+            target = self.call()
+            if isinstance(target, CallExpr): return NewExpr(target.callee, target.args)
+            return NewExpr(target, [])
+        if self.match(TokenType.LBRACKET):
+            elements = []
+            if not self.check(TokenType.RBRACKET):
+                while True:
+                    elements.append(self.expression())
+                    if not self.match(TokenType.COMMA): break
+            self.consume(TokenType.RBRACKET, "Liste sonrası ] bekleniyor.")
+            return ListExpr(elements)
+        if self.match(TokenType.LBRACE): return self.dict_literal()
         if self.match(TokenType.LPAREN):
             expr = self.expression(); self.consume(TokenType.RPAREN, "Grup sonrası ) bekleniyor."); return expr
-        raise Exception(f"Beklenmeyen token: {self.peek()}")
+        raise self.error(self.peek(), "İfade bekleniyor.", "ifade")
+
+    def dict_literal(self):
+        # Tarayıcı ':' karakterini atladığından { "ad": x } token akışında { "ad" x } olarak gelir
+        keys, values = [], []
+        if not self.check(TokenType.RBRACE):
+            while True:
+                if not self.match(TokenType.STRING, TokenType.IDENTIFIER, TokenType.NUMBER):
+                    raise self.error(self.peek(), "Sözlük anahtarı bekleniyor.", TokenType.STRING)
+                keys.append(Literal(self.previous().value))
+                values.append(self.expression())
+                if not self.match(TokenType.COMMA): break
+        self.consume(TokenType.RBRACE, "Sözlük sonrası } bekleniyor.")
+        return DictExpr(keys, values)
 
     def match(self, *types):
+        kind = self.kinds[self.current]
+        if kind == _EOF_CODE: return False
         for type in types:
-            if self.check(type): self.advance(); return True
+            if kind == KIND_CODES[type]: self.current += 1; return True
         return False
         
     def check(self, type):
-        if self.is_at_end(): return False
-        return self.peek().type == type
+        kind = self.kinds[self.current]
+        return kind != _EOF_CODE and kind == KIND_CODES[type]
         
     def advance(self):
         if not self.is_at_end(): self.current += 1
         return self.previous()
         
-    def is_at_end(self): return self.peek().type == TokenType.EOF
+    def is_at_end(self): return self.kinds[self.current] == _EOF_CODE
     def peek(self): return self.tokens[self.current]
     def previous(self): return self.tokens[self.current - 1]
     def consume(self, type, message):
         if self.check(type): return self.advance()
-        raise Exception(f"{message} Bulunan: {self.peek()}")
+        raise self.error(self.peek(), message, type)
+
+    def error(self, token, message, expected=None):
+        return ParseError(token, message, expected)
+
+    def report(self, error):
+        token = error.token
+        self.diagnostics.append(Diagnostic(
+            error.message, token.line, token.col, token.end_col, error.expected, token))
         
-    def synchronize(self):
-        self.advance()
+    def synchronize(self, start):
+        """Hatadan sonra bir sonraki bildirimin başına kadar token atlar"""
+        # En az bir token tüketilmeli, aksi halde aynı hata sonsuza dek tekrarlanır
+        if self.current == start: self.advance()
+        kinds = self.kinds
         while not self.is_at_end():
-            if self.previous().type == TokenType.SEMICOLON: return
-            if self.peek().type in [TokenType.FUNCTION, TokenType.VAR, TokenType.IF,TokenType.WHILE, TokenType.PRINT, TokenType.RETURN]:
-                return
+            if kinds[self.current - 1] == _SEMICOLON_CODE: return
+            if kinds[self.current] in _STATEMENT_STARTS: return
+            # Satır başındaki bir isim büyük olasılıkla yeni bir bildirimdir
+            if self.peek().line > self.previous().line and self.check(TokenType.IDENTIFIER): return
             self.advance()
+
+
+class IncrementalParser:
+    """
+    Artımlı ayrıştırma: üst düzey bildirimlerin token aralıklarını saklar,
+    bir düzenlemeden sonra yalnızca değişen token'lara dokunan bildirimleri
+    yeniden ayrıştırır ve yeni alt ağaçları önceki Program'a yerleştirir.
+
+    Her bildirim [başlangıç, bitiş) token aralığıyla tutulur. Ayrıştırıcı bir
+    token ileriye baktığından, bitişi tam düzenleme noktasına denk gelen
+    bildirim de kirli sayılır. Yeniden ayrıştırma, eski bir bildirimin
+    (kaydırılmış) başlangıcına ulaşıldığında durur; sonrası aynen korunur.
+    """
+
+    def __init__(self, source=""):
+        self.tokenizer = GumusTokenizer(source, incremental=True)
+        self.tokens = self.tokenizer.tokenize()
+        self.kinds = array('B', [KIND_CODES[t.type] for t in self.tokens])
+        self.starts = []       # Bildirimin ilk token indeksi
+        self.stops = []        # Bildirimden sonraki ilk token indeksi
+        self.nodes = []        # Bildirim düğümü (hatalıysa None)
+        self.node_diagnostics = []  # Bildirim başına tanı listesi
+        self.program = Program([], [])
+
+        starts, stops, nodes, diags = self._parse_from(0, None)
+        self.starts, self.stops, self.nodes, self.node_diagnostics = starts, stops, nodes, diags
+        self._rebuild_program()
+
+    @property
+    def source(self):
+        return self.tokenizer.source
+
+    def edit(self, start, end, text):
+        """
+        Kaynakta [start, end) aralığını `text` ile değiştirir.
+        Dönüş: (ilk, eski_son, yeni_son) — eski `nodes[ilk:eski_son]` bildirimleri
+        yerini yeni `nodes[ilk:yeni_son]` bildirimlerine bıraktı.
+        """
+        return self._reparse(*self.tokenizer.edit(start, end, text))
+
+    def sync(self, new_source):
+        """Editörden gelen tam metinle eşitler (ortak önek/sonek dışı tek düzenleme)"""
+        return self._reparse(*self.tokenizer.sync(new_source))
+
+    def _reparse(self, first, old_stop, new_stop):
+        tokens = self.tokens
+        self.kinds[first:old_stop] = array('B', [KIND_CODES[t.type] for t in tokens[first:new_stop]])
+        delta = new_stop - old_stop
+
+        starts, stops = self.starts, self.stops
+        # İlk kirli bildirim: bitişi (bakılan token dahil) düzenlemeye ulaşan ilki
+        i = bisect_left(stops, first)
+        begin = starts[i] if i < len(starts) else (stops[-1] if stops else 0)
+
+        # Düzenlemeden sonra başlayan ilk eski bildirim; yakınsama adayları bunlardır
+        j = bisect_left(starts, old_stop, i)
+        new_starts, new_stops, new_nodes, new_diags = self._parse_from(begin, (j, delta))
+        reused = self._converged
+
+        # Korunan kuyruk: indeksleri kaydır, satırları değişen tanıları güncelle
+        tail_starts = [s + delta for s in starts[reused:]]
+        tail_stops = [s + delta for s in stops[reused:]]
+        for diags in self.node_diagnostics[reused:]:
+            for diag in diags:
+                diag.line = diag.found.line
+
+        self.starts[i:] = new_starts + tail_starts
+        self.stops[i:] = new_stops + tail_stops
+        self.nodes[i:reused] = new_nodes
+        self.node_diagnostics[i:reused] = new_diags
+        self._rebuild_program()
+        return i, reused, i + len(new_nodes)
+
+    def _parse_from(self, position, resync):
+        """`position`dan bildirim bildirim ayrıştırır; `resync` = (aday_indeksi, kayma)"""
+        parser = GumusParser(self.tokens, self.kinds)
+        parser.current = position
+        starts, stops, nodes, diags = [], [], [], []
+        old_starts = self.starts
+        j = resync[0] if resync else 0
+        delta = resync[1] if resync else 0
+        self._converged = len(old_starts)
+
+        while not parser.is_at_end():
+            if resync:
+                while j < len(old_starts) and old_starts[j] + delta < parser.current:
+                    j += 1
+                if j < len(old_starts) and old_starts[j] + delta == parser.current:
+                    self._converged = j
+                    break
+            start = parser.current
+            before = len(parser.diagnostics)
+            node = parser.declaration()
+            starts.append(start)
+            stops.append(parser.current)
+            nodes.append(node)
+            diags.append(parser.diagnostics[before:])
+        return starts, stops, nodes, diags
+
+    def _rebuild_program(self):
+        self.program.statements = [node for node in self.nodes if node is not None]
+        self.program.diagnostics = [d for diags in self.node_diagnostics for d in diags]
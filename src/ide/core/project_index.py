@@ -0,0 +1,347 @@
+# -*- coding: utf-8 -*-
+"""
+Proje Sembol İndeksi
+Açılan klasördeki tüm .tr dosyalarını (öğrenci ödevleri, lib/, ornekler/...)
+süreç havuzunda paralel ayrıştırır; fonksiyon, sınıf, metot ve değişken
+tanımlarını ve dahil_et kenarlarını tek bir birleşik indekste toplar.
+
+Anahat, otomatik tamamlama ve tanıma git özellikleri dosyaları yeniden okumak
+yerine bu indeksi sorgular. refresh() yalnızca değişen dosyaları yeniden işler:
+önce değiştirilme zamanı/boyut, ardından içerik özeti (hash) karşılaştırılır.
+"""
+import hashlib
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+from .tokenizer import TokenizerRunner
+from .parser import GumusParser
+from .ast_nodes import NodeVisitor
+
+# Bu sayının altındaki iş için süreç havuzu kurmaya değmez
+PARALLEL_THRESHOLD = 8
+
+# dahil_et aramasının sırası (yorumlayıcının searchPaths listesiyle aynı)
+INCLUDE_SEARCH_DIRS = (".", "lib", "std_lib")
+
+SYMBOL_ICONS = {"class": "🏛️", "function": "ƒ", "method": "ƒ", "variable": "💎"}
+
+
+class _SymbolCollector(NodeVisitor):
+    """Bildirimleri ve dahil_et kenarlarını toplar; ifadelerin içine girmez"""
+
+    def __init__(self):
+        super().__init__()
+        self.symbols = []
+        self.includes = []
+        self._scope = None  # İçinde bulunulan fonksiyon/sınıf ismi
+
+    def generic_visit(self, node):
+        pass
+
+    def _add(self, token, type, **extra):
+        symbol = {
+            'name': token.value,
+            'type': type,
+            'line': token.line,
+            'col': token.col,
+            'scope': self._scope,
+            'icon': SYMBOL_ICONS[type],
+        }
+        symbol.update(extra)
+        self.symbols.append(symbol)
+
+    def _visit_scoped(self, name, nodes):
+        outer, self._scope = self._scope, name
+        for node in nodes:
+            self.visit(node)
+        self._scope = outer
+
+    def visit_VarStmt(self, node):
+        self._add(node.name, 'variable')
+
+    def visit_FunctionStmt(self, node, type='function'):
+        self._add(node.name, type, params=", ".join(p.value for p in node.params))
+        self._visit_scoped(node.name.value, node.body.statements)
+
+    def visit_ClassStmt(self, node):
+        superclass = node.superclass.name.value if node.superclass else None
+        self._add(node.name, 'class', superclass=superclass)
+        outer, self._scope = self._scope, node.name.value
+        for method in node.methods:
+            self.visit_FunctionStmt(method, 'method')
+        self._scope = outer
+
+    def visit_BlockStmt(self, node):
+        for stmt in node.statements:
+            self.visit(stmt)
+
+    def visit_IfStmt(self, node):
+        self.visit(node.then_branch)
+        if node.else_branch:
+            self.visit(node.else_branch)
+
+    def visit_WhileStmt(self, node):
+        self.visit(node.body)
+
+    def visit_ForStmt(self, node):
+        if node.initializer:
+            self.visit(node.initializer)
+        self.visit(node.body)
+
+    def visit_TryStmt(self, node):
+        self.visit(node.try_block)
+        self.visit(node.catch_body)
+
+    def visit_IncludeStmt(self, node):
+        self.includes.append(node.module)
+
+
+def index_source(source):
+    """Kaynağın (semboller, dahil_et modülleri, hata sayısı) özetini çıkarır"""
+    program = GumusParser(TokenizerRunner.get_tokens(source)).parse()
+    collector = _SymbolCollector()
+    for stmt in program.statements:
+        collector.visit(stmt)
+    return collector.symbols, collector.includes, len(program.diagnostics)
+
+
+def _index_file(path, known_digest=None):
+    """
+    Süreç havuzunda çalışır. Dönüş: (yol, özet, sonuç); içerik özeti bilinenle
+    aynıysa ayrıştırma atlanır ve sonuç None olur. Okunamayan dosyada özet de None'dır.
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return path, None, None
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    if digest == known_digest:
+        return path, digest, None
+    try:
+        result = index_source(data.decode('utf-8-sig', errors='replace'))
+    except RecursionError:
+        # Aşırı derin iç içe bloklar: dosya indekste boş görünür
+        result = ([], [], 1)
+    return path, digest, result
+
+
+class FileIndex:
+    """Tek bir dosyanın indeks kaydı"""
+
+    def __init__(self, path, mtime, size, digest, symbols, includes, error_count):
+        self.path = path
+        self.mtime = mtime
+        self.size = size
+        self.digest = digest
+        self.symbols = symbols          # Sembol sözlükleri (SymbolExtractor biçiminde)
+        self.includes = includes        # dahil_et ile yazılan modül isimleri
+        self.resolved_includes = []     # Projede bulunan hedef dosyalar
+        self.error_count = error_count  # Sözdizimi hatası sayısı
+
+
+class ProjectIndex:
+    """Proje kökü altındaki .tr dosyalarının birleşik sembol indeksi"""
+
+    def __init__(self, root, max_workers=None):
+        self.root = Path(root).resolve()
+        self.max_workers = max_workers
+        self.files = {}       # yol -> FileIndex
+        self._by_name = {}    # sembol ismi -> {yol: [sembol, ...]}
+        self._dependents = {} # yol -> onu dahil eden dosyaların kümesi
+        self._lock = threading.RLock()
+
+    # --- İndeksleme ---
+
+    def scan(self):
+        """Kök altındaki .tr dosyalarını (gizli klasörler hariç) listeler"""
+        for folder, dirs, names in os.walk(self.root):
+            dirs[:] = [d for d in dirs if not d.startswith('.') and d != "__pycache__"]
+            for name in names:
+                if name.endswith(".tr"):
+                    yield os.path.join(folder, name)
+
+    def refresh(self, paths=None):
+        """
+        Değişen dosyaları yeniden indeksler; `paths` verilmezse tüm proje
+        taranır ve silinen dosyalar indeksten çıkarılır.
+        Dönüş: içeriği değişip yeniden ayrıştırılan dosya sayısı.
+        """
+        full_scan = paths is None
+        paths = list(self.scan()) if full_scan else [str(Path(p).resolve()) for p in paths]
+
+        jobs, stats, gone = [], {}, []
+        with self._lock:
+            for path in paths:
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    gone.append(path)
+                    continue
+                stats[path] = st
+                entry = self.files.get(path)
+                if entry is None or entry.mtime != st.st_mtime_ns or entry.size != st.st_size:
+                    jobs.append((path, entry.digest if entry else None))
+            if full_scan:
+                seen = set(paths)
+                gone.extend(path for path in self.files if path not in seen)
+
+        # Ayrıştırma kilit dışında yapılır; sorgular bu sırada eski indeksi görür
+        results = self._run(jobs)
+
+        changed = 0
+        with self._lock:
+            for path in gone:
+                self._forget(path)
+            for path, digest, result in results:
+                st = stats[path]
+                if digest is None:
+                    self._forget(path)
+                elif result is None:
+                    # İçerik aynı (ör. yalnızca kaydedildi): zaman damgası güncellenir
+                    entry = self.files.get(path)
+                    if entry is not None:
+                        entry.mtime, entry.size = st.st_mtime_ns, st.st_size
+                else:
+                    self._forget(path)
+                    self._remember(FileIndex(path, st.st_mtime_ns, st.st_size, digest, *result))
+                    changed += 1
+            if changed or gone:
+                self._link_includes()
+        return changed
+
+    def _run(self, jobs):
+        if not jobs:
+            return []
+        if len(jobs) < PARALLEL_THRESHOLD or self.max_workers == 1:
+            return [_index_file(*job) for job in jobs]
+        try:
+            # GUI iş parçacığından güvenle çağrılabilmesi için 'spawn' (fork yok)
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context) as pool:
+                workers = self.max_workers or os.cpu_count() or 1
+                chunk = max(1, len(jobs) // (workers * 4))
+                paths, digests = zip(*jobs)
+                return list(pool.map(_index_file, paths, digests, chunksize=chunk))
+        except (OSError, BrokenProcessPool):
+            # Süreç açılamayan ortamlar (kısıtlı sandbox vb.): sıralı devam
+            return [_index_file(*job) for job in jobs]
+
+    def _remember(self, entry):
+        self.files[entry.path] = entry
+        for symbol in entry.symbols:
+            self._by_name.setdefault(symbol['name'], {}).setdefault(entry.path, []).append(symbol)
+
+    def _forget(self, path):
+        entry = self.files.pop(path, None)
+        if entry is None:
+            return
+        for symbol in entry.symbols:
+            owners = self._by_name.get(symbol['name'])
+            if owners is not None:
+                owners.pop(path, None)
+                if not owners:
+                    del self._by_name[symbol['name']]
+
+    def _link_includes(self):
+        dependents = {}
+        for path, entry in self.files.items():
+            entry.resolved_includes = []
+            for module in entry.includes:
+                target = self.resolve_include(module, path)
+                if target is not None:
+                    entry.resolved_includes.append(target)
+                    dependents.setdefault(target, set()).add(path)
+        self._dependents = dependents
+
+    def resolve_include(self, module, from_path):
+        """dahil_et modül ismini indeksteki bir dosya yoluna çözer (bulunamazsa None)"""
+        name = module if module.endswith(".tr") else f"{module}.tr"
+        folders = [os.path.dirname(from_path)] + [os.path.join(self.root, d) for d in INCLUDE_SEARCH_DIRS]
+        for folder in folders:
+            candidate = os.path.normpath(os.path.join(folder, name))
+            if candidate in self.files:
+                return candidate
+        return None
+
+    # --- Sorgular ---
+
+    def outline(self, path):
+        """Dosyanın sembolleri (satır sırasıyla)"""
+        with self._lock:
+            entry = self.files.get(str(Path(path).resolve()))
+            return list(entry.symbols) if entry else []
+
+    def includes_of(self, path, transitive=False):
+        """Dosyanın dahil ettiği proje dosyaları"""
+        with self._lock:
+            start = str(Path(path).resolve())
+            entry = self.files.get(start)
+            if entry is None:
+                return []
+            if not transitive:
+                return list(entry.resolved_includes)
+            order, seen, stack = [], {start}, list(reversed(entry.resolved_includes))
+            while stack:
+                target = stack.pop()
+                if target in seen:
+                    continue
+                seen.add(target)
+                order.append(target)
+                stack.extend(reversed(self.files[target].resolved_includes))
+            return order
+
+    def dependents_of(self, path):
+        """Dosyayı dahil eden proje dosyaları"""
+        with self._lock:
+            return sorted(self._dependents.get(str(Path(path).resolve()), ()))
+
+    def find_definitions(self, name, from_path=None):
+        """
+        İsmin tanımlarını [(yol, sembol), ...] olarak döner. `from_path` verilirse
+        önce o dosya, sonra (dolaylı) dahil ettikleri, en son diğer dosyalar gelir.
+        """
+        with self._lock:
+            owners = self._by_name.get(name)
+            if not owners:
+                return []
+            rank = {}
+            if from_path is not None:
+                here = str(Path(from_path).resolve())
+                rank[here] = 0
+                for depth, target in enumerate(self.includes_of(here, transitive=True), 1):
+                    rank[target] = depth
+            far = len(rank) + 1
+            ordered = sorted(owners, key=lambda path: (rank.get(path, far), path))
+            return [(path, symbol) for path in ordered for symbol in owners[path]]
+
+    def complete(self, prefix, limit=50):
+        """Önekle başlayan sembol isimleri: [(isim, sembol + 'path'), ...]"""
+        with self._lock:
+            matches = sorted(name for name in self._by_name if name.startswith(prefix) and name != prefix)
+            result = []
+            for name in matches[:limit]:
+                path, symbols = next(iter(self._by_name[name].items()))
+                result.append((name, dict(symbols[0], path=path)))
+            return result
+
+
+_project_index = None
+
+
+def open_project(root, max_workers=None):
+    """Paylaşılan proje indeksini `root` için (yeniden) oluşturur"""
+    global _project_index
+    root = Path(root).resolve()
+    if _project_index is None or _project_index.root != root:
+        _project_index = ProjectIndex(root, max_workers)
+    return _project_index
+
+
+def get_project_index():
+    """Açık projenin indeksi (henüz klasör açılmadıysa None)"""
+    return _project_index
@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+"""
+GümüşDil Anlamsal Çözümleyici (Resolver)
+src/compiler/semantic/resolver.cpp'nin Python karşılığı. GumusParser AST'sini
+bir kez dolaşır ve her değişken başvurusuna (kapsam derinliği, yuva) çifti
+verir; yorumlayıcı yerel değişkenleri sözlük yerine sabit boyutlu listelerde
+tutup doğrudan indeksleyerek okur.
+
+Kapsam kuralları kapanış yorumlayıcısının çalışma zamanındakiyle birebir aynıdır:
+  - Genel kapsam isimle (sözlükte) kalır; dahil_et ve bildirilmemiş isme atama
+    onu çalışma anında genişletebilir.
+  - Her fonksiyon çağrısı bir çerçeve açar (metotlarda ilk yuva `öz`).
+  - Bildirim içeren bloklar, `için (değişken ...)`, `yakala` ve üst sınıflı
+    sınıfların `ata` kapsamı kendi çerçevesini açar; bildirimsiz bloklar açmaz.
+Bir başvuru yalnızca kendisinden önce bildirilmiş isimlere çözülür; fonksiyon
+gövdeleri ise kapsamları tamamlandıktan sonra çözülür (çağrı anında sonra
+bildirilen kardeş fonksiyonları da görürler).
+
+Çerçeve düzeni: [üst çerçeve, yuva 1, yuva 2, ...]; genel kapsamın çerçevesi None'dır.
+"""
+from collections import deque
+
+from .ast_nodes import NodeVisitor, BlockStmt, VarStmt, FunctionStmt, ClassStmt
+
+_DECLARATIONS = (VarStmt.kind, FunctionStmt.kind, ClassStmt.kind)
+
+
+def declares(nodes):
+    """Deyim listesi doğrudan bir bildirim içeriyor mu (blok kendi çerçevesini açar mı)"""
+    return any(node.kind in _DECLARATIONS for node in nodes)
+
+
+class Scope:
+    """Tek bir çalışma zamanı çerçevesinin isimleri"""
+    __slots__ = ('names', 'parent', 'function')
+
+    def __init__(self, parent, names=(), function=False):
+        self.parent = parent        # Kapsayan Scope (genel kapsamda None)
+        self.function = function    # Fonksiyon çerçevesi mi (dışarıdan erişim sınırı)
+        self.names = {}             # isim -> yuva (1'den başlar; 0 üst çerçevedir)
+        for name in names:
+            self.declare(name)
+
+    def declare(self, name):
+        slot = self.names.get(name)
+        if slot is None:
+            slot = self.names[name] = len(self.names) + 1
+        return slot
+
+    @property
+    def size(self):
+        return len(self.names)
+
+
+class Resolution:
+    """
+    Çözümleme sonucu; AST paylaşıldığı için düğümlere yazılmaz, düğüm -> bilgi
+    tablolarında tutulur.
+      locals:    Variable/AssignExpr/ThisExpr -> (derinlik, yuva, denetimli);
+                 SuperExpr -> ((ata konumu), (öz konumu)). Genel isimler tabloda yoktur.
+                 `denetimli` başvuru fonksiyon sınırını aşıyorsa True'dur: yuva henüz
+                 atanmamış olabilir, o durumda genel kapsama bakılır.
+      slots:     VarStmt/FunctionStmt/ClassStmt -> bildirildiği yuva (genelse None)
+      scopes:    Çerçeve açan düğüm -> Scope (BlockStmt, ForStmt, FunctionStmt,
+                 ClassStmt'nin ata kapsamı, TryStmt'nin yakala kapsamı)
+      global_refs: Genel kapsamdan okunan isimler [(isim, satır), ...]
+      global_defs: Programın genel kapsamda tanımladığı isimler
+      includes:  dahil_et ile yüklenen modül isimleri
+    """
+
+    def __init__(self):
+        self.locals = {}
+        self.slots = {}
+        self.scopes = {}
+        self.global_refs = []
+        self.global_defs = set()
+        self.includes = []
+
+    def unresolved(self, known):
+        """`known` (yerleşikler, dahil edilen modüllerin isimleri) dışında kalan genel başvurular"""
+        defined = self.global_defs | set(known)
+        seen, result = set(), []
+        for name, line in self.global_refs:
+            if name not in defined and name not in seen:
+                seen.add(name)
+                result.append((name, line))
+        return result
+
+
+class Resolver(NodeVisitor):
+    """Programı çözümleyip bir Resolution döner"""
+
+    def __init__(self):
+        super().__init__()
+        self.result = Resolution()
+        self._scope = None
+        self._pending = deque()  # (fonksiyon düğümü, kapsayan kapsam, metot mu)
+
+    def resolve(self, program):
+        self.statements(program.statements)
+        while self._pending:
+            node, scope, method = self._pending.popleft()
+            self._function_body(node, scope, method)
+        return self.result
+
+    def generic_visit(self, node):
+        pass
+
+    # --- Kapsamlar ---
+
+    def statements(self, nodes):
+        for node in nodes:
+            self.visit(node)
+
+    def _push(self, node, names=(), function=False):
+        scope = self._scope = Scope(self._scope, names, function)
+        self.result.scopes[node] = scope
+        return scope
+
+    def _pop(self, scope):
+        self._scope = scope.parent
+
+    def _declare(self, node, name):
+        if self._scope is None:
+            self.result.global_defs.add(name)
+            self.result.slots[node] = None
+        else:
+            self.result.slots[node] = self._scope.declare(name)
+
+    def _lookup(self, name):
+        depth, crossed, scope = 0, False, self._scope
+        while scope is not None:
+            slot = scope.names.get(name)
+            if slot is not None:
+                return depth, slot, crossed
+            crossed = crossed or scope.function
+            scope = scope.parent
+            depth += 1
+        return None
+
+    def _reference(self, node, name, line):
+        location = self._lookup(name)
+        if location is None:
+            self.result.global_refs.append((name, line))
+        else:
+            self.result.locals[node] = location
+        return location
+
+    def _function_body(self, node, scope, method):
+        outer, self._scope = self._scope, scope
+        params = [p.value for p in node.params]
+        inner = self._push(node, (['öz'] if method else []) + params, function=True)
+        self.statements(node.body.statements)
+        self._pop(inner)
+        self._scope = outer
+
+    # --- Deyimler ---
+
+    def visit_BlockStmt(self, node):
+        if not declares(node.statements):
+            self.statements(node.statements)
+            return
+        scope = self._push(node)
+        self.statements(node.statements)
+        self._pop(scope)
+
+    def visit_VarStmt(self, node):
+        if node.initializer is not None:
+            self.visit(node.initializer)
+        self._declare(node, node.name.value)
+
+    def visit_FunctionStmt(self, node):
+        self._declare(node, node.name.value)
+        self._pending.append((node, self._scope, False))
+
+    def visit_ClassStmt(self, node):
+        if node.superclass is not None:
+            self.visit(node.superclass)
+            scope = self._push(node, ['ata'])
+            self._pop(scope)
+        else:
+            scope = self._scope
+        for method in node.methods:
+            self._pending.append((method, scope, True))
+        self._declare(node, node.name.value)
+
+    def visit_IfStmt(self, node):
+        self.visit(node.condition)
+        self.visit(node.then_branch)
+        if node.else_branch is not None:
+            self.visit(node.else_branch)
+
+    def visit_WhileStmt(self, node):
+        self.visit(node.condition)
+        self.visit(node.body)
+
+    def visit_ForStmt(self, node):
+        scope = None
+        if node.initializer is not None:
+            if node.initializer.kind == VarStmt.kind:
+                # Başlangıç ifadesi döngü çerçevesinin içinde, değişken bildirilmeden önce çalışır
+                scope = self._push(node)
+            self.visit(node.initializer)
+        if node.condition is not None:
+            self.visit(node.condition)
+        if node.increment is not None:
+            self.visit(node.increment)
+        self.visit(node.body)
+        if scope is not None:
+            self._pop(scope)
+
+    def visit_PrintStmt(self, node):
+        for expr in node.expressions:
+            self.visit(expr)
+
+    def visit_ReturnStmt(self, node):
+        if node.value is not None:
+            self.visit(node.value)
+
+    def visit_ExprStmt(self, node):
+        self.visit(node.expression)
+
+    def visit_IncludeStmt(self, node):
+        self.result.includes.append(node.module)
+
+    def visit_TryStmt(self, node):
+        self.visit(node.try_block)
+        catch = node.catch_body
+        nodes = catch.statements if catch.kind == BlockStmt.kind else [catch]
+        names = [node.catch_name.value] if node.catch_name is not None else []
+        if not names and not declares(nodes):
+            self.statements(nodes)
+            return
+        scope = self._push(node, names)
+        self.statements(nodes)
+        self._pop(scope)
+
+    # --- İfadeler ---
+
+    def visit_Variable(self, node):
+        self._reference(node, node.name.value, node.name.line)
+
+    def visit_AssignExpr(self, node):
+        self.visit(node.value)
+        location = self._lookup(node.name.value)
+        if location is None:
+            # Bildirilmemiş isme atama genel değişken tanımlar
+            self.result.global_defs.add(node.name.value)
+        else:
+            self.result.locals[node] = location
+
+    def visit_ThisExpr(self, node):
+        self._reference(node, 'öz', node.keyword.line)
+
+    def visit_SuperExpr(self, node):
+        line = node.keyword.line
+        ata, this = self._lookup('ata'), self._lookup('öz')
+        if ata is None:
+            self.result.global_refs.append(('ata', line))
+        if this is None:
+            self.result.global_refs.append(('öz', line))
+        self.result.locals[node] = (ata, this)
+
+    def visit_UnaryExpr(self, node):
+        self.visit(node.right)
+
+    def visit_BinaryExpr(self, node):
+        self.visit(node.left)
+        self.visit(node.right)
+
+    visit_LogicalExpr = visit_BinaryExpr
+
+    def visit_CallExpr(self, node):
+        self.visit(node.callee)
+        for arg in node.args:
+            self.visit(arg)
+
+    visit_NewExpr = visit_CallExpr
+
+    def visit_GetExpr(self, node):
+        self.visit(node.object)
+
+    def visit_SetExpr(self, node):
+        self.visit(node.object)
+        self.visit(node.value)
+
+    def visit_IndexExpr(self, node):
+        self.visit(node.object)
+        self.visit(node.index)
+
+    def visit_IndexSetExpr(self, node):
+        self.visit(node.object)
+        self.visit(node.index)
+        self.visit(node.value)
+
+    def visit_ListExpr(self, node):
+        for element in node.elements:
+            self.visit(element)
+
+    def visit_DictExpr(self, node):
+        for value in node.values:
+            self.visit(value)
+
+
+def resolve(program):
+    """Program düğümünü çözümler"""
+    return Resolver().resolve(program)
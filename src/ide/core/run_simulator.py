@@ -2,7 +2,12 @@
 # -*- coding: utf-8 -*-
 """
 Gümüşdil Simülatör - Enhanced Error Handling
-Derleyici mevcut olmadığında Python tabanlı simülasyon
+Derleyici mevcut olmadığında Python tabanlı simülasyon. Programlar önce bayt
+kodu VM'inde çalıştırılır; VM'in çalıştırmadan önce reddettiği programlar (ör.
+yalnızca yerel yorumlayıcıda bulunan yerleşikler) ve --legacy için satır
+simülatörü kullanılır. Çalışma zamanı hataları satır numarasıyla bildirilir.
+--native-python ile program Python'a tercüme edilip doğrudan CPython'da çalışır;
+Python'a aynı anlambilimle çevrilemeyen programlar yine VM'de çalışır.
 """
 
 import sys
@@ -10,6 +15,10 @@ import os
 import json
 import traceback
 import time
+import hashlib
+import importlib.util
+import marshal
+import tempfile
 from pathlib import Path
 
 # Add project root to path
@@ -355,13 +364,211 @@ class GumusSimulator:
         print(json.dumps(memory_data, ensure_ascii=False, indent=2))
         print("__MEMORY_JSON_END__")
 
+def run_bytecode(file_path, trace=False, optimize=False):
+    """
+    Dosyayı bayt kodu VM'inde (src/ide/core/vm.py) çalıştırır. Çıktı satırları
+    üretildikçe stdout'a yazılır; çalışma zamanı hatası satır numarasıyla
+    stderr'e yazılır ve 1 döner. Yalnızca program statik denetimde tanımsız isim
+    içeriyorsa (ör. yalnızca yerel yorumlayıcıda olan yerleşikler) hiçbir şey
+    ya da VM'in ayrıştırıcısının tanımadığı sözdizimi kullanıyorsa hiçbir şey
+    çalıştırılmadan None döner ve satır simülatörü devreye girer.
+    optimize açıksa AST derlemeden önce sabit katlama / ölü kod aşamasından geçer.
+    """
+    from src.ide.core.vm import GumusVM
+    from src.ide.core.interpreter import GumusInterpreter, read_source
+    from src.ide.core.parse_cache import parse_source
+
+    path = Path(file_path).resolve()
+    try:
+        program = parse_source(read_source(path))
+    except OSError as e:
+        print(f"Dosya okuma hatası: {e}", file=sys.stderr)
+        return 1
+
+    # Hiçbir yerde tanımlanmayan isimler (çoğunlukla yerel yorumlayıcının
+    # yerleşikleri) çalıştırmadan önce yakalanır; program yarıda kesilmez
+    if program.diagnostics:
+        diag = program.diagnostics[0]
+        print(f"[SIMULATOR] Bayt kodu VM: Sözdizimi Hatası (Satır {diag.line}): {diag.message}", file=sys.stderr)
+        return None
+    unresolved = GumusInterpreter().check(program, path.parent)
+    if unresolved:
+        names = ", ".join(f"{name} (Satır {line})" if line else name for name, line in unresolved[:5])
+        print(f"[SIMULATOR] Bayt kodu VM: Tanımsız isimler: {names}", file=sys.stderr)
+        return None
+
+    def write(line):
+        print(line, flush=True)
+
+    def error(message):
+        print(message, file=sys.stderr, flush=True)
+
+    vm = GumusVM(write, error_callback=error)
+    vm.trace_enabled = trace
+    vm.execution_delay = 0
+    vm.optimize = optimize
+    ok = vm.run_file(path)
+    if optimize and "--debug" in sys.argv:
+        print(f"[SIMULATOR] İyileştirici: {vm.optimization_stats}", file=sys.stderr)
+    return 0 if ok else 1
+
+
+def native_code_key(source):
+    """Kaynak, tercüman ve ayrıştırıcı sürümünden kod nesnesi önbelleği anahtarı"""
+    from src.ide.core.parser import PARSER_VERSION
+    from src.ide.core.transpiler import TRANSPILER_VERSION
+
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"gumus-py:{TRANSPILER_VERSION}:{PARSER_VERSION}\0".encode("ascii"))
+    digest.update(source.encode("utf-8", "surrogatepass"))
+    return digest.hexdigest()
+
+
+def load_native_code(source, filename, cache_dir):
+    """
+    Kaynağın Python'a tercüme edilip derlenmiş kod nesnesini döner. Sonuç .pyc
+    dosyaları gibi cache_dir altında saklanır (başlıkta Python'un sihirli sayısı);
+    değişmeyen programda tarama, ayrıştırma ve kod üretimi tamamen atlanır.
+    Program sözdizimi hatalıysa hata mesajlarının listesi, Python'a aynı
+    anlambilimle çevrilemiyorsa (bkz. NativePythonTranspiler) None döner.
+    """
+    path = Path(cache_dir) / f"{native_code_key(source)}.gpyc"
+    magic = importlib.util.MAGIC_NUMBER
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+        if data[:len(magic)] == magic:
+            return marshal.loads(data[len(magic):])
+    except (OSError, EOFError, ValueError, TypeError):
+        pass  # Kayıt yok, bozuk veya başka Python sürümünden: yeniden derlenir
+
+    from src.ide.core.interpreter import GumusInterpreter
+    from src.ide.core.parse_cache import parse_source
+    from src.ide.core.transpiler import NativePythonTranspiler, NotTranslatable
+
+    program = parse_source(source)
+    if program.diagnostics:
+        return [f"Sözdizimi Hatası (Satır {d.line}): {d.message}" for d in program.diagnostics]
+    # Tanımsız isimler (yalnızca yerel yorumlayıcıda olan yerleşikler) Python'da NameError olurdu
+    if GumusInterpreter().check(program, Path(filename).parent):
+        return None
+    try:
+        python_source = NativePythonTranspiler().transpile(source, program)
+        if python_source.startswith("# HATA"):
+            return None
+        code = compile(python_source, filename, "exec")
+    except (NotTranslatable, SyntaxError):
+        return None  # Python'da geçersiz çıktı da (ör. ifade içinde atama) VM'e bırakılır
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Yarım yazılmış dosya okunmasın diye önce geçici dosyaya yazılır
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(magic + marshal.dumps(code))
+            os.replace(tmp_path, path)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass  # Önbellek isteğe bağlıdır
+    return code
+
+
+def native_namespace(file_path):
+    """NativePythonTranspiler çıktısının çalıştığı ad alanı: yerleşikler ve anlambilim yardımcıları"""
+    from functools import partial
+    from src.ide.core.interpreter import (
+        GumusRuntimeError, TYPE_METHODS, make_builtins, truthy, to_text, type_name, _divide, _modulo,
+    )
+
+    def add(a, b):
+        try:
+            return a + b
+        except TypeError:
+            if a.__class__ is str or b.__class__ is str:
+                return to_text(a) + to_text(b)
+            raise GumusRuntimeError(f"'+' işlemi {type_name(a)} ve {type_name(b)} ile yapılamaz.") from None
+
+    def get(obj, name):
+        handler = TYPE_METHODS.get(obj.__class__, {}).get(name)
+        if handler is not None:
+            return partial(handler, obj)
+        try:
+            return getattr(obj, name)
+        except AttributeError:
+            raise GumusRuntimeError(f"{obj.__class__.__name__} değerinin '{name}' özelliği yok.") from None
+
+    class Object:
+        def __str__(self):
+            return f"<{self.__class__.__name__} nesnesi>"
+
+    namespace = make_builtins()
+    namespace.update({
+        "__name__": "__main__", "__file__": str(file_path),
+        "_G_truthy": truthy, "_G_text": to_text, "_G_div": _divide, "_G_mod": _modulo,
+        "_G_add": add, "_G_get": get, "_G_Object": Object,
+    })
+    return namespace
+
+
+def run_native_python(file_path, cache_dir=None):
+    """
+    --native-python: programı tercüme edilmiş Python kodu olarak çalıştırır.
+    Program Python'a aynı anlambilimle çevrilemiyorsa None döner (VM kullanılır).
+    """
+    from src.ide.core.interpreter import GumusRuntimeError, read_source
+
+    if cache_dir is None:
+        from src.ide.config import TEMP_DIR
+        cache_dir = TEMP_DIR / "pycache"
+    file_path = Path(file_path).resolve()
+    try:
+        source = read_source(file_path)
+    except OSError as e:
+        print(f"Dosya okuma hatası: {e}", file=sys.stderr)
+        return 1
+
+    code = load_native_code(source, str(file_path), cache_dir)
+    if code is None:
+        return None
+    if isinstance(code, list):
+        for message in code:
+            print(message, file=sys.stderr)
+        return 1
+
+    try:
+        exec(code, native_namespace(file_path))
+    except GumusRuntimeError as e:
+        sys.stdout.flush()
+        print(f"Çalıştırma Hatası: {e}", file=sys.stderr)
+        return 1
+    except Exception as e:
+        sys.stdout.flush()
+        print(f"Çalıştırma Hatası: {type(e).__name__}: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
 def main():
     """Main entry point"""
     if len(sys.argv) < 2:
-        print("Kullanım: python run_simulator.py <dosya.tr> [--trace] [--debug]", file=sys.stderr)
+        print("Kullanım: python run_simulator.py <dosya.tr> [--trace] [--debug] [--legacy] [--native-python] [--optimize]", file=sys.stderr)
         return 1
     
     file_path = sys.argv[1]
+
+    if "--native-python" in sys.argv:
+        exit_code = run_native_python(file_path)
+        if exit_code is not None:
+            return exit_code
+
+    if "--legacy" not in sys.argv and os.path.exists(file_path):
+        exit_code = run_bytecode(file_path, trace="--trace" in sys.argv,
+                                 optimize="--optimize" in sys.argv)
+        if exit_code is not None:
+            return exit_code
     
     # Create simulator
     simulator = GumusSimulator()
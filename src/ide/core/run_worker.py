@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gümüşdil Çalıştırma İşçisi
+WorkerPool (worker_pool.py) tarafından önceden başlatılır. Tokenizer, parser,
+VM ve yorumlayıcı modüllerini yükleyip stdin'den iş satırı bekler; her iş
+run_simulator.main() ile komut satırından çalıştırılmış gibi yürütülür.
+
+Kullanım: python run_worker.py <jeton> [çalıştırma sayısı]
+"""
+
+import json
+import sys
+import traceback
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# Çalıştırmadan önce yüklenen modüller (run_simulator bunları ilk çalıştırmada içe aktarır)
+from src.ide.core import run_simulator
+from src.ide.core import interpreter, parse_cache, parser, tokenizer, vm  # noqa: F401
+from src.ide.core.worker_pool import RUN_END_MARKER
+
+
+def read_job():
+    """Sıradaki iş; önceki programın okumadığı girdi satırları atlanır"""
+    while True:
+        line = sys.stdin.readline()
+        if not line:
+            return None
+        try:
+            job = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(job, dict) and isinstance(job.get("file"), str):
+            return job
+
+
+def run_job(job):
+    sys.argv = [run_simulator.__file__, job["file"]] + [str(flag) for flag in job.get("flags", [])]
+    try:
+        return run_simulator.main()
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        print(e.code, file=sys.stderr)
+        return 1
+    except Exception:
+        traceback.print_exc()
+        return 1
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Kullanım: python run_worker.py <jeton> [çalıştırma sayısı]", file=sys.stderr)
+        return 1
+    marker = f"{RUN_END_MARKER}{sys.argv[1]}:"
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    # İlk çıktı tamponda beklemeden IDE'ye ulaşsın
+    sys.stdout.reconfigure(line_buffering=True)
+    sys.stderr.reconfigure(line_buffering=True)
+
+    for _ in range(runs):
+        job = read_job()
+        if job is None:
+            break
+        code = run_job(job)
+        for stream in (sys.stdout, sys.stderr):
+            stream.write(f"{marker}{code if isinstance(code, int) else 0}\n")
+            stream.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,6 +4,7 @@ Güvenli Subprocess Yöneticisi
 Shell injection saldırılarını önleyen güvenli komut çalıştırma sistemi
 """
 
+import codecs
 import subprocess
 import shlex
 import os
@@ -12,7 +13,15 @@ import re
 import time
 import threading
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple, Union
+from typing import Callable, List, Dict, Optional, Tuple, Union
+
+try:
+    import resource  # Yalnızca POSIX
+except ImportError:
+    resource = None
+
+# Akış okuyucularının tek seferde okuduğu en fazla bayt
+STREAM_CHUNK_SIZE = 64 * 1024
 
 class SecurityError(Exception):
     """Güvenlik ihlali exception'ı"""
@@ -30,6 +39,40 @@ class SecurityLevel:
         """Güvenlik ihlali exception'ı"""
         pass
 
+class OutputRingBuffer:
+    """Son `capacity` baytı tutan sabit boyutlu çıktı tamponu"""
+
+    def __init__(self, capacity: int):
+        self.capacity = max(1, capacity)
+        self.total = 0  # Yazılan toplam bayt
+        self._data = bytearray()
+
+    def write(self, chunk: bytes):
+        self.total += len(chunk)
+        if len(chunk) >= self.capacity:
+            self._data[:] = chunk[-self.capacity:]
+            return
+        self._data += chunk
+        overflow = len(self._data) - self.capacity
+        if overflow > 0:
+            del self._data[:overflow]
+
+    @property
+    def truncated(self) -> bool:
+        return self.total > len(self._data)
+
+    def getvalue(self) -> str:
+        data = bytes(self._data)
+        if self.truncated:
+            # Kesim noktası çok baytlı bir karakterin ortasına düşmüş olabilir
+            start = 0
+            while start < min(len(data), 3) and (data[start] & 0xC0) == 0x80:
+                start += 1
+            data = data[start:]
+        # text=True ile aynı satır sonları
+        return data.decode('utf-8', errors='replace').replace('\r\n', '\n')
+
+
 class SecureSubprocessManager:
     """Güvenli subprocess yöneticisi"""
     
@@ -37,6 +80,9 @@ class SecureSubprocessManager:
         self.security_level = security_level
         self.timeout = 30  # Varsayılan timeout (saniye)
         self.max_output_size = 1024 * 1024  # 1MB maksimum çıktı
+        self.output_quota = 64 * 1024 * 1024  # Aşılınca süreç öldürülür
+        self.memory_limit = None  # RLIMIT_AS (bayt, yalnızca Linux)
+        self.cpu_limit = None     # RLIMIT_CPU (saniye); None ise timeout + 1
         
         # Güvenli komutlar listesi (whitelist)
         self.safe_commands = {
@@ -173,34 +219,54 @@ class SecureSubprocessManager:
     
     def execute_safe(self, command: str, args: Optional[List[str]] = None, 
                     cwd: Optional[str] = None, env: Optional[Dict[str, str]] = None) -> Dict:
-        """Güvenli komut çalıştırma"""
-        
+        """Güvenli komut çalıştırma (çıktı akış halinde, sınırlı bellekle okunur)"""
+        return self.execute_streaming(command, args, cwd, env)
+
+    def execute_streaming(self, command: str, args: Optional[List[str]] = None,
+                          cwd: Optional[str] = None, env: Optional[Dict[str, str]] = None,
+                          on_output: Optional[Callable[[str, bool], None]] = None,
+                          output_quota: Optional[int] = None) -> Dict:
+        """
+        Komutu çalıştırır; çıktı geldikçe okunur, bellek kullanımı sabit kalır.
+
+        Args:
+            command: Çalıştırılacak komut
+            args: Komut argümanları
+            cwd: Çalışma dizini
+            env: Eklenecek (güvenli) ortam değişkenleri
+            on_output: Her çıktı parçası için callback(metin, stderr_mi)
+            output_quota: Toplam çıktı bayt kotası; aşılınca süreç öldürülür
+                (varsayılan self.output_quota)
+
+        Returns:
+            execute_safe ile aynı sözlük; stdout/stderr her akışın son
+            max_output_size baytıdır. 'output_bytes' toplam çıktı miktarı,
+            'truncated' çıktının kesilip kesilmediğidir.
+        """
         start_time = time.time()
         
-        # Komut doğrulama
-        is_valid, validation_error = self.validate_command(command)
-        if not is_valid:
+        def failure(error, execution_time=0):
             return {
                 'success': False,
-                'error': f"Güvenlik hatası: {validation_error}",
+                'error': error,
                 'stdout': '',
                 'stderr': '',
                 'returncode': -1,
-                'execution_time': 0
+                'execution_time': execution_time,
+                'output_bytes': 0,
+                'truncated': False
             }
         
+        # Komut doğrulama
+        is_valid, validation_error = self.validate_command(command)
+        if not is_valid:
+            return failure(f"Güvenlik hatası: {validation_error}")
+        
         # Çalışma dizini doğrulama
         if cwd:
             is_valid_cwd, cwd_error = self.validate_working_directory(cwd)
             if not is_valid_cwd:
-                return {
-                    'success': False,
-                    'error': f"Dizin hatası: {cwd_error}",
-                    'stdout': '',
-                    'stderr': '',
-                    'returncode': -1,
-                    'execution_time': 0
-                }
+                return failure(f"Dizin hatası: {cwd_error}")
         
         # Argümanları temizle
         if args:
@@ -212,6 +278,8 @@ class SecureSubprocessManager:
         else:
             cmd_list = shlex.split(command)
         
+        quota = self.output_quota if output_quota is None else output_quota
+        
         try:
             # Güvenli environment oluştur
             safe_env = os.environ.copy()
@@ -222,7 +290,7 @@ class SecureSubprocessManager:
                     if key in safe_env_keys and isinstance(value, str):
                         safe_env[key] = value
             
-            # Subprocess çalıştır
+            # Subprocess çalıştır (bayt modunda; metin okuyucularda çözülür)
             process = subprocess.Popen(
                 cmd_list,
                 stdout=subprocess.PIPE,
@@ -230,63 +298,113 @@ class SecureSubprocessManager:
                 stdin=subprocess.DEVNULL,  # stdin'i kapat
                 cwd=cwd,
                 env=safe_env,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
+                preexec_fn=self._resource_limiter(),
                 creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
             )
-            
-            # Timeout ile bekle
-            try:
-                stdout, stderr = process.communicate(timeout=self.timeout)
-            except subprocess.TimeoutExpired:
-                process.kill()
-                process.wait()
-                return {
-                    'success': False,
-                    'error': f"Komut timeout ({self.timeout}s) aşıldı",
-                    'stdout': '',
-                    'stderr': '',
-                    'returncode': -1,
-                    'execution_time': time.time() - start_time
-                }
-            
-            # Çıktı boyutu kontrolü
-            if len(stdout) > self.max_output_size:
-                stdout = stdout[:self.max_output_size] + "\n[ÇIKTI KESİLDİ - BOYUT LİMİTİ]"
-            
-            if len(stderr) > self.max_output_size:
-                stderr = stderr[:self.max_output_size] + "\n[HATA ÇIKTISI KESİLDİ - BOYUT LİMİTİ]"
-            
-            execution_time = time.time() - start_time
-            
-            return {
-                'success': process.returncode == 0,
-                'error': '' if process.returncode == 0 else f"Komut hata kodu: {process.returncode}",
-                'stdout': stdout,
-                'stderr': stderr,
-                'returncode': process.returncode,
-                'execution_time': execution_time
-            }
-            
         except FileNotFoundError:
-            return {
-                'success': False,
-                'error': f"Komut bulunamadı: {command}",
-                'stdout': '',
-                'stderr': '',
-                'returncode': -1,
-                'execution_time': time.time() - start_time
-            }
+            return failure(f"Komut bulunamadı: {command}", time.time() - start_time)
         except Exception as e:
-            return {
-                'success': False,
-                'error': f"Beklenmeyen hata: {str(e)}",
-                'stdout': '',
-                'stderr': '',
-                'returncode': -1,
-                'execution_time': time.time() - start_time
-            }
+            return failure(f"Beklenmeyen hata: {str(e)}", time.time() - start_time)
+        
+        buffers = (OutputRingBuffer(self.max_output_size), OutputRingBuffer(self.max_output_size))
+        state = {'total': 0, 'quota_exceeded': False}
+        lock = threading.Lock()
+        
+        def read_stream(stream, buffer, is_error):
+            decoder = codecs.getincrementaldecoder('utf-8')('replace')
+            try:
+                while True:
+                    chunk = stream.read1(STREAM_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    buffer.write(chunk)
+                    with lock:
+                        state['total'] += len(chunk)
+                        exceeded = quota is not None and state['total'] > quota
+                        if exceeded and not state['quota_exceeded']:
+                            state['quota_exceeded'] = True
+                            process.kill()
+                    if on_output is not None:
+                        text = decoder.decode(chunk)
+                        if text:
+                            on_output(text, is_error)
+                    if exceeded:
+                        break
+                if on_output is not None:
+                    text = decoder.decode(b'', final=True)  # Yarım kalan çok baytlı karakter
+                    if text:
+                        on_output(text, is_error)
+            except (OSError, ValueError):
+                pass
+            finally:
+                stream.close()
+        
+        readers = [
+            threading.Thread(target=read_stream, args=(process.stdout, buffers[0], False), daemon=True),
+            threading.Thread(target=read_stream, args=(process.stderr, buffers[1], True), daemon=True),
+        ]
+        for reader in readers:
+            reader.start()
+        
+        # Timeout ile bekle
+        timed_out = False
+        try:
+            process.wait(timeout=self.timeout)
+        except subprocess.TimeoutExpired:
+            timed_out = True
+            process.kill()
+            process.wait()
+        for reader in readers:
+            # Torun süreçler boruyu açık tutabilir; sonsuza kadar beklenmez
+            reader.join(timeout=5)
+        
+        stdout = buffers[0].getvalue()
+        stderr = buffers[1].getvalue()
+        if buffers[0].truncated:
+            stdout = "[ÇIKTI KESİLDİ - BOYUT LİMİTİ]\n" + stdout
+        if buffers[1].truncated:
+            stderr = "[HATA ÇIKTISI KESİLDİ - BOYUT LİMİTİ]\n" + stderr
+        
+        if timed_out:
+            error = f"Komut timeout ({self.timeout}s) aşıldı"
+        elif state['quota_exceeded']:
+            error = f"Çıktı kotası ({quota} bayt) aşıldı, süreç durduruldu"
+        elif process.returncode != 0:
+            error = f"Komut hata kodu: {process.returncode}"
+        else:
+            error = ''
+        
+        return {
+            'success': not error,
+            'error': error,
+            'stdout': stdout,
+            'stderr': stderr,
+            'returncode': -1 if timed_out else process.returncode,
+            'execution_time': time.time() - start_time,
+            'output_bytes': state['total'],
+            'truncated': buffers[0].truncated or buffers[1].truncated
+        }
+    
+    def _resource_limiter(self) -> Optional[Callable[[], None]]:
+        """Linux'ta alt süreçte RLIMIT_AS/RLIMIT_CPU uygulayan preexec_fn"""
+        if resource is None or not sys.platform.startswith('linux'):
+            return None
+        cpu_limit = self.cpu_limit if self.cpu_limit is not None else self.timeout + 1
+        # fork sonrası alt süreçte import yapılmaz; yalnızca getrlimit/setrlimit çağrılır
+        limits = [(limit, value, grace) for limit, value, grace in
+                  ((resource.RLIMIT_AS, self.memory_limit, 0), (resource.RLIMIT_CPU, cpu_limit, 1))
+                  if value is not None]
+        getrlimit, setrlimit, infinity = resource.getrlimit, resource.setrlimit, resource.RLIM_INFINITY
+        
+        def apply_limits():
+            for limit, value, grace in limits:
+                _, hard = getrlimit(limit)
+                if hard != infinity:
+                    value = min(value, hard)
+                    grace = min(grace, hard - value)
+                setrlimit(limit, (value, value + grace))
+        
+        return apply_limits
     
     def add_safe_command(self, command: str):
         """Güvenli komutlar listesine ekle"""
@@ -311,8 +429,19 @@ class SecureSubprocessManager:
     def set_max_output_size(self, size: int):
         """Maksimum çıktı boyutunu ayarla"""
         self.max_output_size = max(1024, min(size, 10 * 1024 * 1024))  # 1KB - 10MB arası
+
+    def set_output_quota(self, size: Optional[int]):
+        """Süreç öldürülmeden önce üretilebilecek toplam çıktı (None: sınırsız)"""
+        self.output_quota = None if size is None else max(self.max_output_size, size)
+
+    def set_resource_limits(self, memory_mb: Optional[int] = None, cpu_seconds: Optional[int] = None):
+        """Linux'ta alt süreçlere uygulanacak bellek (RLIMIT_AS) ve CPU (RLIMIT_CPU) sınırları"""
+        self.memory_limit = None if memory_mb is None else max(16, memory_mb) * 1024 * 1024
+        self.cpu_limit = None if cpu_seconds is None else max(1, cpu_seconds)
+
     def execute_interactive(self, command: str, args: Optional[List[str]] = None,
-                          cwd: Optional[str] = None) -> subprocess.Popen:
+                          cwd: Optional[str] = None, text: bool = True,
+                          limit_resources: bool = False) -> subprocess.Popen:
         """
         İnteraktif process başlatır ve güvenli Popen nesnesi döner
 
@@ -320,6 +449,9 @@ class SecureSubprocessManager:
             command: Çalıştırılacak komut
             args: Komut argümanları
             cwd: Çalışma dizini
+            text: False ise akışlar bayt modunda açılır (ör. Content-Length çerçeveli protokoller)
+            limit_resources: True ise set_resource_limits sınırları (Linux) uygulanır;
+                uzun yaşayan yardımcı süreçler (ör. LSP) CPU sınırına takılmasın diye varsayılan kapalı
 
         Returns:
             subprocess.Popen: Güvenli process nesnesi
@@ -353,17 +485,17 @@ class SecureSubprocessManager:
 
         try:
             # Create secure Popen process
+            encoding = {'text': True, 'encoding': 'utf-8', 'errors': 'replace'} if text else {}
             process = subprocess.Popen(
                 cmd_list,
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
                 bufsize=0,  # Unbuffered for interactive use
+                preexec_fn=self._resource_limiter() if limit_resources else None,
                 creationflags=creationflags,
-                cwd=cwd
+                cwd=cwd,
+                **encoding
             )
 
             return process
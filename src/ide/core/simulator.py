@@ -3,11 +3,47 @@ import os
 import time
 import math
 import random
+from functools import lru_cache
+
+# Derlenmiş ifade önbelleğinin kapasitesi (en az kullanılan önce atılır)
+EXPRESSION_CACHE_SIZE = 512
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def compile_expression(expr):
+    """
+    İfade metnini Türkçe operatörleri çevirip bir kez derler.
+    Dönüş: (çevrilmiş metin, kod nesnesi); derlenemeyen ifadede kod None olur.
+    """
+    # Türkçe operatör dönüşümleri (Basit)
+    expr = expr.replace(' ve ', ' and ').replace(' veya ', ' or ').replace(' değil ', ' not ')
+    try:
+        return expr, compile(expr, "<ifade>", "eval")
+    except (SyntaxError, ValueError):
+        return expr, None
+
 
 class GumusSimulator:
     def __init__(self, output_callback=None):
         self.variables = {}
         self.functions = {}
+        # eval'ın kalıcı genel ad alanı: yerleşikler ve kullanıcı fonksiyonları bir
+        # kez eklenir; kullanıcı değişkenleri yerel ad alanı olarak doğrudan
+        # self.variables'tan okunur (her ifadede kopyalanmaz)
+        self.namespace = {
+            "__builtins__": None,
+            "input": input,
+            # Native fonksiyonlar
+            'metin': str,
+            'sayı': float,  # float daha mantıklı genel sayılar için
+            'karekök': math.sqrt,
+            'rastgele': random.random,
+            'zaman': time.time,
+            'girdi': input,
+            # Türkçe anahtar kelimeler
+            'doğru': True,
+            'yanlış': False,
+        }
         self.output_callback = output_callback if output_callback else print
         self.running = True
         self.trace_enabled = False # Görsel hata ayıklama için izleme (IDE tarafından açılır)
@@ -270,6 +306,7 @@ class GumusSimulator:
                         'params': params,
                         'body': '\n'.join(body_lines)
                     }
+                    self.namespace[func_name] = self._function_wrapper(func_name)
                     continue
             i += 1
 
@@ -440,41 +477,19 @@ class GumusSimulator:
         # Karmaşık ifade
         return self.evaluate_expression(expr)
 
-    def evaluate_expression(self, expr):
-        safe_dict = {}
-        
-        # Native fonksiyonlar
-        safe_dict['metin'] = str
-        safe_dict['sayı'] = float # float daha mantıklı genel sayılar için
-        safe_dict['karekök'] = math.sqrt
-        safe_dict['rastgele'] = random.random
-        safe_dict['zaman'] = time.time
-        safe_dict['girdi'] = input
-        
-        # Türkçe anahtar kelimeler
-        safe_dict['doğru'] = True
-        safe_dict['yanlış'] = False
-        
-        # Kullanıcı değişkenleri built-in'leri ezebilir (örneğin kullanıcı 'sayı' diye değişken tanımlarsa)
-        safe_dict.update(self.variables)
-        
-        # Kullanıcı tanımlı fonksiyonları ekle
-        def make_func_wrapper(fn_name):
-            def wrapper(*args):
-                return self.call_function(fn_name, list(args))
-            return wrapper
-        
-        for func_name in self.functions:
-            safe_dict[func_name] = make_func_wrapper(func_name)
-        
-        try:
-            # Türkçe operatör dönüşümleri (Basit)
-            expr = expr.replace(' ve ', ' and ').replace(' veya ', ' or ').replace(' değil ', ' not ')
-            
-            result = eval(expr, {"__builtins__": None, "input": input}, safe_dict)
-            return result
-        except Exception as e:
-            if expr.startswith('"') and expr.endswith('"'):
-                return expr.strip('"')
-            return f"<{expr}>"
+    def _function_wrapper(self, fn_name):
+        def wrapper(*args):
+            return self.call_function(fn_name, list(args))
+        return wrapper
 
+    def evaluate_expression(self, expr):
+        expr, code = compile_expression(expr)
+        if code is not None:
+            try:
+                # Kullanıcı değişkenleri built-in'leri ezebilir (örneğin kullanıcı 'sayı' diye değişken tanımlarsa)
+                return eval(code, self.namespace, self.variables)
+            except Exception:
+                pass
+        if expr.startswith('"') and expr.endswith('"'):
+            return expr.strip('"')
+        return f"<{expr}>"
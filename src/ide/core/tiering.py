@@ -0,0 +1,358 @@
+# -*- coding: utf-8 -*-
+"""
+GümüşDil Kademeli Çalıştırma (Tiering)
+Kapanış yorumlayıcısı her FunctionStmt için çağrıları ve döngü turlarını
+(geri dönüş kenarlarını) sayar. Sayaç HOT_THRESHOLD'u aşınca fonksiyon
+GumusToPythonTranspiler tabanlı TierTranspiler ile gerçek bir Python
+fonksiyonuna çevrilir ve sonraki çağrılar doğrudan onu çalıştırır.
+
+Yalnızca yan etkisiz (saf) fonksiyonlar yükseltilir: kendi yerelleri ve
+parametreleri üzerinde hesap yapan, genel değişkenleri yalnızca okuyan, çıktı
+üretmeyen ve yalnızca saf yerleşikleri veya yine yükseltilebilir fonksiyonları
+çağıran gövdeler. Böylece üretilen kod beklenmedik bir Python istisnası verirse
+(ör. "a" + 1 metin birleştirmesi, sıfıra bölme) çağrı yorumlayıcıda baştan
+çalıştırılarak tam GümüşDil anlambilimi ve satırlı hata mesajı elde edilir;
+fonksiyon da kalıcı olarak yorumlayıcıya geri döner.
+
+Yükseltme çağrı sınırında yapılır: çalışmakta olan bir çağrı yarıda Python
+koduna taşınmaz (OSR yok), döngü turları bir sonraki çağrıyı hızlandırır.
+"""
+from .ast_nodes import BlockStmt, BinaryExpr, UnaryExpr, LogicalExpr, Literal, Variable, AssignExpr
+from .tokenizer import decode_escapes
+from .transpiler import GumusToPythonTranspiler
+
+# Çağrı + döngü turu sayısı; aşıldığında fonksiyon Python'a yükseltilir
+HOT_THRESHOLD = 1000
+
+# Yan etkisi olmayan, aynı argümanla tekrar çağrılabilen yerleşikler
+PURE_BUILTINS = frozenset((
+    'metin', 'sayı', 'sayi', 'sayiYap', 'tamsayı', 'tamsayi', 'karekök', 'karekok', 'uzunluk', 'dilim',
+    'sozluk_al', 'sözlük_al', 'anahtar_var',
+))
+
+_COMPARISONS = frozenset(('==', '!=', '<', '<=', '>', '>='))
+_INLINE_OPERATORS = frozenset(('+', '-', '*')) | _COMPARISONS
+_HELPERS = ('_T_g', '_T_i', '_T_Halt', '_T_truthy', '_T_div', '_T_mod')
+
+
+class NotPromotable(Exception):
+    """Fonksiyon gövdesi Python'a birebir anlambilimle çevrilemiyor"""
+
+
+class NotReady(Exception):
+    """Çağrılan bir fonksiyon henüz yükseltilmedi; daha sonra tekrar denenir"""
+
+
+class TierTranspiler(GumusToPythonTranspiler):
+    """
+    Tek bir saf fonksiyonu GümüşDil anlambilimini koruyan Python koduna çevirir.
+    Üst sınıfın girinti/emit altyapısı kullanılır; ifadeler Python'da başarılı
+    olduklarında yorumlayıcıyla aynı sonucu verecek biçimde üretilir (bölme ve
+    mod yardımcılarla, koşullar GümüşDil doğruluğuyla). Çevrilemeyen yapıda
+    NotPromotable yükseltilir.
+
+    `global_values` verilmezse (derleme anındaki ön denetim) çağrılan genel
+    isimlerin saflığı denetlenmez; yükseltme anında gerçek değerlerle denetlenir:
+    çağrılan kullanıcı fonksiyonu ya bu fonksiyonun kendisi (özyineleme) ya da
+    daha önce yükseltilmiş (saflığı denetlenmiş) bir fonksiyon olmalıdır.
+    """
+
+    def __init__(self, resolution, global_values=None, builtin_values=None, function_type=None, hotspot=None):
+        super().__init__()
+        self.resolution = resolution
+        self.global_values = global_values
+        self.builtin_values = builtin_values or {}
+        self.function_type = function_type
+        self.hotspot = hotspot
+        self.bound = {}      # Yerleşik adı -> kapanış değişkeni (_T_b0, ...)
+        self._scopes = []    # Çalışma zamanı çerçeve zinciri (en içteki sonda)
+        self._names = {}     # (id(Scope), yuva) -> Python yerel adı
+        self._temps = 0
+
+    def generic_visit(self, node):
+        raise NotPromotable(type(node).__name__)
+
+    # Üst sınıfın çevirdiği ama yan etkili veya kapanış gerektiren yapılar
+    visit_FunctionStmt = visit_ClassStmt = visit_PrintStmt = visit_IncludeStmt = generic_visit
+    visit_TryStmt = visit_GetExpr = visit_SetExpr = visit_IndexSetExpr = generic_visit
+    visit_ThisExpr = visit_SuperExpr = visit_NewExpr = generic_visit
+
+    def function(self, node):
+        """FunctionStmt'yi `def` olarak üretir; (kaynak, fonksiyon adı) döner"""
+        self.output_lines = []
+        self.indent_level = 1
+        scope = self.resolution.scopes[node]
+        self._scopes.append(scope)
+        params = [self._local(scope, slot) for slot in range(1, len(node.params) + 1)]
+        name = node.name.value if node.name.value.isidentifier() else "fonksiyon"
+        self.emit(f"def {name}({', '.join(params)}):")
+        self.indent_level += 1
+        self.statements(node.body.statements)
+        self.emit("return None")
+        self.indent_level -= 1
+        self._scopes.pop()
+        helpers = list(_HELPERS) + list(self.bound.values())
+        header = f"def _T_make({', '.join(helpers)}):"
+        return "\n".join([header] + self.output_lines + [f"    return {name}"]), name
+
+    # --- Kapsamlar ---
+
+    def _local(self, scope, slot):
+        key = (id(scope), slot)
+        name = self._names.get(key)
+        if name is None:
+            source = next(n for n, s in scope.names.items() if s == slot)
+            base = source if source.isidentifier() else "v"
+            name = self._names[key] = f"{base}_{len(self._names)}"
+        return name
+
+    def _location(self, node):
+        """Yerel başvurunun Python adı; genel başvuru için None"""
+        location = self.resolution.locals.get(node)
+        if location is None:
+            return None
+        depth, slot, crossed = location
+        if crossed or depth >= len(self._scopes):
+            raise NotPromotable("kapanış değişkeni")
+        return self._local(self._scopes[-1 - depth], slot)
+
+    def statements(self, nodes, scope=None):
+        if scope is not None:
+            self._scopes.append(scope)
+        for node in nodes:
+            self.visit(node)
+        if not nodes:
+            self.emit("pass")
+        if scope is not None:
+            self._scopes.pop()
+
+    def _body(self, node):
+        if node.kind == BlockStmt.kind:
+            self.statements(node.statements, self.resolution.scopes.get(node))
+        else:
+            self.statements([node])
+
+    # --- Deyimler ---
+
+    def visit_BlockStmt(self, node):
+        self._body(node)
+
+    def visit_VarStmt(self, node):
+        slot = self.resolution.slots[node]
+        if slot is None:
+            raise NotPromotable("genel bildirim")
+        value = self.visit(node.initializer) if node.initializer is not None else "None"
+        self.emit(f"{self._local(self._scopes[-1], slot)} = {value}")
+
+    def visit_ExprStmt(self, node):
+        expression = node.expression
+        if expression.kind == AssignExpr.kind:
+            self.emit(f"{self._assign_target(expression)} = {self.visit(expression.value)}")
+        else:
+            self.emit(self.visit(expression))
+
+    def visit_IfStmt(self, node):
+        self.emit(f"if {self.condition(node.condition)}:")
+        self.indent_level += 1
+        self._body(node.then_branch)
+        self.indent_level -= 1
+        if node.else_branch is not None:
+            self.emit("else:")
+            self.indent_level += 1
+            self._body(node.else_branch)
+            self.indent_level -= 1
+
+    def _loop(self, condition, body, increment):
+        self.emit(f"while {condition}:")
+        self.indent_level += 1
+        self.emit("if not _T_i.running: raise _T_Halt()")
+        self._loops.append(increment)
+        self._body(body)
+        self._loops.pop()
+        if increment is not None:
+            self.emit(increment)
+        self.indent_level -= 1
+
+    def visit_WhileStmt(self, node):
+        self._loop(self.condition(node.condition), node.body, None)
+
+    def visit_ForStmt(self, node):
+        scope = self.resolution.scopes.get(node)
+        if scope is not None:
+            self._scopes.append(scope)
+        if node.initializer is not None:
+            self.visit(node.initializer)
+        condition = self.condition(node.condition) if node.condition is not None else "True"
+        increment = None
+        if node.increment is not None:
+            increment = self._expression_statement(node.increment)
+        self._loop(condition, node.body, increment)
+        if scope is not None:
+            self._scopes.pop()
+
+    def _expression_statement(self, node):
+        if node.kind == AssignExpr.kind:
+            return f"{self._assign_target(node)} = {self.visit(node.value)}"
+        return self.visit(node)
+
+    def visit_ReturnStmt(self, node):
+        self.emit(f"return {self.visit(node.value)}" if node.value is not None else "return None")
+
+    def visit_BreakStmt(self, node):
+        self.emit("break")
+
+    # --- İfadeler ---
+
+    def condition(self, node):
+        value = self.visit(node)
+        return value if self._is_boolean(node) else f"_T_truthy({value})"
+
+    def _is_boolean(self, node):
+        kind = node.kind
+        if kind == BinaryExpr.kind:
+            return node.operator.value in _COMPARISONS
+        if kind == UnaryExpr.kind:
+            return node.operator.value == '!'
+        if kind == LogicalExpr.kind:
+            return self._is_boolean(node.left) and self._is_boolean(node.right)
+        return kind == Literal.kind and node.value.__class__ is bool
+
+    def visit_Literal(self, node):
+        value = node.value
+        return repr(decode_escapes(value) if value.__class__ is str else value)
+
+    def visit_Variable(self, node):
+        local = self._location(node)
+        if local is not None:
+            return local
+        return self._global(node.name.value)
+
+    def _global(self, name):
+        if self.global_values is not None and name not in self.global_values and name in self.builtin_values:
+            bound = self.bound.get(name)
+            if bound is None:
+                bound = self.bound[name] = f"_T_b{len(self.bound)}"
+            return bound
+        return f"_T_g[{name!r}]"
+
+    def _assign_target(self, node):
+        local = self._location(node)
+        if local is None:
+            raise NotPromotable("genel değişkene atama")
+        return local
+
+    def visit_AssignExpr(self, node):
+        return f"({self._assign_target(node)} := {self.visit(node.value)})"
+
+    def visit_UnaryExpr(self, node):
+        right = self.visit(node.right)
+        if node.operator.value == '!':
+            return f"(not _T_truthy({right}))"
+        return f"(-{right})"
+
+    def visit_BinaryExpr(self, node):
+        left, right = self.visit(node.left), self.visit(node.right)
+        symbol = node.operator.value
+        if symbol == '/':
+            return f"_T_div({left}, {right})"
+        if symbol == '%':
+            return f"_T_mod({left}, {right})"
+        if symbol not in _INLINE_OPERATORS:
+            raise NotPromotable(symbol)
+        return f"({left} {symbol} {right})"
+
+    def visit_LogicalExpr(self, node):
+        left, right = self.visit(node.left), self.visit(node.right)
+        keyword = "or" if node.operator.value == 'veya' else "and"
+        if self._is_boolean(node.left) and self._is_boolean(node.right):
+            return f"({left} {keyword} {right})"
+        # ve/veya işlenen değerini döner; sol taraf bir kez hesaplanır
+        temp = f"_T_t{self._temps}"
+        self._temps += 1
+        if keyword == "or":
+            return f"({temp} if _T_truthy(({temp} := {left})) else {right})"
+        return f"({right} if _T_truthy(({temp} := {left})) else {temp})"
+
+    def visit_CallExpr(self, node):
+        callee = node.callee
+        if callee.kind != Variable.kind or self._location(callee) is not None:
+            raise NotPromotable("dolaylı çağrı")
+        name = callee.name.value
+        if self.global_values is not None:
+            value = self.global_values.get(name)
+            if value is None:
+                if name not in PURE_BUILTINS:
+                    raise NotPromotable(f"saf olmayan çağrı: {name}")
+            elif value.__class__ is not self.function_type or value.tier is None:
+                raise NotPromotable(f"saf olmayan çağrı: {name}")
+            elif value.tier is not self.hotspot and value.tier.code is None:
+                if value.tier.failed:
+                    raise NotPromotable(f"yorumlanan çağrı: {name}")
+                raise NotReady(name)
+        elif name in self.builtin_values and name not in PURE_BUILTINS:
+            raise NotPromotable(f"saf olmayan çağrı: {name}")
+        args = ", ".join(self.visit(arg) for arg in node.args)
+        return f"{self._global(name)}({args})"
+
+    def visit_IndexExpr(self, node):
+        return f"{self.visit(node.object)}[{self.visit(node.index)}]"
+
+    def visit_ListExpr(self, node):
+        return f"[{', '.join(self.visit(e) for e in node.elements)}]"
+
+    def visit_DictExpr(self, node):
+        pairs = [f"{self.visit(k)}: {self.visit(v)}" for k, v in zip(node.keys, node.values)]
+        return f"{{{', '.join(pairs)}}}"
+
+
+def promotable(node, resolution, builtin_values):
+    """Derleme anı ön denetimi: gövde yapısal olarak Python'a çevrilebilir mi"""
+    try:
+        TierTranspiler(resolution, builtin_values=builtin_values).function(node)
+    except NotPromotable:
+        return False
+    return True
+
+
+class HotSpot:
+    """
+    Bir FunctionStmt'nin sıcaklık sayacı ve (yükseltildiyse) Python karşılığı.
+    Aynı düğümden oluşturulan bütün GumusFunction değerleri bunu paylaşır.
+    """
+    __slots__ = ('node', 'resolution', 'runtime', 'count', 'code', 'failed', 'source')
+
+    def __init__(self, node, resolution, runtime):
+        self.node = node
+        self.resolution = resolution
+        self.runtime = runtime  # GumusInterpreter'ın sağladığı yardımcılar (bkz. ClosureCompiler)
+        self.count = 0
+        self.code = None        # Yükseltilmiş Python fonksiyonu
+        self.failed = False     # Yükseltilemedi veya geri düşürüldü: bir daha denenmez
+        self.source = None      # Üretilen Python kaynağı (hata ayıklama için)
+
+    def promote(self):
+        """Fonksiyonu Python'a çevirir; başarılıysa Python fonksiyonunu döner"""
+        runtime = self.runtime
+        try:
+            transpiler = TierTranspiler(self.resolution, runtime['globals'], runtime['builtins'],
+                                        runtime['function_type'], self)
+            source, _ = transpiler.function(self.node)
+            namespace = {}
+            exec(compile(source, f"<gümüş:{self.node.name.value}>", "exec"), namespace)
+        except NotReady:
+            self.count = 0  # Çağrılan fonksiyonlar ısınınca yeniden denenir
+            return None
+        except (NotPromotable, SyntaxError, RecursionError, MemoryError):
+            self.failed = True
+            return None
+        builtins = runtime['builtins']
+        self.source = source
+        self.code = namespace['_T_make'](
+            runtime['globals'], runtime['interpreter'], runtime['halt'], runtime['truthy'],
+            runtime['divide'], runtime['modulo'], *(builtins[n] for n in transpiler.bound))
+        return self.code
+
+    def demote(self):
+        """Üretilen kod GümüşDil'den farklı davrandı: fonksiyon yorumlayıcıda kalır"""
+        self.code = None
+        self.failed = True
@@ -0,0 +1,323 @@
+# -*- coding: utf-8 -*-
+"""
+Sıkıştırılmış ve Akış Halinde Token Depoları
+Büyük kaynaklarda token başına bir Python nesnesi yerine yapı-dizileri
+(struct-of-arrays) düzeni kullanır: tür kodları, ofsetler, uzunluklar ve
+satırlar `array` tamponlarında, değerler ise tekilleştirilmiş bir havuzda
+tutulur. Token nesneleri yalnızca istendiğinde hafif görünümler olarak üretilir.
+
+Çok büyük dosyalar için stream_tokens() kaynağı parça parça okuyup token'ları
+tembel üretir; StreamingTokenBuffer bunları GumusParser'a sınırlı bellekle sunar.
+"""
+import codecs
+import mmap
+import os
+from array import array
+from bisect import bisect_right
+
+from .tokenizer import (
+    GumusTokenizer, Token, TokenType, TOKEN_KINDS, KIND_CODES,
+    _MASTER_PATTERN, _OPERATORS, _MULTI_WORD_KEYS,
+    _K_NEWLINE, _K_SKIP, _K_STRING, _K_NUMBER, _K_IDENT, _K_OP, _K_OTHER,
+)
+
+
+class TokenView:
+    """CompactTokenStream içindeki bir token'a Token arayüzüyle erişim sağlar"""
+    __slots__ = ('_stream', '_index')
+
+    def __init__(self, stream, index):
+        self._stream = stream
+        self._index = index
+
+    @property
+    def type(self):
+        return TOKEN_KINDS[self._stream.kinds[self._index]]
+
+    @property
+    def value(self):
+        stream = self._stream
+        return stream.values[stream.value_ids[self._index]]
+
+    @property
+    def line(self):
+        return self._stream.lines[self._index]
+
+    @property
+    def offset(self):
+        return self._stream.offsets[self._index]
+
+    @property
+    def length(self):
+        return self._stream.lengths[self._index]
+
+    @property
+    def col(self):
+        stream = self._stream
+        offset = stream.offsets[self._index]
+        line_starts = stream.line_starts
+        return offset - line_starts[bisect_right(line_starts, offset) - 1] + 1
+
+    @property
+    def end_col(self):
+        stream = self._stream
+        end = stream.offsets[self._index] + stream.lengths[self._index]
+        return end - stream.line_starts[stream.lines[self._index] - 1] + 1
+
+    def __repr__(self):
+        return f"Token({self.type}, '{self.value}', line={self.line})"
+
+
+class CompactTokenStream:
+    """Dizi tabanlı token akışı; GumusParser doğrudan bunun üzerinde çalışabilir"""
+
+    def __init__(self, source=""):
+        self.source = source
+        self.kinds = array('B')       # TOKEN_KINDS indeksi
+        self.offsets = array('I')     # Kaynaktaki başlangıç ofseti
+        self.lengths = array('I')     # Kaynaktaki uzunluk
+        self.lines = array('I')       # Token satırı (Token.line ile aynı anlam)
+        self.value_ids = array('I')   # `values` havuzundaki indeks
+        self.values = []              # Tekil değer havuzu (isimler bir kez saklanır)
+        self._value_index = {}
+        self.line_starts = array('I', [0])
+
+    @classmethod
+    def from_source(cls, source, keywords=None):
+        """Kaynağı Token nesnesi oluşturmadan doğrudan dizilere tarar"""
+        if keywords is None:
+            keywords = GumusTokenizer("").keywords
+
+        stream = cls(source)
+        kinds, offsets, lengths, lines, value_ids = (
+            stream.kinds, stream.offsets, stream.lengths, stream.lines, stream.value_ids)
+        line_starts = stream.line_starts
+        intern_value = stream._intern
+        codes = KIND_CODES
+        ident_code = codes[TokenType.IDENTIFIER]
+        operators = _OPERATORS
+        line = 1
+
+        for m in _MASTER_PATTERN.finditer(source):
+            kind = m.lastindex
+            if kind == _K_SKIP or kind == _K_OTHER:
+                continue
+            if kind == _K_NEWLINE:
+                line += 1
+                line_starts.append(m.end())
+                continue
+
+            text = m.group(kind)
+            start = m.start()
+
+            if kind == _K_IDENT:
+                code = codes.get(keywords.get(text), ident_code)
+                value = text
+            elif kind == _K_OP:
+                code = codes[operators[text]]
+                value = text
+            elif kind == _K_NUMBER:
+                code = codes[TokenType.NUMBER]
+                value = float(text)
+                if value.is_integer():
+                    value = int(value)
+            elif kind == _K_STRING:
+                nl = text.find('\n')
+                while nl != -1:
+                    line += 1
+                    line_starts.append(start + nl + 1)
+                    nl = text.find('\n', nl + 1)
+                if len(text) < 2 or text[-1] != '"':
+                    continue
+                code = codes[TokenType.STRING]
+                value = text[1:-1]
+            else:  # _K_MULTI
+                code = codes.get(keywords.get(_MULTI_WORD_KEYS[text]), ident_code)
+                value = text
+
+            kinds.append(code)
+            offsets.append(start)
+            lengths.append(len(text))
+            lines.append(line)
+            value_ids.append(intern_value(value))
+
+        stream.append(TokenType.EOF, "", len(source), 0, line)
+        return stream
+
+    def _intern(self, value):
+        # 1 ile 1.0 aynı anahtar sayılmasın diye türü de anahtara katılır
+        key = (value.__class__, value)
+        index = self._value_index.get(key)
+        if index is None:
+            index = self._value_index[key] = len(self.values)
+            self.values.append(value)
+        return index
+
+    def append(self, type, value, offset, length, line):
+        self.kinds.append(KIND_CODES[type])
+        self.offsets.append(offset)
+        self.lengths.append(length)
+        self.lines.append(line)
+        self.value_ids.append(self._intern(value))
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self.kinds)
+        if not 0 <= index < len(self.kinds):
+            raise IndexError("token indeksi aralık dışında")
+        return TokenView(self, index)
+
+    def __iter__(self):
+        for index in range(len(self.kinds)):
+            yield TokenView(self, index)
+
+    def type_at(self, index):
+        return TOKEN_KINDS[self.kinds[index]]
+
+    def memory_bytes(self):
+        """Dizilerin ve değer havuzunun kapladığı yaklaşık bellek (bayt)"""
+        import sys
+        total = sum(buf.buffer_info()[1] * buf.itemsize for buf in (
+            self.kinds, self.offsets, self.lengths, self.lines, self.value_ids, self.line_starts))
+        total += sys.getsizeof(self.values) + sum(sys.getsizeof(v) for v in self.values)
+        total += sys.getsizeof(self._value_index)
+        return total
+
+
+# --- Akış (Streaming) Tarayıcı ---
+
+# Bir eşleşmenin tamponun sonuna bu kadar yakın bitmesi halinde devamı gelecek
+# parçayla değişebilir: '=' -> '==', '12' + '.5', 'dahil' + ' et', yorum/metin
+# sonları... Böyle eşleşmeler bir sonraki parça okunana kadar bekletilir.
+_STREAM_LOOKAHEAD = 6
+
+
+def stream_tokens(source, chunk_size=1 << 16, keywords=None):
+    """
+    Metin/ikili dosya nesnesinden ya da mmap'ten okuyarak token'ları tembel
+    biçimde üretir. Bellekte yalnızca okunan parça ve parça sınırına denk gelen
+    yarım token tutulur; metin, yorum ve çok kelimeli anahtar kelimeler parça
+    sınırlarını aşabilir.
+    """
+    if keywords is None:
+        keywords = GumusTokenizer("").keywords
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    operators = _OPERATORS
+
+    buffer = ""
+    base = 0          # buffer[0]'ın kaynaktaki ofseti
+    line = 1
+    line_start = 0    # Geçerli satırın kaynaktaki başlangıç ofseti
+    at_eof = False
+
+    while not at_eof:
+        chunk = source.read(chunk_size)
+        if not chunk:
+            at_eof = True
+            chunk = decoder.decode(b"", final=True)
+        elif isinstance(chunk, bytes):
+            chunk = decoder.decode(chunk)
+        buffer += chunk
+
+        limit = len(buffer) - _STREAM_LOOKAHEAD
+        consumed = len(buffer)
+        for m in _MASTER_PATTERN.finditer(buffer):
+            if not at_eof and m.end() > limit:
+                consumed = m.start()
+                break
+
+            kind = m.lastindex
+            if kind == _K_SKIP or kind == _K_OTHER:
+                continue
+            if kind == _K_NEWLINE:
+                line += 1
+                line_start = base + m.end()
+                continue
+
+            text = m.group(kind)
+            start = base + m.start()
+            col = start - line_start + 1
+
+            if kind == _K_IDENT:
+                yield Token(keywords.get(text, TokenType.IDENTIFIER), text, line, col, col + len(text))
+            elif kind == _K_OP:
+                yield Token(operators[text], text, line, col, col + len(text))
+            elif kind == _K_NUMBER:
+                val = float(text)
+                if val.is_integer():
+                    val = int(val)
+                yield Token(TokenType.NUMBER, val, line, col, col + len(text))
+            elif kind == _K_STRING:
+                newlines = text.count('\n')
+                if newlines:
+                    line += newlines
+                    line_start = start + text.rfind('\n') + 1
+                if len(text) > 1 and text[-1] == '"':
+                    yield Token(TokenType.STRING, text[1:-1], line, col, start + len(text) - line_start + 1)
+            else:  # _K_MULTI
+                yield Token(keywords.get(_MULTI_WORD_KEYS[text], TokenType.IDENTIFIER), text, line, col, col + len(text))
+
+        buffer = buffer[consumed:]
+        base += consumed
+
+    col = base - line_start + 1
+    yield Token(TokenType.EOF, "", line, col, col)
+
+
+def stream_file_tokens(path, chunk_size=1 << 16):
+    """UTF-8 .tr dosyasını mmap üzerinden akış halinde tarar"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield from stream_tokens(f, chunk_size)
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield from stream_tokens(mapped, chunk_size)
+
+
+class StreamingTokenBuffer:
+    """
+    Token üretecini GumusParser'ın indeksli erişimine uyarlar. Yalnızca
+    ayrıştırıcının baktığı noktanın gerisindeki küçük bir pencere saklanır;
+    daha eski token'lar bırakılır, böylece bellek kullanımı sınırlı kalır.
+    """
+    KEEP_BEHIND = 8
+
+    def __init__(self, token_iter):
+        self._iter = iter(token_iter)
+        self._window = []
+        self._base = 0  # _window[0]'ın akıştaki indeksi
+        self.kinds = _StreamingKinds(self)
+
+    def _fetch(self, index):
+        window = self._window
+        if index < self._base:
+            raise IndexError(f"Akıştaki {index}. token artık bellekte değil")
+
+        # Geride kalanları bırak (pencereyi sınırlı tut)
+        drop = index - self.KEEP_BEHIND - self._base
+        if drop > 0:
+            del window[:drop]
+            self._base += drop
+
+        while index - self._base >= len(window):
+            if window and window[-1].type == TokenType.EOF:
+                return window[-1]  # EOF'un ötesi hep EOF
+            window.append(next(self._iter))
+        return window[index - self._base]
+
+    def __getitem__(self, index):
+        return self._fetch(index)
+
+
+class _StreamingKinds:
+    """GumusParser'ın tür kodu dizisi beklentisini akış tamponu üzerinden karşılar"""
+    __slots__ = ('_buffer',)
+
+    def __init__(self, buffer):
+        self._buffer = buffer
+
+    def __getitem__(self, index):
+        return KIND_CODES[self._buffer._fetch(index).type]
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import re
+from bisect import bisect_left, bisect_right
 
 class TokenType:
     # Keywords
@@ -60,28 +61,93 @@ class TokenType:
     
     EOF = 'SON'
 
+# Token türlerinin sayısal kodları (sıkıştırılmış token deposu ve ayrıştırıcı için)
+TOKEN_KINDS = [value for name, value in vars(TokenType).items() if not name.startswith('_')]
+KIND_CODES = {kind: code for code, kind in enumerate(TOKEN_KINDS)}
+
 class Token:
-    def __init__(self, type, value, line=0):
+    def __init__(self, type, value, line=0, col=0, end_col=0):
         self.type = type
         self.value = value
         self.line = line
+        self.col = col          # 1 tabanlı başlangıç sütunu
+        self.end_col = end_col  # Bitiş sütunu (hariç), token'ın bittiği satırda
     
     def __repr__(self):
         return f"Token({self.type}, '{self.value}', line={self.line})"
 
+# Metin kaçış dizileri (yerel Tokenizer::string ile aynı küme). Token metni ham
+# kalır; değer çalışma zamanı sabiti kurulurken decode_escapes ile çözülür.
+_ESCAPES = {'"': '"', '\\': '\\', 'n': '\n', 't': '\t', 'r': '\r'}
+_ESCAPE_PATTERN = re.compile(r'\\(["\\ntr])')
+
+def decode_escapes(text):
+    """\\n \\t \\r \\" \\\\ dizilerini çözer; bilinmeyen kaçışta ters bölü olduğu gibi kalır"""
+    if '\\' not in text:
+        return text
+    return _ESCAPE_PATTERN.sub(lambda m: _ESCAPES[m.group(1)], text)
+
+# --- Tablo Güdümlü Tarayıcı (Master Regex) ---
+# Her alternatif tek bir yakalama grubudur; eşleşmenin türü `lastindex` ile
+# okunur. Sıralama önemlidir: yorum '/' operatöründen, çok kelimeli anahtar
+# kelimeler tekil isimlerden önce denenmelidir. Son alternatif tanınmayan her
+# karakteri yutar, böylece finditer kaynağı boşluksuz ve tek geçişte tarar.
+_ALPHA = 'A-Za-z_üğışçöÜĞİŞÇÖ'
+_ALNUM = '0-9' + _ALPHA
+
+_K_NEWLINE, _K_SKIP, _K_STRING, _K_NUMBER, _K_MULTI, _K_IDENT, _K_OP, _K_OTHER = range(1, 9)
+
+_MASTER_PATTERN = re.compile(
+    r'(\n)'                                                       # 1: satır sonu
+    r'|([ \r\t]+|//[^\n]*)'                                       # 2: boşluk / yorum
+    r'|("[^"]*"?)'                                                # 3: metin (kapanmamış olabilir)
+    r'|([0-9]+(?:\.[0-9]+)?)'                                     # 4: sayı
+    r'|((?:dahil et|devam et|boş ge[çc])(?![' + _ALNUM + r']))'   # 5: çok kelimeli anahtar kelime
+    r'|([' + _ALPHA + r'][' + _ALNUM + r']*)'                     # 6: isim / anahtar kelime
+    r'|([!=<>]=?|[(){}\[\],.;+\-*%/])'                            # 7: operatör / ayraç
+    r'|(.)'                                                       # 8: tanınmayan karakter
+)
+
+_OPERATORS = {
+    '(': TokenType.LPAREN, ')': TokenType.RPAREN,
+    '{': TokenType.LBRACE, '}': TokenType.RBRACE,
+    '[': TokenType.LBRACKET, ']': TokenType.RBRACKET,
+    ',': TokenType.COMMA, '.': TokenType.DOT, ';': TokenType.SEMICOLON,
+    '+': TokenType.PLUS, '-': TokenType.MINUS, '*': TokenType.STAR,
+    '/': TokenType.SLASH, '%': TokenType.PERCENT,
+    '!': TokenType.BANG, '!=': TokenType.BANGEQ,
+    '=': TokenType.EQ, '==': TokenType.EQEQ,
+    '<': TokenType.LT, '<=': TokenType.LTEQ,
+    '>': TokenType.GT, '>=': TokenType.GTEQ,
+}
+
+# Çok kelimeli anahtar kelimelerin sözlükteki karşılıkları ('boş gec' yazımı da 'boş geç' sayılır)
+_MULTI_WORD_KEYS = {
+    'dahil et': 'dahil et', 'devam et': 'devam et',
+    'boş geç': 'boş geç', 'boş gec': 'boş geç',
+}
+
 class GumusTokenizer:
-    def __init__(self, source):
+    def __init__(self, source, incremental=False):
         self.source = source
         self.tokens = []
         self.start = 0
         self.current = 0
         self.line = 1
+        self.line_start = 0
+
+        # Artımlı mod: her satır başı için lexer durumu denetim noktaları
+        self.incremental = incremental
+        self.line_offsets = []
+        self.line_states = []
+        self.line_tokens = []
         
         self.keywords = {
             'fonksiyon': TokenType.FUNCTION,
             'eğer': TokenType.IF,
             'değilse': TokenType.ELSE, 'yoksa': TokenType.ELSE,
             'döngü': TokenType.WHILE,
+            'için': TokenType.FOR,
             'dön': TokenType.RETURN,
             'kır': TokenType.BREAK,
             'devam': TokenType.CONTINUE,
@@ -105,11 +171,186 @@ class GumusTokenizer:
         }
 
     def tokenize(self):
+        """Kaynağı derlenmiş ana desenle tek geçişte tarar."""
+        if self.incremental:
+            self.line_offsets = [0]
+            self.line_states = [-1]
+            self.line_tokens = [0]
+        self._lex(self.source, 0, self.line, self.line_start, self.tokens)
+        self._append_eof()
+        return self.tokens
+
+    def _append_eof(self):
+        self.current = self.start = len(self.source)
+        col = self.current - self.line_start + 1
+        self.tokens.append(Token(TokenType.EOF, "", self.line, col, col))
+
+    def _lex(self, source, pos, line, line_start, tokens, resync=None):
+        """
+        `pos` konumundan itibaren `tokens` listesine token ekler.
+
+        Artımlı modda her satır başında bir denetim noktası kaydedilir:
+        satırın ofseti, o noktada açık bir metnin içinde olunup olunmadığı
+        (metnin başlangıç ofseti, değilse -1) ve o ana kadar üretilen token
+        sayısı. `resync` verildiğinde (en_erken_ofset, kayma, eski_ofsetler,
+        eski_durumlar) düzenleme sonrası eski akışla yakınsanan ilk satır
+        başında durulur ve eski satır indeksi döner; aksi halde -1 döner.
+        """
+        append = tokens.append
+        keywords = self.keywords
+        operators = _OPERATORS
+        record = self.incremental
+        if record:
+            offsets, states, firsts = self.line_offsets, self.line_states, self.line_tokens
+        converged = -1
+
+        for m in _MASTER_PATTERN.finditer(source, pos):
+            kind = m.lastindex
+            if kind == _K_SKIP or kind == _K_OTHER:
+                continue
+            if kind == _K_NEWLINE:
+                line += 1
+                line_start = m.end()
+                if record:
+                    offsets.append(line_start)
+                    states.append(-1)
+                    firsts.append(len(tokens))
+                    if resync is not None and line_start > resync[0]:
+                        old_offsets = resync[2]
+                        j = bisect_left(old_offsets, line_start - resync[1])
+                        if j < len(old_offsets) and old_offsets[j] == line_start - resync[1] and resync[3][j] < 0:
+                            converged = j
+                            break
+                continue
+
+            text = m.group(kind)
+            start = m.start()
+            col = start - line_start + 1
+
+            if kind == _K_IDENT:
+                append(Token(keywords.get(text, TokenType.IDENTIFIER), text, line, col, col + len(text)))
+            elif kind == _K_OP:
+                append(Token(operators[text], text, line, col, col + len(text)))
+            elif kind == _K_NUMBER:
+                val = float(text)
+                if val.is_integer():
+                    val = int(val)
+                append(Token(TokenType.NUMBER, val, line, col, col + len(text)))
+            elif kind == _K_STRING:
+                newlines = text.count('\n')
+                if newlines:
+                    line += newlines
+                    if record:
+                        nl = text.find('\n')
+                        while nl != -1:
+                            offsets.append(start + nl + 1)
+                            states.append(start)
+                            firsts.append(len(tokens))
+                            nl = text.find('\n', nl + 1)
+                    line_start = start + text.rfind('\n') + 1
+                if len(text) > 1 and text[-1] == '"':
+                    append(Token(TokenType.STRING, text[1:-1], line, col, m.end() - line_start + 1))
+            else:  # _K_MULTI
+                append(Token(keywords.get(_MULTI_WORD_KEYS[text], TokenType.IDENTIFIER), text, line, col, col + len(text)))
+
+        self.line = line
+        self.line_start = line_start
+        return converged
+
+    # --- Artımlı (Incremental) Mod ---
+
+    def edit(self, start, end, text):
+        """
+        Kaynakta [start, end) aralığını `text` ile değiştirir ve yalnızca ilk
+        kirli satırdan, lexer durumu eski akışla yeniden örtüşene kadar tarar.
+
+        Dönüş: (ilk, eski_son, yeni_son) — eski `tokens[ilk:eski_son]` yerini
+        yeni `tokens[ilk:yeni_son]` aldı; sonrasındaki token'lar korunur.
+        """
+        if not self.incremental:
+            raise ValueError("edit() yalnızca incremental=True ile kullanılabilir.")
+        if not self.line_offsets:
+            self.tokenize()
+
+        old_source = self.source
+        source = old_source[:start] + text + old_source[end:]
+        delta = len(text) - (end - start)
+        offsets, states, firsts = self.line_offsets, self.line_states, self.line_tokens
+        tokens = self.tokens
+
+        # İlk kirli satır; açık bir metnin içindeyse metnin başından başla
+        k = bisect_right(offsets, start) - 1
+        first = firsts[k]
+        restart = offsets[k]
+        if states[k] >= 0:
+            restart = states[k]
+            k = bisect_right(offsets, restart) - 1
+
+        old_offsets, old_states, old_firsts = offsets[k + 1:], states[k + 1:], firsts[k + 1:]
+        del offsets[k + 1:], states[k + 1:], firsts[k + 1:]
+        old_tail = tokens[first:]
+        del tokens[first:]
+
+        self.source = source
+        converged = self._lex(source, restart, k + 1, offsets[k], tokens,
+                              resync=(start + len(text), delta, old_offsets, old_states))
+
+        new_stop = len(tokens)
+        if converged < 0:
+            self._append_eof()
+            return first, first + len(old_tail), len(tokens)
+
+        # Yakınsama: eski kuyruğu kaydırarak geri ekle
+        old_stop = old_firsts[converged]
+        line_delta = self.line - (k + 1 + converged + 1)
+        token_delta = new_stop - old_stop
+        reused = old_tail[old_stop - first:]
+        if line_delta:
+            for tok in reused:
+                tok.line += line_delta
+        tokens.extend(reused)
+
+        offsets.extend(o + delta for o in old_offsets[converged + 1:])
+        states.extend(st + delta if st >= 0 else -1 for st in old_states[converged + 1:])
+        firsts.extend(f + token_delta for f in old_firsts[converged + 1:])
+
+        eof = tokens[-1]
+        self.line = eof.line
+        self.line_start = offsets[-1]
+        self.current = self.start = len(source)
+        return first, old_stop, new_stop
+
+    def sync(self, new_source):
+        """Editörden gelen tam metni eskisiyle karşılaştırıp tek bir edit() uygular."""
+        old = self.source
+        limit = min(len(old), len(new_source))
+        lo, hi = 0, limit
+        while lo < hi:  # Ortak önek (ikili arama, dilim karşılaştırmaları C hızında)
+            mid = (lo + hi + 1) // 2
+            if old[:mid] == new_source[:mid]: lo = mid
+            else: hi = mid - 1
+        prefix = lo
+        lo, hi = 0, limit - prefix
+        while lo < hi:  # Ortak sonek
+            mid = (lo + hi + 1) // 2
+            if old[len(old) - mid:] == new_source[len(new_source) - mid:]: lo = mid
+            else: hi = mid - 1
+        suffix = lo
+        return self.edit(prefix, len(old) - suffix, new_source[prefix:len(new_source) - suffix])
+
+    def tokenize_compact(self):
+        """Token nesneleri yerine dizi tabanlı bir CompactTokenStream üretir."""
+        from .token_stream import CompactTokenStream
+        return CompactTokenStream.from_source(self.source, self.keywords)
+
+    def tokenize_charwise(self):
+        """Karakter karakter çalışan eski tarayıcı (referans ve kıyaslama için)."""
         while not self.is_at_end():
             self.start = self.current
             self.scan_token()
         
-        self.tokens.append(Token(TokenType.EOF, "", self.line))
+        col = self.current - self.line_start + 1
+        self.tokens.append(Token(TokenType.EOF, "", self.line, col, col))
         return self.tokens
 
     def is_at_end(self):
@@ -140,6 +381,7 @@ class GumusTokenizer:
             pass
         elif c == '\n':
             self.line += 1
+            self.line_start = self.current
         elif c == '(': self.add_token(TokenType.LPAREN)
         elif c == ')': self.add_token(TokenType.RPAREN)
         elif c == '{': self.add_token(TokenType.LBRACE)
@@ -174,13 +416,19 @@ class GumusTokenizer:
             # print(f"Unexpected char: {c} at line {self.line}")
             pass
 
-    def add_token(self, type, literal=None):
+    def add_token(self, type, literal=None, col=None):
         text = self.source[self.start:self.current]
-        self.tokens.append(Token(type, literal if literal is not None else text, self.line))
+        if col is None:
+            col = self.start - self.line_start + 1
+        self.tokens.append(Token(type, literal if literal is not None else text, self.line,
+                                 col, self.current - self.line_start + 1))
 
     def string(self):
+        col = self.start - self.line_start + 1
         while self.peek() != '"' and not self.is_at_end():
-            if self.peek() == '\n': self.line += 1
+            if self.peek() == '\n':
+                self.line += 1
+                self.line_start = self.current + 1
             self.advance()
         
         if self.is_at_end():
@@ -189,7 +437,7 @@ class GumusTokenizer:
             
         self.advance() # Closing "
         value = self.source[self.start+1 : self.current-1]
-        self.add_token(TokenType.STRING, value)
+        self.add_token(TokenType.STRING, value, col)
 
     def number(self):
         while self.is_digit(self.peek()):
@@ -268,3 +516,15 @@ class TokenizerRunner:
         t = GumusTokenizer(source)
         return t.tokenize()
 
+    @staticmethod
+    def get_compact_tokens(source):
+        """Token nesnesi üretmeden dizi tabanlı CompactTokenStream döner"""
+        t = GumusTokenizer(source)
+        return t.tokenize_compact()
+
+    @staticmethod
+    def stream_file_tokens(path, chunk_size=1 << 16):
+        """Büyük .tr dosyalarını tamamını belleğe almadan tembel biçimde tarar"""
+        from .token_stream import stream_file_tokens
+        return stream_file_tokens(path, chunk_size)
+
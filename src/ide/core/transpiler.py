@@ -1,26 +1,77 @@
 # -*- coding: utf-8 -*-
-from .tokenizer import TokenizerRunner, TokenType
-from .parser import GumusParser, Program, VarStmt, FunctionStmt, BlockStmt, IfStmt, WhileStmt, PrintStmt, ReturnStmt, ExprStmt, BinaryExpr, UnaryExpr, Literal, Variable, CallExpr, IncludeStmt, BreakStmt, ContinueStmt, TryStmt
+import keyword
+
+from .ast_nodes import (
+    NodeVisitor, VarStmt, Literal, FunctionStmt, ClassStmt, BlockStmt, ForStmt, TryStmt,
+    BinaryExpr, UnaryExpr, LogicalExpr, AssignExpr, Variable, ThisExpr,
+)
+from .optimizer import optimize as optimize_ast
+from .parse_cache import parse_source
 from .library_bridge import LibraryBridge
+from .loop_idioms import children, counted_for, counted_while, hoistable_lengths, is_integral
+from .tokenizer import decode_escapes
+
+# Üretilen Python kodunun biçimi değişirse artırılmalıdır (önbellekteki kod nesneleri geçersizleşir)
+TRANSPILER_VERSION = 5
+
+# İkili işleçte işlenen olarak parantez gerektiren ifadeler: (a + b) * 4
+_COMPOUND = (BinaryExpr.kind, UnaryExpr.kind, AssignExpr.kind)
+_COMPARISONS = frozenset(('==', '!=', '<', '<=', '>', '>='))
+
+
+class NotTranslatable(Exception):
+    """Program Python'a aynı anlambilimle çevrilemiyor (bkz. NativePythonTranspiler)"""
+
 
-class GumusToPythonTranspiler:
+def scope_names(nodes):
+    """
+    Bir fonksiyon gövdesinde bildirilen ve atanan isimler. İç fonksiyon ve
+    sınıfların gövdelerine inilmez; onların adları bu kapsamda bildirilmiş sayılır.
+    """
+    declared, assigned = set(), set()
+    pending = list(nodes)
+    while pending:
+        node = pending.pop()
+        kind = node.kind
+        if kind == VarStmt.kind:
+            declared.add(node.name.value)
+        elif kind == AssignExpr.kind:
+            assigned.add(node.name.value)
+        elif kind == FunctionStmt.kind or kind == ClassStmt.kind:
+            declared.add(node.name.value)
+            continue
+        elif kind == TryStmt.kind and node.catch_name is not None:
+            declared.add(node.catch_name.value)
+        pending.extend(children(node))
+    return declared, assigned
+
+
+class GumusToPythonTranspiler(NodeVisitor):
     def __init__(self):
+        super().__init__()
         self.indent_level = 0
         self.output_lines = []
         self.imports = set()
+        self.optimization_stats = None  # transpile(optimize=True) sonrası sayaçlar
+        self._integers = set()   # range döngüsü sayaçları (tamsayı olduğu bilinen isimler)
+        self._hoisted = {}       # Döngüden önce hesaplanan uzunluk(...) çağrısı -> geçici ad
+        self._lengths = 0
+        self._loops = []         # Döngü başına `devam`dan önce çalışacak artış ifadesi (yoksa None)
+        self._functions = []     # Çevreleyen fonksiyonların yerel isimleri (nonlocal için)
         
         # Native Mapping (GümüşDil -> Python)
         self.builtins = {
             "uzunluk": "len",
             "metin": "str",
             "sayı": "int",
+            "tamsayı": "int",
+            "tamsayi": "int",
             "girdi": "input",
             "karekök": "math.sqrt", 
             "rastgele": "random.random", 
             "zaman": "time.time",
             "dosya_oku": "open",
             "dosya_yaz": "open",
-            "ekle": "append",
             "çık": "exit",
             "aralık": "range",
             "rastgele_sayı": "random.randint",
@@ -31,18 +82,22 @@ class GumusToPythonTranspiler:
             "mutlak": "abs"
         }
         
-    def transpile(self, source_code):
+    def transpile(self, source_code, ast=None, optimize=False):
         self.output_lines = []
         self.indent_level = 0
         self.imports = set()
+        self._integers = set()
+        self._hoisted = {}
+        self._lengths = 0
+        self._loops = []
+        self._functions = []
         
         try:
-            # 1. Tokenize
-            tokens = TokenizerRunner.get_tokens(source_code)
-            
-            # 2. Parse
-            parser = GumusParser(tokens)
-            ast = parser.parse()
+            # 1-2. Tokenize + Parse (hazır AST verilmediyse paylaşılan önbellek üzerinden)
+            if ast is None:
+                ast = parse_source(source_code)
+            if optimize and ast is not None and hasattr(ast, 'statements'):
+                ast, self.optimization_stats = optimize_ast(ast)
             
             if not ast or not hasattr(ast, 'statements') or not ast.statements:
                 return "# Boş program veya parse hatası."
@@ -53,18 +108,16 @@ class GumusToPythonTranspiler:
             self.emit("")
             
             # 4. Visit AST
-            for stmt in ast.statements:
-                self.visit_stmt(stmt)
+            self.statements(ast.statements)
             
             # 5. Add Imports
+            # Çıktı ve import kümesi bir kez metne çevrilir (her kontrolde değil)
+            body = str(self.output_lines)
+            imported = str(self.imports)
             header = []
-            if "math." in str(self.output_lines) and "math" not in str(self.imports): header.append("import math")
-            if "random." in str(self.output_lines) or "random.randint" in str(self.output_lines):
-                 if "random" not in str(self.imports): header.append("import random")
-            if "time." in str(self.output_lines) or "time.sleep" in str(self.output_lines):
-                 if "time" not in str(self.imports): header.append("import time")
-            if "os." in str(self.output_lines) or "os.system" in str(self.output_lines):
-                 if "os" not in str(self.imports): header.append("import os")
+            for module in ("math", "random", "time", "os"):
+                if f"{module}." in body and module not in imported:
+                    header.append(f"import {module}")
             
             # Add explicit LibraryBridge imports
             for imp in sorted(list(self.imports)):
@@ -73,6 +126,8 @@ class GumusToPythonTranspiler:
             final_output = "\n".join(header + [""] + self.output_lines)
             return final_output.strip()
             
+        except NotTranslatable:
+            raise
         except Exception as e:
             import traceback
             return f"# HATA: Transpilation başarısız oldu.\n# Sebep: {str(e)}\n\n'''\n{traceback.format_exc()}\n'''"
@@ -81,29 +136,22 @@ class GumusToPythonTranspiler:
         indent = "    " * self.indent_level
         self.output_lines.append(f"{indent}{text}")
 
-    # --- Statement Visitors (Produce Side Effects / Lines) ---
+    def generic_visit(self, node):
+        name = type(node).__name__
+        if name.endswith("Stmt"):
+            # Deyim ziyaretçilerinin dönüş değeri kullanılmaz; satır olarak görünmeli
+            self.emit(f"# Unknown Statement: {name}")
+            self.emit("pass")
+            return None
+        return f"/* Unknown Node: {name} */"
 
-    def visit_stmt(self, node):
-        if isinstance(node, VarStmt): self.visit_VarStmt(node)
-        elif isinstance(node, FunctionStmt): self.visit_FunctionStmt(node)
-        elif isinstance(node, BlockStmt): self.visit_BlockStmt(node)
-        elif isinstance(node, IfStmt): self.visit_IfStmt(node)
-        elif isinstance(node, WhileStmt): self.visit_WhileStmt(node)
-        elif isinstance(node, PrintStmt): self.visit_PrintStmt(node)
-        elif isinstance(node, ReturnStmt): self.visit_ReturnStmt(node)
-        elif isinstance(node, IncludeStmt): self.visit_IncludeStmt(node)
-        elif isinstance(node, BreakStmt): self.visit_BreakStmt(node)
-        elif isinstance(node, ContinueStmt): self.visit_ContinueStmt(node)
-        elif isinstance(node, TryStmt): self.visit_TryStmt(node)
-        elif isinstance(node, ExprStmt): self.visit_ExprStmt(node)
-        else:
-            self.emit(f"# Unknown Statement: {type(node).__name__}")
+    # --- Statement Visitors (Produce Side Effects / Lines) ---
 
     def visit_VarStmt(self, node):
         name = node.name.value
         init = "None"
         if node.initializer:
-            init = self.visit_expr(node.initializer)
+            init = self.visit(node.initializer)
         self.emit(f"{name} = {init}")
 
     def visit_FunctionStmt(self, node):
@@ -113,53 +161,175 @@ class GumusToPythonTranspiler:
         
         self.emit(f"def {name}({params}):")
         self.indent_level += 1
-        self.visit_BlockStmt(node.body)
+        self._function_body(node)
         self.indent_level -= 1
         self.emit("") # Empty line after function
 
+    def _function_body(self, node):
+        """
+        Gövdeyi üretir. GümüşDil'de fonksiyonda bildirilmeden atanan isim dış
+        kapsamındır; Python'da yerel olmasın diye global/nonlocal bildirilir.
+        """
+        declared, assigned = scope_names(node.body.statements)
+        local = declared | {p.value for p in node.params}
+        outer = sorted(assigned - local)
+        enclosing = set().union(*self._functions)
+        nonlocal_names = [name for name in outer if name in enclosing]
+        global_names = [name for name in outer if name not in enclosing]
+        if global_names:
+            self.emit(f"global {', '.join(global_names)}")
+        if nonlocal_names:
+            self.emit(f"nonlocal {', '.join(nonlocal_names)}")
+        self._functions.append(local)
+        self.visit_BlockStmt(node.body)
+        self._functions.pop()
+
     def visit_BlockStmt(self, node):
         if not node.statements:
             self.emit("pass")
             return
-            
-        for stmt in node.statements:
-            self.visit_stmt(stmt)
+        self.statements(node.statements)
+
+    def statements(self, nodes):
+        # `değişken i = a` + sayaçlı `döngü` çifti tek bir range döngüsüne dönüşür
+        index, count = 0, len(nodes)
+        while index < count:
+            stmt = nodes[index]
+            if index + 1 < count and stmt.kind == VarStmt.kind:
+                loop = counted_while(stmt, nodes[index + 1], nodes[index + 2:], self._integers)
+                if loop is not None:
+                    self._range_loop(loop)
+                    index += 2
+                    continue
+            self.visit(stmt)
+            index += 1
+
+    def condition(self, node):
+        """if/while koşulunun Python ifadesi"""
+        return self.visit(node)
 
     def visit_IfStmt(self, node):
-        cond = self.visit_expr(node.condition)
+        cond = self.condition(node.condition)
         self.emit(f"if {cond}:")
         
         self.indent_level += 1
         # Then branch is a single statement (usually BlockStmt)
-        self.visit_stmt(node.then_branch)
+        self.visit(node.then_branch)
         self.indent_level -= 1
         
         if node.else_branch:
             self.emit("else:")
             self.indent_level += 1
-            self.visit_stmt(node.else_branch)
+            self.visit(node.else_branch)
             self.indent_level -= 1
 
     def visit_WhileStmt(self, node):
-        cond = self.visit_expr(node.condition)
+        cond = self._loop_condition(node.condition, [node.body])
         self.emit(f"while {cond}:")
         self.indent_level += 1
-        self.visit_stmt(node.body)
+        self._loops.append(None)
+        self.visit(node.body)
+        self._loops.pop()
+        self.indent_level -= 1
+
+    def visit_ForStmt(self, node):
+        loop = counted_for(node, self._integers)
+        if loop is not None:
+            self._range_loop(loop)
+            return
+        # için (başlangıç; koşul; artış) -> başlangıç + while döngüsü
+        if node.initializer:
+            self.visit(node.initializer)
+        body = [node.body, node.increment] if node.increment else [node.body]
+        cond = self._loop_condition(node.condition, body) if node.condition else "True"
+        increment = self.visit(node.increment) if node.increment else None
+        self.emit(f"while {cond}:")
+        self.indent_level += 1
+        self._loops.append(increment)
+        self.visit(node.body)
+        self._loops.pop()
+        if increment is not None:
+            self.emit(increment)
+        self.indent_level -= 1
+
+    def _loop_condition(self, condition, body):
+        """Koşuldaki değişmez uzunluk(...) çağrılarını döngüden önceye alıp koşulu üretir"""
+        lengths = hoistable_lengths(condition, body)
+        for call in lengths:
+            name = f"_uzunluk{self._lengths}"
+            self._lengths += 1
+            self.emit(f"{name} = {self.visit(call)}")
+            self._hoisted[call] = name
+        cond = self.condition(condition)
+        for call in lengths:
+            del self._hoisted[call]
+        return cond
+
+    def _range_loop(self, loop):
+        """Tanınan sayaçlı döngü (bkz. loop_idioms.py): sınır range'de bir kez hesaplanır"""
+        start = self.visit(loop.start)
+        bound = loop.bound
+        if is_integral(bound, self._integers):
+            if bound.kind == Literal.kind and loop.inclusive:
+                stop = str(bound.value + (1 if loop.step > 0 else -1))
+            elif loop.inclusive:
+                stop = f"{self.visit(bound)} {'+' if loop.step > 0 else '-'} 1"
+            else:
+                stop = self.visit(bound)
+        elif loop.step > 0:
+            # Tamsayı sayaç için i < n <=> i < ceil(n), i <= n <=> i < floor(n) + 1
+            stop = f"math.floor({self.visit(bound)}) + 1" if loop.inclusive else f"math.ceil({self.visit(bound)})"
+        else:
+            stop = f"math.ceil({self.visit(bound)}) - 1" if loop.inclusive else f"math.floor({self.visit(bound)})"
+        if loop.step != 1:
+            args = f"{start}, {stop}, {loop.step}"
+        else:
+            args = stop if start == "0" else f"{start}, {stop}"
+        self.emit(f"for {loop.name} in range({args}):")
+        self.indent_level += 1
+        added = loop.name not in self._integers
+        self._integers.add(loop.name)
+        self._loops.append(None)  # range kendi adımını atar
+        if loop.body:
+            self.statements(loop.body)
+        else:
+            self.emit("pass")
+        self._loops.pop()
+        if added:
+            self._integers.discard(loop.name)
+        self.indent_level -= 1
+
+    def _class_base(self, node):
+        return f"({node.superclass.name.value})" if node.superclass else ""
+
+    def visit_ClassStmt(self, node):
+        self.emit(f"class {node.name.value}{self._class_base(node)}:")
+        self.indent_level += 1
+        if not node.methods:
+            self.emit("pass")
+        for method in node.methods:
+            name = "__init__" if method.name.value == "kurucu" else method.name.value
+            params = ", ".join(["self"] + [p.value for p in method.params])
+            self.emit(f"def {name}({params}):")
+            self.indent_level += 1
+            self._function_body(method)
+            self.indent_level -= 1
+            self.emit("")
         self.indent_level -= 1
 
     def visit_PrintStmt(self, node):
-        args_str = [self.visit_expr(expr) for expr in node.expressions]
+        args_str = [self.visit(expr) for expr in node.expressions]
         self.emit(f"print({', '.join(args_str)})")
 
     def visit_ReturnStmt(self, node):
         if node.value:
-            val = self.visit_expr(node.value)
+            val = self.visit(node.value)
             self.emit(f"return {val}")
         else:
             self.emit("return")
 
     def visit_ExprStmt(self, node):
-        val = self.visit_expr(node.expression)
+        val = self.visit(node.expression)
         self.emit(val)
 
     def visit_IncludeStmt(self, node):
@@ -170,32 +340,34 @@ class GumusToPythonTranspiler:
         self.emit("break")
 
     def visit_ContinueStmt(self, node):
+        # için döngüsünde `devam` artış ifadesini atlamamalı
+        if self._loops and self._loops[-1] is not None:
+            self.emit(self._loops[-1])
         self.emit("continue")
 
     def visit_TryStmt(self, node):
         self.emit("try:")
         self.indent_level += 1
-        self.visit_stmt(node.try_block)
+        self.visit(node.try_block)
         self.indent_level -= 1
-        self.emit("except Exception:")
+        if node.catch_name:
+            self.emit(f"except Exception as {node.catch_name.value}:")
+        else:
+            self.emit("except Exception:")
         self.indent_level += 1
-        self.visit_stmt(node.catch_body)
+        self.visit(node.catch_body)
         self.indent_level -= 1
 
     # --- Expression Visitors (Return Strings) ---
 
-    def visit_expr(self, node):
-        if isinstance(node, BinaryExpr): return self.visit_BinaryExpr(node)
-        elif isinstance(node, UnaryExpr): return self.visit_UnaryExpr(node)
-        elif isinstance(node, Literal): return self.visit_Literal(node)
-        elif isinstance(node, Variable): return self.visit_Variable(node)
-        elif isinstance(node, CallExpr): return self.visit_CallExpr(node)
-        else:
-            return f"/* Unknown Expr: {type(node).__name__} */"
+    def _operand(self, node):
+        """Bileşik işlenen parantezlenir; Python önceliği GümüşDil ağacını bozmaz"""
+        text = self.visit(node)
+        return f"({text})" if node.kind in _COMPOUND else text
 
     def visit_BinaryExpr(self, node):
-        left = self.visit_expr(node.left)
-        right = self.visit_expr(node.right)
+        left = self._operand(node.left)
+        right = self._operand(node.right)
         op = node.operator.value
         
         # Operator Mapping
@@ -214,7 +386,7 @@ class GumusToPythonTranspiler:
 
     def visit_UnaryExpr(self, node):
         op = node.operator.value
-        right = self.visit_expr(node.right)
+        right = self._operand(node.right)
         if op == '!': return f"not {right}"
         return f"{op}{right}"
 
@@ -231,8 +403,19 @@ class GumusToPythonTranspiler:
         return node.name.value
 
     def visit_CallExpr(self, node):
-        callee_name = self.visit_expr(node.callee)
-        args_str = [self.visit_expr(arg) for arg in node.args]
+        hoisted = self._hoisted.get(node)
+        if hoisted is not None:
+            return hoisted
+        callee_name = self.visit(node.callee)
+        args_str = [self.visit(arg) for arg in node.args]
+
+        # Yerel koleksiyon işlemleri yerinde çalışan Python ifadelerine açılır
+        collection = LibraryBridge.get_collection_builtin(callee_name, len(args_str))
+        if collection is not None:
+            template, import_stmt = collection
+            if import_stmt:
+                self.imports.add(import_stmt)
+            return template.format(*args_str)
         
         # Builtin Mapping
         if callee_name in self.builtins:
@@ -258,4 +441,180 @@ class GumusToPythonTranspiler:
             
         return f"{callee_name}({', '.join(args_str)})"
 
+    def visit_AssignExpr(self, node):
+        return f"{node.name.value} = {self.visit(node.value)}"
+
+    def visit_LogicalExpr(self, node):
+        op = "and" if node.operator.value == "ve" else "or"
+        return f"({self.visit(node.left)} {op} {self.visit(node.right)})"
+
+    def visit_GetExpr(self, node):
+        return f"{self.visit(node.object)}.{node.name.value}"
+
+    def visit_SetExpr(self, node):
+        return f"{self.visit(node.object)}.{node.name.value} = {self.visit(node.value)}"
+
+    def visit_IndexExpr(self, node):
+        return f"{self.visit(node.object)}[{self.visit(node.index)}]"
+
+    def visit_IndexSetExpr(self, node):
+        return f"{self.visit(node.object)}[{self.visit(node.index)}] = {self.visit(node.value)}"
+
+    def visit_ListExpr(self, node):
+        return f"[{', '.join(self.visit(e) for e in node.elements)}]"
+
+    def visit_DictExpr(self, node):
+        pairs = [f"{self.visit(k)}: {self.visit(v)}" for k, v in zip(node.keys, node.values)]
+        return f"{{{', '.join(pairs)}}}"
+
+    def visit_ThisExpr(self, node):
+        return "self"
+
+    def visit_SuperExpr(self, node):
+        return f"super().{node.method.value}"
+
+    def visit_NewExpr(self, node):
+        args_str = [self.visit(arg) for arg in node.args]
+        return f"{self.visit(node.callee)}({', '.join(args_str)})"
+
+
+# Üretilen kodun kullandığı Python isimleri; GümüşDil programı bunları bildiremez
+_PYTHON_NAMES = frozenset(('print', 'range', 'super', 'self', 'math', 'object', '__init__'))
+
+
+class NativePythonTranspiler(GumusToPythonTranspiler):
+    """
+    --native-python için tercüman. Üst sınıfın çıktısı okunmak içindir (/ Python
+    bölmesi, print True yazar); bu sınıfın çıktısı run_simulator.native_namespace()
+    içinde çalıştırıldığında VM ile aynı sonucu verir. TierTranspiler gibi bölme,
+    mod, metin birleştirme, doğruluk ve yazdırma çalışma zamanı yardımcılarıyla
+    (_G_div, _G_truthy, ...) yapılır; yerleşikler make_builtins() karşılıklarıdır.
+
+    Python'da aynı anlambilimle ifade edilemeyen programlarda (dahil_et,
+    dene/yakala, iç blokta gölgelenen değişken, Python'a ayrılmış isimler)
+    NotTranslatable yükselir; çağıran programı VM'de çalıştırır.
+    """
+
+    def transpile(self, source_code, ast=None, optimize=False):
+        self._temps = 0
+        if ast is None:
+            ast = parse_source(source_code)
+        if ast is not None and hasattr(ast, 'statements'):
+            self._check_block(ast.statements, frozenset())
+        return super().transpile(source_code, ast, optimize)
+
+    def _check_block(self, nodes, visible):
+        """Python kapsamı fonksiyon düzeyindedir: iç blokta gölgelenen isim ve ayrılmış isimler reddedilir"""
+        declared = set()
+        for node in nodes:
+            self._check(node, visible, declared)
+
+    def _check(self, node, visible, declared):
+        kind = node.kind
+        if kind == VarStmt.kind:
+            name = self._checked_name(node.name.value)
+            if name in visible:
+                raise NotTranslatable(f"iç blokta gölgelenen değişken: {name}")
+            declared.add(name)
+        elif kind == AssignExpr.kind or kind == Variable.kind:
+            self._checked_name(node.name.value)
+        elif kind == FunctionStmt.kind:
+            declared.add(self._checked_name(node.name.value))
+            for param in node.params:
+                self._checked_name(param.value)
+            self._check_block(node.body.statements, frozenset())
+            return
+        elif kind == ClassStmt.kind:
+            declared.add(self._checked_name(node.name.value))
+            for method in node.methods:
+                self._check(method, frozenset(), set())
+            return
+        elif kind == BlockStmt.kind or kind == ForStmt.kind:
+            # için bildirimi de kendi bloğundadır
+            inner = visible | declared
+            block = set()
+            for child in children(node):
+                self._check(child, inner, block)
+            return
+        for child in children(node):
+            self._check(child, visible, declared)
+
+    @staticmethod
+    def _checked_name(name):
+        if keyword.iskeyword(name) or name in _PYTHON_NAMES or name.startswith("_G_"):
+            raise NotTranslatable(f"Python'a ayrılmış isim: {name}")
+        return name
+
+    def generic_visit(self, node):
+        raise NotTranslatable(type(node).__name__)
+
+    visit_IncludeStmt = visit_TryStmt = generic_visit
+
+    def condition(self, node):
+        value = self.visit(node)
+        return value if self._is_boolean(node) else f"_G_truthy({value})"
+
+    def _is_boolean(self, node):
+        kind = node.kind
+        if kind == BinaryExpr.kind:
+            return node.operator.value in _COMPARISONS
+        if kind == UnaryExpr.kind:
+            return node.operator.value == '!'
+        if kind == LogicalExpr.kind:
+            return self._is_boolean(node.left) and self._is_boolean(node.right)
+        return kind == Literal.kind and node.value.__class__ is bool
+
+    def _class_base(self, node):
+        # Nesneler GümüşDil'deki gibi <Sınıf nesnesi> yazılsın diye kök sınıf _G_Object'tir
+        return super()._class_base(node) or "(_G_Object)"
+
+    def visit_PrintStmt(self, node):
+        args = ", ".join(f"_G_text({self.visit(expr)})" for expr in node.expressions)
+        self.emit(f"print({args})")
+
+    def visit_Literal(self, node):
+        value = node.value
+        return repr(decode_escapes(value) if value.__class__ is str else value)
+
+    def visit_UnaryExpr(self, node):
+        right = self.visit(node.right)
+        if node.operator.value == '!':
+            return f"(not _G_truthy({right}))"
+        return f"(-{right})"
+
+    def visit_BinaryExpr(self, node):
+        symbol = node.operator.value
+        left, right = self.visit(node.left), self.visit(node.right)
+        if symbol == '/':
+            return f"_G_div({left}, {right})"
+        if symbol == '%':
+            return f"_G_mod({left}, {right})"
+        if symbol == '+' and not (is_integral(node.left, self._integers)
+                                  and is_integral(node.right, self._integers)):
+            return f"_G_add({left}, {right})"  # Metinle toplama birleştirmedir: "x" + 1 -> x1
+        return f"({left} {symbol} {right})"
+
+    def visit_LogicalExpr(self, node):
+        left, right = self.visit(node.left), self.visit(node.right)
+        keyword_ = "or" if node.operator.value == 'veya' else "and"
+        if self._is_boolean(node.left) and self._is_boolean(node.right):
+            return f"({left} {keyword_} {right})"
+        # ve/veya işlenen değerini döner; sol taraf bir kez hesaplanır
+        temp = f"_G_t{self._temps}"
+        self._temps += 1
+        if keyword_ == "or":
+            return f"({temp} if _G_truthy(({temp} := {left})) else {right})"
+        return f"({right} if _G_truthy(({temp} := {left})) else {temp})"
+
+    def visit_CallExpr(self, node):
+        hoisted = self._hoisted.get(node)
+        if hoisted is not None:
+            return hoisted
+        args = ", ".join(self.visit(arg) for arg in node.args)
+        return f"{self.visit(node.callee)}({args})"
 
+    def visit_GetExpr(self, node):
+        if node.object.kind == ThisExpr.kind:
+            return super().visit_GetExpr(node)
+        # Liste/metin/sözlük metotları (l.uzunluk()) TYPE_METHODS üzerinden bulunur
+        return f"_G_get({self.visit(node.object)}, {node.name.value!r})"
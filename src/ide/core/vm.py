@@ -0,0 +1,1293 @@
+# -*- coding: utf-8 -*-
+"""
+GümüşDil Bayt Kodu Derleyicisi ve Yığın Makinesi
+Yerel VM'in (src/compiler/vm) Python karşılığı: GumusParser'ın AST'si
+op_code.h'deki işlem kodlarıyla düz bir `array` parçasına (Chunk) derlenir,
+sabitler parçanın sabit havuzunda tutulur ve GumusVM.execute içindeki tek
+dağıtım döngüsü çalıştırır. Yerel derleyici bulunamadığında satır satır
+desen eşleyen simülatör yerine kullanılır.
+
+İşlem kodu numaraları op_code.h ile birebir aynıdır. Python'da baytları
+birleştirmek pahalı olduğundan her işlenen dizinin tek bir elemanıdır; bu
+yüzden OP_CONSTANT_LONG ve 16 bitlik atlama mesafeleri gerekmez, atlamalar
+hedefin mutlak konumunu taşır. Yerelde henüz karşılığı olmayan sözlük,
+dene/yakala ve dahil_et kodları OP_HALT'tan sonra eklenmiştir.
+
+Anlambilim ve çıktı/hata sözleşmesi GumusInterpreter ile aynıdır.
+"""
+from array import array
+from functools import partial
+from pathlib import Path
+
+from ..config import PROJECT_ROOT
+from .ast_nodes import NodeVisitor, AssignExpr, BlockStmt, GetExpr, SuperExpr
+from .interpreter import (
+    GumusRuntimeError, _Halt, GumusClass, GumusInstance, BoundMethod, TYPE_METHODS,
+    make_builtins, to_text, type_name, read_source, find_module, report_line,
+    locate, _divide, _modulo, _node_line,
+)
+from .optimizer import OptimizationStats, optimize
+from .parse_cache import parse_source
+from .tokenizer import decode_escapes
+
+# --- İşlem kodları (op_code.h ile aynı sıra ve değerler) ---
+
+OP_CONSTANT = 0
+OP_CONSTANT_LONG = 1
+OP_NIL = 2
+OP_TRUE = 3
+OP_FALSE = 4
+OP_POP = 5
+OP_DUP = 6
+OP_SWAP = 7
+OP_GET_LOCAL = 8
+OP_SET_LOCAL = 9
+OP_GET_GLOBAL = 10
+OP_DEFINE_GLOBAL = 11
+OP_SET_GLOBAL = 12
+OP_GET_UPVALUE = 13
+OP_SET_UPVALUE = 14
+OP_GET_PROPERTY = 15
+OP_SET_PROPERTY = 16
+OP_GET_SUPER = 17
+OP_EQUAL = 18
+OP_NOT_EQUAL = 19
+OP_GREATER = 20
+OP_GREATER_EQUAL = 21
+OP_LESS = 22
+OP_LESS_EQUAL = 23
+OP_ADD = 24
+OP_SUBTRACT = 25
+OP_MULTIPLY = 26
+OP_DIVIDE = 27
+OP_MODULO = 28
+OP_NEGATE = 29
+OP_AND = 30
+OP_OR = 31
+OP_NOT = 32
+OP_PRINT = 33
+OP_READ = 34
+OP_JUMP = 35
+OP_JUMP_IF_FALSE = 36
+OP_JUMP_IF_TRUE = 37
+OP_LOOP = 38
+OP_CALL = 39
+OP_INVOKE = 40
+OP_SUPER_INVOKE = 41
+OP_CLOSURE = 42
+OP_CLOSE_UPVALUE = 43
+OP_RETURN = 44
+OP_DEFINE_FUNCTION = 45
+OP_CLASS = 46
+OP_INHERIT = 47
+OP_METHOD = 48
+OP_ARRAY_NEW = 49
+OP_ARRAY_GET = 50
+OP_ARRAY_SET = 51
+OP_ARRAY_LENGTH = 52
+OP_STRING_CONCAT = 53
+OP_STRING_LENGTH = 54
+OP_STRING_SUBSTR = 55
+OP_TYPEOF = 56
+OP_CAST = 57
+OP_DEBUG_LINE = 58
+OP_DEBUG_VAR = 59
+OP_NOP = 60
+OP_HALT = 61
+# Python tarafı eklentileri
+OP_MAP_NEW = 62     # n: yığındaki n anahtar/değer çiftinden sözlük
+OP_TRY = 63         # hedef: yakala bloğunun başı
+OP_END_TRY = 64
+OP_INCLUDE = 65     # sabit: (modül, klasör)
+OP_NEW = 66         # yığının üstü 'yeni' ile kullanılabilir bir sınıf mı
+
+OPCODE_NAMES = {value: name for name, value in globals().items() if name.startswith("OP_")}
+
+# İşlenen sayıları. OP_CLOSURE'dan sonra her yukarı değer için (yerel_mi, indeks)
+# çifti gelir. OP_ARRAY_NEW eleman sayısını, OP_INVOKE/OP_SUPER_INVOKE metot
+# ismini ve argüman sayısını işlenen olarak taşır.
+OPERAND_COUNTS = dict.fromkeys(OPCODE_NAMES, 0)
+OPERAND_COUNTS.update(dict.fromkeys((
+    OP_CONSTANT, OP_GET_LOCAL, OP_SET_LOCAL, OP_GET_GLOBAL, OP_DEFINE_GLOBAL, OP_SET_GLOBAL,
+    OP_GET_UPVALUE, OP_SET_UPVALUE, OP_GET_PROPERTY, OP_SET_PROPERTY, OP_GET_SUPER,
+    OP_JUMP, OP_JUMP_IF_FALSE, OP_JUMP_IF_TRUE, OP_LOOP, OP_CALL, OP_CLOSURE, OP_CLASS,
+    OP_METHOD, OP_ARRAY_NEW, OP_DEBUG_LINE, OP_MAP_NEW, OP_TRY, OP_INCLUDE,
+), 1))
+OPERAND_COUNTS.update({OP_INVOKE: 2, OP_SUPER_INVOKE: 2})
+
+_JUMPS = frozenset((OP_JUMP, OP_JUMP_IF_FALSE, OP_JUMP_IF_TRUE, OP_LOOP, OP_TRY))
+_CONSTANT_OPERANDS = frozenset((
+    OP_CONSTANT, OP_GET_PROPERTY, OP_SET_PROPERTY, OP_GET_SUPER, OP_CLASS, OP_METHOD,
+    OP_CLOSURE, OP_DEBUG_LINE, OP_INCLUDE, OP_INVOKE, OP_SUPER_INVOKE,
+))
+
+_BINARY_OPS = {
+    '+': OP_ADD, '-': OP_SUBTRACT, '*': OP_MULTIPLY, '/': OP_DIVIDE, '%': OP_MODULO,
+    '==': OP_EQUAL, '!=': OP_NOT_EQUAL, '<': OP_LESS, '<=': OP_LESS_EQUAL,
+    '>': OP_GREATER, '>=': OP_GREATER_EQUAL,
+}
+
+# Yerel VM 64 çerçeveyle sınırlıdır; Python yığını bir liste olduğu için
+# özyinelemeli öğrenci programlarına daha geniş yer bırakılır
+FRAMES_MAX = 10000
+
+_RECURSION_MESSAGE = "Çok derin özyineleme: Fonksiyon kendini durmadan çağırıyor olabilir."
+_UNDEFINED = object()
+
+
+class Chunk:
+    """Bayt kodu parçası: düz kod dizisi, kodla paralel satır dizisi ve sabit havuzu"""
+    __slots__ = ('code', 'lines', 'constants', '_constant_index')
+
+    def __init__(self):
+        self.code = array('i')
+        self.lines = array('i')
+        self.constants = []
+        self._constant_index = {}
+
+    def write(self, word, line):
+        self.code.append(word)
+        self.lines.append(line)
+
+    def add_constant(self, value):
+        """Sabiti havuza ekler; aynı tür ve değerdeki sabit tekrar eklenmez"""
+        try:
+            key = (value.__class__, value)
+            index = self._constant_index.get(key)
+        except TypeError:  # Hashlenemeyen sabit (ör. iç fonksiyon)
+            key = index = None
+        if index is None:
+            index = len(self.constants)
+            self.constants.append(value)
+            if key is not None:
+                self._constant_index[key] = index
+        return index
+
+    def disassemble(self, name="kod"):
+        """chunk.cpp'deki disassemble çıktısının metin karşılığı"""
+        out = [f"== {name} =="]
+        offset = 0
+        code, lines = self.code, self.lines
+        while offset < len(code):
+            op = code[offset]
+            line = "   |" if offset and lines[offset] == lines[offset - 1] else f"{lines[offset]:4d}"
+            text = f"{offset:04d} {line} {OPCODE_NAMES.get(op, f'UNKNOWN_OPCODE {op}'):<18}"
+            count = OPERAND_COUNTS.get(op, 0)
+            operands = list(code[offset + 1:offset + 1 + count])
+            if op == OP_CLOSURE:
+                function = self.constants[operands[0]]
+                count += 2 * function.upvalue_count
+                operands = list(code[offset + 1:offset + 1 + count])
+            if operands:
+                text += " " + " ".join(str(o) for o in operands)
+                if op in _JUMPS:
+                    text += f" -> {operands[0]:04d}"
+                elif op in _CONSTANT_OPERANDS:
+                    text += f" '{to_text(self.constants[operands[0]])}'"
+            out.append(text)
+            offset += 1 + count
+        return "\n".join(out)
+
+
+class Function:
+    """Derlenmiş fonksiyon (yerel Function karşılığı); `code` çalıştırma için listeye açılır"""
+    __slots__ = ('name', 'arity', 'chunk', 'upvalue_count', 'code')
+
+    def __init__(self, name, arity):
+        self.name = name
+        self.arity = arity
+        self.chunk = Chunk()
+        self.upvalue_count = 0
+        self.code = None
+
+    def __str__(self):
+        return f"<fonksiyon {self.name}>"
+
+
+class Closure:
+    """Fonksiyon + yakaladığı yukarı değerler"""
+    __slots__ = ('function', 'upvalues')
+
+    def __init__(self, function, upvalues):
+        self.function = function
+        self.upvalues = upvalues
+
+    @property
+    def name(self):
+        return self.function.name
+
+    def __str__(self):
+        return f"<fonksiyon {self.function.name}>"
+
+
+class Upvalue:
+    """
+    Yakalanan değişken. Açıkken `cell` VM yığınıdır ve `index` yuvayı gösterir;
+    kapsam kapanınca değer tek elemanlı listeye taşınır (okuma dalsız kalır).
+    """
+    __slots__ = ('cell', 'index')
+
+    def __init__(self, cell, index):
+        self.cell = cell
+        self.index = index
+
+
+class _Local:
+    __slots__ = ('name', 'depth', 'captured')
+
+    def __init__(self, name, depth):
+        self.name = name
+        self.depth = depth
+        self.captured = False
+
+
+class _Loop:
+    __slots__ = ('depth', 'tries', 'start', 'breaks', 'continues')
+
+    def __init__(self, depth, tries, start):
+        self.depth = depth      # Gövdenin dışındaki kapsam derinliği
+        self.tries = tries      # Döngü başında açık dene blokları
+        self.start = start      # devam hedefi (için döngüsünde sonradan yamanır)
+        self.breaks = []
+        self.continues = []
+
+
+class _FunctionState:
+    """Derlenmekte olan fonksiyonun yerelleri, yukarı değerleri ve döngüleri"""
+    __slots__ = ('enclosing', 'function', 'kind', 'locals', 'upvalues', 'scope_depth', 'loops', 'tries')
+
+    def __init__(self, enclosing, function, kind):
+        self.enclosing = enclosing
+        self.function = function
+        self.kind = kind  # 'script', 'function', 'method', 'initializer'
+        # Yuva 0: metotlarda alıcı nesne (öz), diğerlerinde çağrılan fonksiyon
+        self.locals = [_Local('öz' if kind in ('method', 'initializer') else '', 0)]
+        self.upvalues = []
+        self.scope_depth = 0
+        self.loops = []
+        self.tries = 0
+
+
+class BytecodeCompiler(NodeVisitor):
+    """
+    AST'yi Function/Chunk'lara derler. Kapsam derinliği 0'daki bildirimler
+    genel değişken tablosuna (isim -> indeks, VM ile ortak) gider; bloklar
+    ve fonksiyonlar içindekiler yığın yuvalarında yaşar, iç fonksiyonlar
+    onları yukarı değer olarak yakalar.
+    """
+
+    def __init__(self, vm, base_dir, trace=False):
+        super().__init__()
+        self.vm = vm
+        self.base_dir = base_dir
+        self.trace = trace
+        self._state = None
+        self._line = 0
+
+    def generic_visit(self, node):
+        raise GumusRuntimeError(f"Desteklenmeyen yapı: {type(node).__name__}", self._line)
+
+    def compile(self, program, name="<betik>"):
+        function = Function(name, 0)
+        self._state = _FunctionState(None, function, 'script')
+        self.statements(program.statements)
+        self._emit(OP_NIL)
+        self._emit(OP_RETURN)
+        self._state = None
+        return function
+
+    # --- Kod üretimi ---
+
+    def _emit(self, *words):
+        write = self._state.function.chunk.write
+        for word in words:
+            write(word, self._line)
+
+    def _constant(self, value):
+        return self._state.function.chunk.add_constant(value)
+
+    def _here(self):
+        return len(self._state.function.chunk.code)
+
+    def _emit_jump(self, op):
+        self._emit(op, 0)
+        return self._here() - 1
+
+    def _patch(self, position, target=None):
+        code = self._state.function.chunk.code
+        code[position] = self._here() if target is None else target
+
+    # --- Kapsamlar ve isim çözümleme ---
+
+    def _begin_scope(self):
+        self._state.scope_depth += 1
+
+    def _end_scope(self):
+        state = self._state
+        state.scope_depth -= 1
+        locals_ = state.locals
+        while len(locals_) > 1 and locals_[-1].depth > state.scope_depth:
+            self._emit(OP_CLOSE_UPVALUE if locals_.pop().captured else OP_POP)
+
+    def _discard_locals(self, depth):
+        """kır/devam: `depth`'ten derin yerelleri derleyici kaydını silmeden yığından atar"""
+        for local in reversed(self._state.locals):
+            if local.depth <= depth:
+                break
+            self._emit(OP_CLOSE_UPVALUE if local.captured else OP_POP)
+
+    @staticmethod
+    def _resolve_local(state, name):
+        locals_ = state.locals
+        for slot in range(len(locals_) - 1, -1, -1):
+            if locals_[slot].name == name:
+                return slot
+        return -1
+
+    def _resolve_upvalue(self, state, name):
+        if state.enclosing is None:
+            return -1
+        slot = self._resolve_local(state.enclosing, name)
+        if slot >= 0:
+            state.enclosing.locals[slot].captured = True
+            return self._add_upvalue(state, 1, slot)
+        index = self._resolve_upvalue(state.enclosing, name)
+        if index >= 0:
+            return self._add_upvalue(state, 0, index)
+        return -1
+
+    @staticmethod
+    def _add_upvalue(state, is_local, index):
+        for i, upvalue in enumerate(state.upvalues):
+            if upvalue == (is_local, index):
+                return i
+        state.upvalues.append((is_local, index))
+        return len(state.upvalues) - 1
+
+    def _load(self, name):
+        state = self._state
+        slot = self._resolve_local(state, name)
+        if slot >= 0:
+            self._emit(OP_GET_LOCAL, slot)
+            return
+        index = self._resolve_upvalue(state, name)
+        if index >= 0:
+            self._emit(OP_GET_UPVALUE, index)
+        else:
+            self._emit(OP_GET_GLOBAL, self.vm.global_slot(name))
+
+    def _store(self, name):
+        state = self._state
+        slot = self._resolve_local(state, name)
+        if slot >= 0:
+            self._emit(OP_SET_LOCAL, slot)
+            return
+        index = self._resolve_upvalue(state, name)
+        if index >= 0:
+            self._emit(OP_SET_UPVALUE, index)
+        else:
+            # Bildirilmemiş isme atama genel değişken tanımlar (GumusInterpreter ile aynı)
+            self._emit(OP_SET_GLOBAL, self.vm.global_slot(name))
+
+    def _is_global(self, name):
+        state = self._state
+        while state is not None:
+            if self._resolve_local(state, name) >= 0:
+                return False
+            state = state.enclosing
+        return True
+
+    def _define(self, name):
+        """Yığının tepesindeki değeri `name` olarak bildirir"""
+        state = self._state
+        if state.scope_depth == 0:
+            self._emit(OP_DEFINE_GLOBAL, self.vm.global_slot(name))
+            return
+        for slot in range(len(state.locals) - 1, 0, -1):
+            local = state.locals[slot]
+            if local.depth < state.scope_depth:
+                break
+            if local.name == name:
+                # Aynı kapsamda yeniden bildirim: eski yuvanın üzerine yazılır
+                self._emit(OP_SET_LOCAL, slot, OP_POP)
+                return
+        state.locals.append(_Local(name, state.scope_depth))
+
+    # --- Deyimler ---
+
+    def statements(self, nodes):
+        for node in nodes:
+            self._line = _node_line(node) or self._line
+            if self.trace:
+                names = tuple(local.name for local in self._state.locals)
+                self._emit(OP_DEBUG_LINE, self._constant((self._line, names)))
+            self.visit(node)
+
+    def _block(self, node):
+        self._begin_scope()
+        self.statements(node.statements if node.kind == BlockStmt.kind else [node])
+        self._end_scope()
+
+    def visit_BlockStmt(self, node):
+        self._block(node)
+
+    def visit_ExprStmt(self, node):
+        expr = node.expression
+        if expr.kind == AssignExpr.kind and self._is_global(expr.name.value):
+            # Genel değişkene atama deyimi: OP_SET_GLOBAL + OP_POP yerine tek kod
+            self.visit(expr.value)
+            self._emit(OP_DEFINE_GLOBAL, self.vm.global_slot(expr.name.value))
+            return
+        self.visit(expr)
+        self._emit(OP_POP)
+
+    def visit_PrintStmt(self, node):
+        first, *rest = node.expressions
+        self.visit(first)
+        if rest:
+            space = self._constant(" ")
+            for expr in rest:
+                self._emit(OP_CONSTANT, space, OP_STRING_CONCAT)
+                self.visit(expr)
+                self._emit(OP_STRING_CONCAT)
+        self._emit(OP_PRINT)
+
+    def visit_VarStmt(self, node):
+        if node.initializer is not None:
+            self.visit(node.initializer)
+        else:
+            self._emit(OP_NIL)
+        self._define(node.name.value)
+
+    def visit_FunctionStmt(self, node):
+        name = node.name.value
+        state = self._state
+        if state.scope_depth > 0:
+            # Özyineleme için isim gövdeden önce yerel olarak bildirilir
+            self._emit(OP_NIL)
+            self._define(name)
+            self._function(node, 'function')
+            self._store(name)
+            self._emit(OP_POP)
+        else:
+            self._function(node, 'function')
+            self._define(name)
+
+    def _function(self, node, kind):
+        line = self._line
+        function = Function(node.name.value, len(node.params))
+        state = _FunctionState(self._state, function, kind)
+        self._state = state
+        state.scope_depth = 1
+        for param in node.params:
+            state.locals.append(_Local(param.value, 1))
+        self.statements(node.body.statements)
+        if kind == 'initializer':
+            self._emit(OP_GET_LOCAL, 0)
+        else:
+            self._emit(OP_NIL)
+        self._emit(OP_RETURN)
+        function.upvalue_count = len(state.upvalues)
+        self._state = state.enclosing
+        self._line = line
+
+        self._emit(OP_CLOSURE, self._constant(function))
+        for is_local, index in state.upvalues:
+            self._emit(is_local, index)
+
+    def visit_ClassStmt(self, node):
+        name = node.name.value
+        self._emit(OP_CLASS, self._constant(name))
+        self._define(name)
+        if node.superclass is not None:
+            self.visit(node.superclass)
+            self._begin_scope()
+            self._state.locals.append(_Local('ata', self._state.scope_depth))
+            self._load(name)
+            self._emit(OP_INHERIT)
+        self._load(name)
+        for method in node.methods:
+            method_name = method.name.value
+            self._function(method, 'initializer' if method_name == 'kurucu' else 'method')
+            self._emit(OP_METHOD, self._constant(method_name))
+        self._emit(OP_POP)
+        if node.superclass is not None:
+            self._end_scope()
+
+    def visit_IfStmt(self, node):
+        self.visit(node.condition)
+        then_jump = self._emit_jump(OP_JUMP_IF_FALSE)
+        self._emit(OP_POP)
+        self._block(node.then_branch)
+        else_jump = self._emit_jump(OP_JUMP)
+        self._patch(then_jump)
+        self._emit(OP_POP)
+        if node.else_branch is not None:
+            self._block(node.else_branch)
+        self._patch(else_jump)
+
+    def _loop_body(self, body, start):
+        state = self._state
+        loop = _Loop(state.scope_depth, state.tries, start)
+        state.loops.append(loop)
+        self._block(body)
+        state.loops.pop()
+        return loop
+
+    def visit_WhileStmt(self, node):
+        start = self._here()
+        self.visit(node.condition)
+        exit_jump = self._emit_jump(OP_JUMP_IF_FALSE)
+        self._emit(OP_POP)
+        loop = self._loop_body(node.body, start)
+        self._emit(OP_LOOP, start)
+        self._patch(exit_jump)
+        self._emit(OP_POP)
+        for jump in loop.breaks:
+            self._patch(jump)
+
+    def visit_ForStmt(self, node):
+        self._begin_scope()
+        if node.initializer is not None:
+            self.visit(node.initializer)
+        start = self._here()
+        exit_jump = None
+        if node.condition is not None:
+            self.visit(node.condition)
+            exit_jump = self._emit_jump(OP_JUMP_IF_FALSE)
+            self._emit(OP_POP)
+        loop = self._loop_body(node.body, None)
+        for jump in loop.continues:
+            self._patch(jump)
+        if node.increment is not None:
+            self.visit(node.increment)
+            self._emit(OP_POP)
+        self._emit(OP_LOOP, start)
+        if exit_jump is not None:
+            self._patch(exit_jump)
+            self._emit(OP_POP)
+        for jump in loop.breaks:
+            self._patch(jump)
+        self._end_scope()
+
+    def _leave_loop(self):
+        state = self._state
+        if not state.loops:
+            raise GumusRuntimeError("'kır' ve 'devam' sadece döngü içinde kullanılabilir.", self._line)
+        loop = state.loops[-1]
+        self._discard_locals(loop.depth)
+        for _ in range(state.tries - loop.tries):
+            self._emit(OP_END_TRY)
+        return loop
+
+    def visit_BreakStmt(self, node):
+        loop = self._leave_loop()
+        loop.breaks.append(self._emit_jump(OP_JUMP))
+
+    def visit_ContinueStmt(self, node):
+        loop = self._leave_loop()
+        if loop.start is None:
+            loop.continues.append(self._emit_jump(OP_JUMP))
+        else:
+            self._emit(OP_LOOP, loop.start)
+
+    def visit_ReturnStmt(self, node):
+        if node.value is not None:
+            self.visit(node.value)
+            if self._state.kind == 'initializer':
+                self._emit(OP_POP, OP_GET_LOCAL, 0)  # kurucu her zaman nesneyi döner
+        elif self._state.kind == 'initializer':
+            self._emit(OP_GET_LOCAL, 0)
+        else:
+            self._emit(OP_NIL)
+        self._emit(OP_RETURN)
+
+    def visit_IncludeStmt(self, node):
+        self._emit(OP_INCLUDE, self._constant((node.module, self.base_dir)))
+
+    def visit_TryStmt(self, node):
+        state = self._state
+        handler = self._emit_jump(OP_TRY)
+        state.tries += 1
+        self._block(node.try_block)
+        state.tries -= 1
+        self._emit(OP_END_TRY)
+        end_jump = self._emit_jump(OP_JUMP)
+        # Yakala: VM hata mesajını yığına koyup buraya atlar
+        self._patch(handler)
+        self._begin_scope()
+        if node.catch_name is not None:
+            state.locals.append(_Local(node.catch_name.value, state.scope_depth))
+        else:
+            self._emit(OP_POP)
+        body = node.catch_body
+        self.statements(body.statements if body.kind == BlockStmt.kind else [body])
+        self._end_scope()
+        self._patch(end_jump)
+
+    # --- İfadeler ---
+
+    def visit_Literal(self, node):
+        value = node.value
+        if value is None:
+            self._emit(OP_NIL)
+        elif value is True:
+            self._emit(OP_TRUE)
+        elif value is False:
+            self._emit(OP_FALSE)
+        else:
+            if value.__class__ is str:
+                value = decode_escapes(value)
+            self._emit(OP_CONSTANT, self._constant(value))
+
+    def visit_Variable(self, node):
+        self._line = node.name.line or self._line
+        self._load(node.name.value)
+
+    def visit_ThisExpr(self, node):
+        self._load('öz')
+
+    def visit_SuperExpr(self, node):
+        self._load('öz')
+        self._load('ata')
+        self._emit(OP_GET_SUPER, self._constant(node.method.value))
+
+    def visit_AssignExpr(self, node):
+        self.visit(node.value)
+        self._store(node.name.value)
+
+    def visit_UnaryExpr(self, node):
+        self.visit(node.right)
+        self._line = node.operator.line or self._line
+        self._emit(OP_NOT if node.operator.value == '!' else OP_NEGATE)
+
+    def visit_BinaryExpr(self, node):
+        self.visit(node.left)
+        self.visit(node.right)
+        self._line = node.operator.line or self._line
+        self._emit(_BINARY_OPS[node.operator.value])
+
+    def visit_LogicalExpr(self, node):
+        self.visit(node.left)
+        jump = self._emit_jump(OP_JUMP_IF_TRUE if node.operator.value == 'veya' else OP_JUMP_IF_FALSE)
+        self._emit(OP_POP)
+        self.visit(node.right)
+        self._patch(jump)
+
+    def visit_CallExpr(self, node):
+        callee, args = node.callee, node.args
+        if callee.kind == GetExpr.kind:
+            self.visit(callee.object)
+            for arg in args:
+                self.visit(arg)
+            self._line = callee.name.line or self._line
+            self._emit(OP_INVOKE, self._constant(callee.name.value), len(args))
+        elif callee.kind == SuperExpr.kind:
+            self._load('öz')
+            for arg in args:
+                self.visit(arg)
+            self._load('ata')
+            self._emit(OP_SUPER_INVOKE, self._constant(callee.method.value), len(args))
+        else:
+            self.visit(callee)
+            for arg in args:
+                self.visit(arg)
+            self._emit(OP_CALL, len(args))
+
+    def visit_NewExpr(self, node):
+        self.visit(node.callee)
+        self._emit(OP_NEW)
+        for arg in node.args:
+            self.visit(arg)
+        self._emit(OP_CALL, len(node.args))
+
+    def visit_GetExpr(self, node):
+        self.visit(node.object)
+        self._line = node.name.line or self._line
+        self._emit(OP_GET_PROPERTY, self._constant(node.name.value))
+
+    def visit_SetExpr(self, node):
+        self.visit(node.object)
+        self.visit(node.value)
+        self._line = node.name.line or self._line
+        self._emit(OP_SET_PROPERTY, self._constant(node.name.value))
+
+    def visit_IndexExpr(self, node):
+        self.visit(node.object)
+        self.visit(node.index)
+        self._emit(OP_ARRAY_GET)
+
+    def visit_IndexSetExpr(self, node):
+        self.visit(node.object)
+        self.visit(node.index)
+        self.visit(node.value)
+        self._emit(OP_ARRAY_SET)
+
+    def visit_ListExpr(self, node):
+        for element in node.elements:
+            self.visit(element)
+        self._emit(OP_ARRAY_NEW, len(node.elements))
+
+    def visit_DictExpr(self, node):
+        for key, value in zip(node.keys, node.values):
+            self._emit(OP_CONSTANT, self._constant(decode_escapes(key.value)))
+            self.visit(value)
+        self._emit(OP_MAP_NEW, len(node.keys))
+
+
+def _operand_error(symbol, a, b):
+    return GumusRuntimeError(f"'{symbol}' işlemi {type_name(a)} ve {type_name(b)} ile yapılamaz.")
+
+
+def _arity_error(function, argc):
+    return GumusRuntimeError(
+        f"Fonksiyon '{function.name}': Beklenen parametre {function.arity} ama alınan {argc}.")
+
+
+class GumusVM:
+    """
+    Yığın makinesi. GumusInterpreter ile aynı sözleşme: çıktı
+    `output_callback`'e gider, hatalar "Simülasyon Hatası (Satır N): ..."
+    olarak loglanır, trace_enabled açıksa her deyimde __TRACE__/__VARS__ gönderilir.
+    error_callback verilirse hata mesajları program çıktısından ayrı oraya gider.
+    """
+
+    def __init__(self, output_callback=None, search_root=None, error_callback=None):
+        self.output_callback = output_callback if output_callback else print
+        self.error_callback = error_callback
+        self.search_root = Path(search_root) if search_root else PROJECT_ROOT
+        self.running = True
+        self.trace_enabled = False
+        self.execution_delay = 0.05
+        self.optimize = False  # Sabit katlama / ölü kod aşaması (bkz. optimizer.py)
+        self.optimization_stats = OptimizationStats()
+        self.stack = []
+        self.frames = []       # Çağıranların kayıtları: (closure, kod, sabitler, satırlar, ip, taban)
+        self.handlers = []     # Açık dene blokları: (çerçeve derinliği, yığın yüksekliği, hedef)
+        self.open_upvalues = {}
+        self.global_names = []
+        self.globals = []
+        self._global_index = {}
+        self._builtins = make_builtins()
+        for name, value in self._builtins.items():
+            self.globals[self.global_slot(name)] = value
+        self._included = set()
+        self._trace = False
+
+    def global_slot(self, name):
+        """Genel değişkenin tablo indeksi (derleyici ilk görüşte yer açar)"""
+        index = self._global_index.get(name)
+        if index is None:
+            index = self._global_index[name] = len(self.global_names)
+            self.global_names.append(name)
+            self.globals.append(_UNDEFINED)
+        return index
+
+    @property
+    def variables(self):
+        """Kullanıcının genel değişkenleri (yerleşikler hariç)"""
+        builtins = self._builtins
+        return {name: value for name, value in zip(self.global_names, self.globals)
+                if value is not _UNDEFINED and value is not builtins.get(name, _UNDEFINED)}
+
+    def log(self, message):
+        if self.output_callback:
+            self.output_callback(str(message))
+
+    def error(self, message):
+        (self.error_callback or self.log)(str(message))
+
+    def stop(self):
+        self.running = False
+
+    def compile(self, program, base_dir=None, name="<betik>"):
+        base_dir = str(base_dir) if base_dir else str(Path.cwd())
+        if self.optimize and not self._trace:
+            program, _ = optimize(program, self.optimization_stats)
+        return BytecodeCompiler(self, base_dir, trace=self._trace).compile(program, name)
+
+    def run(self, code, base_dir=None):
+        """Kaynağı derleyip çalıştırır; başarılıysa True döner"""
+        program = parse_source(code)
+        if program.diagnostics:
+            for diag in program.diagnostics:
+                self.error(f"Sözdizimi Hatası (Satır {diag.line}): {diag.message}")
+            return False
+        return self.run_program(program, base_dir)
+
+    def run_file(self, path):
+        path = Path(path).resolve()
+        self._included.add(str(path))
+        return self.run(read_source(path), path.parent)
+
+    def run_program(self, program, base_dir=None):
+        self.running = True
+        self._trace = self.trace_enabled
+        self.optimization_stats = OptimizationStats()
+        try:
+            self.execute(Closure(self.compile(program, base_dir), ()))
+            return True
+        except _Halt:
+            self.error("Simülasyon durduruldu.")
+        except Exception as error:
+            error = locate(error, None)
+            where = f" (Satır {error.line})" if error.line else ""
+            self.error(f"Simülasyon Hatası{where}: {error.message}")
+        finally:
+            del self.stack[:], self.frames[:], self.handlers[:]
+            self.open_upvalues.clear()
+        return False
+
+    # --- Çalışma zamanı yardımcıları ---
+
+    def _capture(self, index):
+        upvalue = self.open_upvalues.get(index)
+        if upvalue is None:
+            upvalue = self.open_upvalues[index] = Upvalue(self.stack, index)
+        return upvalue
+
+    def _close_upvalues(self, last):
+        stack, open_upvalues = self.stack, self.open_upvalues
+        for index in [i for i in open_upvalues if i >= last]:
+            upvalue = open_upvalues.pop(index)
+            upvalue.cell = [stack[index]]
+            upvalue.index = 0
+
+    def _call_value(self, callee, argc):
+        """
+        Kapanış olmayan çağrılabilirler. Yeni çerçeve gerekiyorsa (sınıf kurucusu,
+        bağlı metot) girilecek Closure'ı döner; yerleşikler sonucu yığına koyup None döner.
+        """
+        stack = self.stack
+        cls = callee.__class__
+        if cls is GumusClass:
+            stack[-argc - 1] = GumusInstance(callee)
+            init = callee.methods.get('kurucu')
+            if init is not None:
+                return init
+            if argc:
+                raise GumusRuntimeError(f"Sınıf '{callee.name}': kurucu yok ama {argc} parametre verildi.")
+            return None
+        if cls is BoundMethod:
+            stack[-argc - 1] = callee.instance
+            return callee.function
+        if not callable(callee):
+            raise GumusRuntimeError(
+                f"Sadece fonksiyonlar ve sınıflar çağrılabilir ({type_name(callee)} değil).")
+        args = stack[len(stack) - argc:]
+        del stack[-argc - 1:]
+        stack.append(callee(*args))
+        return None
+
+    def _invoke(self, name, argc):
+        """obj.metot(...) çağrısı; _call_value gibi girilecek Closure'ı veya None döner"""
+        stack = self.stack
+        receiver = stack[-argc - 1]
+        cls = receiver.__class__
+        if cls is GumusInstance:
+            field = receiver.get(name, _UNDEFINED)
+            if field is _UNDEFINED:
+                method = receiver.klass.methods.get(name)
+                if method is None:
+                    raise GumusRuntimeError(f"'{receiver.klass.name}' nesnesinde '{name}' metodu yok.")
+                return method
+            stack[-argc - 1] = field
+            if field.__class__ is Closure:
+                return field
+            if not callable(field) and field.__class__ not in (GumusClass, BoundMethod):
+                raise GumusRuntimeError(f"'{name}' bir fonksiyon değil.")
+            return self._call_value(field, argc)
+        handler = TYPE_METHODS.get(cls, {}).get(name)
+        if handler is None:
+            raise GumusRuntimeError(f"{type_name(receiver)} değerinin '{name}' metodu yok.")
+        args = stack[len(stack) - argc:]
+        del stack[-argc - 1:]
+        stack.append(handler(receiver, *args))
+        return None
+
+    def _get_property(self, obj, name):
+        if obj.__class__ is GumusInstance:
+            value = obj.get(name, _UNDEFINED)
+            if value is not _UNDEFINED:
+                return value
+            method = obj.klass.methods.get(name)
+            if method is not None:
+                return BoundMethod(method, obj)
+            raise GumusRuntimeError(f"'{obj.klass.name}' nesnesinde '{name}' özelliği yok.")
+        handler = TYPE_METHODS.get(obj.__class__, {}).get(name)
+        if handler is None:
+            raise GumusRuntimeError(f"{type_name(obj)} değerinin '{name}' özelliği yok.")
+        return partial(handler, obj)
+
+    def _include(self, module, base_dir):
+        candidate = find_module(module, base_dir, self.search_root)
+        if candidate is None:
+            raise GumusRuntimeError(f"Modül bulunamadı: {module}")
+        key = str(candidate)
+        if key in self._included:
+            return
+        self._included.add(key)
+        program = parse_source(read_source(candidate))
+        if program.diagnostics:
+            first = program.diagnostics[0]
+            raise GumusRuntimeError(f"Modül ayrıştırılamadı: {module} (Satır {first.line}: {first.message})")
+        try:
+            self.execute(Closure(self.compile(program, candidate.parent, module), ()))
+        except GumusRuntimeError as error:
+            error.message = f"{module}: {error.message}"
+            raise
+
+    def _trace_line(self, line, names, base):
+        if not self.running:
+            raise _Halt()
+        visible = self.variables
+        stack = self.stack
+        for slot, name in enumerate(names):
+            if name and base + slot < len(stack):
+                visible[name] = stack[base + slot]
+        report_line(self.log, line, visible, self.execution_delay)
+
+    # --- Dağıtım döngüsü ---
+
+    def execute(self, closure):
+        """Kapanışı argümansız çalıştırır ve dönüş değerini verir"""
+        stack, frames, handlers = self.stack, self.frames, self.handlers
+        globals_, names = self.globals, self.global_names
+        push, pop = stack.append, stack.pop
+        log = self.log
+        stop = len(frames)
+
+        stack.append(closure)
+        function = closure.function
+        if function.code is None:
+            function.code = function.chunk.code.tolist()
+        code, constants, lines = function.code, function.chunk.constants, function.chunk.lines
+        base = len(stack) - 1
+        ip = 0
+
+        while True:
+            try:
+                while True:
+                    op = code[ip]
+                    ip += 1
+                    if op == OP_GET_LOCAL:
+                        push(stack[base + code[ip]])
+                        ip += 1
+                    elif op == OP_GET_GLOBAL:
+                        value = globals_[code[ip]]
+                        if value is _UNDEFINED:
+                            raise GumusRuntimeError(f"Tanımsız değişken veya fonksiyon: '{names[code[ip]]}'")
+                        push(value)
+                        ip += 1
+                    elif op == OP_CONSTANT:
+                        push(constants[code[ip]])
+                        ip += 1
+                    elif op == OP_POP:
+                        pop()
+                    elif op == OP_SET_LOCAL:
+                        stack[base + code[ip]] = stack[-1]
+                        ip += 1
+                    elif op == OP_JUMP_IF_FALSE:
+                        value = stack[-1]
+                        if value is False or value is None or (value.__class__ is int and value == 0):
+                            ip = code[ip]
+                        else:
+                            ip += 1
+                    elif op == OP_LESS:
+                        b = pop()
+                        a = stack[-1]
+                        try:
+                            stack[-1] = a < b
+                        except TypeError:
+                            raise _operand_error('<', a, b) from None
+                    elif op == OP_ADD:
+                        b = pop()
+                        a = stack[-1]
+                        try:
+                            stack[-1] = a + b
+                        except TypeError:
+                            if a.__class__ is str or b.__class__ is str:
+                                stack[-1] = to_text(a) + to_text(b)
+                            else:
+                                raise _operand_error('+', a, b) from None
+                    elif op == OP_LOOP:
+                        if not self.running:
+                            raise _Halt()
+                        ip = code[ip]
+                    elif op == OP_SET_GLOBAL:
+                        globals_[code[ip]] = stack[-1]
+                        ip += 1
+                    elif op == OP_CALL:
+                        argc = code[ip]
+                        ip += 1
+                        callee = stack[-argc - 1]
+                        if callee.__class__ is not Closure:
+                            callee = self._call_value(callee, argc)
+                            if callee is None:
+                                continue
+                        function = callee.function
+                        if function.arity != argc:
+                            raise _arity_error(function, argc)
+                        if len(frames) >= FRAMES_MAX:
+                            raise GumusRuntimeError(_RECURSION_MESSAGE)
+                        frames.append((closure, code, constants, lines, ip, base))
+                        closure = callee
+                        if function.code is None:
+                            function.code = function.chunk.code.tolist()
+                        code, constants, lines = function.code, function.chunk.constants, function.chunk.lines
+                        base = len(stack) - argc - 1
+                        ip = 0
+                    elif op == OP_RETURN:
+                        result = pop()
+                        if self.open_upvalues:
+                            self._close_upvalues(base)
+                        depth = len(frames)
+                        while handlers and handlers[-1][0] >= depth:
+                            handlers.pop()  # dene bloğunun içinden dön
+                        del stack[base:]
+                        if depth == stop:
+                            return result
+                        closure, code, constants, lines, ip, base = frames.pop()
+                        push(result)
+                    elif op == OP_SUBTRACT:
+                        b = pop()
+                        a = stack[-1]
+                        try:
+                            stack[-1] = a - b
+                        except TypeError:
+                            raise _operand_error('-', a, b) from None
+                    elif op == OP_EQUAL:
+                        b = pop()
+                        stack[-1] = stack[-1] == b
+                    elif op == OP_GET_UPVALUE:
+                        upvalue = closure.upvalues[code[ip]]
+                        push(upvalue.cell[upvalue.index])
+                        ip += 1
+                    elif op == OP_MULTIPLY:
+                        b = pop()
+                        a = stack[-1]
+                        try:
+                            stack[-1] = a * b
+                        except TypeError:
+                            raise _operand_error('*', a, b) from None
+                    elif op == OP_GREATER:
+                        b = pop()
+                        a = stack[-1]
+                        try:
+                            stack[-1] = a > b
+                        except TypeError:
+                            raise _operand_error('>', a, b) from None
+                    elif op == OP_LESS_EQUAL:
+                        b = pop()
+                        a = stack[-1]
+                        try:
+                            stack[-1] = a <= b
+                        except TypeError:
+                            raise _operand_error('<=', a, b) from None
+                    elif op == OP_GREATER_EQUAL:
+                        b = pop()
+                        a = stack[-1]
+                        try:
+                            stack[-1] = a >= b
+                        except TypeError:
+                            raise _operand_error('>=', a, b) from None
+                    elif op == OP_NOT_EQUAL:
+                        b = pop()
+                        stack[-1] = stack[-1] != b
+                    elif op == OP_MODULO:
+                        b = pop()
+                        a = stack[-1]
+                        try:
+                            stack[-1] = _modulo(a, b)
+                        except TypeError:
+                            raise _operand_error('%', a, b) from None
+                    elif op == OP_DIVIDE:
+                        b = pop()
+                        a = stack[-1]
+                        try:
+                            stack[-1] = _divide(a, b)
+                        except TypeError:
+                            raise _operand_error('/', a, b) from None
+                    elif op == OP_JUMP:
+                        ip = code[ip]
+                    elif op == OP_JUMP_IF_TRUE:
+                        value = stack[-1]
+                        if value is False or value is None or (value.__class__ is int and value == 0):
+                            ip += 1
+                        else:
+                            ip = code[ip]
+                    elif op == OP_NOT:
+                        value = stack[-1]
+                        stack[-1] = value is False or value is None or (value.__class__ is int and value == 0)
+                    elif op == OP_NEGATE:
+                        value = stack[-1]
+                        try:
+                            stack[-1] = -value
+                        except TypeError:
+                            raise GumusRuntimeError(f"'-' işlemi {type_name(value)} ile yapılamaz.") from None
+                    elif op == OP_INVOKE or op == OP_SUPER_INVOKE:
+                        name = constants[code[ip]]
+                        argc = code[ip + 1]
+                        ip += 2
+                        if op == OP_INVOKE:
+                            callee = self._invoke(name, argc)
+                            if callee is None:
+                                continue
+                        else:
+                            superclass = pop()
+                            callee = superclass.methods.get(name)
+                            if callee is None:
+                                raise GumusRuntimeError(f"Üst sınıfta '{name}' metodu bulunamadı.")
+                        function = callee.function
+                        if function.arity != argc:
+                            raise _arity_error(function, argc)
+                        if len(frames) >= FRAMES_MAX:
+                            raise GumusRuntimeError(_RECURSION_MESSAGE)
+                        frames.append((closure, code, constants, lines, ip, base))
+                        closure = callee
+                        if function.code is None:
+                            function.code = function.chunk.code.tolist()
+                        code, constants, lines = function.code, function.chunk.constants, function.chunk.lines
+                        base = len(stack) - argc - 1
+                        ip = 0
+                    elif op == OP_GET_PROPERTY:
+                        stack[-1] = self._get_property(stack[-1], constants[code[ip]])
+                        ip += 1
+                    elif op == OP_SET_PROPERTY:
+                        value = pop()
+                        obj = stack[-1]
+                        if obj.__class__ is not GumusInstance:
+                            raise GumusRuntimeError(
+                                f"Sadece nesnelerin özellikleri atanabilir ({type_name(obj)} değil).")
+                        obj.set(constants[code[ip]], value)
+                        stack[-1] = value
+                        ip += 1
+                    elif op == OP_ARRAY_GET:
+                        key = pop()
+                        obj = stack[-1]
+                        try:
+                            stack[-1] = obj[key]
+                        except (IndexError, KeyError, TypeError) as error:
+                            if obj.__class__ not in (list, str, dict):
+                                raise GumusRuntimeError(
+                                    "Sadece listeler, metinler ve sözlükler indekslenebilir.") from None
+                            raise locate(error, None) from None
+                    elif op == OP_ARRAY_SET:
+                        value = pop()
+                        key = pop()
+                        obj = stack[-1]
+                        if obj.__class__ not in (list, dict):
+                            raise GumusRuntimeError("Sadece listelere ve sözlüklere indeks ile atama yapılabilir.")
+                        obj[key] = value
+                        stack[-1] = value
+                    elif op == OP_SET_UPVALUE:
+                        upvalue = closure.upvalues[code[ip]]
+                        upvalue.cell[upvalue.index] = stack[-1]
+                        ip += 1
+                    elif op == OP_NIL:
+                        push(None)
+                    elif op == OP_TRUE:
+                        push(True)
+                    elif op == OP_FALSE:
+                        push(False)
+                    elif op == OP_PRINT:
+                        log(to_text(pop()))
+                    elif op == OP_STRING_CONCAT:
+                        b = pop()
+                        stack[-1] = to_text(stack[-1]) + to_text(b)
+                    elif op == OP_NEW:
+                        if stack[-1].__class__ is not GumusClass:
+                            raise GumusRuntimeError("'yeni' sadece sınıflarla kullanılabilir.")
+                    elif op == OP_ARRAY_NEW:
+                        count = code[ip]
+                        ip += 1
+                        if count:
+                            items = stack[-count:]
+                            del stack[-count:]
+                            push(items)
+                        else:
+                            push([])
+                    elif op == OP_MAP_NEW:
+                        count = 2 * code[ip]
+                        ip += 1
+                        items = stack[len(stack) - count:]
+                        del stack[len(stack) - count:]
+                        push(dict(zip(items[::2], items[1::2])))
+                    elif op == OP_DEFINE_GLOBAL:
+                        globals_[code[ip]] = pop()
+                        ip += 1
+                    elif op == OP_CLOSURE:
+                        function = constants[code[ip]]
+                        ip += 1
+                        upvalues = []
+                        for _ in range(function.upvalue_count):
+                            is_local, index = code[ip], code[ip + 1]
+                            ip += 2
+                            upvalues.append(self._capture(base + index) if is_local else closure.upvalues[index])
+                        push(Closure(function, upvalues))
+                    elif op == OP_CLOSE_UPVALUE:
+                        self._close_upvalues(len(stack) - 1)
+                        pop()
+                    elif op == OP_GET_SUPER:
+                        superclass = pop()
+                        name = constants[code[ip]]
+                        ip += 1
+                        method = superclass.methods.get(name)
+                        if method is None:
+                            raise GumusRuntimeError(f"Üst sınıfta '{name}' metodu bulunamadı.")
+                        stack[-1] = BoundMethod(method, stack[-1])
+                    elif op == OP_CLASS:
+                        push(GumusClass(constants[code[ip]], None, {}))
+                        ip += 1
+                    elif op == OP_INHERIT:
+                        subclass = pop()
+                        superclass = stack[-1]
+                        if superclass.__class__ is not GumusClass:
+                            raise GumusRuntimeError("Üst sınıf bir sınıf olmalıdır.")
+                        subclass.superclass = superclass
+                        subclass.methods.update(superclass.methods)
+                    elif op == OP_METHOD:
+                        method = pop()
+                        stack[-1].methods[constants[code[ip]]] = method
+                        ip += 1
+                    elif op == OP_TRY:
+                        handlers.append((len(frames), len(stack), code[ip]))
+                        ip += 1
+                    elif op == OP_END_TRY:
+                        handlers.pop()
+                    elif op == OP_INCLUDE:
+                        module, folder = constants[code[ip]]
+                        ip += 1
+                        self._include(module, folder)
+                    elif op == OP_DEBUG_LINE:
+                        line, local_names = constants[code[ip]]
+                        ip += 1
+                        self._trace_line(line, local_names, base)
+                    elif op == OP_DUP:
+                        push(stack[-1])
+                    elif op == OP_SWAP:
+                        stack[-1], stack[-2] = stack[-2], stack[-1]
+                    elif op == OP_NOP:
+                        pass
+                    elif op == OP_HALT:
+                        del stack[base:]
+                        del frames[stop:]
+                        return None
+                    else:
+                        raise GumusRuntimeError(f"Bilinmeyen işlem kodu: {OPCODE_NAMES.get(op, op)}")
+            except Exception as error:
+                error = locate(error, lines[ip - 1] if ip else None)
+                if not handlers or handlers[-1][0] < stop:
+                    del frames[stop:]
+                    raise error
+                # En içteki dene bloğunun çerçevesine ve yığın yüksekliğine dönülür
+                depth, height, target = handlers.pop()
+                if len(frames) > depth:
+                    closure, code, constants, lines, ip, base = frames[depth]
+                    del frames[depth:]
+                if self.open_upvalues:
+                    self._close_upvalues(height)
+                del stack[height:]
+                push(error.message)
+                ip = target
+
@@ -0,0 +1,336 @@
+# -*- coding: utf-8 -*-
+"""
+Sıcak Çalıştırma İşçileri (Worker Pool)
+Her Çalıştır'da run_simulator.py için yeni bir Python süreci başlatmak,
+yorumlayıcının açılışını ve tokenizer/parser/VM modüllerinin içe aktarımını
+her seferinde yeniden öder. Havuz, SecureSubprocessManager üzerinden önceden
+başlatılmış run_worker.py süreçleri tutar; bu süreçler modülleri yüklemiş
+olarak stdin'den bir iş satırı bekler:
+
+    {"file": "<kaynak.tr>", "flags": ["--trace"]}\\n
+
+İş satırından sonra stdin programın girdisidir (girdi()). İşçi programı
+run_simulator.main() ile çalıştırır ve bitişte stdout ile stderr'e
+RUN_END_MARKER + "<jeton>:<çıkış kodu>" satırı yazar. WorkerRun bu satırı
+akıştan ayıklar; tüketici için subprocess.Popen gibi davranır (stdout/stderr
+satır satır okunur, wait/poll/terminate/kill).
+
+Geri dönüşüm: bir işçi `max_runs` çalıştırmadan sonra kapanır (varsayılan 1:
+her çalıştırma temiz bir süreçte olur, yenisi arka planda hazırlanır).
+Yeni bir çalıştırma başlatıldığında önceki hâlâ sürüyorsa işçisi öldürülerek
+iptal edilir.
+"""
+import atexit
+import json
+import secrets
+import subprocess
+import sys
+import threading
+
+from ..config import PROJECT_ROOT
+from .secure_subprocess import SecureSubprocessManager, SecurityLevel, SecurityError
+
+WORKER_SCRIPT = PROJECT_ROOT / "src" / "ide" / "core" / "run_worker.py"
+RUN_END_MARKER = "__GUMUS_WORKER_END__"
+
+# Hazırda bekletilen işçi sayısı ve işçi başına çalıştırma sayısı
+POOL_SIZE = 1
+MAX_RUNS_PER_WORKER = 1
+
+# İşçi süreçlerine (Linux) uygulanan bellek sınırı ve çalıştırma başına CPU süresi
+WORKER_MEMORY_MB = 1024
+WORKER_CPU_SECONDS = 60
+
+
+class _Worker:
+    """Havuzdaki tek bir run_worker.py süreci"""
+    __slots__ = ('process', 'token', 'runs', 'reusable')
+
+    def __init__(self, process, token):
+        self.process = process
+        self.token = token
+        self.runs = 0
+        self.reusable = True  # stdin kapatılırsa yeni iş satırı gönderilemez
+
+    def alive(self):
+        return self.process.poll() is None
+
+    def kill(self, close_output=True):
+        """Süreci sonlandırır; okuyan iş parçacığı varsa çıktı akışları ona bırakılır"""
+        try:
+            if self.process.poll() is None:
+                self.process.kill()
+            self.process.wait()
+        except OSError:
+            pass
+        streams = [self.process.stdin]
+        if close_output:
+            streams += [self.process.stdout, self.process.stderr]
+        for stream in streams:
+            try:
+                stream.close()
+            except (OSError, ValueError):
+                pass
+
+
+class _RunStream:
+    """İşçinin stdout/stderr'i: bu çalıştırmanın bitiş satırında dosya sonu verir"""
+
+    def __init__(self, run, stream):
+        self._run = run
+        self._stream = stream
+        self._marker = f"{RUN_END_MARKER}{run.worker.token}:"
+        self.closed = False
+
+    def readline(self):
+        if self.closed:
+            return ''
+        try:
+            line = self._stream.readline()
+        except (OSError, ValueError):
+            line = ''
+        if not line:
+            self.closed = True
+            try:
+                self._stream.close()
+            except (OSError, ValueError):
+                pass
+            self._run._stream_finished(self, None)  # İşçi öldü veya iptal edildi
+            return ''
+        if self._marker in line:
+            # Program satırı yeni satırsız bitirdiyse işaret aynı satırda gelir
+            line, code = line.split(self._marker, 1)
+            self.closed = True
+            try:
+                code = int(code.strip())
+            except ValueError:
+                code = 1
+            self._run._stream_finished(self, code)
+        return line
+
+    def __iter__(self):
+        return iter(self.readline, '')
+
+    def read(self):
+        return ''.join(self)
+
+    def close(self):
+        self.closed = True
+
+
+class _RunInput:
+    """Çalıştırmanın stdin'i; çalıştırma bittikten sonra yazılanlar işçiye gitmez"""
+
+    def __init__(self, run):
+        self._run = run
+        self._stream = run.worker.process.stdin
+
+    def write(self, text):
+        if self._run.returncode is not None:
+            return 0
+        return self._stream.write(text)
+
+    def flush(self):
+        if self._run.returncode is None:
+            self._stream.flush()
+
+    def close(self):
+        # Programa dosya sonu gönderir; işçi artık yeni iş alamaz
+        self._run.worker.reusable = False
+        try:
+            self._stream.close()
+        except (OSError, ValueError):
+            pass
+
+
+class WorkerRun:
+    """Bir işçide süren tek çalıştırma; subprocess.Popen ile aynı kullanım"""
+
+    def __init__(self, pool, worker, args):
+        self.pool = pool
+        self.worker = worker
+        self.args = args
+        self.pid = worker.process.pid
+        self.returncode = None
+        self.stdin = _RunInput(self)
+        self.stdout = _RunStream(self, worker.process.stdout)
+        self.stderr = _RunStream(self, worker.process.stderr)
+        self._pending = 2   # Bitiş satırı beklenen akışlar
+        self._clean = True  # Her iki akış da bitiş satırıyla kapandı mı
+        self._done = threading.Event()
+        self._lock = threading.Lock()
+
+    def _stream_finished(self, stream, code):
+        with self._lock:
+            self._pending -= 1
+            if code is None:
+                self._clean = False
+            elif stream is self.stdout and self.returncode is None:
+                self.returncode = code
+            if stream is self.stdout or code is None:
+                self._finish()
+            if self._pending == 0:
+                self.pool._release(self.worker, self._clean)
+
+    def _finish(self):
+        if self.returncode is None:
+            # Akış bitiş satırı olmadan kapandı: süreç ölüyor, çıkış kodu beklenir
+            try:
+                self.returncode = self.worker.process.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                self.returncode = 1
+        self._done.set()
+
+    def poll(self):
+        if not self._done.is_set() and not self.worker.alive():
+            with self._lock:
+                self._finish()
+        return self.returncode
+
+    def wait(self, timeout=None):
+        step = 0.05 if timeout is None else min(0.05, timeout)
+        waited = 0.0
+        while not self._done.wait(step):
+            if self.poll() is not None:
+                break
+            waited += step
+            if timeout is not None and waited >= timeout:
+                raise subprocess.TimeoutExpired(self.args, timeout)
+        return self.returncode
+
+    def cancel(self):
+        """Çalıştırmayı iptal eder; işçi öldürülür ve havuza dönmez"""
+        if self._done.is_set():
+            return
+        self.worker.reusable = False
+        self.worker.kill(close_output=False)  # Okuyucular dosya sonunu görüp kendileri kapatır
+        self.poll()
+
+    terminate = kill = cancel
+
+
+class WorkerPool:
+    """
+    Önceden başlatılmış run_worker.py süreçleri. `start` hazır bir işçiye işi
+    gönderir (yoksa yenisini başlatır) ve havuzu arka planda yeniden doldurur.
+    """
+
+    def __init__(self, size=POOL_SIZE, max_runs=MAX_RUNS_PER_WORKER, manager=None):
+        self.size = max(0, size)
+        self.max_runs = max(1, max_runs)
+        if manager is None:
+            manager = SecureSubprocessManager(SecurityLevel.MEDIUM)
+            manager.add_safe_command("python")
+            manager.add_safe_command("python3")
+            # Öğrenci programı işçinin içinde çalışır; CPU süresi işçinin ömrü boyunca birikir
+            manager.set_resource_limits(memory_mb=WORKER_MEMORY_MB,
+                                        cpu_seconds=WORKER_CPU_SECONDS * self.max_runs)
+        self.manager = manager
+        self._idle = []
+        self._active = None
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def _spawn(self):
+        token = secrets.token_hex(8)
+        process = self.manager.execute_interactive(
+            sys.executable,
+            [str(WORKER_SCRIPT), token, str(self.max_runs)],
+            cwd=str(PROJECT_ROOT),
+            limit_resources=True
+        )
+        return _Worker(process, token)
+
+    def warm(self):
+        """Hazırdaki işçi sayısını `size`'a tamamlar"""
+        while True:
+            with self._lock:
+                self._idle = [worker for worker in self._idle if worker.alive()]
+                if self._closed or len(self._idle) >= self.size:
+                    return
+            try:
+                worker = self._spawn()
+            except SecurityError:
+                return
+            with self._lock:
+                if self._closed:
+                    worker.kill()
+                    return
+                self._idle.append(worker)
+
+    def start(self, source_file, flags=()):
+        """Programı hazır bir işçide başlatır; süren önceki çalıştırma iptal edilir"""
+        if not WORKER_SCRIPT.exists():
+            raise FileNotFoundError(f"Çalıştırma işçisi bulunamadı: {WORKER_SCRIPT}")
+        self.cancel()
+        with self._lock:
+            worker = None
+            while self._idle and worker is None:
+                candidate = self._idle.pop(0)
+                if candidate.alive():
+                    worker = candidate
+                else:
+                    candidate.kill()
+        if worker is None:
+            worker = self._spawn()
+
+        args = self.manager.sanitize_arguments([str(source_file)] + list(flags))
+        job = json.dumps({"file": args[0], "flags": args[1:]}, ensure_ascii=False)
+        try:
+            worker.process.stdin.write(job + "\n")
+            worker.process.stdin.flush()
+        except (OSError, ValueError) as e:
+            worker.kill()
+            raise SecurityError(f"Çalıştırma işçisine iş gönderilemedi: {e}")
+        worker.runs += 1
+
+        run = WorkerRun(self, worker, [sys.executable, str(WORKER_SCRIPT)] + args)
+        with self._lock:
+            self._active = run
+        if worker.runs >= self.max_runs:
+            self._refill()  # Bu işçi geri dönmeyecek; yerine yenisi hazırlanır
+        return run
+
+    def _refill(self):
+        threading.Thread(target=self.warm, daemon=True).start()
+
+    def cancel(self):
+        """Süren çalıştırmayı (varsa) iptal eder"""
+        with self._lock:
+            run, self._active = self._active, None
+        if run is not None:
+            run.cancel()
+
+    def _release(self, worker, clean):
+        """Çalıştırması biten işçiyi geri alır veya kapatır"""
+        with self._lock:
+            keep = (clean and worker.reusable and not self._closed and worker.runs < self.max_runs
+                    and worker.alive() and len(self._idle) < self.size)
+            if keep:
+                self._idle.append(worker)
+        if not keep:
+            worker.kill()
+            if not self._closed:
+                self._refill()
+
+    def shutdown(self):
+        """Tüm işçileri kapatır"""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        self.cancel()
+        for worker in idle:
+            worker.kill()
+
+
+_shared_pool = None
+
+
+def get_worker_pool():
+    """IDE genelinde paylaşılan havuz (ilk kullanımda ısıtılır)"""
+    global _shared_pool
+    if _shared_pool is None:
+        _shared_pool = WorkerPool()
+        atexit.register(_shared_pool.shutdown)
+        _shared_pool._refill()
+    return _shared_pool
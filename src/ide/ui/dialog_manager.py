@@ -181,7 +181,7 @@ class DialogManager:
             if COMPILER_PATH.exists():
                 # Create compiler runner instance
                 compiler_runner = CompilerRunner()
-                if compiler_runner.is_compiler_viable():
+                if compiler_runner.is_compiler_viable(refresh=True):  # Elle kontrolde yeniden yokla
                     out.write_text(f"✅ Gümüş Native Derleyici: AKTİF ({COMPILER_PATH.name})\n", "success")
                     native_ok = True
                 else:
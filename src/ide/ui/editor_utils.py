@@ -7,6 +7,10 @@ import threading
 import os
 from pathlib import Path
 
+from ..core.tokenizer import TokenType
+from ..core.parser import IncrementalParser
+from ..core.project_index import get_project_index
+
 try:
     import winsound
 except ImportError:
@@ -74,6 +78,11 @@ class EditorAutocompleteMixin:
             all_candidates[word] = meta
         for sym in extracted_symbols:
             all_candidates[sym['name']] = {"type": sym['type'], "doc": f"Tanım: {sym['type'].capitalize()}\nSatır: {sym['line']}"}
+        # Projedeki diğer dosyaların tanımları (arka plan indeksi hazırsa)
+        project_index = get_project_index()
+        if project_index is not None and prefix:
+            for name, sym in project_index.complete(prefix):
+                all_candidates.setdefault(name, {"type": sym['type'], "doc": f"Tanım: {sym['type'].capitalize()}\nDosya: {os.path.basename(sym['path'])}:{sym['line']}"})
 
         suggestions = []
         if prefix:
@@ -181,49 +190,31 @@ class EditorLinterMixin:
             "return": "dön", "don": "dön", "print": "yazdır", "yazdir": "yazdır",
             "class": "sınıf", "sinif": "sınıf", "new": "yeni", "this": "öz", "oz": "öz",
             "null": "boş", "none": "boş", "bos": "boş", "break": "kır", "kir": "kır",
-            "continue": "devam", "try": "deneme", "catch": "yakala", "modul": "modül",
+            "continue": "devam", "try": "dene", "catch": "yakala", "modul": "modül",
             "or": "veya", "and": "ve"
         }
         
-        stack = []
-        pairs = {')':'(', '}':'{', ']':'['}
-        lines = text.split('\n')
-        in_string = False 
-        string_char = None
-        
-        for i, line in enumerate(lines):
-            line_no = i + 1
-            stripped = line.strip()
-            if stripped.startswith("//"): continue
-            
-            col_idx = 0
-            while col_idx < len(line):
-                char = line[col_idx]
-                if char in ('"', "'"):
-                    if not in_string: in_string = True; string_char = char
-                    elif char == string_char: in_string = False; string_char = None
-                
-                if not in_string:
-                    if char in "({[": stack.append((char, line_no))
-                    elif char in ")}]":
-                        if not stack: errors.append({"line": line_no, "message": f"Beklenmeyen kapatma: '{char}'"})
-                        else:
-                            top, open_line = stack.pop()
-                            if pairs[char] != top:
-                                 errors.append({"line": line_no, "message": f"Uyuşmazlık: '{top}' (Satır {open_line}) beklenirken '{char}' geldi."})
-                col_idx += 1
-            
-            clean_line = re.sub(r'("[^"]*"|\'[^\']*\')', '', stripped) 
-            words = re.findall(r'\b\w+\b', clean_line)
-            seen_errors = set()
-            for w in words:
-                if w in forbidden_map and w not in seen_errors:
-                    errors.append({"line": line_no, "message": f"🔍 Bak hele! '{w}' yasak! '{forbidden_map[w]}' kullanmalısın."})
-                    seen_errors.add(w)
+        # Tek tarama + tek ayrıştırma: sözdizimi hataları ayrıştırıcının tanılarından,
+        # yabancı anahtar kelime uyarıları aynı token akışından çıkarılır. Ayrıştırıcı
+        # artımlıdır; her tuş vuruşunda yalnızca düzenlenen bildirim yeniden kurulur.
+        parser = getattr(self, '_lint_parser', None)
+        if parser is None:
+            parser = self._lint_parser = IncrementalParser(text)
+        else:
+            parser.sync(text)
+        tokens = parser.tokens
+        program = parser.program
+        for diag in program.diagnostics:
+            message = diag.message
+            if diag.found is not None and diag.found.type != TokenType.EOF:
+                message += f" (Bulunan: '{diag.found.value}')"
+            errors.append({"line": diag.line, "col": diag.col, "message": message})
 
-        if stack:
-            top, line_no = stack[-1]
-            errors.append({"line": line_no, "message": f"Kapatılmamış blok: '{top}'"})
+        seen_errors = set()
+        for tok in tokens:
+            if tok.type == TokenType.IDENTIFIER and tok.value in forbidden_map and (tok.line, tok.value) not in seen_errors:
+                errors.append({"line": tok.line, "col": tok.col, "message": f"🔍 Bak hele! '{tok.value}' yasak! '{forbidden_map[tok.value]}' kullanmalısın."})
+                seen_errors.add((tok.line, tok.value))
 
         self.set_errors(errors)
 
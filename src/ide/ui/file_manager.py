@@ -1,8 +1,10 @@
 import os
+import threading
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from pathlib import Path
 from .editor import CodeEditor
+from ..core.project_index import get_project_index
 
 class CodeFileManager:
     """Dosya Yönetim İşlemleri"""
@@ -41,6 +43,12 @@ class CodeFileManager:
                 self.main_window.sidebar.set_root(path)
                 self.main_window.terminal.write_text(f">>> Klasör açıldı: {path}\n")
     
+    def _reindex(self, path):
+        """Kaydedilen dosyayı (proje klasöründeyse) sembol indeksinde günceller"""
+        index = get_project_index()
+        if index is not None and path.endswith(".tr") and Path(path).resolve().is_relative_to(index.root):
+            threading.Thread(target=index.refresh, args=([path],), daemon=True).start()
+
     def open_file_from_path(self, path):
         """Dosyayı aç (Eğer zaten açıksa o sekmeye geç)"""
         path = str(Path(path).resolve())
@@ -107,6 +115,7 @@ class CodeFileManager:
             content = self.main_window.editors[path].get('1.0', 'end-1c')
             with open(path, 'w', encoding='utf-8') as f:
                 f.write(content)
+            self._reindex(path)
             
             # Editöre yolu bildir (Breadcrumbs için)
             if hasattr(self.main_window.editors[path], 'set_file_path'):
@@ -142,6 +151,7 @@ class CodeFileManager:
             
             with open(path, 'w', encoding='utf-8') as f:
                 f.write(content)
+            self._reindex(path)
                 
             old_path = self.main_window.active_tab
             
@@ -2,8 +2,7 @@
 import customtkinter as ctk
 import tkinter as tk
 from ..core.flowchart_generator import FlowchartGenerator
-from ..core.tokenizer import GumusTokenizer
-from ..core.parser import GumusParser
+from ..core.parse_cache import parse_source
 
 class FlowchartPanel(ctk.CTkFrame):
     def __init__(self, parent, config):
@@ -44,17 +43,15 @@ class FlowchartPanel(ctk.CTkFrame):
         )
         self.canvas.pack(fill="both", expand=True, padx=20, pady=20)
         
-    def update_flowchart(self, code=None):
+    def update_flowchart(self, code=None, ast=None):
         if not code:
             # Editördeki kodu almayı denemek lazım ama şu an için boşsa işlem yapma
             return
 
         try:
             # Parse code
-            tokenizer = GumusTokenizer(code)
-            tokens = tokenizer.tokenize()
-            parser = GumusParser(tokens)
-            ast = parser.parse()
+            if ast is None:
+                ast = parse_source(code)
             
             # Generate flow
             nodes = self.generator.generate(ast)
@@ -50,6 +50,10 @@ class MainWindow(MainWindowActionsMixin, MainWindowUIMixin):
         
         if hasattr(self, 'tab_manager'): self.file_manager.tab_manager = self.tab_manager
 
+        # Derleyici yoklaması arka planda bir kez (çalıştırmalar süreç başlatmadan sonucu okur)
+        from ..core.compiler_probe import get_compiler_probe
+        get_compiler_probe().start()
+
         self.plugin_manager.load_plugins()
         self.plugin_manager.trigger_hook("on_startup")
         self.file_manager.start_auto_save_loop()
@@ -5,6 +5,7 @@ import os
 import threading
 from ..core.compiler import CompilerRunner
 from ..core.symbols import SymbolExtractor
+from ..core.project_index import get_project_index
 
 class MainWindowActionsMixin:
     """MainWindow için çalışma ve çeviri aksiyonları"""
@@ -89,8 +90,14 @@ class MainWindowActionsMixin:
         editor = self.get_current_editor()
         if not editor: return
         if hasattr(self, 'sidebar') and hasattr(self.sidebar, 'update_outline'):
-            text = editor.get("1.0", 'end-1c')
-            symbols = SymbolExtractor.extract_from_text(text)
+            # Kaydedilmiş dosyada hazır proje indeksi kullanılır; değişiklik varsa canlı metin taranır
+            symbols = None
+            index = get_project_index()
+            dirty = hasattr(self, 'tab_manager') and self.active_tab in self.tab_manager.dirty_tabs
+            if index is not None and self.active_tab and not dirty:
+                symbols = index.outline(self.active_tab) or None
+            if symbols is None:
+                symbols = SymbolExtractor.extract_from_text(editor.get("1.0", 'end-1c'))
             self.sidebar.update_outline(symbols)
 
 class MainWindowUIMixin:
@@ -106,6 +113,24 @@ class MainWindowUIMixin:
             editor._textbox.mark_set("insert", f"{line}.0")
             editor._highlight_current_line()
 
+    def go_to_definition(self, event=None):
+        """İmleç altındaki ismin tanımına gider (proje indeksi üzerinden)"""
+        editor = self.get_current_editor()
+        index = get_project_index()
+        if not editor or index is None: return
+        word = editor._textbox.get("insert wordstart", "insert wordend").strip()
+        if not word: return
+        current = self.active_tab if self.active_tab and os.path.isfile(self.active_tab) else None
+        definitions = index.find_definitions(word, current)
+        if not definitions:
+            self.show_toast(f"Tanım bulunamadı: {word}", "warning")
+            return "break"
+        path, symbol = definitions[0]
+        if current is None or os.path.normpath(path) != os.path.normpath(current):
+            self.file_manager.open_file_from_path(path)
+        self.jump_to_line(symbol['line'])
+        return "break"
+
     def apply_code_snippet(self, code, line=None):
         editor = self.get_current_editor()
         if editor:
@@ -1,12 +1,15 @@
 # -*- coding: utf-8 -*-
 import customtkinter as ctk
 import os
+import threading
 from pathlib import Path
 from ..config import EXAMPLES_DIR
 from .memory import GumusHafizaMain as MemoryView
 from .ai_panel import AIPanel
 from .notes_panel import NotesPanel
 from ..core.debugger import DebuggerManager
+from ..core.parser import IncrementalParser
+from ..core.project_index import open_project
 from .debug_panels import VariableWatchPanel, CallStackPanel
 from .pardus_panel import PardusPanel
 from .market_panel import MarketPanel
@@ -30,6 +33,7 @@ class Sidebar(ctk.CTkFrame):
         self.callbacks = callbacks # {'on_file_select', 'on_jump'}
         self.current_root = EXAMPLES_DIR
         self.mode = "explorer"
+        self._incremental_parser = None # Akış şeması ve çevirici panelleri paylaşır
         
         self.top_frame = ctk.CTkFrame(self, fg_color="transparent")
         self.top_frame.pack(fill="x", pady=(10, 5), padx=10)
@@ -201,7 +205,8 @@ class Sidebar(ctk.CTkFrame):
             # Eğer kod varsa, akış şemasını güncelle
             if self.callbacks.get('get_code'):
                 code = self.callbacks['get_code']()
-                self.flowchart_panel.update_flowchart(code)
+                if code:
+                    self.flowchart_panel.update_flowchart(code, self._program_for(code))
         elif mode == "vizyon":
             # Simüle telemetri
             self.after(500, lambda: self.vizyon_panel.update_metrics(240, 85, 92, -65))
@@ -223,16 +228,27 @@ class Sidebar(ctk.CTkFrame):
                             from ..core.gumus_to_cpp import GumusToCppTranspiler
                             t = GumusToCppTranspiler()
                             
-                        translated_code = t.transpile(code)
+                        translated_code = t.transpile(code, self._program_for(code))
                         self.transpiler_panel.set_code(translated_code)
                     except Exception as e:
                         self.transpiler_panel.set_code(f"# Error: {e}")
 
+    def _program_for(self, code):
+        """Kodu artımlı ayrıştırır; yalnızca değişen üst düzey bildirimler yeniden kurulur"""
+        if self._incremental_parser is None:
+            self._incremental_parser = IncrementalParser(code)
+        else:
+            self._incremental_parser.sync(code)
+        return self._incremental_parser.program
+
     def set_root(self, path):
         self.current_root = Path(path)
         self.label.configure(text=self.current_root.name[:15].upper() if self.current_root.name else str(self.current_root))
         self.switch_mode("explorer")
         self.explorer_tree.load_root(self.current_root)
+        # Klasördeki .tr dosyaları arka planda (süreç havuzunda) indekslenir
+        index = open_project(self.current_root)
+        threading.Thread(target=index.refresh, daemon=True).start()
 
     def reveal_file(self, path):
         if hasattr(self, 'explorer_tree'):
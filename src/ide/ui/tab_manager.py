@@ -171,6 +171,7 @@ class TabManager:
             editor._textbox.bind('<KeyRelease>', lambda e: mw.update_cursor_position(e) if hasattr(mw, 'update_cursor_position') else None, add="+")
             editor._textbox.bind('<KeyRelease>', lambda e: mw.update_outline(e) if hasattr(mw, 'update_outline') else None, add="+")
             editor._textbox.bind('<ButtonRelease-1>', lambda e: mw.update_cursor_position(e) if hasattr(mw, 'update_cursor_position') else None, add="+")
+            editor._textbox.bind('<F12>', lambda e: mw.go_to_definition(e) if hasattr(mw, 'go_to_definition') else None, add="+")
 
     def register_editor(self, path, editor_widget):
         """Yeni bir editör kaydet"""
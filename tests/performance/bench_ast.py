@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AST Bellek ve Dönüştürme Kıyaslaması
+lib/ korpusunun çoğaltılmış hali üzerinde AST düğümü başına bellek kullanımını
+ve hazır AST'den Python/C++ dönüştürme ile akış şeması üretim hızını ölçer.
+
+Kullanım: python tests/performance/bench_ast.py [kopya_sayisi]
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.ide.core.tokenizer import GumusTokenizer
+from src.ide.core.parser import GumusParser
+from src.ide.core.ast_nodes import ASTNode
+from src.ide.core.transpiler import GumusToPythonTranspiler
+from src.ide.core.gumus_to_cpp import GumusToCppTranspiler
+from src.ide.core.flowchart_generator import FlowchartGenerator
+
+
+def load_corpus(copies):
+    parts = []
+    for path in sorted((PROJECT_ROOT / "lib").rglob("*.tr")):
+        parts.append(path.read_text(encoding="utf-8", errors="replace"))
+    return "\n".join(parts) * copies
+
+
+def node_fields(node):
+    slots = getattr(type(node), "__slots__", None)
+    if slots is not None and not hasattr(node, "__dict__"):
+        return [getattr(node, name, None) for cls in type(node).__mro__
+                for name in getattr(cls, "__slots__", ())]
+    return list(vars(node).values())
+
+
+def count_nodes(root):
+    count = 0
+    stack = [root]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, ASTNode):
+            count += 1
+            stack.extend(node_fields(item))
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return count
+
+
+def best_time(func, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    source = load_corpus(copies)
+    tokens = GumusTokenizer(source).tokenize()
+
+    gc.collect()
+    tracemalloc.start()
+    program = GumusParser(tokens).parse()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    nodes = count_nodes(program)
+
+    print(f"Korpus: {len(source):,} karakter, {len(tokens):,} token, {nodes:,} AST düğümü")
+    print(f"AST belleği: {current / 1024:,.0f} KB ({current / nodes:.1f} bayt/düğüm)")
+
+    size_mb = len(source.encode("utf-8")) / (1024 * 1024)
+    jobs = (
+        ("Python dönüştürme", lambda: GumusToPythonTranspiler().transpile(source, program)),
+        ("C++ dönüştürme", lambda: GumusToCppTranspiler().transpile(source, program)),
+        ("Akış şeması", lambda: FlowchartGenerator().generate(program)),
+    )
+    print(f"{'İş':<20}{'Süre (ms)':>12}{'Düğüm/sn':>14}{'MB/sn':>9}")
+    for label, job in jobs:
+        elapsed = best_time(job)
+        print(f"{label:<20}{elapsed * 1000:>12.1f}{nodes / elapsed:>14,.0f}{size_mb / elapsed:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
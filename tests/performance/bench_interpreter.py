@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Yorumlayıcı Hız Kıyaslaması
+Satır satır regex/eval ile çalışan eski GumusSimulator'ı, AST'yi bir kez
+kapanışlara derleyen GumusInterpreter ve bayt kodu üreten GumusVM ile döngü
+ve fonksiyon ağırlıklı programlarda karşılaştırır. Eski simülatörün 10.000 tur döngü sınırı
+olduğundan kıyas programları bu sınırın içinde kalır.
+
+Nesne ağırlıklı program (yığın ve bağlı liste sınıfları) Shape tabanlı alan
+yerleşimini ve satır içi önbellekleri ölçer; eski simülatör sınıf
+desteklemediğinden yalnızca yorumlayıcı ve VM karşılaştırılır.
+
+Sıcak fonksiyon programı (özyinelemeli fib ve asal sayma) kademeli
+çalıştırmayı ölçer: yorumlayıcı yükseltme kapalı ve açıkken karşılaştırılır.
+
+Son olarak tests/test_performans.tr'deki stres senaryoları (10.000 nesne,
+AI katmanları, çöp toplayıcı turu) yalnızca yeni motorla ölçülür; eski
+simülatör sınıf, yeni ve dahil_et desteklemediği için bunları çalıştıramaz.
+
+Kullanım: python tests/performance/bench_interpreter.py [tekrar_sayisi]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.ide.core.simulator import GumusSimulator
+from src.ide.core.interpreter import GumusInterpreter
+from src.ide.core.vm import GumusVM
+
+
+LOOP = """
+değişken i = 0
+değişken toplam = 0
+döngü (i < 10000) {
+    eğer (i % 3 == 0) {
+        toplam = toplam + i * 2
+    }
+    i = i + 1
+}
+yazdır(toplam)
+"""
+
+CALLS = """
+fonksiyon kare(x) {
+    dön x * x
+}
+değişken j = 0
+değişken s = 0
+döngü (j < 3000) {
+    s = s + kare(j)
+    j = j + 1
+}
+yazdır(s)
+"""
+
+OBJECTS = """
+sınıf Yigin {
+    kurucu() {
+        öz.elemanlar = []
+        öz.boyut = 0
+    }
+    fonksiyon it(x) {
+        öz.elemanlar.ekle(x)
+        öz.boyut = öz.boyut + 1
+    }
+    fonksiyon cek() {
+        öz.boyut = öz.boyut - 1
+        değişken x = öz.elemanlar[öz.boyut]
+        öz.elemanlar.sil(öz.boyut)
+        dön x
+    }
+}
+sınıf Dugum {
+    kurucu(deger) {
+        öz.deger = deger
+        öz.sonraki = yok
+    }
+}
+değişken y = yeni Yigin()
+değişken bas = yok
+değişken i = 0
+döngü (i < 3000) {
+    y.it(i)
+    değişken d = yeni Dugum(i)
+    d.sonraki = bas
+    bas = d
+    i = i + 1
+}
+değişken toplam = 0
+döngü (y.boyut > 0) {
+    toplam = toplam + y.cek()
+}
+döngü (bas != yok) {
+    toplam = toplam + bas.deger
+    bas = bas.sonraki
+}
+yazdır(toplam)
+"""
+
+HOT = """
+fonksiyon fib(n) {
+    eğer (n < 2) { dön n }
+    dön fib(n - 1) + fib(n - 2)
+}
+fonksiyon asal_mi(n) {
+    için (değişken i = 2; i * i <= n; i = i + 1) {
+        eğer (n % i == 0) { dön yanlış }
+    }
+    dön n > 1
+}
+değişken sayi = 0
+değişken k = 0
+döngü (k < 5000) {
+    eğer (asal_mi(k)) { sayi = sayi + 1 }
+    k = k + 1
+}
+yazdır(fib(20), sayi)
+"""
+
+STRESS = """
+dahil_et("../lib/birim.tr")
+dahil_et("../std_lib/zaman.tr")
+dahil_et("../lib/ai_gelis.tr")
+
+değişken t = yeni BirimTest("Performans ve Stres Testleri")
+t.bolum("STRES TESTI: 10,000 Nesne")
+
+sınıf BasitVeri {
+    kurucu(n) { öz.no = n }
+}
+
+değişken i = 0
+değişken limit = 10000
+değişken liste = []
+döngü (i < limit) {
+    liste.ekle(yeni BasitVeri(i))
+    i = i + 1
+}
+t.esit_mi(limit, uzunluk(liste), "Tum nesneler hafizaya alinabilmeli")
+
+t.bolum("BELLEK BASKISI: AI Katmanlari")
+değişken beyin = yeni SinirAgi(0.1)
+değişken k = 0
+dene {
+    döngü (k < 1000) {
+        beyin.katman_ekle(10, 10)
+        k = k + 1
+    }
+    t.dogru_mu(doğru, "Sistem cokmeden katman eklendi.")
+} yakala(hata) {
+    t.dogru_mu(yanlış, "Bellek hatasi veya cokme: " + hata)
+}
+
+t.bolum("BELLEK SIZINTISI: Referans Temizligi")
+değişken sayac = 0
+değişken gecici = yok
+döngü (sayac < 1000) {
+    gecici = yeni SinirAgi(0.01)
+    gecici.katman_ekle(50, 50)
+    sayac = sayac + 1
+}
+t.raporla()
+"""
+
+
+def best_time(job, repeat):
+    best = float("inf")
+    output = None
+    for _ in range(repeat):
+        lines = []
+        started = time.perf_counter()
+        job(lines.append)
+        best = min(best, time.perf_counter() - started)
+        output = lines
+    return best, output
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    base_dir = PROJECT_ROOT / "tests"
+
+    print(f"{'Program':<12}{'Simülatör (ms)':>16}{'Yorumlayıcı (ms)':>18}{'VM (ms)':>10}{'Hızlanma':>10}")
+    for label, source in (("Döngü", LOOP), ("Çağrı", CALLS)):
+        old, old_out = best_time(lambda out: GumusSimulator(out).run(source), repeat)
+        new, new_out = best_time(lambda out: GumusInterpreter(out).run(source, base_dir), repeat)
+        vm, vm_out = best_time(lambda out: GumusVM(out).run(source, base_dir), repeat)
+        status = "" if old_out == new_out == vm_out else "  (çıktılar farklı!)"
+        print(f"{label:<12}{old * 1000:>16.1f}{new * 1000:>18.1f}{vm * 1000:>10.1f}"
+              f"{old / min(new, vm):>9.0f}x{status}")
+
+    new, new_out = best_time(lambda out: GumusInterpreter(out).run(OBJECTS, base_dir), repeat)
+    vm, vm_out = best_time(lambda out: GumusVM(out).run(OBJECTS, base_dir), repeat)
+    status = "" if new_out == vm_out else "  (çıktılar farklı!)"
+    print(f"{'Nesne':<12}{'-':>16}{new * 1000:>18.1f}{vm * 1000:>10.1f}{'':>10}{status}")
+
+    def interpreted(out):
+        interpreter = GumusInterpreter(out)
+        interpreter.tiering = False
+        return interpreter.run(HOT, base_dir)
+
+    plain, plain_out = best_time(interpreted, repeat)
+    tiered, tiered_out = best_time(lambda out: GumusInterpreter(out).run(HOT, base_dir), repeat)
+    status = "" if plain_out == tiered_out else "  (çıktılar farklı!)"
+    print(f"\nSıcak fonksiyon: yorumlayıcı {plain * 1000:.1f} ms, kademeli {tiered * 1000:.1f} ms"
+          f" ({plain / tiered:.1f}x){status}")
+
+    elapsed, output = best_time(lambda out: GumusInterpreter(out).run(STRESS, base_dir), repeat)
+    failed = [line for line in output if "Hata" in line or "[X]" in line]
+    print(f"\ntest_performans.tr senaryoları: {elapsed * 1000:.1f} ms, {len(output)} satır çıktı"
+          + (f", hatalar: {failed[:3]}" if failed else ""))
+    elapsed, vm_output = best_time(lambda out: GumusVM(out).run(STRESS, base_dir), repeat)
+    print(f"test_performans.tr senaryoları (VM): {elapsed * 1000:.1f} ms"
+          + ("" if vm_output == output else ", çıktılar farklı!"))
+
+
+if __name__ == "__main__":
+    main()
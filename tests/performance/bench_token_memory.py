@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Token Deposu Bellek Kıyaslaması
+Token nesnelerinden oluşan liste ile dizi tabanlı CompactTokenStream'in bellek
+kullanımını ve tarama + ayrıştırma süresini lib/ korpusu üzerinde karşılaştırır.
+
+Kullanım: python tests/performance/bench_token_memory.py [kopya_sayisi]
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.ide.core.tokenizer import GumusTokenizer
+from src.ide.core.parser import GumusParser
+
+
+def load_corpus(copies):
+    parts = []
+    for path in sorted((PROJECT_ROOT / "lib").rglob("*.tr")):
+        parts.append(path.read_text(encoding="utf-8", errors="replace"))
+    return "\n".join(parts) * copies
+
+
+def measure_memory(build):
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current, peak
+
+
+def measure_time(build, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        build()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    source = load_corpus(copies)
+
+    layouts = (
+        ("Token listesi", lambda: GumusTokenizer(source).tokenize()),
+        ("CompactTokenStream", lambda: GumusTokenizer(source).tokenize_compact()),
+    )
+
+    print(f"Korpus: {len(source):,} karakter")
+    print(f"{'Düzen':<22}{'Token':>10}{'Bellek (KB)':>14}{'Bayt/token':>12}{'Tarama (ms)':>13}{'+Ayrıştırma (ms)':>18}")
+    for label, build in layouts:
+        tokens, current, _ = measure_memory(build)
+        count = len(tokens)
+        lex_time = measure_time(build)
+        parse_time = measure_time(lambda: GumusParser(build()).parse())
+        print(f"{label:<22}{count:>10,}{current / 1024:>14,.0f}{current / count:>12.1f}"
+              f"{lex_time * 1000:>13.1f}{parse_time * 1000:>18.1f}")
+        del tokens
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+GümüşTokenizer Hız Kıyaslaması
+Tablo güdümlü (master regex) tarayıcı ile eski karakter-karakter tarayıcıyı
+lib/ altındaki tüm .tr dosyalarının birleştirilmiş hali üzerinde karşılaştırır.
+Ayrıca artımlı modda tek bir tuş vuruşunun maliyetini tam taramayla kıyaslar.
+
+Kullanım: python tests/performance/bench_tokenizer.py [tekrar_sayisi]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.ide.core.tokenizer import GumusTokenizer
+
+
+def load_corpus(copies=4):
+    parts = []
+    for path in sorted((PROJECT_ROOT / "lib").rglob("*.tr")):
+        parts.append(path.read_text(encoding="utf-8", errors="replace"))
+    return "\n".join(parts) * copies
+
+
+def measure(source, method_name, repeat):
+    best = float("inf")
+    count = 0
+    for _ in range(repeat):
+        tokenizer = GumusTokenizer(source)
+        started = time.perf_counter()
+        count = len(getattr(tokenizer, method_name)())
+        best = min(best, time.perf_counter() - started)
+    return best, count
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    source = load_corpus()
+    size_mb = len(source.encode("utf-8")) / (1024 * 1024)
+
+    print(f"Korpus: {len(source):,} karakter ({size_mb:.2f} MB), en iyi {repeat} ölçüm")
+    print(f"{'Motor':<22}{'Süre (ms)':>12}{'Token':>10}{'Token/sn':>14}{'MB/sn':>9}")
+
+    results = {}
+    for label, method in (("Karakter-karakter", "tokenize_charwise"), ("Tablo güdümlü", "tokenize")):
+        elapsed, count = measure(source, method, repeat)
+        results[method] = elapsed
+        print(f"{label:<22}{elapsed * 1000:>12.1f}{count:>10,}{count / elapsed:>14,.0f}{size_mb / elapsed:>9.2f}")
+
+    print(f"Hızlanma: {results['tokenize_charwise'] / results['tokenize']:.1f}x")
+
+    measure_incremental(source, repeat)
+
+
+def measure_incremental(source, repeat, line_count=5000):
+    """Dosyanın ortasına tek karakter eklemenin artımlı ve tam tarama maliyeti"""
+    source = "\n".join(source.split("\n")[:line_count])
+    tokenizer = GumusTokenizer(source, incremental=True)
+    started = time.perf_counter()
+    tokenizer.tokenize()
+    full = time.perf_counter() - started
+
+    pos = len(source) // 2
+    edits = repeat * 20
+    started = time.perf_counter()
+    for _ in range(edits):
+        first, old_stop, new_stop = tokenizer.edit(pos, pos, "x")
+    incremental = (time.perf_counter() - started) / edits
+
+    print(f"\nArtımlı mod ({source.count(chr(10)) + 1:,} satır, ortada tek tuş vuruşu)")
+    print(f"Tam tarama: {full * 1000:.2f} ms, artımlı: {incremental * 1000:.3f} ms "
+          f"({new_stop - first} token yeniden tarandı, {full / incremental:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+/*
+ * Sahte GümüşDil kütüphanesi
+ * test_native_vm.py için src/compiler/gumus_api.h arayüzünü uygular.
+ * gumus_run kaynağı satır satır "çalıştırır":
+ *   oku     -> girdiden bir satır okur, "okundu: <satır>" yazar
+ *   sonsuz  -> iptal edilene kadar döner
+ *   yavaş   -> iptali dinlemeden 1 saniye bekler
+ *   hata... -> satırı stderr'e yazar, GUMUS_ERROR döner
+ *   diğer   -> satırı stdout'a yazar
+ */
+#include <stdio.h>
+#include <string.h>
+#include <unistd.h>
+#include "../../src/compiler/gumus_api.h"
+
+static int busy = 0;
+static char memory[256] = "null";
+
+static int copy_out(const char* text, char* buffer, size_t capacity, size_t* required) {
+    size_t length = strlen(text);
+    if (required) *required = length + 1;
+    if (buffer == NULL || capacity < length + 1) return GUMUS_BUFFER_TOO_SMALL;
+    memcpy(buffer, text, length + 1);
+    return GUMUS_OK;
+}
+
+GUMUS_API int gumus_api_version(void) { return GUMUS_API_VERSION; }
+
+GUMUS_API int gumus_compile(const char* source, char* diagnostics, size_t capacity, size_t* required) {
+    if (strstr(source, "hata")) {
+        int status = copy_out("[{\"type\": \"syntax_error\", \"line\": 1, \"message\": \"hata\"}]",
+                              diagnostics, capacity, required);
+        return status == GUMUS_OK ? GUMUS_ERROR : status;
+    }
+    return copy_out("[]", diagnostics, capacity, required);
+}
+
+GUMUS_API int gumus_dump_ast(const char* source, char* buffer, size_t capacity, size_t* required) {
+    if (busy) return GUMUS_BUSY;
+    /* Tampon yeniden deneme yolunu sınamak için kaynak kadar uzun bir değer */
+    static char json[1 << 20];
+    snprintf(json, sizeof(json), "[{\"type\": \"Source\", \"value\": \"%s\"}]", source);
+    return copy_out(json, buffer, capacity, required);
+}
+
+GUMUS_API int gumus_run(const char* source, const char* filename, int flags,
+                        gumus_output_fn output, gumus_input_fn input, void* user,
+                        const volatile int* cancel) {
+    if (busy) return GUMUS_BUSY;
+    busy = 1;
+    int status = GUMUS_OK;
+    int number = 0;
+    char line[1024];
+    const char* cursor = source;
+    while (*cursor && status == GUMUS_OK) {
+        size_t length = strcspn(cursor, "\n");
+        snprintf(line, sizeof(line), "%.*s\n", (int)length, cursor);
+        cursor += length + (cursor[length] == '\n');
+        number++;
+        if (cancel && *cancel) {
+            status = GUMUS_CANCELLED;
+        } else if (strcmp(line, "oku\n") == 0) {
+            char data[512];
+            size_t count = input ? input(user, data, sizeof(data) - 1) : 0;
+            data[count] = '\0';
+            char text[600];
+            int size = snprintf(text, sizeof(text), "okundu: %s", count ? data : "(son)\n");
+            output(user, GUMUS_STDOUT, text, (size_t)size);
+        } else if (strcmp(line, "sonsuz\n") == 0) {
+            while (!(cancel && *cancel)) { }
+            status = GUMUS_CANCELLED;
+        } else if (strcmp(line, "yavaş\n") == 0) {
+            usleep(1000000);
+        } else if (strncmp(line, "hata", 4) == 0) {
+            output(user, GUMUS_STDERR, line, strlen(line));
+            status = GUMUS_ERROR;
+        } else {
+            output(user, GUMUS_STDOUT, line, strlen(line));
+        }
+    }
+    snprintf(memory, sizeof(memory), "{\"line\": %d, \"stack\": [], \"env\": {\"bayrak\": %d}}", number, flags);
+    busy = 0;
+    return status;
+}
+
+GUMUS_API int gumus_dump_memory(char* buffer, size_t capacity, size_t* required) {
+    return copy_out(memory, buffer, capacity, required);
+}
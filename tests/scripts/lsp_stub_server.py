@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sahte Gümüşdil Dil Sunucusu
+test_lsp_client.py için `gumus --lsp` ile aynı çerçeveleme ve yöntemleri
+konuşur. Derleyici gibi istekleri sırayla, tek iş parçacığında işler.
+AST olarak her satır için {"type": "Line", "value": ...} döner; "hata"
+içeren satırlar için tanı yayınlar. Test yöntemleri:
+  test/sleep {"seconds": n}  n saniye sonra yanıt verir
+  test/crash                 süreci hemen sonlandırır
+"""
+
+import json
+import os
+import sys
+import time
+
+
+def read_message(stream):
+    length = None
+    while True:
+        line = stream.readline()
+        if not line:
+            return None
+        line = line.strip()
+        if not line:
+            if length is not None:
+                break
+            continue
+        name, _, value = line.partition(b":")
+        if name.strip().lower() == b"content-length":
+            length = int(value)
+    return json.loads(stream.read(length).decode("utf-8"))
+
+
+def send(message):
+    body = json.dumps(message, ensure_ascii=False).encode("utf-8")
+    sys.stdout.buffer.write(b"Content-Length: %d\r\n\r\n" % len(body) + body)
+    sys.stdout.buffer.flush()
+
+
+def publish(uri, text):
+    diagnostics = [
+        {"range": {"start": {"line": number, "character": 0},
+                   "end": {"line": number, "character": len(line)}},
+         "severity": 1, "source": "gumus", "message": line.strip()}
+        for number, line in enumerate(text.splitlines()) if "hata" in line
+    ]
+    send({"jsonrpc": "2.0", "method": "textDocument/publishDiagnostics",
+          "params": {"uri": uri, "diagnostics": diagnostics}})
+
+
+def main():
+    documents = {}
+    while True:
+        message = read_message(sys.stdin.buffer)
+        if message is None:
+            return 0
+        method = message.get("method")
+        params = message.get("params") or {}
+        request_id = message.get("id")
+
+        if method in ("textDocument/didOpen", "textDocument/didChange"):
+            document = params["textDocument"]
+            text = document["text"] if "text" in document else params["contentChanges"][-1]["text"]
+            documents[document["uri"]] = text
+            publish(document["uri"], text)
+        elif method == "textDocument/didClose":
+            documents.pop(params["textDocument"]["uri"], None)
+        elif method == "exit":
+            return 0
+        elif method == "test/crash":
+            os._exit(3)
+        elif request_id is None:
+            continue  # initialized, $/cancelRequest
+        elif method == "initialize":
+            send({"jsonrpc": "2.0", "id": request_id,
+                  "result": {"capabilities": {"textDocumentSync": 1}}})
+        elif method == "shutdown":
+            send({"jsonrpc": "2.0", "id": request_id, "result": None})
+        elif method == "test/sleep":
+            time.sleep(params.get("seconds", 0))
+            send({"jsonrpc": "2.0", "id": request_id, "result": "uyandım"})
+        elif method == "gumus/ast":
+            text = documents.get(params["textDocument"]["uri"])
+            if text is None:
+                send({"jsonrpc": "2.0", "id": request_id,
+                      "error": {"code": -32602, "message": "Document not found"}})
+            else:
+                send({"jsonrpc": "2.0", "id": request_id,
+                      "result": [{"type": "Line", "value": line} for line in text.splitlines()]})
+        else:
+            send({"jsonrpc": "2.0", "id": request_id,
+                  "error": {"code": -32601, "message": "Method not found"}})
+
+
+if __name__ == "__main__":
+    sys.exit(main())
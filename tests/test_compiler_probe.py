@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Derleyici Yoklama Testleri
+Yoklama sonucunun ikilinin parmak iziyle diske yazılmasını, aynı ikili için
+sonraki oturumlarda süreç başlatılmamasını ve ikili değişince yeniden
+yoklanmasını sahte bir derleyici betiğiyle doğrular.
+"""
+
+import os
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+
+TEST_DIR = Path(__file__).parent
+PROJECT_ROOT = TEST_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.ide.core.compiler_probe import CompilerProbe
+
+USAGE = (
+    '#!/bin/sh\n'
+    'echo "Usage: gumus [options] <file>"\n'
+    'echo "  --dump-ast          Dump AST in JSON format"\n'
+    'echo "  --debug             Enable debug mode"\n'
+    'exit 1\n'
+)
+
+
+@unittest.skipIf(sys.platform == 'win32', "Sahte derleyici bir kabuk betiğidir")
+class TestCompilerProbe(unittest.TestCase):
+
+    def setUp(self):
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        self.root = Path(folder.name)
+        self.compiler = self.root / "gumus"
+        self.write_compiler(USAGE)
+        self.cache_file = self.root / "cache" / "compiler_probe.json"
+
+    def write_compiler(self, text):
+        self.compiler.write_text(text, encoding="utf-8")
+        os.chmod(self.compiler, 0o755)
+
+    def probe(self):
+        return CompilerProbe(self.compiler, self.cache_file, attempts=2, retry_delay=0)
+
+    def test_result_is_persisted_by_fingerprint(self):
+        first = self.probe()
+        result = first.result()
+        self.assertTrue(result.viable)
+        self.assertEqual(result.features, {"--dump-ast", "--debug"})
+        self.assertFalse(result.supports("--dump-memory"))
+        first.result()
+        self.assertEqual(first.launches, 1)
+
+        second = self.probe()  # Yeni oturum: diskteki kayıt kullanılır
+        self.assertEqual(second.result().features, result.features)
+        self.assertEqual(second.launches, 0)
+
+        self.write_compiler('#!/bin/sh\nexit 3\n')  # İkili değişti (boyut farklı)
+        broken = second.result()
+        self.assertFalse(broken.viable)
+        self.assertEqual(second.launches, 2)
+
+    def test_missing_binary_launches_nothing(self):
+        self.compiler.unlink()
+        probe = self.probe()
+        self.assertFalse(probe.result().viable)
+        self.assertEqual(probe.launches, 0)
+        self.assertFalse(self.cache_file.exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
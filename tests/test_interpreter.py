@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+"""
+GumusInterpreter Testleri
+AST'den kapanışlara derlenen yorumlayıcının dil anlambilimini, yerleşik
+fonksiyonları, dahil_et yüklemesini ve GumusSimulator çıktı/hata sözleşmesini doğrular.
+"""
+
+import contextlib
+import io
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+
+TEST_DIR = Path(__file__).parent
+PROJECT_ROOT = TEST_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.ide.core import run_simulator
+from src.ide.core.interpreter import GumusInterpreter
+from src.ide.core.simulator import GumusSimulator, compile_expression
+from src.ide.core.transpiler import GumusToPythonTranspiler
+from src.ide.core.vm import GumusVM
+
+
+def run(source, **kwargs):
+    output = []
+    interpreter = GumusInterpreter(output.append, **kwargs)
+    ok = interpreter.run(source)
+    return output, ok, interpreter
+
+
+class TestInterpreterSemantics(unittest.TestCase):
+
+    def test_values_and_operators(self):
+        output, ok, _ = run(
+            'yazdır(7 / 2, -7 / 2, -7 % 3, 7.5 / 3, 1 + 2 * 3)\n'
+            'yazdır("n=" + 5, 2 + "x", doğru, yok, [1, "a", [yanlış]])\n'
+            'yazdır(0 veya "b", 0 ve 1, !0, "" ve 3)\n'
+        )
+        self.assertTrue(ok)
+        self.assertEqual(output, [
+            "3 -3 -1 2.5 7",
+            "n=5 2x doğru yok [1, a, [yanlış]]",
+            "b 0 doğru 3",  # Yalnızca yanlış/yok/0 yanlıştır; boş metin doğrudur
+        ])
+
+    def test_control_flow_and_functions(self):
+        output, ok, interpreter = run(
+            'fonksiyon fib(n) {\n'
+            '    eğer (n < 2) { dön n }\n'
+            '    dön fib(n - 1) + fib(n - 2)\n'
+            '}\n'
+            'fonksiyon ilk_cift(liste) {\n'
+            '    için (değişken i = 0; i < uzunluk(liste); i = i + 1) {\n'
+            '        eğer (liste[i] % 2 == 1) { devam }\n'
+            '        dön liste[i]\n'
+            '    }\n'
+            '}\n'
+            'değişken toplam = 0\n'
+            'döngü (doğru) {\n'
+            '    toplam = toplam + 1\n'
+            '    eğer (toplam == 5) { kır }\n'
+            '}\n'
+            'yazdır(fib(15), ilk_cift([1, 3, 8, 4]), ilk_cift([1]), toplam)\n'
+            'sayac = 3\n'
+        )
+        self.assertTrue(ok)
+        self.assertEqual(output, ["610 8 yok 5"])
+        self.assertEqual(interpreter.variables["sayac"], 3)
+
+    def test_classes_and_builtin_methods(self):
+        output, ok, _ = run(
+            'sınıf Hayvan {\n'
+            '    kurucu(ad) { öz.ad = ad }\n'
+            '    fonksiyon ses() { dön "..." }\n'
+            '    fonksiyon tanit() { dön öz.ad + ": " + öz.ses() }\n'
+            '}\n'
+            'sınıf Kedi < Hayvan {\n'
+            '    fonksiyon ses() { dön "miyav" }\n'
+            '    fonksiyon tanit() { dön "Kedi " + ata.tanit() }\n'
+            '}\n'
+            'değişken k = yeni Kedi("Tekir")\n'
+            'değişken l = [3, 1, 2]\n'
+            'l.ekle(0)\n'
+            'ekle(l, 9)\n'
+            'değişken d = {"a": 1, b: [1, 2]}\n'
+            'yazdır(k.tanit(), sırala(l), l.bul(9), "istanbul".buyuk(), "a,b".parcala(","))\n'
+            'yazdır(d, d.anahtarlar(), metin(1.5), sayı("42") + 1)\n'
+        )
+        self.assertTrue(ok)
+        self.assertEqual(output, [
+            "Kedi Tekir: miyav [0, 1, 2, 3, 9] 4 İSTANBUL [a, b]",
+            '{"a": 1, "b": [1, 2]} [a, b] 1.5 43',
+        ])
+
+    def test_instances_share_constructor_shapes(self):
+        output, ok, interpreter = run(
+            'sınıf Dugum {\n'
+            '    kurucu(deger) { öz.deger = deger  öz.sonraki = yok }\n'
+            '    fonksiyon toplam() {\n'
+            '        eğer (öz.sonraki == yok) { dön öz.deger }\n'
+            '        dön öz.deger + öz.sonraki.toplam()\n'
+            '    }\n'
+            '}\n'
+            'sınıf Etiketli < Dugum {\n'
+            '    kurucu(deger) { ata.kurucu(deger)  öz.etiket = "e" }\n'
+            '}\n'
+            'değişken a = yeni Dugum(1)\n'
+            'değişken b = yeni Etiketli(2)\n'
+            'b.sonraki = a\n'
+            'değişken c = yeni Dugum(3)\n'
+            'c.sonraki = b\n'
+            'c.ek = doğru\n'
+            'yazdır(c.toplam(), b.etiket, c.ek)\n'
+        )
+        self.assertTrue(ok)
+        self.assertEqual(output, ["6 e doğru"])
+        a, b, c = (interpreter.variables[name] for name in "abc")
+        self.assertEqual(a.klass.layout, ("deger", "sonraki"))
+        self.assertEqual(b.klass.layout, ("deger", "sonraki", "etiket"))
+        self.assertIs(a.shape, a.klass.shape)  # Kurucunun atadığı alanlar yeni Shape açmaz
+        self.assertIs(c.shape, a.shape.add("ek"))
+        self.assertEqual(c.fields, {"deger": 3, "sonraki": b, "ek": True})
+
+
+class TestCollectionBuiltins(unittest.TestCase):
+
+    PROGRAM = (
+        'dahil_et("veri_yapilari")\n'
+        'değişken y = yeni Yigin()\n'
+        'için (değişken i = 0; i < 1000; i = i + 1) { y.ekle(i) }\n'
+        'değişken pq = yeni OncelikliKuyruk()\n'
+        'pq.ekle("c", 5)  pq.ekle("a", 1)  pq.ekle("d", 5)  pq.ekle("b", 3)\n'
+        'değişken t = yeni HashTablosu(4)\n'
+        't.ekle("x", 1)  t.ekle("x", 2)\n'
+        'değişken k = kuyruk_yap([2])\n'
+        'başa_ekle(k, 1)  ekle(k, 3)\n'
+        'yazdır(y.cikar(), y.boyut, pq.cikar() + pq.cikar() + pq.cikar() + pq.cikar(), pq.cikar())\n'
+        'yazdır(t.al("x"), t.boyut, t.varmi("z"), baştan_çıkar(k), k, dilim([1, 2, 3], 1))\n'
+    )
+
+    def test_data_structures_library(self):
+        output, ok, interpreter = run(self.PROGRAM, search_root=PROJECT_ROOT)
+        self.assertTrue(ok)
+        self.assertEqual(output[-2:], ["999 999 abcd yok", "2 1 yanlış 1 [2, 3] [2, 3]"])
+        # Eklemeler yerinde yapılır: yığının listesi kopyalanmaz
+        self.assertEqual(len(interpreter.variables["y"].get("elemanlar")), 999)
+
+        output, ok, _ = run('değişken l = []\nçıkar(l)\n')
+        self.assertFalse(ok)
+        self.assertEqual(output, ["Simülasyon Hatası (Satır 2): Liste indeks hatası (sınır dışı)."])
+
+    def test_priority_queue_on_every_backend(self):
+        # Kütüphanenin kendisi + kullanım: --native-python dahil_et'i tercüme etmez
+        library = (PROJECT_ROOT / "lib" / "veri_yapilari.tr").read_text(encoding="utf-8")
+        source = library + (
+            '\ndeğişken pq = yeni OncelikliKuyruk()\n'
+            'için (değişken i = 0; i < 9; i = i + 1) { pq.ekle("e" + i, (i * 4) % 7) }\n'
+            'değişken sira = []\n'
+            'döngü (!pq.bosmu()) { ekle(sira, pq.cikar()) }\n'
+            'yazdır(sira)\n'
+        )
+        expected = "[e0, e7, e2, e4, e6, e1, e8, e3, e5]"  # Öncelik 0..6; eşitler eklenme sırasıyla
+        with tempfile.TemporaryDirectory() as folder:
+            path = Path(folder) / "kuyruk.tr"
+            path.write_text(source, encoding="utf-8")
+            interpreted = []
+            self.assertTrue(GumusInterpreter(interpreted.append).run(source))
+            compiled = []
+            self.assertTrue(GumusVM(compiled.append).run_file(path))
+            native = io.StringIO()
+            with contextlib.redirect_stdout(native):
+                self.assertEqual(run_simulator.run_native_python(path, Path(folder) / "cache"), 0)
+        self.assertEqual(interpreted[-1], expected)
+        self.assertEqual(compiled, interpreted)
+        self.assertEqual(native.getvalue().splitlines(), interpreted)
+        # Orta nokta bölmenin kesmesine dayanmaz: Python görünümünde de tamsayı
+        self.assertIn("orta = int((alt + ust) / 2)", GumusToPythonTranspiler().transpile(library))
+
+    def test_transpiler_expands_collection_builtins(self):
+        code = GumusToPythonTranspiler().transpile(
+            'değişken k = kuyruk_yap()\nekle(k, 1)\nbaşa_ekle(k, 0)\nyazdır(baştan_çıkar(k), sozluk_al({}, "a", 7))\n')
+        self.assertIn("from collections import deque", code)
+        self.assertIn("k.appendleft(0)", code)
+        self.assertIn("print(k.popleft(), {}.get(\"a\", 7))", code)
+
+
+class TestTiering(unittest.TestCase):
+
+    PROGRAM = (
+        'fonksiyon fib(n) { eğer (n < 2) { dön n } dön fib(n - 1) + fib(n - 2) }\n'
+        'fonksiyon tek_topla(n) {\n'
+        '    değişken t = 0\n'
+        '    için (değişken i = 0; i < n; i = i + 1) { eğer (i % 2 == 0) { devam } t = t + i }\n'
+        '    dön t veya "yok"\n'
+        '}\n'
+        'fonksiyon etiket(x) { dön "n=" + x }\n'
+        'fonksiyon yaz(x) { yazdır(x) }\n'
+        'değişken s = 0\n'
+        'için (değişken j = 0; j < 1500; j = j + 1) { s = s + uzunluk(etiket(j)) }\n'
+        'yazdır(fib(18), tek_topla(1500), tek_topla(1), -7 / 2, s, etiket(5))\n'
+        'yazdır(tek_topla("a"))\n'
+    )
+
+    def run_program(self, tiering):
+        output = []
+        interpreter = GumusInterpreter(output.append)
+        interpreter.tiering = tiering
+        ok = interpreter.run(self.PROGRAM)
+        return output, ok, interpreter.variables
+
+    def test_hot_pure_functions_are_promoted_with_same_results(self):
+        expected = self.run_program(False)[:2]
+        output, ok, variables = self.run_program(True)
+        self.assertEqual((output, ok), expected)
+        self.assertEqual(output[0], "2584 562500 yok -3 7890 n=5")
+        self.assertIn("Satır 4", output[1])  # Python'da farklı davranan çağrı yorumlayıcıda tekrarlanır
+
+        self.assertIsNotNone(variables["fib"].tier.code)
+        self.assertTrue(variables["tek_topla"].tier.failed)  # Metin < sayı: geri düşürüldü
+        self.assertTrue(variables["etiket"].tier.failed)     # "n=" + x metin birleştirmesi
+        self.assertIsNone(variables["yaz"].tier)             # Çıktı üreten fonksiyon yükseltilmez
+
+
+class TestInterpreterContract(unittest.TestCase):
+
+    def test_errors_are_caught_and_reported_with_line(self):
+        output, ok, _ = run(
+            'dene {\n'
+            '    yazdır(1 / 0)\n'
+            '} yakala(hata) {\n'
+            '    yazdır("yakalandı: " + hata)\n'
+            '}\n'
+            'yazdır("devam")\n'
+            'yazdır(tanimsiz)\n'
+            'yazdır("buraya gelinmez")\n'
+        )
+        self.assertFalse(ok)
+        self.assertEqual(output, [
+            "yakalandı: Sıfıra bölme hatası: Matematik kurallarına aykırı yeğenim.",
+            "devam",
+            "Simülasyon Hatası (Satır 7): Tanımsız değişken veya fonksiyon: 'tanimsiz'",
+        ])
+
+        output, ok, _ = run('değişken = 1\n')
+        self.assertFalse(ok)
+        self.assertTrue(output[0].startswith("Sözdizimi Hatası (Satır 1)"))
+
+    def test_include_loads_each_module_once(self):
+        with tempfile.TemporaryDirectory() as folder:
+            root = Path(folder)
+            (root / "lib").mkdir()
+            (root / "lib" / "sayac.tr").write_text(
+                'yazdır("yüklendi")\nfonksiyon iki_kat(x) { dön x * 2 }\n', encoding="utf-8")
+            # Eski kütüphane dosyaları cp1254 kodlamalı olabilir
+            (root / "eski.tr").write_bytes('değişken selam = "günaydın"\n'.encode("cp1254"))
+            main = root / "ana.tr"
+            main.write_text('dahil_et("sayac")\ndahil_et("lib/sayac.tr")\ndahil et eski\n'
+                            'yazdır(iki_kat(21), selam)\n', encoding="utf-8")
+
+            output = []
+            self.assertTrue(GumusInterpreter(output.append, search_root=root).run_file(main))
+            self.assertEqual(output, ["yüklendi", "42 günaydın"])
+
+    def test_trace_signals_and_stop(self):
+        output = []
+        interpreter = GumusInterpreter(output.append)
+        interpreter.trace_enabled = True
+        interpreter.execution_delay = 0
+        interpreter.run('değişken x = 1\nyazdır(x)\n')
+        self.assertEqual([line for line in output if not line.startswith("__PROFILE__")],
+                         ["__TRACE__:1", "__TRACE__:2", '__VARS__:{"x": 1}', "1"])
+
+        def stop_after_first(message):
+            output.append(message)
+            interpreter.stop()
+        output.clear()
+        interpreter = GumusInterpreter(stop_after_first)
+        self.assertFalse(interpreter.run('döngü (doğru) { yazdır("tur") }\n'))
+        self.assertEqual(output, ["tur", "Simülasyon durduruldu."])
+
+
+class TestLegacySimulatorExpressions(unittest.TestCase):
+
+    def test_expressions_compile_once_and_see_current_variables(self):
+        output = []
+        simulator = GumusSimulator(output.append)
+        compile_expression.cache_clear()
+        simulator.run(
+            'fonksiyon kare(x) {\n'
+            '    dön x * x\n'
+            '}\n'
+            'değişken i = 0\n'
+            'değişken s = 0\n'
+            'döngü (i < 50 ve s >= 0) {\n'
+            '    s = s + kare(i)\n'
+            '    i = i + 1\n'
+            '}\n'
+            'yazdır(s, i)\n'
+        )
+        self.assertEqual(output, ["40425 50"])
+        info = compile_expression.cache_info()
+        self.assertGreater(info.hits, 100)
+        self.assertLess(info.currsize, 10)
+        self.assertNotIn("s", simulator.namespace)  # Değişkenler kalıcı ad alanına kopyalanmaz
+
+
+if __name__ == '__main__':
+    unittest.main()
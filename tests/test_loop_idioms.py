@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+Döngü Kalıbı Testleri
+Python transpiler'ının sayaçlı döngüleri range döngüsüne çevirmesini, değişmez
+uzunluk(...) çağrılarını koşuldan dışarı almasını ve anlambilimin değişebileceği
+döngüleri olduğu gibi bırakmasını doğrular.
+"""
+
+import contextlib
+import io
+import unittest
+import sys
+from pathlib import Path
+
+TEST_DIR = Path(__file__).parent
+PROJECT_ROOT = TEST_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.ide.core.interpreter import GumusInterpreter
+from src.ide.core.transpiler import GumusToPythonTranspiler
+
+
+def transpile_and_run(source):
+    """(üretilen kod, Python çıktısı satırları, yorumlayıcı çıktısı)"""
+    code = GumusToPythonTranspiler().transpile(source)
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        exec(code, {})
+    expected = []
+    GumusInterpreter(expected.append).run(source)
+    return code, buffer.getvalue().splitlines(), expected
+
+
+class TestLoopIdioms(unittest.TestCase):
+
+    def test_counted_loops_become_ranges(self):
+        code, output, expected = transpile_and_run(
+            'değişken l = [3, 1, 4, 1, 5]\n'
+            'değişken toplam = 0\n'
+            'değişken i = 0\n'
+            'döngü (i < uzunluk(l)) { toplam = toplam + l[i]  i = i + 1 }\n'
+            'yazdır(toplam)\n'
+            'için (değişken a = 0; a < uzunluk(l); a = a + 1) {\n'
+            '    için (değişken b = a + 1; b <= 4; b = b + 1) {\n'
+            '        eğer (l[b] < l[a]) { devam }\n'   # devam artışı atlamaz
+            '        yazdır(a, b)\n'
+            '    }\n'
+            '}\n'
+            'için (değişken k = 10; k > 0; k = k - 3) { yazdır(k) }\n'
+            'değişken n = 2.5\n'
+            'için (değişken k = 0; k <= n; k = k + 1) { yazdır("f", k) }\n'
+        )
+        self.assertIn("for i in range(len(l)):", code)
+        self.assertIn("for b in range(a + 1, 5):", code)
+        self.assertIn("for k in range(10, 0, -3):", code)
+        self.assertIn("for k in range(math.floor(n) + 1):", code)
+        self.assertNotIn("while", code)
+        self.assertEqual(output, expected)
+
+    def test_loops_that_must_stay_while(self):
+        code, output, expected = transpile_and_run(
+            'değişken l = [3, 1, 4]\n'
+            'değişken j = 0\n'
+            'döngü (j < uzunluk(l) ve l[j] != 4) { j = j + 1 }\n'  # Sayaç döngüden sonra okunuyor
+            'yazdır(j)\n'
+            'değişken m = 0\n'
+            'döngü (m < uzunluk(l)) { ekle(l, 1)  m = m + 2 }\n'   # Gövde listeyi büyütüyor
+            'değişken t = 0\n'
+            'döngü (t < 3) { t = t + 1  eğer (t == 2) { devam }  yazdır(t) }\n'
+            'yazdır(m, uzunluk(l))\n'
+        )
+        self.assertNotIn("range", code)
+        self.assertIn("_uzunluk0 = len(l)\nwhile (j < _uzunluk0 and", code)
+        self.assertIn("while m < len(l):", code)
+        self.assertEqual(output, expected)
+
+    def test_continue_runs_for_increment(self):
+        # range'e çevrilemeyen için döngüsünde `devam` artışı atlarsa döngü biter mez
+        code, output, expected = transpile_and_run(
+            'için (değişken i = 1; i < 100; i = i * 2) { eğer (i == 4) { devam } yazdır(i) }\n'
+        )
+        self.assertIn("while i < 100:", code)
+        self.assertIn("        i = i * 2\n        continue", code)
+        self.assertEqual(output, ["1", "2", "8", "16", "32", "64"])
+        self.assertEqual(output, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
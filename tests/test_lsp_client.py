@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+Dil Sunucusu İstemcisi Testleri
+İsteklerin yanıt beklenmeden art arda gönderilmesini, iptalin hemen
+sonuçlanmasını ve sunucu çöktüğünde bekleyen isteklerin hata ile bitip
+sunucunun açık belgelerle yeniden başlatılmasını sahte bir sunucuyla doğrular.
+"""
+
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+
+TEST_DIR = Path(__file__).parent
+PROJECT_ROOT = TEST_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.ide.core.lsp_client import LspClient, LspError, METHOD_NOT_FOUND, REQUEST_CANCELLED
+from src.ide.core.secure_subprocess import SecureSubprocessManager, SecurityLevel
+
+STUB_SERVER = TEST_DIR / "scripts" / "lsp_stub_server.py"
+
+
+class TestLspClient(unittest.TestCase):
+
+    def setUp(self):
+        manager = SecureSubprocessManager(SecurityLevel.MEDIUM)
+        manager.add_safe_command(Path(sys.executable).name)
+        self.client = LspClient([sys.executable, str(STUB_SERVER)], manager=manager, timeout=10)
+        self.addCleanup(self.client.shutdown)
+
+    def wait_for(self, condition, timeout=10):
+        deadline = time.monotonic() + timeout
+        while not condition():
+            if time.monotonic() > deadline:
+                self.fail("Koşul zamanında sağlanmadı")
+            time.sleep(0.02)
+
+    def test_requests_are_pipelined(self):
+        self.assertEqual(self.client.ast('yazdır("ğüş")\n'), [{"type": "Line", "value": 'yazdır("ğüş")'}])
+        slow = self.client.request("test/sleep", {"seconds": 0.3})
+        fast = self.client.request("gumus/ast", {"textDocument": {"uri": "gumus://ast"}})
+        unknown = self.client.request("gumus/yok")
+        self.assertFalse(slow.done())  # Gönderim yanıt beklemedi
+        self.assertEqual(slow.result(10), "uyandım")
+        self.assertEqual(len(fast.result(10)), 1)
+        with self.assertRaises(LspError) as error:
+            unknown.result(10)
+        self.assertEqual(error.exception.code, METHOD_NOT_FOUND)
+
+    def test_concurrent_ast_calls_get_their_own_source(self):
+        results, errors = {}, []
+
+        def worker(n):
+            try:
+                for i in range(50):
+                    source = f"kaynak {n} {i}\n"
+                    results[(n, i)] = (source, self.client.ast(source))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        for source, tree in results.values():
+            self.assertEqual(tree, [{"type": "Line", "value": source.strip()}])
+
+    def test_cancel_resolves_immediately(self):
+        slow = self.client.request("test/sleep", {"seconds": 0.5})
+        self.assertTrue(self.client.cancel(slow))
+        with self.assertRaises(LspError) as error:
+            slow.result(0)
+        self.assertEqual(error.exception.code, REQUEST_CANCELLED)
+        self.assertFalse(self.client.cancel(slow))
+        # Geç gelen yanıt yok sayılır, sonraki istek etkilenmez
+        self.assertEqual(self.client.call("test/sleep", {"seconds": 0}), "uyandım")
+
+    def test_crash_fails_pending_and_restarts(self):
+        self.client.open_document("file:///a.tr", "değişken x = 1\nhata burada\n")
+        self.wait_for(lambda: self.client.diagnostics("file:///a.tr"))
+        self.client._diagnostics.clear()
+        pending = self.client.request("test/crash")
+        with self.assertRaises(LspError):
+            pending.result(10)
+
+        self.wait_for(lambda: self.client.restarts == 1)
+        # Açık belge yeni sürece yeniden gönderildi, tanıları yeniden yayınlandı
+        self.wait_for(lambda: self.client.diagnostics("file:///a.tr"))
+        self.assertEqual(self.client.ast("a\nb\n")[1]["value"], "b")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+Süreç İçi Yerel Yorumlayıcı Testleri
+gumus_api.h arayüzünü uygulayan sahte bir kütüphaneyi derleyip NativeVM ile
+yükler; çıktının geri çağırımla gelmesini, girdinin aktarılmasını, iptali ve
+tampon büyütmeyi doğrular.
+"""
+
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+import unittest.mock
+from pathlib import Path
+
+TEST_DIR = Path(__file__).parent
+PROJECT_ROOT = TEST_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.ide.core import native_vm
+from src.ide.core.native_vm import NativeVM, NativeError, BUSY, INITIAL_BUFFER
+
+STUB_LIBRARY = TEST_DIR / "scripts" / "gumus_api_stub.c"
+C_COMPILER = shutil.which("cc") or shutil.which("gcc")
+
+
+@unittest.skipIf(sys.platform == 'win32' or C_COMPILER is None, "Sahte kütüphane için C derleyicisi gerekir")
+class TestNativeVM(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.folder = tempfile.TemporaryDirectory()
+        cls.library = Path(cls.folder.name) / "libgumus.so"
+        subprocess.run([C_COMPILER, "-shared", "-fPIC", "-o", str(cls.library), str(STUB_LIBRARY)],
+                       check=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.folder.cleanup()
+
+    def setUp(self):
+        self.vm = NativeVM(self.library)
+        self.program = Path(self.folder.name) / "program.tr"
+
+    def start(self, text, **options):
+        self.program.write_text(text, encoding="utf-8")
+        return self.vm.start(self.program, **options)
+
+    def test_output_and_input(self):
+        chunks = []
+        run = self.start("selam ğüş\noku\nhata burada\nçalışmaz\n",
+                         on_output=lambda text, is_error: chunks.append((text, is_error)))
+        self.assertEqual(run.stdout.readline(), "selam ğüş\n")
+        run.stdin.write("Ayşe\n")
+        run.stdin.flush()
+        self.assertEqual(run.stdout.read(), "okundu: Ayşe\n")
+        self.assertEqual(run.stderr.read(), "hata burada\n")
+        self.assertEqual(run.wait(timeout=10), 1)
+        self.assertEqual(chunks[-1], ("hata burada\n", True))
+        self.assertEqual(self.vm.dump_memory(), {"line": 3, "stack": [], "env": {"bayrak": 0}})
+
+    def test_cancel_and_restart(self):
+        endless = self.start("sonsuz\n")
+        with self.assertRaises(subprocess.TimeoutExpired):
+            endless.wait(timeout=0.1)
+        run = self.start("oku\n", dump_memory=True)  # Öncekini iptal eder
+        self.assertEqual(endless.wait(timeout=10), -1)
+        run.stdin.close()
+        self.assertEqual(run.stdout.read(), "okundu: (son)\n")
+        self.assertEqual(run.wait(timeout=10), 0)
+        self.assertEqual(self.vm.dump_memory()["env"], {"bayrak": 1})
+
+    def test_run_timeout_cancels(self):
+        self.program.write_text("sonsuz\n", encoding="utf-8")
+        with self.assertRaises(subprocess.TimeoutExpired):
+            self.vm.run(self.program, timeout=0.1)
+        run = self.start("selam\n")  # Zaman aşımında iptal edildi, kütüphane boşta
+        self.assertEqual(run.stdout.read(), "selam\n")
+        self.assertEqual(run.wait(timeout=10), 0)
+
+    def test_unresponsive_run_reports_busy(self):
+        slow = self.start("yavaş\n")
+        with unittest.mock.patch.object(native_vm, "CANCEL_TIMEOUT", 0.1):
+            with self.assertRaises(NativeError) as caught:
+                self.start("selam\n")
+        self.assertEqual(caught.exception.status, BUSY)
+        self.assertEqual(slow.wait(timeout=10), 0)
+        run = self.start("selam\n")  # Önceki bitince yeniden başlatılabilir
+        self.assertEqual(run.stdout.read(), "selam\n")
+        self.assertEqual(run.wait(timeout=10), 0)
+
+    def test_buffer_calls(self):
+        source = "x" * (INITIAL_BUFFER + 10)  # İlk tampon yetmez, yeniden denenir
+        self.assertEqual(self.vm.dump_ast(source), '[{"type": "Source", "value": "%s"}]' % source)
+        self.assertEqual(self.vm.compile("yazdır(1)"), (True, []))
+        ok, diagnostics = self.vm.compile("hata")
+        self.assertFalse(ok)
+        self.assertEqual(diagnostics[0]["type"], "syntax_error")
+
+    def test_missing_library(self):
+        vm = NativeVM(Path(self.folder.name) / "yok.so")
+        self.assertFalse(vm.available())
+
+
+if __name__ == '__main__':
+    unittest.main()
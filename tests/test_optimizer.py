@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+AST İyileştirici Testleri
+Sabit katlama ve ölü kod atmanın sayaçlarını, iyileştirilmiş programın yorumlayıcı,
+VM ve transpiler'da aynı çıktıyı vermesini ve paylaşılan AST'nin değişmemesini doğrular.
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+TEST_DIR = Path(__file__).parent
+PROJECT_ROOT = TEST_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.ide.core.ast_nodes import BinaryExpr
+from src.ide.core.parse_cache import parse_source
+from src.ide.core.optimizer import optimize
+from src.ide.core.interpreter import GumusInterpreter
+from src.ide.core.vm import GumusVM
+from src.ide.core.transpiler import GumusToPythonTranspiler
+
+SOURCE = (
+    'değişken x = 2 * 3 + 1\n'
+    'değişken s = "n=" + 5 + " " + 7 / 2\n'
+    'eğer (yanlış) { yazdır("asla") } değilse { yazdır("her zaman", x, s) }\n'
+    'eğer (!!x) { yazdır("x var") }\n'
+    'döngü (1 > 2) { yazdır("yok") }\n'
+    'fonksiyon f(a) {\n'
+    '    dön a * (10 % 4)\n'
+    '    yazdır("ölü")\n'
+    '}\n'
+    'için (değişken i = 0; i < 3; i = i + 1) {\n'
+    '    eğer (i == 1) { devam  yazdır("ölü") }\n'
+    '    yazdır(i, yok veya "v", 0 ve f(1), !yanlış)\n'
+    '}\n'
+    'yazdır(f(3), 1 / 0)\n'
+)
+
+
+class TestAstOptimizer(unittest.TestCase):
+
+    def test_counters_and_shared_ast(self):
+        program = parse_source(SOURCE)
+        before = program.to_json()
+        optimized, stats = optimize(program)
+        self.assertEqual(stats.as_dict(),
+                         {'folded': 11, 'pruned_branches': 2, 'unreachable': 2, 'negations': 1})
+        self.assertEqual(program.to_json(), before)  # Önbellekteki ağaç olduğu gibi kalır
+        self.assertEqual(optimized.statements[0].initializer.value, 7)
+        self.assertEqual(optimized.statements[1].initializer.value, "n=5 3")
+        self.assertIs(optimize(optimized)[0], optimized)  # İkinci geçişte yapılacak iş kalmaz
+
+    def test_large_repetition_is_not_folded(self):
+        program = parse_source('değişken a = "ab" * 400000000\ndeğişken b = 400000000 * "ab"\n'
+                               'değişken c = "ab" * 3\n')
+        optimized, stats = optimize(program)
+        self.assertEqual(stats.folded, 1)
+        self.assertEqual(optimized.statements[2].initializer.value, "ababab")
+        self.assertIsInstance(optimized.statements[0].initializer, BinaryExpr)
+        self.assertIsInstance(optimized.statements[1].initializer, BinaryExpr)
+
+    def test_same_output_in_every_backend(self):
+        for backend in (GumusInterpreter, GumusVM):
+            outputs = []
+            for flag in (False, True):
+                output = []
+                runner = backend(output.append)
+                runner.optimize = flag
+                self.assertFalse(runner.run(SOURCE))  # 1 / 0 katlanmaz, satırıyla hata verir
+                outputs.append(output)
+            self.assertEqual(outputs[0], outputs[1])
+            self.assertIn("(Satır 14)", outputs[1][-1])
+            self.assertEqual(runner.optimization_stats.pruned_branches, 2)
+
+        transpiler = GumusToPythonTranspiler()
+        code = transpiler.transpile(SOURCE, optimize=True)
+        self.assertNotIn("asla", code)
+        self.assertEqual(transpiler.optimization_stats.folded, 11)
+
+    def test_trace_runs_unoptimized(self):
+        output = []
+        interpreter = GumusInterpreter(output.append)
+        interpreter.optimize = True
+        interpreter.trace_enabled = True
+        interpreter.execution_delay = 0
+        self.assertTrue(interpreter.run('eğer (yanlış) { yazdır(1) }\nyazdır(1 + 1)\n'))
+        self.assertEqual(interpreter.optimization_stats.total, 0)
+        self.assertIn("2", output)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+Ayrıştırma Önbelleği Testleri
+ParseCache'in aynı içerik için tek bir ayrıştırmayı paylaştırdığını, LRU
+sınırına uyduğunu ve disk katmanının oturumlar arasında kullanıldığını doğrular.
+"""
+
+import tempfile
+import threading
+import unittest
+import sys
+from pathlib import Path
+
+TEST_DIR = Path(__file__).parent
+PROJECT_ROOT = TEST_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.ide.core.tokenizer import GumusTokenizer
+from src.ide.core.parser import GumusParser
+from src.ide.core.parse_cache import ParseCache
+
+
+class TestParseCache(unittest.TestCase):
+
+    SOURCE = 'fonksiyon kare(x) {\n    dön x * x\n}\nyazdır(kare(4))\n'
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self._tmp.name) / "ast"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_memory_hit_returns_same_tree(self):
+        cache = ParseCache(persist=False)
+        first = cache.parse(self.SOURCE)
+        self.assertIs(cache.parse(self.SOURCE), first)
+        self.assertEqual((cache.misses, cache.hits), (1, 1))
+        expected = GumusParser(GumusTokenizer(self.SOURCE).tokenize()).parse()
+        self.assertEqual(first.to_json(), expected.to_json())
+
+    def test_lru_bound(self):
+        cache = ParseCache(max_entries=2, persist=False)
+        for i in range(3):
+            cache.parse(f"değişken x = {i}")
+        self.assertEqual(len(cache._entries), 2)
+        cache.parse("değişken x = 0")  # En eskisi atılmıştı
+        self.assertEqual(cache.misses, 4)
+
+    def test_concurrent_parses_share_bounded_table(self):
+        cache = ParseCache(max_entries=4, persist=False)
+        errors = []
+
+        def worker(offset):
+            try:
+                for i in range(300):
+                    cache.parse(f"değişken x = {(i + offset) % 10}")
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(cache._entries), 4)
+        self.assertEqual(cache.hits + cache.misses, 8 * 300)
+
+    def test_disk_layer_survives_new_session(self):
+        ParseCache(self.cache_dir).parse(self.SOURCE)
+        self.assertEqual(len(list(self.cache_dir.glob("*/*.ast"))), 1)
+
+        fresh = ParseCache(self.cache_dir)
+        ast = fresh.parse(self.SOURCE)
+        self.assertEqual((fresh.disk_hits, fresh.misses), (1, 0))
+        self.assertEqual(ast.to_json(), ParseCache(persist=False).parse(self.SOURCE).to_json())
+
+    def test_corrupt_entry_is_reparsed(self):
+        cache = ParseCache(self.cache_dir)
+        cache.parse(self.SOURCE)
+        for entry in self.cache_dir.glob("*/*.ast"):
+            entry.write_bytes(b"bozuk")
+        fresh = ParseCache(self.cache_dir)
+        fresh.parse(self.SOURCE)
+        self.assertEqual(fresh.misses, 1)
+
+    def test_key_depends_on_content(self):
+        self.assertEqual(ParseCache.key("a"), ParseCache.key("a"))
+        self.assertNotEqual(ParseCache.key("a"), ParseCache.key("a "))
+
+
+if __name__ == '__main__':
+    unittest.main()
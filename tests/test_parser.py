@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+"""
+GümüşParser Testleri
+Ayrıştırıcının hataları tek geçişte konumlarıyla topladığını, hatalı bildirimleri
+atlayıp kalan programı kurtardığını ve dilin ifade biçimlerini tanıdığını doğrular.
+"""
+
+import pickle
+import unittest
+import sys
+from pathlib import Path
+
+TEST_DIR = Path(__file__).parent
+PROJECT_ROOT = TEST_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.ide.core.tokenizer import GumusTokenizer, TokenType
+from src.ide.core.parser import GumusParser, IncrementalParser
+from src.ide.core.ast_nodes import (
+    NODE_TYPES, NodeVisitor, VarStmt, ClassStmt, ForStmt, TryStmt, ExprStmt, PrintStmt,
+    BreakStmt, ContinueStmt,
+    AssignExpr, SetExpr, IndexSetExpr, LogicalExpr, NewExpr, DictExpr, ListExpr,
+    BinaryExpr, UnaryExpr, Variable,
+)
+
+
+def parse(source):
+    return GumusParser(GumusTokenizer(source).tokenize()).parse()
+
+
+class TestParserDiagnostics(unittest.TestCase):
+
+    def test_valid_program_has_no_diagnostics(self):
+        program = parse('değişken x = 1\nfonksiyon f(a) {\n    dön a + x\n}\nyazdır(f(2))\n')
+        self.assertEqual(program.diagnostics, [])
+        self.assertEqual(len(program.statements), 3)
+
+    def test_all_errors_collected_in_one_pass(self):
+        program = parse(
+            'değişken = 5\n'          # 1: isim eksik
+            'yazdır("tamam")\n'
+            'eğer (x > ) {\n'          # 3: ifade eksik
+            '    yazdır(1)\n'
+            '}\n'
+            'değişken y = 2\n'
+        )
+        self.assertEqual([d.line for d in program.diagnostics], [1, 3])
+
+        first = program.diagnostics[0]
+        self.assertEqual((first.col, first.end_col), (10, 11))
+        self.assertEqual(first.expected, TokenType.IDENTIFIER)
+        self.assertEqual(first.found.type, TokenType.EQ)
+
+        second = program.diagnostics[1]
+        self.assertEqual(second.found.type, TokenType.RPAREN)
+        self.assertEqual(second.to_json()["found"], TokenType.RPAREN)
+
+        # Hatalı bildirimler atlanır, None yerine geçerli kısımlar kalır
+        self.assertTrue(all(stmt is not None for stmt in program.statements))
+        self.assertIsInstance(program.statements[0], PrintStmt)
+        self.assertIsInstance(program.statements[-1], VarStmt)
+        program.to_json()
+
+    def test_unclosed_block_reported_at_opening_brace(self):
+        program = parse('fonksiyon f() {\n    yazdır(1)\n\n')
+        self.assertEqual(len(program.diagnostics), 1)
+        self.assertEqual(program.diagnostics[0].line, 1)
+        self.assertEqual(program.diagnostics[0].expected, TokenType.RBRACE)
+
+    def test_errors_inside_blocks_do_not_lose_block(self):
+        program = parse('döngü (doğru) {\n    x = = 1\n    kır\n}\n')
+        self.assertEqual([d.line for d in program.diagnostics], [2])
+        body = program.statements[0].body
+        self.assertEqual([type(s).__name__ for s in body.statements], ["BreakStmt"])
+
+
+class TestParserGrammar(unittest.TestCase):
+
+    def test_assignment_targets(self):
+        stmts = parse('x = 1\nöz.ad = "a"\nliste[0] = x ve y veya z').statements
+        self.assertIsInstance(stmts[0].expression, AssignExpr)
+        self.assertIsInstance(stmts[1].expression, SetExpr)
+        assign = stmts[2].expression
+        self.assertIsInstance(assign, IndexSetExpr)
+        self.assertIsInstance(assign.value, LogicalExpr)
+        self.assertEqual(assign.value.operator.value, "veya")
+
+    def test_class_new_and_try(self):
+        program = parse(
+            'sınıf Kedi < Hayvan {\n'
+            '    kurucu(ad) { öz.ad = ad }\n'
+            '    fonksiyon ses() { dön "miyav" }\n'
+            '}\n'
+            'dene { değişken k = yeni Kedi("Tekir") } yakala(hata) { yazdır(hata) }\n'
+        )
+        self.assertEqual(program.diagnostics, [])
+        cls, attempt = program.statements
+        self.assertIsInstance(cls, ClassStmt)
+        self.assertEqual([m.name.value for m in cls.methods], ["kurucu", "ses"])
+        self.assertEqual(cls.superclass.name.value, "Hayvan")
+        self.assertIsInstance(attempt, TryStmt)
+        self.assertEqual(attempt.catch_name.value, "hata")
+        self.assertIsInstance(attempt.try_block.statements[0].initializer, NewExpr)
+
+    def test_for_loops_and_literals(self):
+        program = parse(
+            'için (değişken i = 0; i < 3; i = i + 1) { yazdır(i) }\n'
+            'döngü (j = 0; j < 2; j = j + 1) { }\n'
+            'değişken d = {"a": [1, 2], b: 3};\n'
+        )
+        self.assertEqual(program.diagnostics, [])
+        first, second, var = program.statements
+        self.assertIsInstance(first, ForStmt)
+        self.assertIsInstance(first.initializer, VarStmt)
+        self.assertIsInstance(second.initializer, ExprStmt)
+        self.assertIsInstance(var.initializer, DictExpr)
+        self.assertEqual([k.value for k in var.initializer.keys], ["a", "b"])
+        self.assertIsInstance(var.initializer.values[0], ListExpr)
+
+    def test_break_and_continue_keep_keyword_token(self):
+        program = parse('döngü (doğru) {\n    kır;\n    devam\n}\n')
+        self.assertEqual(program.diagnostics, [])
+        stop, skip = program.statements[0].body.statements
+        self.assertIsInstance(stop, BreakStmt)
+        self.assertEqual((stop.keyword.type, stop.keyword.line), (TokenType.BREAK, 2))
+        self.assertIsInstance(skip, ContinueStmt)
+        self.assertEqual((skip.keyword.type, skip.keyword.line), (TokenType.CONTINUE, 3))
+
+    def test_precedence_and_associativity(self):
+        def shape(expr):
+            if isinstance(expr, (BinaryExpr, LogicalExpr)):
+                return [shape(expr.left), expr.operator.value, shape(expr.right)]
+            if isinstance(expr, UnaryExpr):
+                return [expr.operator.value, shape(expr.right)]
+            if isinstance(expr, AssignExpr):
+                return [expr.name.value, "=", shape(expr.value)]
+            return expr.name.value if isinstance(expr, Variable) else expr.value
+
+        expr = parse('x = y = a - b - c * -d % e < f ve !g veya h').statements[0].expression
+        self.assertEqual(shape(expr), ["x", "=", ["y", "=", [
+            [[[["a", "-", "b"], "-", [["c", "*", ["-", "d"]], "%", "e"]], "<", "f"], "ve", ["!", "g"]],
+            "veya", "h"]]])
+        # Gruba uygulanan sonekler ve grup içinde atama
+        call = parse('(f)(1).ad').statements[0].expression
+        self.assertEqual((type(call).__name__, type(call.object).__name__), ("GetExpr", "CallExpr"))
+        self.assertIsInstance(parse('(a = 1)').statements[0].expression, AssignExpr)
+
+    def test_deep_nesting_does_not_recurse(self):
+        depth = sys.getrecursionlimit() * 2
+        program = parse('x = ' + '(' * depth + '1' + ')' * depth + ' + ' + '-' * depth + 'y')
+        self.assertEqual(program.diagnostics, [])
+        program = parse('x = ((1 + 2)\ndeğişken y = a + = 3\n')
+        self.assertEqual([(d.line, d.message) for d in program.diagnostics],
+                         [(2, "Grup sonrası ) bekleniyor."), (2, "İfade bekleniyor.")])
+
+
+class TestAstNodes(unittest.TestCase):
+
+    def test_nodes_are_slotted_and_tagged(self):
+        self.assertEqual([t.kind for t in NODE_TYPES], list(range(len(NODE_TYPES))))
+        program = parse('sınıf A { kurucu() { öz.x = [1, {"a": 2}] } }\nyazdır(yeni A().x)\n')
+        self.assertFalse(hasattr(program.statements[0], "__dict__"))
+        # Önbellek diske pickle ile yazar; slotlu düğümler aynen geri gelmeli
+        restored = pickle.loads(pickle.dumps(program, protocol=pickle.HIGHEST_PROTOCOL))
+        self.assertEqual(restored.to_json(), program.to_json())
+
+    def test_visitor_dispatches_by_kind(self):
+        class Counter(NodeVisitor):
+            def __init__(self):
+                super().__init__()
+                self.seen = []
+
+            def visit_PrintStmt(self, node):
+                self.seen.append("yazdır")
+                for expr in node.expressions:
+                    self.visit(expr)
+
+            def visit_Literal(self, node):
+                self.seen.append(node.value)
+
+            def generic_visit(self, node):
+                self.seen.append(type(node).__name__)
+
+        counter = Counter()
+        for stmt in parse('yazdır(1, x)\nkır\n').statements:
+            counter.visit(stmt)
+        self.assertEqual(counter.seen, ["yazdır", 1, "Variable", "BreakStmt"])
+        with self.assertRaises(NotImplementedError):
+            NodeVisitor().visit(parse('kır').statements[0])
+
+
+class TestIncrementalParser(unittest.TestCase):
+
+    SOURCE = (
+        'değişken a = 1\n'
+        'fonksiyon f(x) {\n'
+        '    dön x + a\n'
+        '}\n'
+        'fonksiyon g(y) {\n'
+        '    yazdır(y)\n'
+        '}\n'
+        'yazdır(f(2))\n'
+    )
+
+    def assertMatchesFullParse(self, parser):
+        reference = parse(parser.source)
+        self.assertEqual(parser.program.to_json(), reference.to_json())
+        self.assertEqual([(d.line, d.col, d.message) for d in parser.program.diagnostics],
+                         [(d.line, d.col, d.message) for d in reference.diagnostics])
+
+    def test_edit_reparses_only_touched_declaration(self):
+        parser = IncrementalParser(self.SOURCE * 20)
+        before = list(parser.nodes)
+        pos = parser.source.index("yazdır(y)", len(parser.source) // 2)
+
+        first, old_stop, new_stop = parser.edit(pos + 7, pos + 8, "y * 2")
+        self.assertEqual((old_stop - first, new_stop - first), (1, 1))
+        self.assertMatchesFullParse(parser)
+        # Dokunulmayan bildirimler aynı nesneler olarak korunur
+        changed = set(range(first, new_stop))
+        for index, node in enumerate(parser.nodes):
+            if index not in changed:
+                self.assertIs(node, before[index])
+
+    def test_edits_that_merge_split_and_break_declarations(self):
+        parser = IncrementalParser(self.SOURCE)
+        brace = parser.source.index("}\nfonksiyon g")
+        parser.edit(brace, brace + 1, "")        # f, g'yi yutar
+        self.assertMatchesFullParse(parser)
+        parser.edit(brace, brace, "}")           # geri ayrılır
+        self.assertMatchesFullParse(parser)
+        parser.sync(parser.source.replace("dön x + a", "dön x +"))
+        self.assertEqual(len(parser.program.diagnostics), 1)
+        self.assertMatchesFullParse(parser)
+        parser.sync('yazdır("yeni")\n\n' + parser.source)  # Satırlar kayar
+        self.assertMatchesFullParse(parser)
+        parser.sync("")
+        self.assertMatchesFullParse(parser)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+Proje İndeksi Testleri
+Klasördeki .tr dosyalarının sembollerinin ve dahil_et kenarlarının birleşik
+indekse alındığını, değişikliklerin artımlı yenilendiğini doğrular.
+"""
+
+import os
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+
+TEST_DIR = Path(__file__).parent
+PROJECT_ROOT = TEST_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.ide.core.project_index import ProjectIndex, PARALLEL_THRESHOLD, index_source
+
+
+class TestProjectIndex(unittest.TestCase):
+
+    FILES = {
+        "ana.tr": 'dahil_et("lib/yardimci.tr")\ndeğişken sayac = 0\nyazdır(topla(1, 2))\n',
+        "lib/yardimci.tr": 'dahil et ortak\nfonksiyon topla(a, b) {\n    değişken t = a + b\n    dön t\n}\n',
+        "lib/ortak.tr": 'sınıf Sayac < Taban {\n    kurucu() { öz.n = 0 }\n    fonksiyon artir() { }\n}\n',
+        "odev/topla.tr": 'fonksiyon topla(x) { dön x }\n',
+    }
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name).resolve()
+        for name, source in self.FILES.items():
+            self.write(name, source)
+        self.index = ProjectIndex(self.root, max_workers=1)
+        self.assertEqual(self.index.refresh(), len(self.FILES))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def write(self, name, source):
+        path = self.root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(source, encoding="utf-8")
+        return str(path)
+
+    def test_symbols_from_ast(self):
+        symbols, includes, errors = index_source(self.FILES["lib/ortak.tr"])
+        self.assertEqual([(s['name'], s['type'], s['scope']) for s in symbols],
+                         [("Sayac", "class", None), ("kurucu", "method", "Sayac"), ("artir", "method", "Sayac")])
+        self.assertEqual(symbols[0]['superclass'], "Taban")
+        self.assertEqual((includes, errors), ([], 0))
+
+        outline = self.index.outline(self.root / "lib/yardimci.tr")
+        self.assertEqual([(s['name'], s['line'], s.get('params')) for s in outline],
+                         [("topla", 2, "a, b"), ("t", 3, None)])
+
+    def test_includes_and_definitions(self):
+        main = str(self.root / "ana.tr")
+        helper = str(self.root / "lib" / "yardimci.tr")
+        common = str(self.root / "lib" / "ortak.tr")
+        self.assertEqual(self.index.includes_of(main), [helper])
+        self.assertEqual(self.index.includes_of(main, transitive=True), [helper, common])
+        self.assertEqual(self.index.dependents_of(common), [helper])
+
+        # Dahil edilen dosyadaki tanım, ilgisiz ödev dosyasındakinden önce gelir
+        found = self.index.find_definitions("topla", main)
+        self.assertEqual([path for path, _ in found], [helper, str(self.root / "odev" / "topla.tr")])
+        self.assertEqual([name for name, _ in self.index.complete("Say")], ["Sayac"])
+
+    def test_incremental_refresh(self):
+        helper = self.write("lib/yardimci.tr", 'fonksiyon cikar(a, b) { dön a - b }\n')
+        os.utime(helper, ns=(1, 1))  # Zaman damgası kesin farklı olsun
+        self.assertEqual(self.index.refresh(), 1)
+        self.assertEqual(self.index.find_definitions("topla", str(self.root / "ana.tr"))[0][0],
+                         str(self.root / "odev" / "topla.tr"))
+        self.assertTrue(self.index.find_definitions("cikar"))
+
+        # Yalnızca zaman damgası değişti: içerik özeti aynı, yeniden ayrıştırılmaz
+        os.utime(helper, ns=(2, 2))
+        self.assertEqual(self.index.refresh([helper]), 0)
+
+        os.remove(self.root / "lib" / "ortak.tr")
+        self.index.refresh()
+        self.assertEqual(self.index.find_definitions("Sayac"), [])
+        self.assertEqual(self.index.includes_of(helper), [])
+
+    def test_parallel_matches_serial(self):
+        for i in range(PARALLEL_THRESHOLD):
+            self.write(f"ornekler/ornek_{i}.tr", f'fonksiyon f{i}() {{ dön {i} }}\ndeğişken v{i} = f{i}()\n')
+        serial = ProjectIndex(self.root, max_workers=1)
+        serial.refresh()
+        parallel = ProjectIndex(self.root, max_workers=2)
+        parallel.refresh()
+        self.assertEqual(sorted(parallel.files), sorted(serial.files))
+        for path, entry in serial.files.items():
+            self.assertEqual(parallel.files[path].symbols, entry.symbols)
+
+
+if __name__ == '__main__':
+    unittest.main()
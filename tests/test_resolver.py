@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+Resolver Testleri
+Değişken başvurularının (derinlik, yuva) çiftlerine çözülmesini, yorumlayıcının
+liste tabanlı çerçevelerle eski kapsam anlambilimini korumasını ve tanımsız
+isimlerin çalıştırmadan önce bildirilmesini doğrular.
+"""
+
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+
+TEST_DIR = Path(__file__).parent
+PROJECT_ROOT = TEST_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.ide.core.parse_cache import parse_source
+from src.ide.core.resolver import resolve
+from src.ide.core.interpreter import GumusInterpreter
+
+
+class TestResolver(unittest.TestCase):
+
+    def test_slots_and_depths(self):
+        program = parse_source(
+            'değişken g = 1\n'
+            'fonksiyon f(a, b) {\n'
+            '    değişken c = a\n'
+            '    eğer (b) {\n'
+            '        değişken d = c + g\n'
+            '    }\n'
+            '}\n'
+        )
+        resolution = resolve(program)
+        function = program.statements[1]
+        self.assertEqual(resolution.slots[program.statements[0]], None)  # Genel kapsam isimle kalır
+        self.assertEqual(resolution.scopes[function].names, {'a': 1, 'b': 2, 'c': 3})
+
+        block = function.body.statements[1].then_branch
+        declaration = block.statements[0]
+        self.assertEqual(resolution.scopes[block].names, {'d': 1})
+        add = declaration.initializer
+        self.assertEqual(resolution.locals[add.left], (1, 3, False))  # c: bir üst çerçeve
+        self.assertNotIn(add.right, resolution.locals)                 # g: genel
+        self.assertEqual(resolution.global_refs, [('g', 5)])
+
+    def test_reference_before_declaration_resolves_outward(self):
+        program = parse_source('fonksiyon f() {\n    yazdır(x)\n    değişken x = 2\n}\n')
+        resolution = resolve(program)
+        self.assertEqual(resolution.global_refs, [('x', 2)])
+
+
+class TestSlotFrames(unittest.TestCase):
+
+    def test_scoping_semantics(self):
+        output = []
+        ok = GumusInterpreter(output.append).run(
+            'değişken x = "genel"\n'
+            'fonksiyon f() {\n'
+            '    yazdır(x)\n'
+            '    değişken x = "yerel"\n'
+            '    fonksiyon g() { dön h() + x }\n'     # h sonra bildirilir ama çağrı anında vardır
+            '    fonksiyon h() { dön "h:" }\n'
+            '    dön g()\n'
+            '}\n'
+            'değişken fs = []\n'
+            'için (değişken i = 0; i < 3; i = i + 1) {\n'
+            '    değişken j = i * 10\n'
+            '    fonksiyon g() { dön j + i }\n'       # Her tur kendi j'sini yakalar
+            '    fs.ekle(g)\n'
+            '}\n'
+            'fonksiyon sayac() { değişken n = 0  fonksiyon art() { n = n + 1  dön n } dön art }\n'
+            'değişken s = sayac()\n'
+            's()\n'
+            'dene { yazdır(1 / 0) } yakala(e) { değişken z = "yakalandı"  yazdır(z) }\n'
+            'yazdır(f(), fs[0](), fs[2](), s())\n'
+        )
+        self.assertTrue(ok)
+        self.assertEqual(output, ["yakalandı", "genel", "h:yerel 3 23 2"])
+
+
+class TestStaticCheck(unittest.TestCase):
+
+    def test_unresolved_names_follow_includes(self):
+        with tempfile.TemporaryDirectory() as folder:
+            root = Path(folder)
+            (root / "yardim.tr").write_text('fonksiyon yardim() { dön 1 }\n', encoding="utf-8")
+            program = parse_source(
+                'dahil_et("yardim")\n'
+                'fonksiyon f(a) { dön a + yardim() + uzunluk("ab") }\n'
+                'sonra = 1\n'
+                'yazdır(f(sonra), yerel_yerlesik(2), öz)\n'
+                'dahil_et("olmayan")\n'
+            )
+            interpreter = GumusInterpreter(search_root=root)
+            self.assertEqual(interpreter.check(program, root), [
+                ("yerel_yerlesik", 4), ("öz", 4), ("dahil_et: olmayan", None),
+            ])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+Akışlı Güvenli Çalıştırma Testleri
+Çıktının geldikçe callback'e verilmesini, yalnızca son baytların sabit
+boyutlu tamponda tutulmasını, kota aşılınca sürecin öldürülmesini ve Linux'ta
+kaynak sınırlarının uygulanmasını doğrular.
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+TEST_DIR = Path(__file__).parent
+PROJECT_ROOT = TEST_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.ide.core.secure_subprocess import OutputRingBuffer, SecureSubprocessManager, SecurityLevel
+
+
+class TestSecureStreaming(unittest.TestCase):
+
+    def setUp(self):
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        self.folder = Path(folder.name)
+        self.manager = SecureSubprocessManager(SecurityLevel.MEDIUM)
+        self.manager.set_timeout(30)
+
+    def script(self, text):
+        path = self.folder / "program.py"
+        path.write_text(text, encoding="utf-8")
+        return str(path)
+
+    def test_ring_buffer_keeps_tail(self):
+        buffer = OutputRingBuffer(3)
+        buffer.write("ağ".encode("utf-8"))
+        self.assertFalse(buffer.truncated)
+        buffer.write("çde".encode("utf-8"))  # "ç" yarıda kalır
+        self.assertTrue(buffer.truncated)
+        self.assertEqual(buffer.total, 7)
+        self.assertEqual(buffer.getvalue(), "de")
+
+    def test_output_is_streamed_to_callback(self):
+        chunks = []
+        result = self.manager.execute_streaming(
+            sys.executable,
+            [self.script('import sys\nprint("selam ğüş", flush=True)\nprint("uyarı", file=sys.stderr)\n')],
+            on_output=lambda text, is_error: chunks.append((text, is_error)))
+        self.assertTrue(result['success'])
+        self.assertEqual(result['stdout'], "selam ğüş\n")
+        self.assertEqual(result['stderr'], "uyarı\n")
+        self.assertEqual("".join(text for text, is_error in chunks if not is_error), "selam ğüş\n")
+        self.assertEqual("".join(text for text, is_error in chunks if is_error), "uyarı\n")
+
+    def test_truncated_character_is_flushed_at_end(self):
+        chunks = []
+        self.manager.execute_streaming(
+            sys.executable, [self.script('import sys\nsys.stdout.buffer.write("ağ".encode("utf-8")[:2])\n')],
+            on_output=lambda text, is_error: chunks.append(text))
+        self.assertEqual("".join(chunks), "a\ufffd")
+
+    def test_runaway_output_is_killed_at_quota(self):
+        self.manager.set_max_output_size(64 * 1024)
+        seen = []
+        result = self.manager.execute_streaming(
+            sys.executable, [self.script('import sys\nwhile True:\n    sys.stdout.write("x" * 4096)\n')],
+            on_output=lambda text, is_error: seen.append(len(text)), output_quota=2 * 1024 * 1024)
+        self.assertFalse(result['success'])
+        self.assertIn("kota", result['error'])
+        self.assertTrue(result['truncated'])
+        self.assertGreater(result['output_bytes'], 2 * 1024 * 1024)
+        self.assertLessEqual(len(result['stdout']), 64 * 1024 + 64)
+        self.assertGreater(sum(seen), 2 * 1024 * 1024)
+
+    @unittest.skipUnless(sys.platform.startswith('linux'), "RLIMIT yalnızca Linux'ta uygulanır")
+    def test_resource_limits(self):
+        self.manager.set_resource_limits(memory_mb=256, cpu_seconds=1)
+        memory = self.manager.execute_safe(sys.executable, [self.script('veri = bytearray(512 * 1024 * 1024)\n')])
+        self.assertFalse(memory['success'])
+        self.assertIn("MemoryError", memory['stderr'])
+
+        cpu = self.manager.execute_safe(sys.executable, [self.script('while True:\n    pass\n')])
+        self.assertFalse(cpu['success'])
+        self.assertLess(cpu['execution_time'], 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
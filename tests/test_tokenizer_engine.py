@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+"""
+GümüşTokenizer Testleri
+Tablo güdümlü tarayıcının eski karakter-karakter tarayıcı ile birebir aynı
+token akışını ürettiğini ve sütun bilgisini doğru kaydettiğini doğrular.
+"""
+
+import io
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+
+TEST_DIR = Path(__file__).parent
+PROJECT_ROOT = TEST_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.ide.core.tokenizer import GumusTokenizer, TokenType
+from src.ide.core.parser import GumusParser
+from src.ide.core.token_stream import stream_tokens, stream_file_tokens, StreamingTokenBuffer
+
+
+def token_tuples(tokens):
+    return [(t.type, t.value, t.line, t.col, t.end_col) for t in tokens]
+
+
+class TestTableDrivenTokenizer(unittest.TestCase):
+
+    def assertSameStream(self, source):
+        fast = GumusTokenizer(source).tokenize()
+        reference = GumusTokenizer(source).tokenize_charwise()
+        self.assertEqual(token_tuples(fast), token_tuples(reference))
+        return fast
+
+    def test_corpus_matches_reference(self):
+        """Depodaki tüm .tr dosyaları iki motorda aynı akışı üretmeli"""
+        files = sorted(PROJECT_ROOT.glob("**/*.tr"))
+        self.assertTrue(files)
+        for path in files:
+            with self.subTest(file=str(path.relative_to(PROJECT_ROOT))):
+                self.assertSameStream(path.read_text(encoding="utf-8", errors="replace"))
+
+    def test_multi_word_keywords(self):
+        tokens = self.assertSameStream('dahil et matematik\nboş geç\nboş gec\ndevam et\ndahil etmek\ndevam  et')
+        types = [t.type for t in tokens]
+        self.assertEqual(types[:5], [TokenType.INCLUDE, TokenType.IDENTIFIER, TokenType.NULL,
+                                     TokenType.NULL, TokenType.CONTINUE])
+        self.assertEqual(tokens[3].value, "boş gec")
+        # 'dahil etmek' ve çift boşluklu 'devam  et' birleştirilmez
+        self.assertEqual([t.value for t in tokens[5:9]], ["dahil", "etmek", "devam", "et"])
+
+    def test_columns(self):
+        tokens = self.assertSameStream('değişken x = 42\n  yazdır("a\nb") // not')
+        var_tok, name_tok, eq_tok, num_tok = tokens[:4]
+        self.assertEqual((var_tok.col, var_tok.end_col), (1, 9))
+        self.assertEqual((name_tok.col, name_tok.end_col), (10, 11))
+        self.assertEqual((num_tok.line, num_tok.col, num_tok.end_col), (1, 14, 16))
+
+        print_tok, lparen, string_tok = tokens[4:7]
+        self.assertEqual((print_tok.line, print_tok.col), (2, 3))
+        # Çok satırlı metin: satır bitiş satırıdır, bitiş sütunu da o satıra göredir
+        self.assertEqual((string_tok.line, string_tok.col, string_tok.end_col), (3, 10, 3))
+
+    def test_unterminated_string_and_unknown_chars(self):
+        tokens = self.assertSameStream('x & y $ "açık\nkalan')
+        self.assertEqual([t.type for t in tokens], [TokenType.IDENTIFIER, TokenType.IDENTIFIER, TokenType.EOF])
+        self.assertEqual(tokens[-1].line, 2)
+
+    def test_numbers(self):
+        tokens = self.assertSameStream('3.0 2.5 7. 10')
+        self.assertEqual([t.value for t in tokens[:-1]], [3, 2.5, 7, ".", 10])
+
+
+class TestIncrementalTokenizer(unittest.TestCase):
+
+    SOURCE = (
+        'değişken x = 1\n'
+        'yazdır("çok\nsatırlı")\n'
+        'fonksiyon f(a) {\n'
+        '    dön a + 1 // yorum\n'
+        '}\n'
+        'dahil et matematik\n'
+    )
+
+    def assertMatchesFullScan(self, tokenizer):
+        reference = GumusTokenizer(tokenizer.source, incremental=True)
+        reference.tokenize()
+        self.assertEqual(token_tuples(tokenizer.tokens), token_tuples(reference.tokens))
+        self.assertEqual(tokenizer.line_offsets, reference.line_offsets)
+        self.assertEqual(tokenizer.line_states, reference.line_states)
+        self.assertEqual(tokenizer.line_tokens, reference.line_tokens)
+
+    def test_checkpoints(self):
+        tokenizer = GumusTokenizer(self.SOURCE, incremental=True)
+        tokenizer.tokenize()
+        self.assertEqual(len(tokenizer.line_offsets), self.SOURCE.count("\n") + 1)
+        # 3. satır başı açık metnin içinde; durum metnin başlangıç ofsetidir
+        self.assertEqual(tokenizer.line_states[2], self.SOURCE.index('"çok'))
+        self.assertTrue(all(state == -1 for i, state in enumerate(tokenizer.line_states) if i != 2))
+
+    def test_edit_relexes_only_dirty_lines(self):
+        tokenizer = GumusTokenizer(self.SOURCE * 50, incremental=True)
+        tokens = tokenizer.tokenize()
+        total = len(tokens)
+        pos = tokenizer.source.index("dön a", len(tokenizer.source) // 2)
+
+        first, old_stop, new_stop = tokenizer.edit(pos + 4, pos + 5, "b * 2")
+        self.assertEqual((old_stop - first, new_stop - first), (4, 6))
+        self.assertEqual(len(tokenizer.tokens), total + 2)
+        self.assertMatchesFullScan(tokenizer)
+
+    def test_edit_changing_line_count_and_string_state(self):
+        tokenizer = GumusTokenizer(self.SOURCE * 3, incremental=True)
+        tokenizer.tokenize()
+        # Metni açan tırnağı silmek sonraki satırların durumunu değiştirir
+        quote = tokenizer.source.index('"çok')
+        tokenizer.edit(quote, quote + 1, "")
+        self.assertMatchesFullScan(tokenizer)
+        tokenizer.edit(quote, quote, '"\n\n')
+        self.assertMatchesFullScan(tokenizer)
+        # Açık metnin ortasında düzenleme: metnin başından yeniden taranır
+        tokenizer.edit(quote + 4, quote + 4, "yeni satır\n")
+        self.assertMatchesFullScan(tokenizer)
+
+    def test_sync(self):
+        tokenizer = GumusTokenizer(self.SOURCE, incremental=True)
+        tokenizer.tokenize()
+        tokenizer.sync(self.SOURCE.replace("x = 1", "xy = 10\n"))
+        self.assertMatchesFullScan(tokenizer)
+        tokenizer.sync("")
+        self.assertMatchesFullScan(tokenizer)
+
+    def test_edit_requires_incremental_mode(self):
+        with self.assertRaises(ValueError):
+            GumusTokenizer("x").edit(0, 0, "y")
+
+
+class TestCompactTokenStream(unittest.TestCase):
+
+    SOURCE = 'fonksiyon topla(a, b) {\n    dön a + b\n}\nyazdır(topla(1, 2.5), "x\ny")\n'
+
+    def test_views_match_token_objects(self):
+        tokens = GumusTokenizer(self.SOURCE).tokenize()
+        stream = GumusTokenizer(self.SOURCE).tokenize_compact()
+        self.assertEqual(len(stream), len(tokens))
+        self.assertEqual(token_tuples(stream), token_tuples(tokens))
+        self.assertEqual(stream[-1].type, TokenType.EOF)
+
+    def test_identifiers_are_interned(self):
+        stream = GumusTokenizer(self.SOURCE).tokenize_compact()
+        a_ids = {stream.value_ids[i] for i in range(len(stream)) if stream[i].value == "a"}
+        self.assertEqual(len(a_ids), 1)
+        self.assertEqual(stream.kinds.typecode, 'B')
+        self.assertEqual(stream.offsets.typecode, 'I')
+
+    def test_parser_runs_on_packed_stream(self):
+        packed = GumusParser(GumusTokenizer(self.SOURCE).tokenize_compact()).parse()
+        regular = GumusParser(GumusTokenizer(self.SOURCE).tokenize()).parse()
+        self.assertEqual(packed.to_json(), regular.to_json())
+
+
+class TestStreamingTokenizer(unittest.TestCase):
+
+    # Parça sınırına denk gelebilecek her şey: çok kelimeli anahtarlar, ondalık
+    # sayılar, iki karakterli operatörler, yorumlar ve çok satırlı metinler
+    SOURCE = (
+        'dahil et matematik\n'
+        'değişken x = 12.5 // yorum satırı\n'
+        'eğer (x == 3) { boş geç }\n'
+        'yazdır("çok\nsatırlı ğüşıöç")\n'
+        'devam et\n'
+    )
+
+    def test_tiny_chunks_match_full_scan(self):
+        reference = token_tuples(GumusTokenizer(self.SOURCE).tokenize())
+        for chunk_size in (1, 2, 3, 7, 4096):
+            with self.subTest(chunk_size=chunk_size):
+                # Bayt parçaları UTF-8 karakterlerini de ortadan böler
+                stream = stream_tokens(io.BytesIO(self.SOURCE.encode("utf-8")), chunk_size)
+                self.assertEqual(token_tuples(stream), reference)
+                stream = stream_tokens(io.StringIO(self.SOURCE), chunk_size)
+                self.assertEqual(token_tuples(stream), reference)
+
+    def test_mmap_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "buyuk.tr"
+            path.write_bytes(self.SOURCE.encode("utf-8"))
+            tokens = list(stream_file_tokens(str(path), chunk_size=5))
+            self.assertEqual(token_tuples(tokens), token_tuples(GumusTokenizer(self.SOURCE).tokenize()))
+
+            empty = Path(tmp) / "bos.tr"
+            empty.write_bytes(b"")
+            self.assertEqual([t.type for t in stream_file_tokens(str(empty))], [TokenType.EOF])
+
+    def test_parser_consumes_stream(self):
+        source = 'fonksiyon topla(a, b) {\n    dön a + b\n}\n' * 200
+        buffer = StreamingTokenBuffer(stream_tokens(io.StringIO(source), 64))
+        streamed = GumusParser(buffer).parse()
+        regular = GumusParser(GumusTokenizer(source).tokenize()).parse()
+        self.assertEqual(streamed.to_json(), regular.to_json())
+        # Pencere sınırlı kalır; eski token'lar bırakılmıştır
+        self.assertLess(len(buffer._window), 32)
+        with self.assertRaises(IndexError):
+            buffer[0]
+
+
+if __name__ == '__main__':
+    unittest.main()
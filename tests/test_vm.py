@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""
+GumusVM Testleri
+Bayt kodu derleyicisinin işlem kodlarının yerel op_code.h ile aynı numaralandığını,
+VM'in GumusInterpreter ile aynı anlambilimi ürettiğini ve run_simulator'ın
+VM'i önce deneyip gerektiğinde satır simülatörüne geçtiğini doğrular.
+--native-python'un tercüme ettiği programların VM ile aynı çıktıyı verdiği de
+tests/programs üzerinde karşılaştırılır.
+"""
+
+import contextlib
+import io
+import re
+import subprocess
+import tempfile
+import unittest
+import unittest.mock
+import sys
+from pathlib import Path
+
+TEST_DIR = Path(__file__).parent
+PROJECT_ROOT = TEST_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.ide.core import vm as vm_module
+from src.ide.core import run_simulator
+from src.ide.core.vm import GumusVM
+from src.ide.core.interpreter import GumusInterpreter
+from src.ide.core.parse_cache import parse_source
+
+
+PROGRAM = (
+    'fonksiyon sayac_yap() {\n'
+    '    değişken n = 0\n'
+    '    fonksiyon arttir() { n = n + 1  dön n }\n'
+    '    dön arttir\n'
+    '}\n'
+    'değişken s = sayac_yap()\n'
+    's()\n'
+    'sınıf Hayvan {\n'
+    '    kurucu(ad) { öz.ad = ad }\n'
+    '    fonksiyon tanit() { dön öz.ad + " " + öz.ses() }\n'
+    '}\n'
+    'sınıf Kedi < Hayvan {\n'
+    '    fonksiyon ses() { dön "miyav" }\n'
+    '    fonksiyon tanit() { dön "Kedi " + ata.tanit() }\n'
+    '}\n'
+    'değişken liste = []\n'
+    'için (değişken i = 0; i < 10; i = i + 1) {\n'
+    '    eğer (i % 2 == 0) { devam }\n'
+    '    eğer (i > 7) { kır }\n'
+    '    dene { liste.ekle(10 / (i - 5)) } yakala(h) { liste.ekle("sıfır") }\n'
+    '}\n'
+    'değişken k = yeni Kedi("Tekir")\n'
+    'yazdır(s(), k.tanit(), liste, -7 / 2, 0 veya "b", {"a": [1, 2]})\n'
+    'yazdır(tanimsiz)\n'
+)
+
+
+def run_vm(source, **kwargs):
+    output = []
+    ok = GumusVM(output.append, **kwargs).run(source)
+    return output, ok
+
+
+class TestBytecode(unittest.TestCase):
+
+    def test_opcodes_match_native_header(self):
+        header = (PROJECT_ROOT / "src" / "compiler" / "vm" / "op_code.h").read_text(encoding="utf-8")
+        names = re.findall(r"^\s*(OP_\w+)\b", header, re.MULTILINE)
+        self.assertIn("OP_HALT", names)
+        for number, name in enumerate(names):
+            self.assertEqual(getattr(vm_module, name), number, name)
+
+    def test_disassemble(self):
+        program = parse_source('değişken x = 1\nyazdır(x + 2)\n')
+        function = GumusVM().compile(program)
+        listing = function.chunk.disassemble("betik").splitlines()
+        self.assertEqual(listing[0], "== betik ==")
+        self.assertIn("OP_DEFINE_GLOBAL", listing[2])
+        self.assertTrue(any("OP_ADD" in line for line in listing))
+        self.assertTrue(listing[-1].split()[2] == "OP_RETURN")
+
+
+class TestVMSemantics(unittest.TestCase):
+
+    def test_matches_interpreter(self):
+        expected = []
+        expected_ok = GumusInterpreter(expected.append).run(PROGRAM)
+        output, ok = run_vm(PROGRAM)
+        self.assertEqual((output, ok), (expected, expected_ok))
+        self.assertFalse(ok)
+        self.assertEqual(output[-1], "Simülasyon Hatası (Satır 24): Tanımsız değişken veya fonksiyon: 'tanimsiz'")
+
+    def test_errors_unwind_frames_and_recursion(self):
+        output, ok = run_vm(
+            'fonksiyon f(n) { eğer (n == 0) { dön 1 / 0 } dön f(n - 1) }\n'
+            'dene { f(50) } yakala(h) { yazdır("yakalandı") }\n'
+            'fonksiyon fib(n) { eğer (n < 2) { dön n } dön fib(n - 1) + fib(n - 2) }\n'
+            'yazdır(fib(20))\n'
+            'fonksiyon sonsuz(n) { dön sonsuz(n + 1) }\n'
+            'sonsuz(0)\n'
+        )
+        self.assertFalse(ok)
+        self.assertEqual(output[:2], ["yakalandı", "6765"])
+        self.assertTrue(output[2].startswith("Simülasyon Hatası (Satır 5)"))
+
+        output, ok = run_vm('değişken = 1\n')
+        self.assertFalse(ok)
+        self.assertTrue(output[0].startswith("Sözdizimi Hatası (Satır 1)"))
+
+    def test_string_escapes_match_native_tokenizer(self):
+        # Yerel Tokenizer::string ile aynı kaçış dizileri; bilinmeyen kaçış olduğu gibi kalır
+        source = 'değişken s = "a\\tb\\\\n\\q"\nyazdır(s + "\\n" + uzunluk(s))\nyazdır({"x\\ty": 1})\n'
+        expected = []
+        GumusInterpreter(expected.append).run(source)
+        for optimize in (False, True):
+            output = []
+            vm = GumusVM(output.append)
+            vm.optimize = optimize
+            self.assertTrue(vm.run(source))
+            self.assertEqual(output, expected)
+        self.assertEqual(expected[0], "a\tb\\n\\q\n7")
+        self.assertIn("x\ty", expected[1])
+
+    def test_include_and_trace(self):
+        with tempfile.TemporaryDirectory() as folder:
+            root = Path(folder)
+            (root / "lib").mkdir()
+            (root / "lib" / "kare.tr").write_text('fonksiyon kare(x) { dön x * x }\n', encoding="utf-8")
+            main = root / "ana.tr"
+            main.write_text('dahil_et("kare")\ndahil et kare\ndeğişken y = kare(4)\nyazdır(y)\n',
+                            encoding="utf-8")
+            output = []
+            vm = GumusVM(output.append, search_root=root)
+            vm.trace_enabled = True
+            vm.execution_delay = 0
+            self.assertTrue(vm.run_file(main))
+        self.assertEqual([line for line in output if not line.startswith("__")], ["16"])
+        self.assertIn("__TRACE__:4", output)
+        self.assertIn('__VARS__:{"y": 16}', output)
+
+
+class TestRunSimulatorEngine(unittest.TestCase):
+
+    def run_cli(self, source, *flags):
+        with tempfile.TemporaryDirectory() as folder:
+            path = Path(folder) / "deneme.tr"
+            path.write_text(source, encoding="utf-8")
+            return subprocess.run(
+                [sys.executable, str(PROJECT_ROOT / "src" / "ide" / "core" / "run_simulator.py"),
+                 str(path), *flags],
+                capture_output=True, text=True, encoding="utf-8", timeout=30)
+
+    def test_vm_first_then_line_simulator(self):
+        result = self.run_cli('sınıf A { fonksiyon f() { dön 42 } }\ndeğişken a = yeni A()\nyazdır(a.f())\n')
+        self.assertEqual((result.returncode, result.stdout.strip()), (0, "42"))
+        self.assertEqual(result.stderr, "")
+
+        # Yalnızca yerel yorumlayıcıda olan yerleşik: satır simülatörü devralır
+        result = self.run_cli('yazdır("a")\nbilinmeyen_yerlesik(1)\n')
+        self.assertIn("[SIMULATOR] Bayt kodu VM", result.stderr)
+        self.assertEqual(result.stdout.count("a\n"), 1)
+
+    def test_runtime_error_is_reported_without_rerun(self):
+        # Hatadan önceki çıktı bir kez yazılır; program satır simülatöründe yeniden çalışmaz
+        result = self.run_cli('yazdır("önce")\ndeğişken x = 1\nyazdır(x / "a")\nyazdır("sonra")\n')
+        self.assertEqual(result.returncode, 1)
+        self.assertEqual(result.stdout, "önce\n")
+        self.assertIn("Simülasyon Hatası (Satır 3)", result.stderr)
+        self.assertNotIn("[SIMULATOR]", result.stderr)
+
+    def test_native_python_caches_code_objects(self):
+        source = 'fonksiyon kare(x) { dön x * x }\nyazdır(kare(7))\n'
+        with tempfile.TemporaryDirectory() as cache_dir:
+            code = run_simulator.load_native_code(source, "kare.tr", cache_dir)
+            self.assertEqual(len(list(Path(cache_dir).glob("*.gpyc"))), 1)
+            # İkinci çağrı önbellekten gelir: ayrıştırıcı hiç çağrılmaz
+            with unittest.mock.patch("src.ide.core.parse_cache.parse_source", side_effect=AssertionError):
+                cached = run_simulator.load_native_code(source, "kare.tr", cache_dir)
+            self.assertEqual(cached.co_code, code.co_code)
+
+            self.assertEqual(run_simulator.load_native_code('değişken = 1\n', "x.tr", cache_dir)[0][:22],
+                             "Sözdizimi Hatası (Satı")
+
+    def test_native_python_falls_back_to_vm(self):
+        # İç blokta gölgelenen değişken Python'da dış değişkeni ezerdi
+        result = self.run_cli('değişken x = 1\neğer (x) { değişken x = 2 }\nyazdır(x)\n', "--native-python")
+        self.assertEqual((result.returncode, result.stdout, result.stderr), (0, "1\n", ""))
+
+
+# Python'un farklı davrandığı noktalar: öncelik, tamsayı bölmesi, doğru/yanlış
+# yazımı, metin birleştirme, fonksiyonda genel değişkene atama, doğruluk
+SEMANTICS = (
+    'değişken a = 2\ndeğişken b = 3\n'
+    'yazdır((a + b) * 4, 7 / 2, -7 / 2, -7 % 3, 1 == 1, "x" + 1, 1 + "x")\n'
+    'değişken sayac = 0\n'
+    'fonksiyon art() { sayac = sayac + 1 }\n'
+    'art()\nart()\n'
+    'değişken l = [3, 1]\n'
+    'yazdır(sayac, 0 veya "boş", 1 ve 2, !0, l.uzunluk(), l, yok)\n'
+    'eğer (0) { yazdır("hayır") } değilse { yazdır("evet") }\n'
+)
+
+
+class TestNativePython(unittest.TestCase):
+
+    def assert_matches_vm(self, path):
+        """Program tercüme edilebiliyorsa çıktısı VM'inkiyle aynı olmalı; tercüme edildi mi döner"""
+        expected = []
+        expected_ok = GumusVM(expected.append).run_file(path)
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with tempfile.TemporaryDirectory() as cache_dir, \
+                contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            code = run_simulator.run_native_python(path, cache_dir)
+        if code is None:
+            return False  # VM'e bırakıldı
+        self.assertEqual((stdout.getvalue().splitlines(), code == 0), (expected, expected_ok), path.name)
+        return True
+
+    def test_semantics_match_vm(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = Path(folder) / "anlam.tr"
+            path.write_text(SEMANTICS, encoding="utf-8")
+            self.assertTrue(self.assert_matches_vm(path))
+
+    def test_programs_match_vm(self):
+        translated = [path.name for path in sorted((TEST_DIR / "programs").iterdir())
+                      if path.suffix in (".tr", ".gumus") and self.assert_matches_vm(path)]
+        self.assertIn("test_transpiler.tr", translated)
+
+    def test_untranslatable_programs_run_in_vm(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            self.assertIsNone(run_simulator.load_native_code(
+                'dene { yazdır(1 / 0) } yakala(h) { yazdır(h) }\n', "dene.tr", cache_dir))
+            self.assertIsNone(run_simulator.load_native_code(
+                'değişken x = 1\neğer (x) { değişken x = 2 }\nyazdır(x)\n', "blok.tr", cache_dir))
+
+
+if __name__ == '__main__':
+    unittest.main()
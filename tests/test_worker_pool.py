@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+Çalıştırma İşçisi Havuzu Testleri
+Hazır işçilerin programı girdiyle çalıştırmasını, çıktının çalıştırma sınırında
+dosya sonu vermesini, işçilerin geri dönüştürülmesini ve yeni çalıştırmanın
+süren öncekini iptal etmesini doğrular.
+"""
+
+import tempfile
+import threading
+import unittest
+import sys
+from pathlib import Path
+
+TEST_DIR = Path(__file__).parent
+PROJECT_ROOT = TEST_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.ide.core.worker_pool import WorkerPool, WORKER_MEMORY_MB
+
+
+class TestWorkerPool(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.addCleanup(self.folder.cleanup)
+        self.program = Path(self.folder.name) / "selam.tr"
+        self.program.write_text('değişken ad = girdi("")\nyazdır("selam", ad)\n', encoding="utf-8")
+
+    def test_runs_reuse_warm_worker(self):
+        pool = WorkerPool(size=1, max_runs=2)
+        self.addCleanup(pool.shutdown)
+        pool.warm()
+        pids = []
+        for name in ("Ali", "Ayşe"):
+            run = pool.start(self.program)
+            run.stdin.write(name + "\n")
+            run.stdin.flush()
+            self.assertEqual(run.stdout.read(), f"selam {name}\n")
+            self.assertEqual(run.stderr.read(), "")
+            self.assertEqual(run.wait(timeout=10), 0)
+            pids.append(run.pid)
+        self.assertEqual(pids[0], pids[1])  # İkinci çalıştırma aynı işçide
+
+        run = pool.start(self.program)      # max_runs doldu: yeni işçi
+        run.stdin.close()
+        run.stdout.read()
+        run.stderr.read()
+        run.wait(timeout=10)
+        self.assertNotEqual(run.pid, pids[0])
+
+    def test_new_run_cancels_previous(self):
+        endless = Path(self.folder.name) / "sonsuz.tr"
+        endless.write_text('döngü (doğru) { }\n', encoding="utf-8")
+        pool = WorkerPool()
+        self.addCleanup(pool.shutdown)
+        first = pool.start(endless)
+        output = []
+        reader = threading.Thread(target=lambda: output.append(first.stdout.read()))
+        reader.start()
+
+        second = pool.start(self.program)
+        reader.join(timeout=10)
+        self.assertFalse(reader.is_alive())
+        self.assertNotEqual(first.wait(timeout=10), 0)
+        second.stdin.write("Can\n")
+        second.stdin.flush()
+        self.assertEqual(second.stdout.read(), "selam Can\n")
+        self.assertEqual(second.wait(timeout=10), 0)
+
+    @unittest.skipUnless(sys.platform.startswith('linux'), "RLIMIT yalnızca Linux'ta uygulanır")
+    def test_workers_are_resource_limited(self):
+        pool = WorkerPool(size=1)
+        self.addCleanup(pool.shutdown)
+        pool.warm()
+        pid = pool._idle[0].process.pid
+        limits = Path(f"/proc/{pid}/limits").read_text()
+        line = next(line for line in limits.splitlines() if line.startswith("Max address space"))
+        self.assertEqual(int(line.split()[3]), WORKER_MEMORY_MB * 1024 * 1024)
+
+
+if __name__ == '__main__':
+    unittest.main()